@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark /metrics Scrape Latency
+=================================
+Records N histogram observations (default 10M) into the worker's
+REQUEST_LATENCY histogram across a handful of routes, then times
+get_metrics_text(). Scrape time should be independent of N.
+
+Usage:
+    python scripts/bench-metrics-scrape.py
+    python scripts/bench-metrics-scrape.py --observations 1000000 --routes 20
+    python scripts/bench-metrics-scrape.py --multiproc-dir /tmp/rf-metrics
+"""
+
+import argparse
+import os
+import random
+import shutil
+import statistics
+import sys
+import time
+from pathlib import Path
+
+WORKER_SRC = Path(__file__).resolve().parent.parent / "services" / "worker" / "src"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--observations", type=int, default=10_000_000)
+    parser.add_argument("--routes", type=int, default=10)
+    parser.add_argument("--scrapes", type=int, default=20)
+    parser.add_argument(
+        "--multiproc-dir",
+        help="Enable multiprocess mode with this (emptied) PROMETHEUS_MULTIPROC_DIR",
+    )
+    args = parser.parse_args()
+
+    if args.multiproc_dir:
+        shutil.rmtree(args.multiproc_dir, ignore_errors=True)
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = args.multiproc_dir
+
+    sys.path.insert(0, str(WORKER_SRC))
+    import metrics
+
+    rng = random.Random(42)
+    routes = [f"/api/route/{i}" for i in range(args.routes)]
+    observe = metrics.REQUEST_LATENCY.observe
+
+    start = time.perf_counter()
+    for i in range(args.observations):
+        observe(rng.expovariate(10.0), route=routes[i % len(routes)])
+    record_s = time.perf_counter() - start
+
+    timings = []
+    for _ in range(args.scrapes):
+        start = time.perf_counter()
+        text = metrics.get_metrics_text()
+        timings.append(time.perf_counter() - start)
+
+    print(f"observations:      {args.observations:,} over {args.routes} routes")
+    print(f"multiprocess:      {'on (' + args.multiproc_dir + ')' if args.multiproc_dir else 'off'}")
+    print(f"record throughput: {args.observations / record_s:,.0f} obs/s")
+    print(f"scrape latency:    median {statistics.median(timings) * 1e3:.2f} ms, "
+          f"max {max(timings) * 1e3:.2f} ms ({len(text):,} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2538,7 +2538,12 @@ if __name__ == "__main__":
     print(f"[ROS] Runtime mode: {config.ros_mode}")
 
     if workers > 1:
-        # Multi-worker mode
+        # Multi-worker mode: aggregate /metrics across workers via a shared
+        # directory of per-process mmap files (fresh per server start)
+        if not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+            os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(prefix="ros-metrics-")
+        print(f"[ROS] Metrics multiprocess dir: {os.environ['PROMETHEUS_MULTIPROC_DIR']}")
+
         uvicorn.run(
             "api_server:app",
             host="0.0.0.0",
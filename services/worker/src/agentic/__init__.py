@@ -33,7 +33,9 @@ from .models import (
     ArtifactOutput,
 )
 
+from .context import ExecutionContext
 from .safe_query import SafeQueryBuilder, QueryValidationError
+from .query_engine import QueryEngine, DUCKDB_AVAILABLE
 from .schema_introspect import SchemaIntrospector
 from .stats_selector import StatsSelector
 from .stats_executor import StatsExecutor
@@ -56,9 +58,12 @@ __all__ = [
     "ExecutionRequest",
     "ExecutionResult",
     "ArtifactOutput",
+    "ExecutionContext",
     # Services
     "SafeQueryBuilder",
     "QueryValidationError",
+    "QueryEngine",
+    "DUCKDB_AVAILABLE",
     "SchemaIntrospector",
     "StatsSelector",
     "StatsExecutor",
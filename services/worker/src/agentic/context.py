@@ -0,0 +1,98 @@
+"""
+Execution Context
+
+Holds the working dataset of a pipeline run by reference, so stages hand
+data to each other without serializing it. Transforms are copy-on-write:
+they operate on a shallow copy and replace the held frame, leaving any
+earlier reference to the data untouched.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ExecutionContext:
+    """
+    Data shared between the stages of one plan execution.
+
+    Attributes:
+        data: Working dataset (pandas DataFrame or pyarrow Table), or None
+        source: Where the data came from (path or dataset ID)
+        version: Incremented each time the data is replaced
+    """
+    data: Any = None
+    source: Optional[str] = None
+    version: int = 0
+
+    @property
+    def has_data(self) -> bool:
+        """Whether a dataset has been loaded."""
+        return self.data is not None
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows, without converting Arrow data."""
+        if self.data is None:
+            return 0
+        if isinstance(self.data, pd.DataFrame):
+            return len(self.data)
+        return self.data.num_rows
+
+    @property
+    def columns(self) -> List[str]:
+        """Column names, without converting Arrow data."""
+        if self.data is None:
+            return []
+        if isinstance(self.data, pd.DataFrame):
+            return list(self.data.columns)
+        return list(self.data.column_names)
+
+    def set_data(self, data: Any, source: Optional[str] = None) -> None:
+        """
+        Replace the working dataset (stored by reference).
+
+        Args:
+            data: DataFrame or pyarrow Table
+            source: Optional description of the origin
+        """
+        self.data = data
+        if source is not None:
+            self.source = source
+        self.version += 1
+
+    def to_pandas(self) -> pd.DataFrame:
+        """
+        Get the data as a DataFrame.
+
+        Arrow tables are converted once and the result is kept, so later
+        stages share the same frame.
+        """
+        if self.data is None:
+            raise ValueError("No data loaded in execution context")
+        if not isinstance(self.data, pd.DataFrame):
+            self.data = self.data.to_pandas()
+        return self.data
+
+    def transform(self, func: Callable[[pd.DataFrame], pd.DataFrame]) -> pd.DataFrame:
+        """
+        Apply a transformation copy-on-write.
+
+        ``func`` receives a shallow copy of the current frame; assigning
+        columns on it allocates new column data and never writes into the
+        previous frame.
+
+        Args:
+            func: Function taking and returning a DataFrame
+
+        Returns:
+            The transformed DataFrame (now held by the context)
+        """
+        df = func(self.to_pandas().copy(deep=False))
+        self.set_data(df)
+        return df
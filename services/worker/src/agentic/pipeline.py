@@ -18,10 +18,12 @@ from .models import (
     ExecutionRequest, ExecutionResult, StageResult,
     ArtifactOutput, StatisticalMethod
 )
+from .context import ExecutionContext
 from .schema_introspect import SchemaIntrospector, schema_introspector
 from .stats_selector import StatsSelector, stats_selector
 from .stats_executor import StatsExecutor, stats_executor
 from .safe_query import SafeQueryBuilder, safe_query
+from .query_engine import QueryEngine
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +37,9 @@ class AgenticPipeline:
     2. Execute each stage in order
     3. Generate artifacts
     4. Return results
+
+    Stages share data through an ExecutionContext that holds the working
+    dataset by reference.
     """
 
     def __init__(
@@ -58,17 +63,23 @@ class AgenticPipeline:
         self.stats_executor = stats_executor
         self.safe_query = safe_query
 
-    def execute(self, request: ExecutionRequest) -> ExecutionResult:
+    def execute(
+        self,
+        request: ExecutionRequest,
+        context: Optional[ExecutionContext] = None
+    ) -> ExecutionResult:
         """
         Execute an analysis plan.
 
         Args:
             request: Execution request with plan spec
+            context: Optional context, e.g. preloaded with data
 
         Returns:
             ExecutionResult with findings
         """
         start_time = time.time()
+        context = context or ExecutionContext()
         stages_completed = []
         stages_failed = []
         stage_results = []
@@ -96,7 +107,7 @@ class AgenticPipeline:
 
                 # Execute stage
                 logger.info(f"Executing stage: {stage.name} ({stage.stage_id})")
-                result = self._execute_stage(stage, request)
+                result = self._execute_stage(stage, request, context)
 
                 if result.success:
                     stages_completed.append(stage.stage_id)
@@ -149,22 +160,23 @@ class AgenticPipeline:
     def _execute_stage(
         self,
         stage: PlanStage,
-        request: ExecutionRequest
+        request: ExecutionRequest,
+        context: ExecutionContext
     ) -> StageResult:
         """Execute a single stage."""
         start_time = time.time()
 
         try:
             if stage.stage_type == StageType.EXTRACTION:
-                return self._execute_extraction(stage, request, start_time)
+                return self._execute_extraction(stage, request, context, start_time)
             elif stage.stage_type == StageType.TRANSFORM:
-                return self._execute_transform(stage, request, start_time)
+                return self._execute_transform(stage, request, context, start_time)
             elif stage.stage_type == StageType.ANALYSIS:
-                return self._execute_analysis(stage, request, start_time)
+                return self._execute_analysis(stage, request, context, start_time)
             elif stage.stage_type == StageType.VALIDATION:
-                return self._execute_validation(stage, request, start_time)
+                return self._execute_validation(stage, request, context, start_time)
             elif stage.stage_type == StageType.OUTPUT:
-                return self._execute_output(stage, request, start_time)
+                return self._execute_output(stage, request, context, start_time)
             else:
                 return StageResult(
                     stage_id=stage.stage_id,
@@ -185,6 +197,7 @@ class AgenticPipeline:
         self,
         stage: PlanStage,
         request: ExecutionRequest,
+        context: ExecutionContext,
         start_time: float
     ) -> StageResult:
         """Execute data extraction stage."""
@@ -197,24 +210,21 @@ class AgenticPipeline:
         filters = config.get("filters")
         row_limit = request.constraints.get("maxRows", 100000)
 
-        # Load dataset
+        # SQL extraction runs in DuckDB over the file and returns Arrow
+        if config.get("query") or config.get("aggregations"):
+            return self._execute_sql_extraction(stage, context, row_limit, start_time)
+
+        # Load dataset (columns, filters and row limit pushed into the read)
         df = self.schema_introspector.load_dataset(
             dataset_id or "unknown",
-            dataset_path
+            dataset_path,
+            columns=columns or None,
+            filters=filters,
+            row_limit=row_limit
         )
 
-        # Apply row limit
-        if len(df) > row_limit:
-            df = df.sample(n=row_limit, random_state=42)
-            logger.info(f"Sampled {row_limit} rows from dataset")
-
-        # Select columns
-        if columns:
-            df = df[[c for c in columns if c in df.columns]]
-
         # Store in context for later stages
-        # (In production, this would use a proper context manager)
-        request.config_overrides["_extracted_data"] = df.to_dict()
+        context.set_data(df, source=dataset_path or dataset_id)
 
         return StageResult(
             stage_id=stage.stage_id,
@@ -228,18 +238,60 @@ class AgenticPipeline:
             duration_ms=int((time.time() - start_time) * 1000)
         )
 
+    def _execute_sql_extraction(
+        self,
+        stage: PlanStage,
+        context: ExecutionContext,
+        row_limit: int,
+        start_time: float
+    ) -> StageResult:
+        """Execute an extraction stage as a validated SQL query."""
+        config = stage.config
+        path = self.schema_introspector.resolve_dataset_path(
+            config.get("dataset_id") or "unknown",
+            config.get("dataset_path")
+        )
+        table_name = config.get("table", "dataset")
+
+        with QueryEngine(self.safe_query) as engine:
+            engine.register(table_name, str(path))
+            if config.get("aggregations"):
+                table = engine.aggregate(
+                    table_name,
+                    [tuple(a) for a in config["aggregations"]],
+                    group_by=config.get("group_by"),
+                    where=config.get("where"),
+                    params=config.get("params")
+                )
+            else:
+                table = engine.execute(config["query"], config.get("params"), max_rows=row_limit)
+
+        context.set_data(table, source=str(path))
+
+        return StageResult(
+            stage_id=stage.stage_id,
+            success=True,
+            message=f"Queried {table.num_rows} rows, {table.num_columns} columns",
+            data={
+                "row_count": table.num_rows,
+                "column_count": table.num_columns,
+                "columns": table.column_names
+            },
+            duration_ms=int((time.time() - start_time) * 1000)
+        )
+
     def _execute_transform(
         self,
         stage: PlanStage,
         request: ExecutionRequest,
+        context: ExecutionContext,
         start_time: float
     ) -> StageResult:
         """Execute data transformation stage."""
         config = stage.config
 
         # Get data from previous stage
-        data_dict = request.config_overrides.get("_extracted_data")
-        if not data_dict:
+        if not context.has_data:
             return StageResult(
                 stage_id=stage.stage_id,
                 success=False,
@@ -247,10 +299,25 @@ class AgenticPipeline:
                 duration_ms=int((time.time() - start_time) * 1000)
             )
 
-        df = pd.DataFrame(data_dict)
-
-        # Apply transformations
         transformations = config.get("transformations", [])
+        df = context.transform(
+            lambda frame: self._apply_transformations(frame, transformations)
+        )
+
+        return StageResult(
+            stage_id=stage.stage_id,
+            success=True,
+            message=f"Applied {len(transformations)} transformations",
+            data={"row_count": len(df)},
+            duration_ms=int((time.time() - start_time) * 1000)
+        )
+
+    def _apply_transformations(
+        self,
+        df: pd.DataFrame,
+        transformations: List[Dict[str, Any]]
+    ) -> pd.DataFrame:
+        """Apply transformation steps, assigning whole columns only."""
         for transform in transformations:
             transform_type = transform.get("type")
             if transform_type == "drop_missing":
@@ -264,30 +331,20 @@ class AgenticPipeline:
                 for col in columns:
                     if col in df.columns and pd.api.types.is_numeric_dtype(df[col]):
                         df[col] = (df[col] - df[col].mean()) / df[col].std()
-
-        # Update context
-        request.config_overrides["_extracted_data"] = df.to_dict()
-
-        return StageResult(
-            stage_id=stage.stage_id,
-            success=True,
-            message=f"Applied {len(transformations)} transformations",
-            data={"row_count": len(df)},
-            duration_ms=int((time.time() - start_time) * 1000)
-        )
+        return df
 
     def _execute_analysis(
         self,
         stage: PlanStage,
         request: ExecutionRequest,
+        context: ExecutionContext,
         start_time: float
     ) -> StageResult:
         """Execute statistical analysis stage."""
         config = stage.config
 
         # Get data
-        data_dict = request.config_overrides.get("_extracted_data")
-        if not data_dict:
+        if not context.has_data:
             return StageResult(
                 stage_id=stage.stage_id,
                 success=False,
@@ -295,7 +352,7 @@ class AgenticPipeline:
                 duration_ms=int((time.time() - start_time) * 1000)
             )
 
-        df = pd.DataFrame(data_dict)
+        df = context.to_pandas()
 
         # Get statistical method from config
         method_config = config.get("method", {})
@@ -334,6 +391,7 @@ class AgenticPipeline:
         self,
         stage: PlanStage,
         request: ExecutionRequest,
+        context: ExecutionContext,
         start_time: float
     ) -> StageResult:
         """Execute validation stage."""
@@ -346,13 +404,11 @@ class AgenticPipeline:
             val_type = validation.get("type")
             if val_type == "check_sample_size":
                 min_n = validation.get("min_n", 30)
-                data_dict = request.config_overrides.get("_extracted_data")
-                if data_dict:
-                    df = pd.DataFrame(data_dict)
+                if context.has_data:
                     results.append({
                         "validation": "sample_size",
-                        "passed": len(df) >= min_n,
-                        "actual": len(df),
+                        "passed": context.row_count >= min_n,
+                        "actual": context.row_count,
                         "required": min_n
                     })
 
@@ -370,6 +426,7 @@ class AgenticPipeline:
         self,
         stage: PlanStage,
         request: ExecutionRequest,
+        context: ExecutionContext,
         start_time: float
     ) -> StageResult:
         """Execute output generation stage."""
@@ -384,10 +441,8 @@ class AgenticPipeline:
 
             if output_type == "summary_table":
                 # Generate summary table
-                data_dict = request.config_overrides.get("_extracted_data")
-                if data_dict:
-                    df = pd.DataFrame(data_dict)
-                    summary = df.describe().to_dict()
+                if context.has_data:
+                    summary = context.to_pandas().describe().to_dict()
 
                     # Save to file
                     file_path = self.output_dir / f"{request.job_id}_{name}.json"
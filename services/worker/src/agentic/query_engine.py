@@ -0,0 +1,219 @@
+"""
+Query Engine
+
+Executes SafeQueryBuilder queries directly against CSV/Parquet datasets
+with an embedded DuckDB, returning Arrow tables. Files are scanned in
+place with projection and predicate pushdown over parallel threads, so
+selections and aggregations over large uploads never load the full
+dataset into pandas.
+
+Safety guarantees on top of SafeQueryBuilder validation:
+- Only registered dataset files are readable: external access is
+  disabled and the configuration is locked before any query runs
+- Single statements only
+- Row limit enforced in SQL and again while fetching results
+"""
+
+import logging
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .safe_query import SafeQueryBuilder, QueryValidationError, safe_query
+
+logger = logging.getLogger(__name__)
+
+try:
+    import duckdb
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    DUCKDB_AVAILABLE = False
+    logger.info("duckdb not available - SQL query engine disabled")
+
+# Rows per Arrow batch when streaming results
+FETCH_BATCH_ROWS = 65536
+
+
+def _lit(value: str) -> str:
+    """Quote a SQL string literal."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+class QueryEngine:
+    """
+    Runs validated SELECT queries over dataset files.
+
+    Usage:
+        with QueryEngine() as engine:
+            engine.register("patients", "/app/data/patients.parquet")
+            table = engine.aggregate("patients", [("avg", "age")], group_by=["sex"])
+    """
+
+    def __init__(
+        self,
+        builder: Optional[SafeQueryBuilder] = None,
+        threads: Optional[int] = None,
+        memory_limit: Optional[str] = None,
+        temp_directory: Optional[str] = None
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            builder: Query builder providing validation and the row limit
+            threads: DuckDB worker threads (default: all cores)
+            memory_limit: DuckDB memory limit, e.g. "2GB"
+            temp_directory: Spill directory for large aggregations
+        """
+        if not DUCKDB_AVAILABLE:
+            raise RuntimeError("duckdb is required for the SQL query engine")
+        self.builder = builder or safe_query
+        self.threads = threads
+        self.memory_limit = memory_limit
+        self.temp_directory = temp_directory
+        self._datasets: Dict[str, Path] = {}
+        self._con = None
+
+    def __enter__(self) -> "QueryEngine":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the DuckDB connection."""
+        if self._con is not None:
+            self._con.close()
+            self._con = None
+
+    def register(self, name: str, path: str) -> None:
+        """
+        Expose a dataset file as a table.
+
+        Args:
+            name: Table name used in queries
+            path: CSV, TSV or Parquet file
+
+        Raises:
+            QueryValidationError: If the name is not a plain identifier
+            FileNotFoundError: If the file does not exist
+            ValueError: If the file type is not supported
+        """
+        if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", name):
+            raise QueryValidationError(f"Invalid table name: {name}")
+        file_path = Path(path).resolve()
+        if not file_path.exists():
+            raise FileNotFoundError(f"Dataset not found: {path}")
+        if file_path.suffix.lower() not in (".parquet", ".csv", ".tsv"):
+            raise ValueError(f"Unsupported dataset type for SQL queries: {file_path.suffix}")
+
+        self._datasets[name] = file_path
+        # Allowed paths are locked per connection; reconnect on next query
+        self.close()
+
+    def _scan(self, path: Path) -> str:
+        ext = path.suffix.lower()
+        if ext == ".parquet":
+            return f"read_parquet({_lit(path)})"
+        if ext == ".tsv":
+            return f"read_csv_auto({_lit(path)}, delim='\\t')"
+        return f"read_csv_auto({_lit(path)})"
+
+    def _connect(self):
+        if self._con is not None:
+            return self._con
+
+        con = duckdb.connect()
+        if self.memory_limit:
+            con.execute(f"SET memory_limit = {_lit(self.memory_limit)}")
+        if self.temp_directory:
+            con.execute(f"SET temp_directory = {_lit(self.temp_directory)}")
+        if self.threads:
+            con.execute(f"SET threads = {int(self.threads)}")
+
+        paths = ", ".join(_lit(p) for p in self._datasets.values())
+        con.execute(f"SET allowed_paths = [{paths}]")
+        for name, path in self._datasets.items():
+            con.execute(f"CREATE VIEW {name} AS SELECT * FROM {self._scan(path)}")
+        con.execute("SET enable_external_access = false")
+        con.execute("SET lock_configuration = true")
+
+        self._con = con
+        return con
+
+    def execute(
+        self,
+        query: str,
+        params: Optional[List[Any]] = None,
+        max_rows: Optional[int] = None
+    ):
+        """
+        Validate and run a query.
+
+        Args:
+            query: SELECT query over registered tables ($1, $2 placeholders)
+            params: Parameters for placeholders
+            max_rows: Override the builder's row limit
+
+        Returns:
+            pyarrow.Table with at most max_rows rows
+
+        Raises:
+            QueryValidationError: If the query fails validation
+        """
+        import pyarrow as pa
+
+        query = query.strip()
+        if query.endswith(";"):
+            query = query[:-1].rstrip()
+        if ";" in query:
+            raise QueryValidationError("Multiple statements not allowed")
+        is_valid, error = self.builder.validate_query(query)
+        if not is_valid:
+            raise QueryValidationError(error)
+
+        limit = max_rows or self.builder.max_rows
+        query = self.builder.ensure_row_limit(query, limit)
+
+        result = self._connect().execute(query, params or [])
+        reader = (
+            result.to_arrow_reader(FETCH_BATCH_ROWS)
+            if hasattr(result, "to_arrow_reader")
+            else result.fetch_record_batch(FETCH_BATCH_ROWS)
+        )
+
+        # Stop reading once the limit is reached (e.g. LIMIT only in a subquery)
+        batches = []
+        fetched = 0
+        for batch in reader:
+            batches.append(batch)
+            fetched += batch.num_rows
+            if fetched >= limit:
+                break
+        table = pa.Table.from_batches(batches, schema=reader.schema)
+        return table.slice(0, limit)
+
+    def select(
+        self,
+        table: str,
+        columns: Optional[List[str]] = None,
+        where: Optional[str] = None,
+        params: Optional[List[Any]] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None
+    ):
+        """Build a safe SELECT (see SafeQueryBuilder.build_select) and run it."""
+        query, params = self.builder.build_select(table, columns, where, params, order_by, limit)
+        return self.execute(query, params, max_rows=limit)
+
+    def aggregate(
+        self,
+        table: str,
+        aggregations: List[Tuple[str, str]],
+        group_by: Optional[List[str]] = None,
+        where: Optional[str] = None,
+        params: Optional[List[Any]] = None
+    ):
+        """Build a safe aggregate (see SafeQueryBuilder.build_aggregate) and run it."""
+        query, params = self.builder.build_aggregate(table, aggregations, group_by, where, params)
+        return self.execute(query, params)
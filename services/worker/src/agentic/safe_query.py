@@ -146,7 +146,20 @@ class SafeQueryBuilder:
         else:
             cols_str = "*"
 
-        query = f"SELECT {cols_str} FROM {table}"
+        return self._assemble(cols_str, table, where, params, order_by=order_by, limit=limit)
+
+    def _assemble(
+        self,
+        select_list: str,
+        table: str,
+        where: Optional[str],
+        params: Optional[List[Any]],
+        group_by: Optional[List[str]] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[str, List[Any]]:
+        """Assemble a SELECT from validated parts and enforce the row limit."""
+        query = f"SELECT {select_list} FROM {table}"
 
         if where:
             # Validate WHERE clause doesn't contain blocked keywords
@@ -155,6 +168,9 @@ class SafeQueryBuilder:
                 raise QueryValidationError(f"Invalid WHERE clause: {error}")
             query += f" WHERE {where}"
 
+        if group_by:
+            query += f" GROUP BY {', '.join(group_by)}"
+
         if order_by:
             # Validate ORDER BY
             if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*(\s+(ASC|DESC))?$", order_by, re.IGNORECASE):
@@ -196,7 +212,13 @@ class SafeQueryBuilder:
                 raise QueryValidationError(f"Invalid aggregate function: {func}")
             if col != "*" and not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", col):
                 raise QueryValidationError(f"Invalid column: {col}")
-            agg_parts.append(f"{func_upper}({col}) AS {func.lower()}_{col}")
+            alias = "all" if col == "*" else col
+            agg_parts.append(f"{func_upper}({col}) AS {func.lower()}_{alias}")
+
+        if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", table):
+            raise QueryValidationError(f"Invalid table name: {table}")
+        if not agg_parts:
+            raise QueryValidationError("At least one aggregation is required")
 
         if group_by:
             for col in group_by:
@@ -206,12 +228,7 @@ class SafeQueryBuilder:
         else:
             cols_str = ", ".join(agg_parts)
 
-        return self.build_select(
-            table=table,
-            columns=None,  # We build our own SELECT
-            where=where,
-            params=params
-        )
+        return self._assemble(cols_str, table, where, params, group_by=group_by)
 
     def sanitize_identifier(self, name: str) -> str:
         """
@@ -6,7 +6,8 @@ Only provides column names, types, and aggregate statistics.
 """
 
 import logging
-from typing import Optional, List, Dict, Any
+import operator
+from typing import Optional, List, Dict, Any, Sequence
 from pathlib import Path
 import pandas as pd
 import numpy as np
@@ -15,6 +16,17 @@ from .models import ColumnProfile, DatasetProfile, ColumnType
 
 logger = logging.getLogger(__name__)
 
+# Comparison operators accepted in load_dataset filters (pyarrow style)
+FILTER_OPERATORS = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
 
 class SchemaIntrospector:
     """
@@ -212,14 +224,14 @@ class SchemaIntrospector:
             ]
         }
 
-    def load_dataset(
+    def resolve_dataset_path(
         self,
         dataset_id: str,
         dataset_path: Optional[str] = None,
         data_dir: str = "/app/data"
-    ) -> pd.DataFrame:
+    ) -> Path:
         """
-        Load a dataset from various locations.
+        Locate a dataset file.
 
         Args:
             dataset_id: Dataset identifier
@@ -227,7 +239,7 @@ class SchemaIntrospector:
             data_dir: Base data directory
 
         Returns:
-            Loaded DataFrame
+            Path to the dataset file
         """
         if dataset_path:
             path = Path(dataset_path)
@@ -257,18 +269,151 @@ class SchemaIntrospector:
                     f"Searched: {[str(p) for p in possible_paths]}"
                 )
 
+        return path
+
+    def load_dataset(
+        self,
+        dataset_id: str,
+        dataset_path: Optional[str] = None,
+        data_dir: str = "/app/data",
+        columns: Optional[List[str]] = None,
+        filters: Optional[Sequence[Sequence[Any]]] = None,
+        row_limit: Optional[int] = None,
+        random_state: int = 42
+    ) -> pd.DataFrame:
+        """
+        Load a dataset from various locations.
+
+        Column selection, filters and the row limit are applied while
+        reading: Parquet files are read with column projection and
+        row-group pruning, and row-limit samples are drawn from the file
+        metadata so only the row groups holding sampled rows are read.
+
+        Args:
+            dataset_id: Dataset identifier
+            dataset_path: Optional explicit path
+            data_dir: Base data directory
+            columns: Columns to keep (missing names are ignored)
+            filters: Conjunction of (column, op, value) conditions; op is
+                one of =, ==, !=, <, <=, >, >=, in, not in
+            row_limit: Maximum rows; larger results are randomly sampled
+            random_state: Seed for row-limit sampling
+
+        Returns:
+            Loaded DataFrame
+        """
+        path = self.resolve_dataset_path(dataset_id, dataset_path, data_dir)
+
+        filters = [tuple(f) for f in filters] if filters else None
+        for condition in filters or []:
+            if len(condition) != 3 or (
+                condition[1] not in FILTER_OPERATORS and condition[1] not in ("in", "not in")
+            ):
+                raise ValueError(f"Invalid filter: {condition}")
+
         # Load based on extension
         ext = path.suffix.lower()
-        if ext == ".csv":
-            return pd.read_csv(path)
-        elif ext == ".tsv":
-            return pd.read_csv(path, sep="\t")
-        elif ext == ".parquet":
-            return pd.read_parquet(path)
+        if ext == ".parquet":
+            return self._read_parquet(path, columns, filters, row_limit, random_state)
+
+        usecols = None
+        if columns is not None:
+            wanted = set(columns) | {f[0] for f in filters or []}
+            usecols = lambda c: c in wanted  # noqa: E731
+
+        if ext == ".tsv":
+            df = pd.read_csv(path, sep="\t", usecols=usecols)
         elif ext in [".xlsx", ".xls"]:
-            return pd.read_excel(path)
+            df = pd.read_excel(path, usecols=usecols)
         else:
-            return pd.read_csv(path)
+            df = pd.read_csv(path, usecols=usecols)
+
+        if filters:
+            df = df[self._filter_mask(df, filters)]
+        df = self._sample_rows(df, row_limit, random_state)
+        if columns is not None:
+            df = df[[c for c in columns if c in df.columns]]
+        return df
+
+    def _filter_mask(self, df: pd.DataFrame, filters: Sequence[Sequence[Any]]) -> pd.Series:
+        """Boolean mask for a conjunction of (column, op, value) filters."""
+        mask = pd.Series(True, index=df.index)
+        for col, op, value in filters:
+            if op == "in":
+                mask &= df[col].isin(value)
+            elif op == "not in":
+                mask &= ~df[col].isin(value)
+            else:
+                mask &= FILTER_OPERATORS[op](df[col], value)
+        return mask
+
+    def _sample_rows(
+        self,
+        df: pd.DataFrame,
+        row_limit: Optional[int],
+        random_state: int
+    ) -> pd.DataFrame:
+        """Randomly sample down to the row limit."""
+        if row_limit and len(df) > row_limit:
+            df = df.sample(n=row_limit, random_state=random_state)
+            logger.info(f"Sampled {row_limit} rows from dataset")
+        return df
+
+    def _read_parquet(
+        self,
+        path: Path,
+        columns: Optional[List[str]],
+        filters: Optional[List[tuple]],
+        row_limit: Optional[int],
+        random_state: int
+    ) -> pd.DataFrame:
+        """
+        Read a Parquet file with projection, pruning and pre-load sampling.
+
+        Unfiltered samples pick the same row positions as DataFrame.sample
+        on the full file, then read only the row groups containing them.
+        """
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+        if columns is not None:
+            names = set(parquet_file.schema_arrow.names)
+            columns = [c for c in columns if c in names]
+        n_rows = parquet_file.metadata.num_rows
+
+        if filters or not row_limit or n_rows <= row_limit:
+            table = pq.read_table(
+                path, columns=columns, filters=filters, use_pandas_metadata=True
+            )
+            return self._sample_rows(table.to_pandas(), row_limit, random_state)
+
+        positions = np.random.RandomState(random_state).choice(
+            n_rows, size=row_limit, replace=False
+        )
+        group_sizes = [
+            parquet_file.metadata.row_group(i).num_rows
+            for i in range(parquet_file.num_row_groups)
+        ]
+        group_starts = np.concatenate([[0], np.cumsum(group_sizes)])
+        owner = np.searchsorted(group_starts, positions, side="right") - 1
+        groups = np.unique(owner)
+
+        # Offset of each selected group within the concatenated read
+        read_starts = np.zeros(len(group_sizes), dtype=np.int64)
+        read_starts[groups] = np.concatenate(
+            [[0], np.cumsum(np.asarray(group_sizes)[groups])[:-1]]
+        )
+        local = positions - group_starts[owner] + read_starts[owner]
+
+        table = parquet_file.read_row_groups(
+            groups.tolist(), columns=columns, use_pandas_metadata=True
+        )
+        df = table.take(local).to_pandas()
+        if isinstance(df.index, pd.RangeIndex):
+            # Keep the file row numbers as labels, like DataFrame.sample
+            df.index = pd.Index(positions)
+        logger.info(f"Sampled {row_limit} rows from {len(groups)} row groups")
+        return df
 
 
 # Singleton instance
@@ -0,0 +1,136 @@
+"""
+Tests for AgenticPipeline data flow - execution context and load pushdown.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from ..context import ExecutionContext
+from ..models import ExecutionRequest, PlanSpec, PlanStage, StageType
+from ..pipeline import AgenticPipeline
+from ..query_engine import DUCKDB_AVAILABLE
+from ..schema_introspect import SchemaIntrospector
+
+
+@pytest.fixture
+def dataset():
+    """Dataset with a few columns and several hundred rows."""
+    rng = np.random.default_rng(0)
+    n = 500
+    return pd.DataFrame({
+        "age": rng.integers(18, 90, n),
+        "weight": rng.normal(70, 15, n),
+        "group": rng.choice(["A", "B"], n),
+        "notes": [f"note {i}" for i in range(n)],
+    })
+
+
+class TestLoadDatasetPushdown:
+    """Tests for column, filter and row-limit pushdown in load_dataset."""
+
+    def setup_method(self):
+        self.introspector = SchemaIntrospector()
+
+    def test_parquet_sample_matches_post_load_sample(self, dataset, tmp_path):
+        """Pre-load sampling should pick the same rows as DataFrame.sample."""
+        path = tmp_path / "data.parquet"
+        dataset.to_parquet(path, row_group_size=64)
+
+        df = self.introspector.load_dataset(
+            "data", str(path), columns=["weight", "age", "missing"], row_limit=100
+        )
+        expected = pd.read_parquet(path).sample(n=100, random_state=42)[["weight", "age"]]
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_filters_match_between_formats(self, dataset, tmp_path):
+        """Filters should select the same rows from CSV and Parquet."""
+        dataset.to_csv(tmp_path / "data.csv", index=False)
+        dataset.to_parquet(tmp_path / "data.parquet", index=False)
+        filters = [["group", "==", "A"], ["age", ">=", 40]]
+
+        from_csv = self.introspector.load_dataset(
+            "data", str(tmp_path / "data.csv"), columns=["age"], filters=filters
+        )
+        from_parquet = self.introspector.load_dataset(
+            "data", str(tmp_path / "data.parquet"), columns=["age"], filters=filters
+        )
+
+        expected = dataset.loc[(dataset["group"] == "A") & (dataset["age"] >= 40), ["age"]]
+        assert list(from_csv.columns) == ["age"]
+        assert from_csv["age"].tolist() == expected["age"].tolist()
+        assert from_parquet["age"].tolist() == expected["age"].tolist()
+
+    def test_invalid_filter_rejected(self, dataset, tmp_path):
+        """Unknown filter operators should raise."""
+        dataset.to_csv(tmp_path / "data.csv", index=False)
+        with pytest.raises(ValueError):
+            self.introspector.load_dataset(
+                "data", str(tmp_path / "data.csv"), filters=[["age", "like", 1]]
+            )
+
+
+class TestExecutionContext:
+    """Tests for the stage-to-stage execution context."""
+
+    def test_transform_is_copy_on_write(self, dataset):
+        """Transforms should not modify frames handed out earlier."""
+        context = ExecutionContext()
+        context.set_data(dataset)
+
+        def scale(df):
+            df["weight"] = df["weight"] * 2
+            return df
+
+        result = context.transform(scale)
+        assert context.data is result
+        assert context.version == 2
+        np.testing.assert_allclose(result["weight"], dataset["weight"] * 2)
+        assert dataset["weight"].iloc[0] == result["weight"].iloc[0] / 2
+
+    def test_pipeline_stages_share_context(self, dataset, tmp_path):
+        """Stages should pass data by reference without serializing it."""
+        path = tmp_path / "data.parquet"
+        dataset.to_parquet(path)
+        plan = PlanSpec(stages=[
+            PlanStage(stage_id="extract", stage_type=StageType.EXTRACTION, name="Extract",
+                      config={"dataset_path": str(path), "columns": ["age", "weight"],
+                              "filters": [["group", "=", "B"]]}),
+            PlanStage(stage_id="transform", stage_type=StageType.TRANSFORM, name="Transform",
+                      config={"transformations": [{"type": "standardize", "columns": ["age"]}]},
+                      depends_on=["extract"]),
+            PlanStage(stage_id="validate", stage_type=StageType.VALIDATION, name="Validate",
+                      config={"validations": [{"type": "check_sample_size", "min_n": 30}]},
+                      depends_on=["transform"]),
+        ])
+        request = ExecutionRequest(plan_id="p1", job_id="j1", plan_spec=plan,
+                                   constraints={"maxRows": 100})
+        context = ExecutionContext()
+
+        result = AgenticPipeline(output_dir=str(tmp_path / "out")).execute(request, context)
+
+        assert result.success, result.stage_results
+        assert context.columns == ["age", "weight"]
+        assert context.row_count == 100
+        assert context.to_pandas()["age"].mean() == pytest.approx(0.0, abs=1e-9)
+        assert "_extracted_data" not in request.config_overrides
+
+    @pytest.mark.skipif(not DUCKDB_AVAILABLE, reason="duckdb not installed")
+    def test_sql_extraction_keeps_arrow(self, dataset, tmp_path):
+        """SQL extraction should run in DuckDB and hold the Arrow result."""
+        path = tmp_path / "data.csv"
+        dataset.rename(columns={"group": "arm"}).to_csv(path, index=False)
+        plan = PlanSpec(stages=[
+            PlanStage(stage_id="extract", stage_type=StageType.EXTRACTION, name="Extract",
+                      config={"dataset_path": str(path),
+                              "aggregations": [["count", "*"], ["avg", "weight"]],
+                              "group_by": ["arm"]}),
+        ])
+        request = ExecutionRequest(plan_id="p2", job_id="j2", plan_spec=plan)
+        context = ExecutionContext()
+
+        result = AgenticPipeline(output_dir=str(tmp_path / "out")).execute(request, context)
+
+        assert result.success, result.stage_results
+        assert not isinstance(context.data, pd.DataFrame)
+        assert context.columns == ["arm", "count_all", "avg_weight"]
+        assert sorted(context.to_pandas()["count_all"]) == sorted(dataset["group"].value_counts())
@@ -0,0 +1,74 @@
+"""
+Tests for QueryEngine - DuckDB execution of safe queries over dataset files.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from ..query_engine import QueryEngine, DUCKDB_AVAILABLE
+from ..safe_query import SafeQueryBuilder, QueryValidationError
+
+pytestmark = pytest.mark.skipif(not DUCKDB_AVAILABLE, reason="duckdb not installed")
+
+
+@pytest.fixture
+def patients(tmp_path):
+    """Patients table written as Parquet and CSV."""
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({
+        "id": range(1000),
+        "age": rng.integers(20, 80, 1000),
+        "sex": rng.choice(["F", "M"], 1000),
+    })
+    df.to_parquet(tmp_path / "patients.parquet", index=False)
+    df.to_csv(tmp_path / "patients.csv", index=False)
+    return df
+
+
+class TestQueryEngine:
+    """Tests for query execution, limits and file access restrictions."""
+
+    @pytest.mark.parametrize("ext", ["parquet", "csv"])
+    def test_aggregate_matches_pandas(self, patients, tmp_path, ext):
+        """Grouped aggregates should match pandas."""
+        with QueryEngine() as engine:
+            engine.register("patients", str(tmp_path / f"patients.{ext}"))
+            table = engine.aggregate(
+                "patients", [("count", "*"), ("avg", "age")],
+                group_by=["sex"], where="age >= $1", params=[40]
+            )
+
+        result = table.to_pandas().sort_values("sex").reset_index(drop=True)
+        adults = patients[patients["age"] >= 40].groupby("sex")["age"]
+        assert result["count_all"].tolist() == adults.count().tolist()
+        np.testing.assert_allclose(result["avg_age"], adults.mean().to_numpy())
+
+    def test_row_limit_enforced(self, patients, tmp_path):
+        """Results should never exceed the row limit, even with a subquery LIMIT."""
+        with QueryEngine(SafeQueryBuilder(max_rows=50)) as engine:
+            engine.register("patients", str(tmp_path / "patients.parquet"))
+            assert engine.select("patients", ["id", "age"]).num_rows == 50
+            table = engine.execute(
+                "SELECT * FROM patients WHERE id IN (SELECT id FROM patients LIMIT 500)"
+            )
+            assert table.num_rows == 50
+
+    def test_unregistered_files_not_readable(self, patients, tmp_path):
+        """Queries should only see registered datasets."""
+        with QueryEngine() as engine:
+            engine.register("patients", str(tmp_path / "patients.parquet"))
+            with pytest.raises(Exception, match="(?i)permission"):
+                engine.execute(f"SELECT * FROM read_csv_auto('{tmp_path / 'patients.csv'}')")
+
+    def test_invalid_queries_rejected(self, patients, tmp_path):
+        """Validation and identifier checks should apply before execution."""
+        with QueryEngine() as engine:
+            engine.register("patients", str(tmp_path / "patients.parquet"))
+            with pytest.raises(QueryValidationError):
+                engine.execute("SELECT 1; SELECT 2")
+            with pytest.raises(QueryValidationError):
+                engine.execute("DELETE FROM patients")
+            with pytest.raises(QueryValidationError):
+                engine.select("patients", ["age; DROP TABLE patients"])
+            with pytest.raises(QueryValidationError):
+                engine.register("bad name", str(tmp_path / "patients.parquet"))
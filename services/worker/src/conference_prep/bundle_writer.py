@@ -0,0 +1,449 @@
+"""
+Bundle Writer Module
+
+Streaming ZIP writer for conference and archive bundles:
+- Members are compressed concurrently in a thread pool (zlib releases the
+  GIL), each in a single streaming pass that also computes CRC-32 and
+  SHA-256
+- Already-compressed formats (PNG, PDF, Parquet, Office files, ...) are
+  stored without recompression
+- Members are written to the archive in the order they were added, as
+  soon as each is ready; the bundle's own SHA-256 is computed while it is
+  written, so it is never re-read
+- Optional content-addressed store: compressed payloads are kept by
+  SHA-256, so identical files in later bundles are not compressed again
+
+The archive layout (local headers, ZIP64 extras, central directory) is
+produced by zipfile; only the member payloads are prepared here.
+
+Usage:
+    with BundleWriter(bundle_path, store_dir=store) as writer:
+        writer.add_bytes(manifest_json, "manifest.json")
+        writer.add_file(poster_path, "poster.pdf")
+    print(writer.sha256)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
+
+try:
+    from ..utils.file_hash import file_sha256
+except ImportError:
+    from utils.file_hash import file_sha256
+
+
+# ============ Constants ============
+
+# Formats that are already compressed; deflating them only costs time
+STORED_SUFFIXES = frozenset({
+    ".pdf", ".png", ".jpg", ".jpeg", ".gif", ".webp", ".tif", ".tiff",
+    ".parquet", ".zip", ".gz", ".bz2", ".xz", ".zst",
+    ".pptx", ".docx", ".xlsx", ".mp3", ".mp4",
+})
+
+CHUNK_BYTES = 1024 * 1024
+
+# zlib's default level (what zipfile uses for ZIP_DEFLATED)
+DEFAULT_COMPRESSLEVEL = 6
+
+# Compressed payloads up to this size stay in memory until written
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+
+# ============ Data Classes ============
+
+@dataclass
+class BundleMember:
+    """Metadata for a member written to the bundle."""
+    arcname: str
+    size_bytes: int
+    compress_size: int
+    sha256_hash: str
+    stored: bool
+    reused: bool = False
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "arcname": self.arcname,
+            "size_bytes": self.size_bytes,
+            "compress_size": self.compress_size,
+            "sha256_hash": self.sha256_hash,
+            "stored": self.stored,
+            "reused": self.reused,
+        }
+
+
+@dataclass
+class _Payload:
+    """Encoded member data, ready to be copied into the archive."""
+    crc: int
+    size: int
+    sha256: str
+    compress_type: int
+    compress_size: int
+    source: Union[Path, BinaryIO]
+    reused: bool = False
+
+
+class _HashingWriter:
+    """Write-only file wrapper that hashes everything written through it."""
+
+    def __init__(self, fileobj: BinaryIO):
+        self._fileobj = fileobj
+        self._sha256 = hashlib.sha256()
+        self._offset = 0
+
+    def write(self, data: bytes) -> int:
+        self._sha256.update(data)
+        self._offset += len(data)
+        return self._fileobj.write(data)
+
+    def tell(self) -> int:
+        return self._offset
+
+    def flush(self) -> None:
+        self._fileobj.flush()
+
+    def hexdigest(self) -> str:
+        return self._sha256.hexdigest()
+
+
+class _PrecompressedZipFile(zipfile.ZipFile):
+    """
+    ZipFile that can append members whose compressed bytes already exist.
+
+    ``ZipFile.open(zinfo, "w")`` always compresses what it is given, so
+    payloads deflated ahead of time (or reused from the store) are added by
+    ``write_precompressed`` instead. It does the same bookkeeping as
+    ``ZipFile.mkdir``.
+    """
+
+    def write_precompressed(self, zinfo: zipfile.ZipInfo, data: BinaryIO) -> None:
+        """
+        Append a member whose ``CRC``, sizes and compression are already set on ``zinfo``.
+
+        Args:
+            zinfo: Member info with final CRC, file_size and compress_size
+            data: Compressed payload, read from its current position
+        """
+        # Private zipfile state used here: _lock, _writing, _writecheck,
+        # _didModify, _seekable, fp, start_dir, filelist and NameToInfo
+        with self._lock:
+            if self._writing:
+                raise ValueError("Can't write to ZIP archive while an open writing handle exists")
+            self._writecheck(zinfo)
+            self._didModify = True
+            if self._seekable:
+                self.fp.seek(self.start_dir)
+            # Sizes are known up front, so the local header is final and written once
+            zinfo.header_offset = self.fp.tell()
+            self.fp.write(zinfo.FileHeader())
+            shutil.copyfileobj(data, self.fp, CHUNK_BYTES)
+            self.start_dir = self.fp.tell()
+            self.filelist.append(zinfo)
+            self.NameToInfo[zinfo.filename] = zinfo
+
+
+# ============ Encoding ============
+
+def _encode(source: Path, compresslevel: int, out: Optional[BinaryIO]) -> Tuple[int, int, str, int]:
+    """
+    Stream a file once, computing CRC-32, size and SHA-256.
+
+    With ``out``, the raw-deflate stream (as zipfile writes it) is written
+    there and its size returned; otherwise the compressed size is 0.
+    """
+    crc = 0
+    size = 0
+    sha256 = hashlib.sha256()
+    compressor = None
+    if out is not None:
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -15)
+
+    with open(source, "rb") as f:
+        while chunk := f.read(CHUNK_BYTES):
+            crc = zlib.crc32(chunk, crc)
+            sha256.update(chunk)
+            size += len(chunk)
+            if compressor is not None:
+                out.write(compressor.compress(chunk))
+
+    compress_size = 0
+    if compressor is not None:
+        out.write(compressor.flush())
+        compress_size = out.tell()
+    return crc, size, sha256.hexdigest(), compress_size
+
+
+# ============ Writer ============
+
+class BundleWriter:
+    """
+    ZIP bundle writer with parallel compression and optional dedup store.
+
+    Members are prepared as soon as they are added; ``close`` writes them
+    in order while later members are still being compressed.
+    """
+
+    def __init__(
+        self,
+        bundle_path: Path,
+        compresslevel: int = DEFAULT_COMPRESSLEVEL,
+        max_workers: Optional[int] = None,
+        store_dir: Optional[Path] = None,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            bundle_path: Output ZIP path (overwritten)
+            compresslevel: zlib level for deflated members
+            max_workers: Compression threads (default: min(4, cpu_count))
+            store_dir: Content-addressed payload store shared across bundles
+        """
+        self.bundle_path = Path(bundle_path)
+        self.compresslevel = compresslevel
+        self.store_dir = Path(store_dir) if store_dir else None
+        self.members: List[BundleMember] = []
+        self.sha256: Optional[str] = None
+        self._pending: List[Tuple[str, Optional[Path], Future]] = []
+        self._names: set = set()
+        self._digest_locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers or min(4, os.cpu_count() or 1))
+        self._closed = False
+
+    def __enter__(self) -> "BundleWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _check_name(self, arcname: str) -> None:
+        if self._closed:
+            raise ValueError("Bundle already closed")
+        if arcname in self._names:
+            raise ValueError(f"Duplicate bundle member: {arcname}")
+        self._names.add(arcname)
+
+    def add_file(self, path: Path, arcname: Optional[str] = None, compress: Optional[bool] = None) -> None:
+        """
+        Queue a file for the bundle.
+
+        Args:
+            path: File to add
+            arcname: Name inside the bundle (default: file name)
+            compress: Force deflate (True) or store (False); by default
+                formats in STORED_SUFFIXES are stored
+        """
+        path = Path(path)
+        arcname = arcname or path.name
+        self._check_name(arcname)
+        if compress is None:
+            compress = path.suffix.lower() not in STORED_SUFFIXES
+        future = self._pool.submit(self._prepare_file, path, compress)
+        self._pending.append((arcname, path, future))
+
+    def add_bytes(self, data: bytes, arcname: str) -> None:
+        """Queue in-memory content (e.g. a manifest) as a deflated member."""
+        self._check_name(arcname)
+        future = self._pool.submit(self._prepare_bytes, data)
+        self._pending.append((arcname, None, future))
+
+    def _prepare_bytes(self, data: bytes) -> _Payload:
+        compressor = zlib.compressobj(self.compresslevel, zlib.DEFLATED, -15)
+        compressed = compressor.compress(data) + compressor.flush()
+        out = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+        out.write(compressed)
+        return _Payload(
+            crc=zlib.crc32(data),
+            size=len(data),
+            sha256=hashlib.sha256(data).hexdigest(),
+            compress_type=zipfile.ZIP_DEFLATED,
+            compress_size=len(compressed),
+            source=out,
+        )
+
+    def _prepare_file(self, path: Path, compress: bool) -> _Payload:
+        if self.store_dir is None:
+            out = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) if compress else None
+            crc, size, sha256, compress_size = _encode(path, self.compresslevel, out)
+            return self._payload(path, crc, size, sha256, compress_size, out)
+
+        # Identical content (in this or another bundle) is encoded once
+        digest = file_sha256(path)
+        with self._digest_lock(digest):
+            payload = self._load_stored(path, digest, compress)
+            if payload is None:
+                payload = self._encode_into_store(path, compress)
+            return payload
+
+    def _payload(self, path: Path, crc: int, size: int, sha256: str,
+                 compress_size: int, out: Optional[BinaryIO], reused: bool = False) -> _Payload:
+        # Store members that deflate does not shrink
+        if out is None or compress_size >= size:
+            if out is not None:
+                out.close()
+            return _Payload(crc, size, sha256, zipfile.ZIP_STORED, size, path, reused)
+        return _Payload(crc, size, sha256, zipfile.ZIP_DEFLATED, compress_size, out, reused)
+
+    def _digest_lock(self, digest: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._digest_locks.setdefault(digest, threading.Lock())
+
+    def _store_paths(self, digest: str, compress: bool) -> Tuple[Path, Path]:
+        tag = f"deflate{self.compresslevel}" if compress else "stored"
+        base = self.store_dir / digest[:2] / f"{digest}.{tag}"
+        return base.with_name(base.name + ".json"), base.with_name(base.name + ".bin")
+
+    def _load_stored(self, path: Path, digest: str, compress: bool) -> Optional[_Payload]:
+        meta_path, blob_path = self._store_paths(digest, compress)
+        try:
+            meta = json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if meta.get("size") != path.stat().st_size:
+            return None
+        if meta["stored"]:
+            return _Payload(meta["crc"], meta["size"], digest, zipfile.ZIP_STORED,
+                            meta["size"], path, reused=True)
+        if not blob_path.exists():
+            return None
+        return _Payload(meta["crc"], meta["size"], digest, zipfile.ZIP_DEFLATED,
+                        meta["compress_size"], blob_path, reused=True)
+
+    def _encode_into_store(self, path: Path, compress: bool) -> _Payload:
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        out = None
+        if compress:
+            out = tempfile.NamedTemporaryFile(dir=self.store_dir, suffix=".tmp", delete=False)
+        try:
+            crc, size, sha256, compress_size = _encode(path, self.compresslevel, out)
+        except Exception:
+            if out is not None:
+                out.close()
+                os.unlink(out.name)
+            raise
+
+        payload = self._payload(path, crc, size, sha256, compress_size, out)
+        meta_path, blob_path = self._store_paths(sha256, compress)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        if out is not None:
+            out.close()
+            if payload.compress_type == zipfile.ZIP_DEFLATED:
+                os.replace(out.name, blob_path)
+                payload.source = blob_path
+            else:
+                os.unlink(out.name)
+
+        meta = {
+            "crc": crc,
+            "size": size,
+            "compress_size": payload.compress_size,
+            "stored": payload.compress_type == zipfile.ZIP_STORED,
+        }
+        tmp_meta = meta_path.with_name(f"{meta_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_meta.write_text(json.dumps(meta))
+        os.replace(tmp_meta, meta_path)
+        return payload
+
+    def _write_member(self, zf: _PrecompressedZipFile, arcname: str, source_path: Optional[Path],
+                      payload: _Payload) -> None:
+        if source_path is not None:
+            zinfo = zipfile.ZipInfo.from_file(source_path, arcname, strict_timestamps=False)
+        else:
+            zinfo = zipfile.ZipInfo(arcname, date_time=time.localtime(time.time())[:6])
+            zinfo.external_attr = 0o600 << 16
+        zinfo.compress_type = payload.compress_type
+        zinfo.CRC = payload.crc
+        zinfo.file_size = payload.size
+        zinfo.compress_size = payload.compress_size
+
+        if isinstance(payload.source, Path):
+            with open(payload.source, "rb") as f:
+                zf.write_precompressed(zinfo, f)
+        else:
+            payload.source.seek(0)
+            zf.write_precompressed(zinfo, payload.source)
+            payload.source.close()
+
+        self.members.append(BundleMember(
+            arcname=arcname,
+            size_bytes=payload.size,
+            compress_size=payload.compress_size,
+            sha256_hash=payload.sha256,
+            stored=payload.compress_type == zipfile.ZIP_STORED,
+            reused=payload.reused,
+        ))
+
+    def close(self) -> str:
+        """
+        Write all queued members and finish the archive.
+
+        Returns:
+            SHA-256 hex digest of the bundle file
+        """
+        if self._closed:
+            return self.sha256
+        self._closed = True
+        try:
+            with open(self.bundle_path, "wb") as raw:
+                out = _HashingWriter(raw)
+                with _PrecompressedZipFile(out, "w") as zf:
+                    for arcname, source_path, future in self._pending:
+                        self._write_member(zf, arcname, source_path, future.result())
+        except BaseException:
+            self._discard()
+            raise
+        finally:
+            self._pool.shutdown(wait=True)
+        self.sha256 = out.hexdigest()
+        return self.sha256
+
+    def abort(self) -> None:
+        """Discard queued members and any partial bundle."""
+        self._closed = True
+        self._discard()
+
+    def _discard(self) -> None:
+        for future in (f for _, _, f in self._pending):
+            future.cancel()
+        self._pool.shutdown(wait=True)
+        for _, _, future in self._pending:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                source = future.result().source
+                if not isinstance(source, Path):
+                    source.close()
+        self.bundle_path.unlink(missing_ok=True)
+
+
+def hash_bundle_member(zf: zipfile.ZipFile, arcname: str) -> Tuple[str, int]:
+    """
+    Stream a bundle member, returning its SHA-256 and uncompressed size.
+
+    zipfile also checks the member's CRC-32 while it is read.
+    """
+    sha256 = hashlib.sha256()
+    size = 0
+    with zf.open(arcname) as f:
+        while chunk := f.read(CHUNK_BYTES):
+            sha256.update(chunk)
+            size += len(chunk)
+    return sha256.hexdigest(), size
@@ -11,7 +11,6 @@ Output: conference_submission_bundle_<run_id>.zip
 
 from __future__ import annotations
 
-import hashlib
 import json
 import os
 import zipfile
@@ -20,6 +19,12 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:
+    from ..utils.file_hash import sha256_file
+except ImportError:
+    from utils.file_hash import sha256_file
+
+from .bundle_writer import BundleWriter, hash_bundle_member
 from .generate_materials import (
     MaterialGenerationResult,
     MaterialType,
@@ -112,6 +117,7 @@ class ExportBundleInput:
     slide_content: Optional[SlideContent] = None
     guidelines: Optional[Dict[str, Any]] = None
     poster_size: tuple = (48, 36)
+    dedup_store_dir: Optional[Path] = None
 
     def get_output_dir(self) -> Path:
         """Get output directory, creating if needed."""
@@ -144,15 +150,6 @@ class ExportBundleResult:
 
 # ============ Utility Functions ============
 
-def _compute_file_hash(file_path: Path) -> str:
-    """Compute SHA256 hash of a file."""
-    sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256_hash.update(chunk)
-    return sha256_hash.hexdigest()
-
-
 def _get_content_type(filename: str) -> str:
     """Get MIME content type for a filename."""
     ext = Path(filename).suffix.lower()
@@ -301,19 +298,18 @@ def create_conference_bundle(
     bundle_path = output_dir / bundle_filename
 
     try:
-        with zipfile.ZipFile(bundle_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        # Members are compressed in parallel; the bundle hash is computed while writing
+        with BundleWriter(bundle_path, store_dir=input_params.dedup_store_dir) as writer:
             # Add manifest
-            zf.write(manifest_path, "manifest.json")
+            writer.add_file(manifest_path, "manifest.json")
 
             # Add generated files
             for bundle_file in bundle_files:
                 file_path = output_dir / bundle_file.filename
                 if file_path.exists():
-                    zf.write(file_path, bundle_file.relative_path)
+                    writer.add_file(file_path, bundle_file.relative_path)
 
-        # Compute bundle hash
-        bundle_hash = _compute_file_hash(bundle_path)
-        manifest.bundle_sha256 = bundle_hash
+        manifest.bundle_sha256 = writer.sha256
 
         # Update manifest with bundle hash
         with open(manifest_path, "w") as f:
@@ -387,12 +383,8 @@ def validate_bundle(bundle_path: Path) -> Dict[str, Any]:
                     result["errors"].append(f"File missing: {relative_path}")
                     continue
 
-                # Extract and verify
-                with zf.open(relative_path) as f:
-                    content = f.read()
-
-                actual_hash = hashlib.sha256(content).hexdigest()
-                actual_size = len(content)
+                # Stream and verify
+                actual_hash, actual_size = hash_bundle_member(zf, relative_path)
 
                 if actual_hash != expected_hash:
                     result["errors"].append(
@@ -409,7 +401,8 @@ def validate_bundle(bundle_path: Path) -> Dict[str, Any]:
 
             # Check bundle hash
             if manifest_data.get("bundle_sha256"):
-                actual_bundle_hash = _compute_file_hash(bundle_path)
+                # Verification reads the bytes; never trust the hash cache here
+                actual_bundle_hash = sha256_file(bundle_path)
                 # Note: Bundle hash may differ due to re-zipping; this is a warning only
                 if actual_bundle_hash != manifest_data["bundle_sha256"]:
                     result["warnings"].append(
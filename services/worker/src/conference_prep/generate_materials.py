@@ -12,7 +12,6 @@ Output directory: /data/artifacts/conference/<run_id>/
 
 from __future__ import annotations
 
-import hashlib
 import os
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -20,6 +19,11 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    from ..utils.file_hash import file_sha256
+except ImportError:
+    from utils.file_hash import file_sha256
+
 # reportlab imports for PDF generation
 try:
     from reportlab.lib import colors
@@ -617,12 +621,8 @@ def generate_slides_pptx(
 # ============ Utility Functions ============
 
 def _compute_file_hash(file_path: Path) -> str:
-    """Compute SHA256 hash of a file."""
-    sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256_hash.update(chunk)
-    return sha256_hash.hexdigest()
+    """Compute SHA256 hash of a file (cached by file identity)."""
+    return file_sha256(file_path)
 
 
 def generate_material(
@@ -62,6 +62,11 @@ from .nlm_client import (
     lookup_mesh_terms,
 )
 
+from .mesh_store import (
+    MeSHDiskCache,
+    MeSHDescriptorIndex,
+)
+
 from .cell_parser import (
     detect_narrative_columns,
     identify_extraction_targets,
@@ -123,6 +128,8 @@ __all__ = [
     "get_nlm_client",
     "lookup_mesh_term",
     "lookup_mesh_terms",
+    "MeSHDiskCache",
+    "MeSHDescriptorIndex",
     # Cell Parser (DataFrame-level)
     "detect_narrative_columns",
     "identify_extraction_targets",
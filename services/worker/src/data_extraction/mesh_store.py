@@ -0,0 +1,241 @@
+"""
+MeSH Store - Persistent lookup cache and offline descriptor index for NLMClient.
+
+This module provides:
+- MeSHDiskCache: SQLite-backed term cache shared by every worker process on
+  a host (WAL mode, so concurrent readers never block on a writer)
+- MeSHDescriptorIndex: in-memory index over a local MeSH descriptor dump
+  (NLM's descYYYY.xml, optionally gzipped) for zero-network lookups
+
+Both store plain field dicts (the MeSHTermResult fields minus original_term
+and source) so they stay independent of the client.
+
+MeSH downloads: https://www.nlm.nih.gov/databases/download/mesh.html
+"""
+
+import bisect
+import gzip
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from xml.etree import ElementTree
+
+logger = logging.getLogger(__name__)
+
+# Limits applied to every stored descriptor, matching the NCBI parser
+MAX_SCOPE_NOTE_CHARS = 500
+MAX_SYNONYMS = 10
+
+
+def normalize_term(term: str) -> str:
+    """Normalize a term for cache keys and index lookups."""
+    return " ".join(term.lower().split())
+
+
+def descriptor_fields(descriptor: ElementTree.Element) -> Dict[str, Any]:
+    """
+    Extract MeSH fields from a DescriptorRecord element.
+
+    Returns a dict with mesh_id, mesh_label, tree_numbers, scope_note and
+    synonyms (all entry terms other than the preferred label).
+    """
+    mesh_id_elem = descriptor.find("DescriptorUI")
+    name_elem = descriptor.find("DescriptorName/String")
+    mesh_label = name_elem.text if name_elem is not None else None
+
+    tree_numbers = [t.text for t in descriptor.findall(".//TreeNumber") if t.text]
+
+    scope_note_elem = descriptor.find(".//ScopeNote")
+    scope_note = scope_note_elem.text.strip() if scope_note_elem is not None and scope_note_elem.text else None
+
+    synonyms = []
+    for term_elem in descriptor.findall(".//Term/String"):
+        if term_elem.text and term_elem.text != mesh_label and term_elem.text not in synonyms:
+            synonyms.append(term_elem.text)
+
+    return {
+        "mesh_id": mesh_id_elem.text if mesh_id_elem is not None else None,
+        "mesh_label": mesh_label,
+        "tree_numbers": tree_numbers,
+        "scope_note": scope_note,
+        "synonyms": synonyms,
+    }
+
+
+class MeSHDiskCache:
+    """
+    SQLite cache of MeSH lookups keyed by normalized term.
+
+    Safe to share between threads of one process and between processes on
+    one host. Entries older than ``max_age_days`` are treated as misses.
+
+    Usage:
+        cache = MeSHDiskCache("/var/cache/researchflow/mesh.sqlite")
+        cache.put_many({"diabetes": {...}})
+        fields = cache.get_many(["diabetes", "asthma"])
+    """
+
+    def __init__(self, path: str, max_age_days: Optional[float] = 90):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_age_days = max_age_days
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS mesh_terms ("
+            " term TEXT PRIMARY KEY,"
+            " payload TEXT NOT NULL,"
+            " updated_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _min_updated_at(self) -> float:
+        if self.max_age_days is None:
+            return 0.0
+        return time.time() - self.max_age_days * 86400
+
+    def get_many(self, terms: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch cached fields for many terms; missing terms are omitted."""
+        keys = list(dict.fromkeys(normalize_term(t) for t in terms))
+        found: Dict[str, Dict[str, Any]] = {}
+        min_updated = self._min_updated_at()
+
+        with self._lock:
+            # SQLite's default host parameter limit is 999
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT term, payload FROM mesh_terms"
+                    f" WHERE term IN ({placeholders}) AND updated_at >= ?",
+                    (*chunk, min_updated),
+                ).fetchall()
+                for term, payload in rows:
+                    found[term] = json.loads(payload)
+        return found
+
+    def get(self, term: str) -> Optional[Dict[str, Any]]:
+        """Fetch cached fields for one term."""
+        return self.get_many([term]).get(normalize_term(term))
+
+    def put_many(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Insert or replace cached fields for many terms in one transaction."""
+        if not entries:
+            return
+        now = time.time()
+        rows = [
+            (normalize_term(term), json.dumps(fields), now)
+            for term, fields in entries.items()
+        ]
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO mesh_terms (term, payload, updated_at)"
+                    " VALUES (?, ?, ?)",
+                    rows,
+                )
+
+    def put(self, term: str, fields: Dict[str, Any]) -> None:
+        """Insert or replace cached fields for one term."""
+        self.put_many({term: fields})
+
+    def clear(self) -> None:
+        """Delete every cached entry."""
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM mesh_terms")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM mesh_terms").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class MeSHDescriptorIndex:
+    """
+    In-memory MeSH index built from a local descriptor dump.
+
+    Every preferred label and entry term maps to its descriptor, so exact
+    lookups are a dict hit; a sorted term list supports prefix search.
+
+    Usage:
+        index = MeSHDescriptorIndex.from_xml("desc2026.xml.gz")
+        fields, matched_term = index.lookup("heart attack")
+    """
+
+    def __init__(self):
+        self._descriptors: List[Dict[str, Any]] = []
+        self._by_term: Dict[str, int] = {}
+        self._sorted_terms: List[str] = []
+
+    @classmethod
+    def from_xml(cls, path: str) -> "MeSHDescriptorIndex":
+        """Load a MeSH descriptor XML dump (``.xml`` or ``.xml.gz``)."""
+        index = cls()
+        index.add_descriptors(_iter_descriptor_records(Path(path)))
+        logger.info(
+            f"Loaded {len(index)} MeSH descriptors ({len(index._by_term)} terms) from {path}"
+        )
+        return index
+
+    def add_descriptors(self, descriptors: Iterable[Dict[str, Any]]) -> None:
+        """Add descriptor field dicts (as produced by ``descriptor_fields``)."""
+        for fields in descriptors:
+            position = len(self._descriptors)
+            self._descriptors.append(fields)
+            names = [fields.get("mesh_label")] + list(fields.get("synonyms", []))
+            for name in names:
+                if name:
+                    # Preferred labels win over another descriptor's entry term
+                    self._by_term.setdefault(normalize_term(name), position)
+        self._sorted_terms = sorted(self._by_term)
+
+    def __len__(self) -> int:
+        return len(self._descriptors)
+
+    def lookup(self, term: str) -> Optional[Dict[str, Any]]:
+        """Exact (normalized) lookup of a label or entry term."""
+        position = self._by_term.get(normalize_term(term))
+        return self._descriptors[position] if position is not None else None
+
+    def search_prefix(self, prefix: str, limit: int = 10) -> List[Tuple[str, Dict[str, Any]]]:
+        """Terms starting with ``prefix`` and their descriptors, in sorted order."""
+        key = normalize_term(prefix)
+        start = bisect.bisect_left(self._sorted_terms, key)
+        matches = []
+        for term in self._sorted_terms[start:]:
+            if not term.startswith(key) or len(matches) >= limit:
+                break
+            matches.append((term, self._descriptors[self._by_term[term]]))
+        return matches
+
+
+def _iter_descriptor_records(path: Path) -> Iterator[Dict[str, Any]]:
+    """Stream DescriptorRecord fields from a dump without holding the whole tree."""
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rb") as f:
+        for _, elem in ElementTree.iterparse(f, events=("end",)):
+            if elem.tag != "DescriptorRecord":
+                continue
+            fields = descriptor_fields(elem)
+            if fields["scope_note"]:
+                fields["scope_note"] = fields["scope_note"][:MAX_SCOPE_NOTE_CHARS]
+            yield fields
+            elem.clear()
+
+
+__all__ = [
+    "MeSHDiskCache",
+    "MeSHDescriptorIndex",
+    "descriptor_fields",
+    "normalize_term",
+]
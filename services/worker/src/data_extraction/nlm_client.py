@@ -8,6 +8,9 @@ This module provides direct access to NLM's NCBI E-utilities API for:
 
 Features:
 - Local LRU caching to reduce API calls
+- Optional persistent SQLite cache of matched terms shared across worker processes
+- Batched efetch (many UIDs per request) for multi-term lookups
+- Offline mode backed by a local MeSH descriptor dump (no network calls)
 - Retry logic with exponential backoff
 - Rate limiting compliance (NCBI allows 3 req/sec without key, 10 with key)
 - Fallback for when orchestrator is unavailable
@@ -28,6 +31,15 @@ from xml.etree import ElementTree
 
 import httpx
 
+from .mesh_store import (
+    MAX_SCOPE_NOTE_CHARS,
+    MAX_SYNONYMS,
+    MeSHDescriptorIndex,
+    MeSHDiskCache,
+    descriptor_fields,
+    normalize_term,
+)
+
 logger = logging.getLogger(__name__)
 
 # NCBI E-utilities base URL
@@ -46,6 +58,29 @@ REQUEST_TIMEOUT = int(os.getenv("NLM_REQUEST_TIMEOUT", "30"))
 MAX_RETRIES = int(os.getenv("NLM_MAX_RETRIES", "3"))
 RETRY_BACKOFF = 1.5
 
+# Persistent cache and offline mode
+NLM_CACHE_PATH = os.getenv("NLM_CACHE_PATH", "")
+NLM_MESH_DUMP = os.getenv("NLM_MESH_DUMP", "")
+NLM_OFFLINE = os.getenv("NLM_OFFLINE", "false").lower() == "true"
+
+# UIDs per efetch request in batched lookups
+EFETCH_BATCH_SIZE = int(os.getenv("NLM_EFETCH_BATCH_SIZE", "200"))
+
+# Entrez MeSH UID prefix -> MeSH unique ID letter (68009203 -> D009203)
+_UID_PREFIXES = {"68": "D", "67": "C", "66": "Q"}
+
+
+def _uid_to_mesh_id(uid: str) -> Optional[str]:
+    """Convert an Entrez MeSH UID to its MeSH unique ID, if recognizable."""
+    letter = _UID_PREFIXES.get(uid[:2])
+    return f"{letter}{uid[2:]}" if letter and len(uid) > 2 else None
+
+
+@lru_cache(maxsize=4)
+def _load_descriptor_index(path: str) -> MeSHDescriptorIndex:
+    """Load (once per process) the offline MeSH index for a dump path."""
+    return MeSHDescriptorIndex.from_xml(path)
+
 
 @dataclass
 class MeSHTermResult:
@@ -58,7 +93,7 @@ class MeSHTermResult:
     synonyms: List[str] = field(default_factory=list)
     confidence: float = 0.0
     matched: bool = False
-    source: str = "ncbi"  # 'ncbi' or 'cache'
+    source: str = "ncbi"  # 'ncbi', 'cache' or 'offline'
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -123,6 +158,9 @@ class NLMClient:
         email: Optional[str] = None,
         cache_size: int = 1000,
         enable_cache: bool = True,
+        cache_path: Optional[str] = None,
+        mesh_dump_path: Optional[str] = None,
+        offline: Optional[bool] = None,
     ):
         """
         Initialize NLM client.
@@ -133,19 +171,32 @@ class NLMClient:
             email: Contact email for NCBI
             cache_size: Maximum number of cached terms
             enable_cache: Enable/disable caching
+            cache_path: SQLite file for a persistent cache shared across
+                processes (default NLM_CACHE_PATH; empty disables)
+            mesh_dump_path: Local MeSH descriptor dump consulted before the
+                network (default NLM_MESH_DUMP; empty disables)
+            offline: Never call NCBI; terms not in the cache or dump are
+                unmatched (default NLM_OFFLINE)
         """
         self.api_key = api_key or NCBI_API_KEY
         self.tool_name = tool_name or NCBI_TOOL
         self.email = email or NCBI_EMAIL
         self.enable_cache = enable_cache
+        self.offline = NLM_OFFLINE if offline is None else offline
+        self.mesh_dump_path = mesh_dump_path if mesh_dump_path is not None else NLM_MESH_DUMP
         
         # Initialize cache
         self._cache: Dict[str, MeSHTermResult] = {}
         self._cache_size = cache_size
+        cache_path = cache_path if cache_path is not None else NLM_CACHE_PATH
+        self._disk_cache: Optional[MeSHDiskCache] = (
+            MeSHDiskCache(cache_path) if cache_path and enable_cache else None
+        )
         
         # Rate limiting
         self._last_request_time = 0.0
         self._rate_limit_delay = 0.1 if self.api_key else 0.35
+        self._rate_lock = asyncio.Lock()
         
         # Statistics
         self.stats = NLMClientStats()
@@ -164,6 +215,16 @@ class NLMClient:
         if self._client:
             await self._client.aclose()
             self._client = None
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+            self._disk_cache = None
+    
+    @property
+    def mesh_index(self) -> Optional[MeSHDescriptorIndex]:
+        """Offline MeSH index, loaded from the dump on first use."""
+        if not self.mesh_dump_path:
+            return None
+        return _load_descriptor_index(self.mesh_dump_path)
     
     def _get_base_params(self) -> Dict[str, str]:
         """Get base parameters for NCBI API calls."""
@@ -187,28 +248,60 @@ class NLMClient:
         key = self._cache_key(term)
         if key in self._cache:
             self.stats.cache_hits += 1
-            result = self._cache[key]
-            # Return copy with updated source
-            return MeSHTermResult(
-                original_term=term,
-                mesh_id=result.mesh_id,
-                mesh_label=result.mesh_label,
-                tree_numbers=result.tree_numbers.copy(),
-                scope_note=result.scope_note,
-                synonyms=result.synonyms.copy(),
-                confidence=result.confidence,
-                matched=result.matched,
-                source="cache",
-            )
+            return self._copy_result(self._cache[key], term, source="cache")
+        
+        if self._disk_cache is not None:
+            fields = self._disk_cache.get(term)
+            if fields is not None:
+                self.stats.cache_hits += 1
+                result = self._result_from_fields(term, fields, source="cache")
+                self._add_to_memory_cache(term, result)
+                return result
         
         self.stats.cache_misses += 1
         return None
     
+    @staticmethod
+    def _copy_result(result: MeSHTermResult, term: str, source: Optional[str] = None) -> MeSHTermResult:
+        """Copy a result for a (possibly differently cased) input term."""
+        return MeSHTermResult(
+            original_term=term,
+            mesh_id=result.mesh_id,
+            mesh_label=result.mesh_label,
+            tree_numbers=result.tree_numbers.copy(),
+            scope_note=result.scope_note,
+            synonyms=result.synonyms.copy(),
+            confidence=result.confidence,
+            matched=result.matched,
+            source=source or result.source,
+        )
+    
+    @staticmethod
+    def _result_fields(result: MeSHTermResult) -> Dict[str, Any]:
+        """Term-independent fields of a result, for the persistent cache."""
+        fields = result.to_dict()
+        del fields["original_term"], fields["source"]
+        return fields
+    
+    @staticmethod
+    def _result_from_fields(term: str, fields: Dict[str, Any], source: str) -> MeSHTermResult:
+        return MeSHTermResult(original_term=term, source=source, **fields)
+    
     def _add_to_cache(self, term: str, result: MeSHTermResult):
         """Add term result to cache."""
         if not self.enable_cache:
             return
         
+        self._add_to_memory_cache(term, result)
+        # Misses are not persisted: MeSH gains terms, and a stored miss would outlive them
+        if self._disk_cache is not None and result.matched:
+            self._disk_cache.put(term, self._result_fields(result))
+    
+    def _add_to_memory_cache(self, term: str, result: MeSHTermResult):
+        """Add term result to the in-process cache only."""
+        if not self.enable_cache:
+            return
+        
         key = self._cache_key(term)
         
         # Simple LRU: remove oldest if at capacity
@@ -218,13 +311,34 @@ class NLMClient:
         
         self._cache[key] = result
     
+    def _lookup_offline(self, term: str) -> Optional[MeSHTermResult]:
+        """Resolve a term from the local MeSH dump, if one is configured."""
+        index = self.mesh_index
+        if index is None:
+            return None
+        fields = index.lookup(term)
+        if fields is None:
+            return None
+        return MeSHTermResult(
+            original_term=term,
+            mesh_id=fields["mesh_id"],
+            mesh_label=fields["mesh_label"],
+            tree_numbers=list(fields["tree_numbers"]),
+            scope_note=fields["scope_note"],
+            synonyms=fields["synonyms"][:MAX_SYNONYMS],
+            confidence=self._calculate_confidence(term, fields["mesh_label"], fields["synonyms"]),
+            matched=True,
+            source="offline",
+        )
+    
     async def _rate_limit(self):
-        """Apply rate limiting between requests."""
-        now = time.time()
-        elapsed = now - self._last_request_time
-        if elapsed < self._rate_limit_delay:
-            await asyncio.sleep(self._rate_limit_delay - elapsed)
-        self._last_request_time = time.time()
+        """Apply rate limiting between requests (shared by concurrent tasks)."""
+        async with self._rate_lock:
+            now = time.time()
+            elapsed = now - self._last_request_time
+            if elapsed < self._rate_limit_delay:
+                await asyncio.sleep(self._rate_limit_delay - elapsed)
+            self._last_request_time = time.time()
     
     async def _request_with_retry(
         self,
@@ -301,24 +415,16 @@ class NLMClient:
         if cached:
             return cached
         
+        offline_result = self._lookup_offline(term)
+        if offline_result is not None:
+            self._add_to_memory_cache(term, offline_result)
+            return offline_result
+        if self.offline:
+            return MeSHTermResult(original_term=term, matched=False, source="offline")
+        
         try:
             # Step 1: Search MeSH database
-            search_params = {
-                **self._get_base_params(),
-                "db": "mesh",
-                "term": term,
-                "retmode": "json",
-                "retmax": 5,
-            }
-            
-            search_response = await self._request_with_retry(
-                "GET",
-                f"{EUTILS_BASE}/esearch.fcgi",
-                search_params,
-            )
-            search_data = search_response.json()
-            
-            id_list = search_data.get("esearchresult", {}).get("idlist", [])
+            id_list = await self._esearch_mesh(term)
             
             if not id_list:
                 # No match found
@@ -359,58 +465,91 @@ class NLMClient:
                 confidence=0.0,
             )
     
-    def _parse_mesh_xml(self, original_term: str, xml_text: str, mesh_uid: str) -> MeSHTermResult:
-        """Parse MeSH XML response into MeSHTermResult."""
+    async def _esearch_mesh(self, term: str) -> List[str]:
+        """Search the MeSH database for a term, returning Entrez UIDs."""
+        search_params = {
+            **self._get_base_params(),
+            "db": "mesh",
+            "term": term,
+            "retmode": "json",
+            "retmax": 5,
+        }
+        
+        search_response = await self._request_with_retry(
+            "GET",
+            f"{EUTILS_BASE}/esearch.fcgi",
+            search_params,
+        )
+        return search_response.json().get("esearchresult", {}).get("idlist", [])
+    
+    async def _efetch_mesh_batch(self, uids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch descriptor fields for many MeSH UIDs, EFETCH_BATCH_SIZE per request.
+        
+        Returns a map of UID -> descriptor fields. Records are matched to UIDs
+        by MeSH ID, falling back to response order.
+        """
+        fields_by_uid: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(uids), EFETCH_BATCH_SIZE):
+            chunk = uids[start:start + EFETCH_BATCH_SIZE]
+            # POST keeps long id lists out of the URL
+            response = await self._request_with_retry(
+                "POST",
+                f"{EUTILS_BASE}/efetch.fcgi",
+                {
+                    **self._get_base_params(),
+                    "db": "mesh",
+                    "id": ",".join(chunk),
+                    "retmode": "xml",
+                },
+            )
+            records = self._parse_mesh_records(response.text)
+            by_mesh_id = {r["mesh_id"]: r for r in records if r["mesh_id"]}
+            for i, uid in enumerate(chunk):
+                record = by_mesh_id.get(_uid_to_mesh_id(uid))
+                if record is None and len(records) == len(chunk):
+                    record = records[i]
+                if record is not None:
+                    fields_by_uid[uid] = record
+        return fields_by_uid
+    
+    def _parse_mesh_records(self, xml_text: str) -> List[Dict[str, Any]]:
+        """Parse every DescriptorRecord in an efetch response."""
         try:
             root = ElementTree.fromstring(xml_text)
-            
-            # Find the DescriptorRecord
-            descriptor = root.find(".//DescriptorRecord")
-            if descriptor is None:
-                return MeSHTermResult(original_term=original_term, matched=False)
-            
-            # Get DescriptorUI (MeSH ID)
-            mesh_id_elem = descriptor.find("DescriptorUI")
-            mesh_id = mesh_id_elem.text if mesh_id_elem is not None else f"D{mesh_uid}"
-            
-            # Get DescriptorName
-            name_elem = descriptor.find(".//DescriptorName/String")
-            mesh_label = name_elem.text if name_elem is not None else None
-            
-            # Get TreeNumberList
-            tree_numbers = []
-            for tree_num in descriptor.findall(".//TreeNumber"):
-                if tree_num.text:
-                    tree_numbers.append(tree_num.text)
-            
-            # Get ScopeNote
-            scope_note_elem = descriptor.find(".//ScopeNote")
-            scope_note = scope_note_elem.text if scope_note_elem is not None else None
-            
-            # Get synonyms from ConceptList
-            synonyms = []
-            for term_elem in descriptor.findall(".//Term/String"):
-                if term_elem.text and term_elem.text != mesh_label:
-                    synonyms.append(term_elem.text)
-            
-            # Calculate confidence based on match quality
-            confidence = self._calculate_confidence(original_term, mesh_label, synonyms)
-            
-            return MeSHTermResult(
-                original_term=original_term,
-                mesh_id=mesh_id,
-                mesh_label=mesh_label,
-                tree_numbers=tree_numbers,
-                scope_note=scope_note[:500] if scope_note else None,  # Truncate long notes
-                synonyms=synonyms[:10],  # Limit synonyms
-                confidence=confidence,
-                matched=True,
-                source="ncbi",
-            )
-            
         except ElementTree.ParseError as e:
             logger.error(f"Failed to parse MeSH XML: {e}")
+            return []
+        return [descriptor_fields(d) for d in root.iter("DescriptorRecord")]
+    
+    def _result_from_descriptor(
+        self,
+        original_term: str,
+        fields: Dict[str, Any],
+        mesh_uid: str,
+    ) -> MeSHTermResult:
+        """Build a matched result from descriptor fields."""
+        mesh_label = fields["mesh_label"]
+        synonyms = fields["synonyms"]
+        scope_note = fields["scope_note"]
+        return MeSHTermResult(
+            original_term=original_term,
+            mesh_id=fields["mesh_id"] or f"D{mesh_uid}",
+            mesh_label=mesh_label,
+            tree_numbers=fields["tree_numbers"],
+            scope_note=scope_note[:MAX_SCOPE_NOTE_CHARS] if scope_note else None,  # Truncate long notes
+            synonyms=synonyms[:MAX_SYNONYMS],  # Limit synonyms
+            confidence=self._calculate_confidence(original_term, mesh_label, synonyms),
+            matched=True,
+            source="ncbi",
+        )
+    
+    def _parse_mesh_xml(self, original_term: str, xml_text: str, mesh_uid: str) -> MeSHTermResult:
+        """Parse MeSH XML response into MeSHTermResult."""
+        records = self._parse_mesh_records(xml_text)
+        if not records:
             return MeSHTermResult(original_term=original_term, matched=False)
+        return self._result_from_descriptor(original_term, records[0], mesh_uid)
     
     def _calculate_confidence(
         self,
@@ -459,9 +598,14 @@ class NLMClient:
         """
         Look up multiple terms in the MeSH database.
         
+        Terms are resolved from the in-process cache, then the persistent
+        cache (one query for all terms), then the offline dump. Remaining
+        terms are searched concurrently and their descriptors fetched with
+        batched efetch calls.
+        
         Args:
             terms: List of medical terms to look up
-            max_concurrent: Maximum concurrent requests
+            max_concurrent: Maximum concurrent esearch requests
         
         Returns:
             List of MeSHTermResult in same order as input
@@ -481,25 +625,7 @@ class NLMClient:
                 unique_terms.append(term)
             term_indices.setdefault(normalized, []).append(i)
         
-        # Lookup unique terms with concurrency control
-        semaphore = asyncio.Semaphore(max_concurrent)
-        
-        async def lookup_with_semaphore(t: str) -> Tuple[str, MeSHTermResult]:
-            async with semaphore:
-                result = await self.lookup_mesh_term(t)
-                return t.lower().strip(), result
-        
-        tasks = [lookup_with_semaphore(t) for t in unique_terms]
-        lookup_results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Build result map
-        result_map: Dict[str, MeSHTermResult] = {}
-        for item in lookup_results:
-            if isinstance(item, Exception):
-                logger.error(f"Batch lookup error: {item}")
-                continue
-            normalized, result = item
-            result_map[normalized] = result
+        result_map = await self._resolve_terms(unique_terms, max_concurrent)
         
         # Reconstruct results in original order
         results = []
@@ -524,6 +650,105 @@ class NLMClient:
         
         return results
     
+    async def _resolve_terms(
+        self,
+        unique_terms: List[str],
+        max_concurrent: int,
+    ) -> Dict[str, MeSHTermResult]:
+        """Resolve distinct terms to results keyed by normalized term."""
+        result_map: Dict[str, MeSHTermResult] = {}
+        pending: List[str] = []
+        
+        # In-process cache
+        for term in unique_terms:
+            key = self._cache_key(term)
+            if self.enable_cache and key in self._cache:
+                result_map[term.lower().strip()] = self._copy_result(self._cache[key], term, source="cache")
+            else:
+                pending.append(term)
+        
+        # Persistent cache, one query for every remaining term
+        if pending and self._disk_cache is not None:
+            found = self._disk_cache.get_many(pending)
+            still_pending = []
+            for term in pending:
+                fields = found.get(normalize_term(term))
+                if fields is None:
+                    still_pending.append(term)
+                    continue
+                result = self._result_from_fields(term, fields, source="cache")
+                self._add_to_memory_cache(term, result)
+                result_map[term.lower().strip()] = result
+            pending = still_pending
+        
+        if self.enable_cache:
+            self.stats.cache_hits += len(unique_terms) - len(pending)
+            self.stats.cache_misses += len(pending)
+        
+        # Offline dump
+        remaining = []
+        for term in pending:
+            result = self._lookup_offline(term)
+            if result is not None:
+                self._add_to_memory_cache(term, result)
+                result_map[term.lower().strip()] = result
+            elif self.offline:
+                result_map[term.lower().strip()] = MeSHTermResult(
+                    original_term=term, matched=False, source="offline",
+                )
+            else:
+                remaining.append(term)
+        
+        if not remaining:
+            return result_map
+        
+        # Network: concurrent esearch, then batched efetch
+        semaphore = asyncio.Semaphore(max_concurrent)
+        
+        async def search_with_semaphore(t: str) -> Tuple[str, List[str]]:
+            async with semaphore:
+                return t, await self._esearch_mesh(t)
+        
+        search_results = await asyncio.gather(
+            *(search_with_semaphore(t) for t in remaining),
+            return_exceptions=True,
+        )
+        
+        to_cache: Dict[str, MeSHTermResult] = {}
+        term_uids: Dict[str, str] = {}
+        for item in search_results:
+            if isinstance(item, Exception):
+                logger.error(f"Batch lookup error: {item}")
+                continue
+            term, id_list = item
+            if id_list:
+                term_uids[term] = id_list[0]
+            else:
+                to_cache[term] = MeSHTermResult(original_term=term, matched=False, confidence=0.0)
+        
+        if term_uids:
+            try:
+                fields_by_uid = await self._efetch_mesh_batch(list(dict.fromkeys(term_uids.values())))
+            except Exception as e:
+                logger.error(f"Batch efetch error: {e}")
+                fields_by_uid = {}
+            for term, uid in term_uids.items():
+                fields = fields_by_uid.get(uid)
+                if fields is not None:
+                    to_cache[term] = self._result_from_descriptor(term, fields, uid)
+        
+        for term, result in to_cache.items():
+            self._add_to_memory_cache(term, result)
+            result_map[term.lower().strip()] = result
+        if self._disk_cache is not None:
+            self._disk_cache.put_many({
+                term: self._result_fields(result)
+                for term, result in to_cache.items()
+                if result.matched
+            })
+        
+        return result_map
+    
     async def search_pubmed(
         self,
         query: str,
@@ -571,9 +796,11 @@ class NLMClient:
             "cache_size": len(self._cache),
         }
     
-    def clear_cache(self):
-        """Clear the term cache."""
+    def clear_cache(self, persistent: bool = False):
+        """Clear the term cache (and the persistent cache if requested)."""
         self._cache.clear()
+        if persistent and self._disk_cache is not None:
+            self._disk_cache.clear()
 
 
 # Module-level singleton for convenience
@@ -7,6 +7,7 @@ Based on document_pdf.pdf specification (page 8).
 
 Environment Variables:
     EPIC_FHIR_BASE_URL: FHIR base URL (e.g., https://.../api/FHIR/R4)
+    EPIC_FHIR_MAX_RPS: Client-side request rate limit (optional)
     Plus all variables from auth.py for authentication
 
 Notes:
@@ -16,13 +17,23 @@ Notes:
     - Follow content.attachment.url or Binary to retrieve note text/PDF
     
     You will need to align with your local Epic/FHIR configuration and scopes.
+
+    Search results are paged; use iter_search()/search_all() to follow
+    Bundle link[rel=next] across all pages. Cohort-scale pulls should use
+    FHIR Bulk Data ($export) via bulk_export()/iter_bulk_export().
 """
 
 from __future__ import annotations
 
+import json
 import logging
 import os
-from typing import Any, Dict, Optional
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import requests
 
@@ -36,6 +47,43 @@ class EpicFHIRError(Exception):
     pass
 
 
+# Per-patient resource searches fanned out by fetch_patient_resources()
+DEFAULT_PATIENT_RESOURCES: Tuple[str, ...] = ("Encounter", "Procedure", "DocumentReference")
+
+
+class _RateLimiter:
+    """Thread-safe minimum-interval rate limiter shared by all request threads."""
+
+    def __init__(self, max_per_second: Optional[float]) -> None:
+        self._interval = 1.0 / max_per_second if max_per_second else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _bundle_resources(bundle: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract resources from a Bundle's entries."""
+    return [e["resource"] for e in bundle.get("entry", []) if "resource" in e]
+
+
+def _next_link(bundle: Dict[str, Any]) -> Optional[str]:
+    """Return the Bundle's link[rel=next] URL, if any."""
+    for link in bundle.get("link", []):
+        if link.get("relation") == "next" and link.get("url"):
+            return link["url"]
+    return None
+
+
 class EpicFHIRClient:
     """
     FHIR R4 client for Epic with automatic token management.
@@ -44,6 +92,10 @@ class EpicFHIRClient:
         client = EpicFHIRClient.from_env()
         patient = client.get("Patient/12345")
         procedures = client.search("Procedure", params={"patient": "12345"})
+
+        # All pages, streamed
+        for proc in client.iter_search("Procedure", params={"patient": "12345"}):
+            ...
     """
 
     def __init__(
@@ -51,7 +103,8 @@ class EpicFHIRClient:
         base_url: str,
         authenticator: EpicBackendAuthenticator,
         *,
-        timeout_s: int = 60
+        timeout_s: int = 60,
+        max_requests_per_second: Optional[float] = None,
     ) -> None:
         """
         Initialize FHIR client.
@@ -60,11 +113,18 @@ class EpicFHIRClient:
             base_url: FHIR R4 base URL
             authenticator: Configured authenticator for token management
             timeout_s: Request timeout in seconds
+            max_requests_per_second: Client-side rate limit shared across
+                threads (None = unlimited)
         """
         self.base_url = base_url.rstrip("/")
         self.authenticator = authenticator
         self.timeout_s = timeout_s
         self.session = requests.Session()
+        self._rate_limiter = _RateLimiter(max_requests_per_second)
+        self._token_lock = threading.Lock()
+        # requests.Session is not thread-safe; worker threads get their own
+        self._local = threading.local()
+        self._local.session = self.session
 
     @classmethod
     def from_env(cls) -> "EpicFHIRClient":
@@ -78,16 +138,71 @@ class EpicFHIRClient:
         base_url = os.environ["EPIC_FHIR_BASE_URL"]
         auth_cfg = EpicBackendAuthConfig.from_env()
         auth = EpicBackendAuthenticator(auth_cfg)
-        return cls(base_url=base_url, authenticator=auth, timeout_s=auth_cfg.timeout_s)
+        max_rps = os.getenv("EPIC_FHIR_MAX_RPS")
+        return cls(
+            base_url=base_url,
+            authenticator=auth,
+            timeout_s=auth_cfg.timeout_s,
+            max_requests_per_second=float(max_rps) if max_rps else None,
+        )
 
     def _headers(self) -> Dict[str, str]:
         """Get request headers with current access token."""
-        token = self.authenticator.get_access_token()
+        with self._token_lock:
+            token = self.authenticator.get_access_token()
         return {
             "Authorization": f"Bearer {token}",
             "Accept": "application/fhir+json",
         }
 
+    def _session(self) -> requests.Session:
+        """Get the calling thread's HTTP session."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        return session
+
+    @contextmanager
+    def _thread_pool(self, max_workers: int) -> Iterator[ThreadPoolExecutor]:
+        """Thread pool whose workers' HTTP sessions are closed when it shuts down."""
+        sessions: List[requests.Session] = []
+        sessions_lock = threading.Lock()
+
+        def _init_worker() -> None:
+            session = requests.Session()
+            self._local.session = session
+            with sessions_lock:
+                sessions.append(session)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+                yield executor
+        finally:
+            for session in sessions:
+                session.close()
+
+    def _get_json(
+        self,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Rate-limited authenticated GET returning parsed JSON."""
+        self._rate_limiter.wait()
+        try:
+            resp = self._session().get(
+                url,
+                headers=self._headers(),
+                params=params,
+                timeout=self.timeout_s
+            )
+            resp.raise_for_status()
+        except requests.RequestException as e:
+            raise EpicFHIRError(f"FHIR GET failed: {e}") from e
+
+        return resp.json()
+
     def get(
         self,
         path: str,
@@ -108,19 +223,7 @@ class EpicFHIRClient:
             EpicFHIRError: If request fails
         """
         url = f"{self.base_url}/{path.lstrip('/')}"
-
-        try:
-            resp = self.session.get(
-                url,
-                headers=self._headers(),
-                params=params,
-                timeout=self.timeout_s
-            )
-            resp.raise_for_status()
-        except requests.RequestException as e:
-            raise EpicFHIRError(f"FHIR GET failed: {e}") from e
-
-        return resp.json()
+        return self._get_json(url, params=params)
 
     def search(
         self,
@@ -138,10 +241,270 @@ class EpicFHIRClient:
             params: Search parameters
 
         Returns:
-            FHIR Bundle with search results
+            FHIR Bundle with search results (first page only; see iter_search)
         """
         return self.get(resource_type, params=params)
 
+    def iter_search_pages(
+        self,
+        resource_type: str,
+        *,
+        params: Dict[str, Any],
+        max_pages: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every Bundle page of a search, following link[rel=next].
+
+        With prefetch enabled the next page is requested in a background
+        thread while the caller processes the current one.
+
+        Args:
+            resource_type: Resource type (e.g., "Procedure")
+            params: Search parameters (applied to the first request only;
+                next links carry the server's paging state)
+            max_pages: Stop after this many pages (None = all)
+            prefetch: Fetch page N+1 while page N is being consumed
+
+        Yields:
+            FHIR Bundle pages
+        """
+        bundle = self.search(resource_type, params=params)
+        pages = 0
+
+        if not prefetch:
+            while bundle is not None:
+                yield bundle
+                pages += 1
+                next_url = _next_link(bundle)
+                if not next_url or (max_pages is not None and pages >= max_pages):
+                    return
+                bundle = self._get_json(next_url)
+            return
+
+        with self._thread_pool(max_workers=1) as executor:
+            while True:
+                next_url = _next_link(bundle)
+                pages += 1
+                more = next_url and (max_pages is None or pages < max_pages)
+                pending = executor.submit(self._get_json, next_url) if more else None
+
+                yield bundle
+
+                if pending is None:
+                    return
+                bundle = pending.result()
+
+    def iter_search(
+        self,
+        resource_type: str,
+        *,
+        params: Dict[str, Any],
+        max_pages: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream resources from all pages of a search.
+
+        Yields:
+            FHIR resources from Bundle entries, in server order
+        """
+        for bundle in self.iter_search_pages(
+            resource_type, params=params, max_pages=max_pages, prefetch=prefetch
+        ):
+            yield from _bundle_resources(bundle)
+
+    def search_all(
+        self,
+        resource_type: str,
+        *,
+        params: Dict[str, Any],
+        max_pages: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Collect resources from all pages of a search into a list."""
+        return list(self.iter_search(resource_type, params=params, max_pages=max_pages))
+
+    def fetch_patient_resources(
+        self,
+        patient_ids: Iterable[str],
+        *,
+        resource_types: Iterable[str] = DEFAULT_PATIENT_RESOURCES,
+        extra_params: Optional[Dict[str, Dict[str, Any]]] = None,
+        max_workers: int = 4,
+    ) -> Iterator[Tuple[str, str, List[Dict[str, Any]]]]:
+        """
+        Run per-patient searches concurrently, following all pages.
+
+        One task per (patient, resource type) is submitted to a bounded thread
+        pool; every request still goes through the client's rate limiter. At
+        most ``2 * max_workers`` tasks are submitted or held at once, so
+        patient_ids may be a lazy iterable of any size.
+
+        Args:
+            patient_ids: Patient IDs to fetch
+            resource_types: Resource types to search per patient
+            extra_params: Optional extra search params keyed by resource type
+                (e.g., {"DocumentReference": {"type": "11504-8"}})
+            max_workers: Concurrent searches in flight
+
+        Yields:
+            (patient_id, resource_type, resources) in submission order
+
+        Raises:
+            EpicFHIRError: If any search fails
+        """
+        extra_params = extra_params or {}
+        resource_types = tuple(resource_types)
+
+        def _fetch(patient_id: str, resource_type: str) -> Tuple[str, str, List[Dict[str, Any]]]:
+            params = {"patient": patient_id, **extra_params.get(resource_type, {})}
+            resources = list(
+                self.iter_search(resource_type, params=params, prefetch=False)
+            )
+            return patient_id, resource_type, resources
+
+        max_in_flight = max(1, 2 * max_workers)
+        pending: Deque[Future] = deque()
+
+        with self._thread_pool(max_workers) as executor:
+            try:
+                for pid in patient_ids:
+                    for rtype in resource_types:
+                        pending.append(executor.submit(_fetch, pid, rtype))
+                        if len(pending) >= max_in_flight:
+                            yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def bulk_export(
+        self,
+        *,
+        group_id: Optional[str] = None,
+        resource_types: Optional[Iterable[str]] = None,
+        since: Optional[str] = None,
+        poll_interval_s: float = 5.0,
+        max_wait_s: float = 3600.0,
+    ) -> Dict[str, Any]:
+        """
+        Run a FHIR Bulk Data $export and wait for its completion manifest.
+
+        Kicks off Group/[id]/$export (or Patient/$export without a group),
+        then polls the Content-Location status URL, honoring Retry-After.
+
+        Args:
+            group_id: Group (cohort) to export; None exports all patients
+            resource_types: _type filter (e.g., ["Encounter", "Procedure"])
+            since: _since filter (FHIR instant)
+            poll_interval_s: Default delay between status polls
+            max_wait_s: Give up after this many seconds
+
+        Returns:
+            Completion manifest with "output" entries ({"type", "url"})
+
+        Raises:
+            EpicFHIRError: If kick-off or polling fails, or export times out
+        """
+        path = f"Group/{group_id}/$export" if group_id else "Patient/$export"
+        params: Dict[str, Any] = {"_outputFormat": "application/fhir+ndjson"}
+        if resource_types:
+            params["_type"] = ",".join(resource_types)
+        if since:
+            params["_since"] = since
+
+        headers = self._headers()
+        headers["Prefer"] = "respond-async"
+
+        self._rate_limiter.wait()
+        try:
+            resp = self._session().get(
+                f"{self.base_url}/{path}",
+                headers=headers,
+                params=params,
+                timeout=self.timeout_s
+            )
+            resp.raise_for_status()
+        except requests.RequestException as e:
+            raise EpicFHIRError(f"FHIR $export kick-off failed: {e}") from e
+
+        status_url = resp.headers.get("Content-Location")
+        if not status_url:
+            raise EpicFHIRError("FHIR $export response missing Content-Location")
+
+        logger.info(f"Started FHIR bulk export: {status_url}")
+        deadline = time.monotonic() + max_wait_s
+
+        while True:
+            self._rate_limiter.wait()
+            try:
+                status = self._session().get(
+                    status_url,
+                    headers=self._headers(),
+                    timeout=self.timeout_s
+                )
+                status.raise_for_status()
+            except requests.RequestException as e:
+                raise EpicFHIRError(f"FHIR $export status poll failed: {e}") from e
+
+            if status.status_code == 200:
+                manifest = status.json()
+                logger.info(
+                    f"FHIR bulk export complete: {len(manifest.get('output', []))} files"
+                )
+                return manifest
+
+            if time.monotonic() >= deadline:
+                raise EpicFHIRError(f"FHIR $export did not complete within {max_wait_s}s")
+
+            retry_after = status.headers.get("Retry-After", "")
+            delay = float(retry_after) if retry_after.isdigit() else poll_interval_s
+            time.sleep(delay)
+
+    def iter_bulk_export(
+        self,
+        manifest: Dict[str, Any],
+        *,
+        resource_type: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream resources from a bulk export manifest's NDJSON output files.
+
+        Files are read line by line, so memory stays flat regardless of
+        export size.
+
+        Args:
+            manifest: Completion manifest from bulk_export()
+            resource_type: Only read output files of this type
+
+        Yields:
+            FHIR resources
+        """
+        requires_token = manifest.get("requiresAccessToken", True)
+
+        for output in manifest.get("output", []):
+            if resource_type and output.get("type") != resource_type:
+                continue
+
+            headers = self._headers() if requires_token else {}
+            headers["Accept"] = "application/fhir+ndjson"
+
+            self._rate_limiter.wait()
+            try:
+                with self._session().get(
+                    output["url"],
+                    headers=headers,
+                    stream=True,
+                    timeout=self.timeout_s
+                ) as resp:
+                    resp.raise_for_status()
+                    for line in resp.iter_lines():
+                        if line:
+                            yield json.loads(line)
+            except requests.RequestException as e:
+                raise EpicFHIRError(f"FHIR bulk output download failed: {e}") from e
+
     def get_patient(self, patient_id: str) -> Dict[str, Any]:
         """Get Patient resource by ID."""
         return self.get(f"Patient/{patient_id}")
@@ -238,7 +601,8 @@ class EpicFHIRClient:
         headers = self._headers()
         headers["Accept"] = "*/*"  # Accept any content type
 
-        resp = self.session.get(url, headers=headers, timeout=self.timeout_s)
+        self._rate_limiter.wait()
+        resp = self._session().get(url, headers=headers, timeout=self.timeout_s)
         resp.raise_for_status()
 
         return resp.content
@@ -11,6 +11,9 @@ Usage:
     client = RedcapClient.from_env()
     records = client.export_records(filter_logic='[service_line]="General Surgery"')
     cases = [redcap_record_to_case(r) for r in records]
+
+    # Large projects: chunked, parallel export straight to Parquet
+    client.export_records_to_parquet("data/raw/redcap/records.parquet", chunk_size=500)
 """
 
 from .client import RedcapClient
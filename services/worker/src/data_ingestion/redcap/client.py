@@ -12,6 +12,12 @@ Environment Variables:
     REDCAP_API_TOKEN: Project-scoped API token
     REDCAP_TIMEOUT_S: Request timeout in seconds (default: 60)
 
+Large Projects:
+    export_records() fetches everything in one POST. For large (longitudinal)
+    projects use export_records_to_parquet(), which lists record IDs first,
+    exports them in batches over a bounded thread pool and streams each batch
+    into a Parquet file whose schema is derived from export_metadata().
+
 Security Notes:
     - API tokens are user+project scoped; never log tokens
     - Prefer exporting de-identified datasets when feasible
@@ -21,7 +27,11 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Any, Optional
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Iterator, Optional
 
 import requests
 
@@ -64,6 +74,17 @@ class RedcapClient:
         self.api_token = api_token
         self.timeout_s = timeout_s
         self.session = requests.Session()
+        # requests.Session is not thread-safe; worker threads get their own
+        self._local = threading.local()
+        self._local.session = self.session
+
+    def _session(self) -> requests.Session:
+        """Get the calling thread's HTTP session."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        return session
 
     @classmethod
     def from_env(cls) -> "RedcapClient":
@@ -139,7 +160,7 @@ class RedcapClient:
         logger.debug(f"REDCap export_records: filter={filter_logic}, fields={fields}")
 
         try:
-            resp = self.session.post(
+            resp = self._session().post(
                 self.api_url,
                 data=data,
                 timeout=self.timeout_s
@@ -160,6 +181,197 @@ class RedcapClient:
 
         raise ValueError(f"Unsupported return_format={return_format!r}")
 
+    def list_record_ids(
+        self,
+        *,
+        record_id_field: Optional[str] = None,
+        events: Optional[list[str]] = None,
+        filter_logic: Optional[str] = None,
+    ) -> list[str]:
+        """
+        List distinct record IDs by exporting only the record ID field.
+
+        Longitudinal projects return one row per event; IDs are de-duplicated
+        in first-seen order.
+
+        Args:
+            record_id_field: Record ID field name (default: first field in
+                the data dictionary)
+            events: Restrict to these events
+            filter_logic: REDCap filter logic string
+
+        Returns:
+            List of record IDs
+        """
+        if record_id_field is None:
+            from .schema import infer_record_id_field
+
+            record_id_field = infer_record_id_field(self.export_metadata())
+            if record_id_field is None:
+                raise RedcapError("Could not determine record ID field from metadata")
+
+        rows = self.export_records(
+            fields=[record_id_field], events=events, filter_logic=filter_logic
+        )
+        ids = list(dict.fromkeys(str(r[record_id_field]) for r in rows if r.get(record_id_field)))
+        logger.info(f"REDCap listed {len(ids)} record IDs")
+        return ids
+
+    def iter_record_batches(
+        self,
+        *,
+        record_ids: Optional[list[str]] = None,
+        chunk_size: int = 500,
+        max_workers: int = 4,
+        fields: Optional[list[str]] = None,
+        forms: Optional[list[str]] = None,
+        events: Optional[list[str]] = None,
+        filter_logic: Optional[str] = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Export records in batches of record IDs, several batches in flight.
+
+        Batches are yielded in record ID order. At most ``2 * max_workers``
+        batches are held in memory at once.
+
+        Args:
+            record_ids: Record IDs to export (default: list_record_ids())
+            chunk_size: Records per export request
+            max_workers: Concurrent export requests
+            fields, forms, events: Passed through to export_records()
+            filter_logic: Used only when listing record IDs
+
+        Yields:
+            Lists of record dictionaries, one per batch
+        """
+        if record_ids is None:
+            record_ids = self.list_record_ids(events=events, filter_logic=filter_logic)
+
+        chunks = [
+            record_ids[i:i + chunk_size] for i in range(0, len(record_ids), chunk_size)
+        ]
+        logger.info(
+            f"REDCap chunked export: {len(record_ids)} records in {len(chunks)} batches "
+            f"({max_workers} workers)"
+        )
+
+        def _export(chunk: list[str]) -> list[dict[str, Any]]:
+            return self.export_records(
+                fields=fields, records=chunk, forms=forms, events=events
+            )
+
+        max_in_flight = max(1, 2 * max_workers)
+        pending: deque[Future] = deque()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                for chunk in chunks:
+                    pending.append(executor.submit(_export, chunk))
+                    if len(pending) >= max_in_flight:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def export_records_to_parquet(
+        self,
+        output_path: str | Path,
+        *,
+        chunk_size: int = 500,
+        max_workers: int = 4,
+        fields: Optional[list[str]] = None,
+        forms: Optional[list[str]] = None,
+        events: Optional[list[str]] = None,
+        filter_logic: Optional[str] = None,
+        compression: str = "snappy",
+    ) -> dict[str, Any]:
+        """
+        Chunked, parallel export of records straight into a Parquet file.
+
+        Column types come from export_metadata() (see redcap.schema); each
+        batch is converted and written as it arrives, so memory is bounded
+        by the number of in-flight batches rather than the project size.
+
+        Args:
+            output_path: Destination Parquet file
+            chunk_size: Records per export request
+            max_workers: Concurrent export requests
+            fields, forms, events: Passed through to export_records()
+            filter_logic: REDCap filter logic string
+            compression: Parquet compression codec
+
+        Returns:
+            Summary dict with path, record/row/batch counts and column names
+
+        Raises:
+            RedcapError: If any API request fails
+        """
+        import pyarrow.parquet as pq
+
+        from .schema import build_export_schema, infer_record_id_field, records_to_table
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        metadata = self.export_metadata()
+        record_id_field = infer_record_id_field(metadata)
+        record_ids = self.list_record_ids(
+            record_id_field=record_id_field, events=events, filter_logic=filter_logic
+        )
+
+        writer = None
+        schema = None
+        rows = 0
+        batches = 0
+        tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+
+        try:
+            for records in self.iter_record_batches(
+                record_ids=record_ids,
+                chunk_size=chunk_size,
+                max_workers=max_workers,
+                fields=fields,
+                forms=forms,
+                events=events,
+            ):
+                if not records:
+                    continue
+                if schema is None:
+                    schema = build_export_schema(records[0].keys(), metadata)
+                    writer = pq.ParquetWriter(tmp_path, schema, compression=compression)
+
+                writer.write_table(records_to_table(records, schema))
+                rows += len(records)
+                batches += 1
+        except BaseException:
+            if writer is not None:
+                writer.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        if writer is None:
+            schema = build_export_schema(
+                [record_id_field] if record_id_field else [], metadata
+            )
+            writer = pq.ParquetWriter(tmp_path, schema, compression=compression)
+        writer.close()
+        os.replace(tmp_path, output_path)
+
+        logger.info(
+            f"REDCap exported {len(record_ids)} records ({rows} rows, {batches} batches) "
+            f"to {output_path}"
+        )
+
+        return {
+            "path": str(output_path),
+            "records": len(record_ids),
+            "rows": rows,
+            "batches": batches,
+            "columns": schema.names,
+        }
+
     def export_metadata(self, *, return_format: str = "json") -> list[dict[str, Any]]:
         """
         Export project metadata (data dictionary).
@@ -174,7 +386,7 @@ class RedcapClient:
             "returnFormat": return_format,
         }
 
-        resp = self.session.post(self.api_url, data=data, timeout=self.timeout_s)
+        resp = self._session().post(self.api_url, data=data, timeout=self.timeout_s)
         resp.raise_for_status()
 
         if return_format == "json":
@@ -196,6 +408,6 @@ class RedcapClient:
             "returnFormat": "json",
         }
 
-        resp = self.session.post(self.api_url, data=data, timeout=self.timeout_s)
+        resp = self._session().post(self.api_url, data=data, timeout=self.timeout_s)
         resp.raise_for_status()
         return resp.json()
@@ -0,0 +1,168 @@
+"""
+REDCap Metadata → Arrow Schema
+
+Derives column types for flat REDCap record exports from the project's data
+dictionary (content=metadata), so record batches can be streamed into a
+single Parquet file with a stable schema.
+
+REDCap returns every value as a string ("" for missing). Type mapping:
+    text + integer validation      → int64
+    text + number* validation      → float64
+    text + date_* validation       → date32
+    text + datetime_* validation   → timestamp[s]
+    calc, slider                   → float64
+    yesno, truefalse               → int64
+    checkbox                       → one int64 column per choice (field___code)
+    <form>_complete                → int64
+    everything else                → string
+
+Requires pyarrow.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Iterable, Optional
+
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+# Columns REDCap adds to flat exports that are not in the data dictionary
+REDCAP_SYSTEM_COLUMNS: dict[str, pa.DataType] = {
+    "redcap_event_name": pa.string(),
+    "redcap_repeat_instrument": pa.string(),
+    "redcap_repeat_instance": pa.int64(),
+    "redcap_data_access_group": pa.string(),
+    "redcap_survey_identifier": pa.string(),
+}
+
+
+def _field_type(field: dict[str, Any]) -> pa.DataType:
+    """Map one data dictionary row to an Arrow type."""
+    field_type = field.get("field_type", "")
+    validation = field.get("text_validation_type_or_show_slider_number", "") or ""
+
+    if field_type == "text":
+        if validation == "integer":
+            return pa.int64()
+        if validation.startswith("number"):
+            return pa.float64()
+        if validation.startswith("datetime"):
+            return pa.timestamp("s")
+        if validation.startswith("date"):
+            return pa.date32()
+        return pa.string()
+    if field_type in ("calc", "slider"):
+        return pa.float64()
+    if field_type in ("yesno", "truefalse"):
+        return pa.int64()
+    return pa.string()
+
+
+def _checkbox_codes(field: dict[str, Any]) -> list[str]:
+    """Parse checkbox choice codes from 'code, label | code, label'."""
+    choices = field.get("select_choices_or_calculations", "") or ""
+    codes = []
+    for choice in choices.split("|"):
+        code = choice.split(",", 1)[0].strip()
+        if code:
+            # REDCap lower-cases codes and replaces '-'/'.' in export column names
+            codes.append(code.lower().replace("-", "_").replace(".", "_"))
+    return codes
+
+
+def metadata_column_types(metadata: Iterable[dict[str, Any]]) -> dict[str, pa.DataType]:
+    """
+    Expand a REDCap data dictionary to export column name → Arrow type.
+
+    Includes checkbox expansions and <form>_complete status columns.
+    """
+    types: dict[str, pa.DataType] = {}
+    forms_seen: list[str] = []
+
+    for field in metadata:
+        name = field.get("field_name")
+        if not name or field.get("field_type") == "descriptive":
+            continue
+
+        form = field.get("form_name")
+        if form and form not in forms_seen:
+            forms_seen.append(form)
+
+        if field.get("field_type") == "checkbox":
+            for code in _checkbox_codes(field):
+                types[f"{name}___{code}"] = pa.int64()
+        else:
+            types[name] = _field_type(field)
+
+    for form in forms_seen:
+        types[f"{form}_complete"] = pa.int64()
+
+    return types
+
+
+def build_export_schema(
+    columns: Iterable[str],
+    metadata: Iterable[dict[str, Any]],
+) -> pa.Schema:
+    """
+    Build the Parquet schema for an export with the given columns.
+
+    Columns not described by the data dictionary (or REDCap system columns)
+    are stored as strings.
+    """
+    types = metadata_column_types(metadata)
+    fields = []
+    for col in columns:
+        dtype = types.get(col) or REDCAP_SYSTEM_COLUMNS.get(col) or pa.string()
+        fields.append(pa.field(col, dtype, nullable=True))
+    return pa.schema(fields)
+
+
+def records_to_table(
+    records: list[dict[str, Any]],
+    schema: pa.Schema,
+) -> pa.Table:
+    """
+    Convert a batch of raw REDCap records to an Arrow table with ``schema``.
+
+    Empty strings become nulls; values that fail to parse for a typed column
+    are nulled and counted in a warning. Columns missing from the batch are
+    filled with nulls, extra columns are dropped.
+    """
+    df = pd.DataFrame.from_records(records, columns=schema.names)
+    df = df.replace("", None)
+
+    arrays = []
+    for field in schema:
+        col = df[field.name]
+        dtype = field.type
+
+        if pa.types.is_string(dtype):
+            values = col.astype(object).where(col.notna(), None)
+        elif pa.types.is_integer(dtype) or pa.types.is_floating(dtype):
+            values = pd.to_numeric(col, errors="coerce")
+            if pa.types.is_integer(dtype):
+                values = values.round().astype("Int64")
+        elif pa.types.is_date(dtype):
+            values = pd.to_datetime(col, errors="coerce").dt.date
+        else:
+            values = pd.to_datetime(col, errors="coerce")
+
+        invalid = int((values.isna() & col.notna()).sum())
+        if invalid:
+            logger.warning(f"REDCap column {field.name}: {invalid} values failed {dtype} parse")
+
+        arrays.append(pa.array(values, type=dtype, from_pandas=True))
+
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def infer_record_id_field(metadata: Iterable[dict[str, Any]]) -> Optional[str]:
+    """The record ID field is the first field in a REDCap data dictionary."""
+    for field in metadata:
+        if field.get("field_name"):
+            return field["field_name"]
+    return None
@@ -56,6 +56,7 @@ from .create_episodes import (
     identify_index_events,
     assign_events_to_episodes,
     link_episodes_to_surgeries,
+    resolve_time_window,
 )
 
 from .episode_features import (
@@ -64,6 +65,9 @@ from .episode_features import (
     aggregate_cytology_features,
     aggregate_molecular_features,
     aggregate_lab_features,
+    compute_episode_fingerprints,
+    update_episode_features,
+    load_episode_features,
 )
 
 __all__ = [
@@ -71,9 +75,13 @@ __all__ = [
     "identify_index_events",
     "assign_events_to_episodes",
     "link_episodes_to_surgeries",
+    "resolve_time_window",
     "compute_episode_features",
     "aggregate_imaging_features",
     "aggregate_cytology_features",
     "aggregate_molecular_features",
     "aggregate_lab_features",
+    "compute_episode_fingerprints",
+    "update_episode_features",
+    "load_episode_features",
 ]
@@ -16,7 +16,7 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from datetime import timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 import logging
 
 # Configure logging
@@ -65,6 +65,31 @@ class EpisodeConfig:
     POSTOP_WINDOW_DAYS = 365  # Events within 365 days after surgery are post-op
 
 
+def resolve_time_window(time_window: Union[int, str]) -> int:
+    """
+    Resolve a time window given in days or by name.
+
+    Parameters
+    ----------
+    time_window : int or str
+        Days, or a key of EpisodeConfig.TIME_WINDOWS (narrow, standard, wide)
+
+    Returns
+    -------
+    int
+        Window half-width in days
+    """
+    if isinstance(time_window, str):
+        try:
+            return EpisodeConfig.TIME_WINDOWS[time_window]
+        except KeyError:
+            raise ValueError(
+                f"Unknown time window '{time_window}', "
+                f"expected one of {list(EpisodeConfig.TIME_WINDOWS)}"
+            )
+    return int(time_window)
+
+
 def identify_index_events(
     events_df: pd.DataFrame,
     index_event_types: Optional[List[str]] = None,
@@ -160,7 +185,7 @@ def identify_index_events(
 def assign_events_to_episodes(
     episodes_df: pd.DataFrame,
     events_df: pd.DataFrame,
-    time_window_days: int = 30,
+    time_window_days: Union[int, str] = 30,
     patient_id_col: str = "research_id",
 ) -> pd.DataFrame:
     """
@@ -168,7 +193,13 @@ def assign_events_to_episodes(
 
     Each event is assigned to the nearest episode within the time window. If an
     event falls within multiple episode windows, it is assigned to the closest
-    episode by date.
+    episode by date; ties go to the earlier episode, and between episodes on
+    the same date to the one listed first in ``episodes_df``.
+
+    Events and index events are sorted into per-patient timelines and each
+    event is matched against only its preceding and following index event
+    (two ``merge_asof`` sweeps), so the cost grows with the number of events
+    rather than events x index events.
 
     Parameters
     ----------
@@ -176,8 +207,9 @@ def assign_events_to_episodes(
         Episode metadata with index_event_date
     events_df : pd.DataFrame
         All events with event_date
-    time_window_days : int
-        Time window (days) before/after index event (default: 30)
+    time_window_days : int or str
+        Time window (days) before/after index event, or a named window from
+        EpisodeConfig.TIME_WINDOWS (default: 30)
     patient_id_col : str
         Column name for patient identifier
 
@@ -187,46 +219,70 @@ def assign_events_to_episodes(
         Episode-event links with columns: episode_id, event_id, event_type,
         event_date, delta_days, within_window
     """
+    time_window_days = resolve_time_window(time_window_days)
     logger.info(f"Assigning {len(events_df)} events to {len(episodes_df)} episodes")
     logger.info(f"Time window: ±{time_window_days} days")
 
-    # Merge episodes with events on patient ID
-    merged = episodes_df.merge(events_df, on=patient_id_col, how="inner")
+    if len(episodes_df) == 0 or len(events_df) == 0:
+        logger.warning("No events within time window!")
+        return pd.DataFrame()
 
-    logger.info(
-        f"Patient-level merge resulted in {len(merged)} potential episode-event pairs"
-    )
+    # Index event timeline; only the first episode on a given date can win
+    anchors = episodes_df[[patient_id_col, "episode_id", "index_event_date"]]
+    anchors = anchors[anchors["index_event_date"].notna()]
+    anchors = anchors.drop_duplicates([patient_id_col, "index_event_date"])
+    anchors = anchors.sort_values("index_event_date", kind="stable")
+
+    events = events_df[[patient_id_col, "event_id", "event_type", "event_date"]]
+    events = events[events["event_date"].notna()]
+    events = events.sort_values("event_date", kind="stable")
+
+    # Nearest index event at or before, and strictly after, each event
+    sweeps = {}
+    for direction, exact in [("backward", True), ("forward", False)]:
+        matched = pd.merge_asof(
+            events[[patient_id_col, "event_date"]],
+            anchors,
+            left_on="event_date",
+            right_on="index_event_date",
+            by=patient_id_col,
+            direction=direction,
+            allow_exact_matches=exact,
+        )
+        delta = (matched["event_date"] - matched["index_event_date"]).dt.days
+        sweeps[direction] = (matched["episode_id"].to_numpy(), delta.to_numpy())
 
-    # Calculate delta days (event_date - index_event_date)
-    merged["delta_days"] = (merged["event_date"] - merged["index_event_date"]).dt.days
+    before_id, before_delta = sweeps["backward"]
+    after_id, after_delta = sweeps["forward"]
+    before_ok = np.abs(before_delta) <= time_window_days  # NaN compares False
+    after_ok = np.abs(after_delta) <= time_window_days
+    use_before = before_ok & (~after_ok | (np.abs(before_delta) <= np.abs(after_delta)))
+    use_after = after_ok & ~use_before
 
-    # Filter to events within time window
-    merged["within_window"] = merged["delta_days"].abs() <= time_window_days
+    result = events.assign(
+        episode_id=np.select([use_before, use_after], [before_id, after_id], default=None),
+        delta_days=np.select([use_before, use_after], [before_delta, after_delta], default=np.nan),
+        within_window=True,
+    )[use_before | use_after]
 
-    within_window = merged[merged["within_window"]].copy()
-    logger.info(f"{len(within_window)} events within ±{time_window_days} day window")
+    logger.info(f"{len(result)} events within ±{time_window_days} day window")
 
-    if len(within_window) == 0:
+    if len(result) == 0:
         logger.warning("No events within time window!")
         return pd.DataFrame()
 
-    # Handle collisions: if event falls in multiple episodes, assign to nearest
-    within_window["abs_delta_days"] = within_window["delta_days"].abs()
+    result["delta_days"] = result["delta_days"].astype("int64")
 
-    # Group by event and keep nearest episode
-    nearest_episode = (
-        within_window.sort_values("abs_delta_days")
-        .groupby("event_id")
-        .first()
-        .reset_index()
-    )
-
-    logger.info(
-        f"Resolved collisions: {len(within_window)} → {len(nearest_episode)} unique event assignments"
+    # Duplicate event IDs keep their nearest assignment
+    result = (
+        result.assign(abs_delta_days=result["delta_days"].abs())
+        .sort_values("abs_delta_days", kind="stable")
+        .drop_duplicates("event_id")
+        .sort_values("event_id", kind="stable")
     )
 
     # Select final columns
-    result = nearest_episode[
+    result = result[
         [
             "episode_id",
             "event_id",
@@ -235,7 +291,7 @@ def assign_events_to_episodes(
             "delta_days",
             "within_window",
         ]
-    ]
+    ].reset_index(drop=True)
 
     # Log event distribution per episode
     events_per_episode = result.groupby("episode_id").size()
@@ -295,17 +351,16 @@ def link_episodes_to_surgeries(
     ).dt.days
 
     # Classify relationship
-    def classify_relationship(days):
-        if pd.isna(days):
-            return "no_surgery"
-        elif -preop_window_days <= days <= 0:
-            return "preop"
-        elif 0 < days <= postop_window_days:
-            return "postop"
-        else:
-            return "unrelated"
-
-    merged["relationship_type"] = merged["days_to_surgery"].apply(classify_relationship)
+    days = merged["days_to_surgery"]
+    merged["relationship_type"] = np.select(
+        [
+            days.isna(),
+            (days >= -preop_window_days) & (days <= 0),
+            (days > 0) & (days <= postop_window_days),
+        ],
+        ["no_surgery", "preop", "postop"],
+        default="unrelated",
+    )
 
     # Select final columns
     result = merged[
@@ -330,7 +385,7 @@ def link_episodes_to_surgeries(
 def create_episodes(
     events_df: pd.DataFrame,
     surgeries_df: Optional[pd.DataFrame] = None,
-    time_window_days: int = 30,
+    time_window_days: Union[int, str] = 30,
     index_event_types: Optional[List[str]] = None,
     patient_id_col: str = "research_id",
     output_dir: Optional[Path] = None,
@@ -349,8 +404,9 @@ def create_episodes(
         All events with columns: research_id, event_type, event_date, event_id
     surgeries_df : pd.DataFrame, optional
         Surgery records for episode-surgery linkage
-    time_window_days : int
-        Time window around index events (default: 30)
+    time_window_days : int or str
+        Time window around index events, in days or as a named window
+        (narrow, standard, wide) (default: 30)
     index_event_types : List[str], optional
         Event types to use as episode anchors
     patient_id_col : str
@@ -373,6 +429,8 @@ def create_episodes(
     >>> episodes = create_episodes(events, surgeries, time_window_days=30)
     >>> print(f"Created {len(episodes['diagnostic_episodes'])} episodes")
     """
+    time_window_days = resolve_time_window(time_window_days)
+
     logger.info("=" * 80)
     logger.info("TEMPORAL DIAGNOSTIC EPISODE FUSION")
     logger.info("=" * 80)
@@ -22,7 +22,6 @@ Usage:
     )
 """
 
-import hashlib
 import json
 import logging
 import subprocess
@@ -34,6 +33,7 @@ from typing import Optional, List, Dict, Any, Literal
 import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 
+from src.utils.file_hash import file_sha256
 from src.validation.phi_detector import PHIDetector, PHIScanResult
 
 # Import ProvenanceLogger for provenance tracking
@@ -386,12 +386,8 @@ def _collect_metadata(
 
 
 def _compute_file_hash(filepath: Path) -> str:
-    """Compute SHA256 hash of file."""
-    sha256 = hashlib.sha256()
-    with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+    """Compute SHA256 hash of file (cached by file identity)."""
+    return file_sha256(filepath)
 
 
 def _get_git_info() -> tuple[Optional[str], Optional[str], bool]:
@@ -4,6 +4,7 @@ Data Fusion Module
 Provides data fusion and integration capabilities:
 - Schema alignment
 - Join/union operations
+- Out-of-core fusion on DuckDB
 - Provenance tracking
 """
 
@@ -13,6 +14,7 @@ from .fusion_engine import (
     FusionResult,
     fuse_datasets,
 )
+from .duckdb_backend import DuckDBFusionBackend, DUCKDB_AVAILABLE
 from .schema_alignment import (
     align_schemas,
     SchemaAlignment,
@@ -24,6 +26,8 @@ __all__ = [
     "FusionConfig",
     "FusionResult",
     "fuse_datasets",
+    "DuckDBFusionBackend",
+    "DUCKDB_AVAILABLE",
     "align_schemas",
     "SchemaAlignment",
     "ColumnMapping",
@@ -0,0 +1,395 @@
+"""
+DuckDB Fusion Backend
+
+Out-of-core implementation of the FusionEngine strategies. Sources are
+registered with DuckDB without copying (DataFrames, Arrow tables) or scanned
+in place (Parquet/CSV paths), and union, join and merge run as a single SQL
+plan. DuckDB's hash joins and aggregates are partitioned and spill to
+``temp_directory`` when ``memory_limit`` is reached, so inputs larger than
+worker memory can be fused.
+
+Results match the pandas implementation except that row order of joins is
+not guaranteed, and null join keys do not match each other (SQL semantics).
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .fusion_engine import FusionConfig, FusionResult
+
+logger = logging.getLogger(__name__)
+
+try:
+    import duckdb
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    DUCKDB_AVAILABLE = False
+    logger.info("duckdb not available - out-of-core fusion disabled")
+
+_JOIN_SQL = {
+    "inner": "INNER JOIN",
+    "left": "LEFT JOIN",
+    "right": "RIGHT JOIN",
+    "outer": "FULL OUTER JOIN",
+}
+
+
+def _q(identifier: str) -> str:
+    """Quote a SQL identifier."""
+    return '"' + str(identifier).replace('"', '""') + '"'
+
+
+def _lit(value: str) -> str:
+    """Quote a SQL string literal."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def is_file_source(data: Any) -> bool:
+    """Whether a dataset's data is a path DuckDB can scan in place."""
+    return isinstance(data, (str, Path)) and Path(data).suffix.lower() in (
+        ".parquet", ".csv", ".tsv",
+    )
+
+
+class _Source:
+    """A dataset registered as a DuckDB view."""
+
+    def __init__(self, position: int, name: str, view: str, columns: List[str],
+                 row_count: int, row_expr: str):
+        self.position = position
+        self.name = name
+        self.view = view
+        self.columns = columns
+        self.row_count = row_count
+        self.row_expr = row_expr  # expression for the row's index within its source
+
+
+class DuckDBFusionBackend:
+    """
+    Union, join and merge over DuckDB.
+
+    Usage:
+        backend = DuckDBFusionBackend(FusionConfig(strategy="join", join_keys=["mrn"]))
+        result = backend.fuse(datasets)
+    """
+
+    def __init__(self, config: FusionConfig):
+        if not DUCKDB_AVAILABLE:
+            raise RuntimeError("duckdb is required for the duckdb fusion backend")
+        self.config = config
+
+    def _connect(self):
+        con = duckdb.connect()
+        if self.config.memory_limit:
+            con.execute(f"SET memory_limit = {_lit(self.config.memory_limit)}")
+        if self.config.temp_directory:
+            con.execute(f"SET temp_directory = {_lit(self.config.temp_directory)}")
+        if self.config.threads:
+            con.execute(f"SET threads = {int(self.config.threads)}")
+        con.execute("SET preserve_insertion_order = true")
+        return con
+
+    def _register(self, con, datasets: List[Dict[str, Any]]) -> Tuple[List[_Source], Dict[str, int]]:
+        import pandas as pd
+
+        sources = []
+        source_counts = {}
+        for i, ds in enumerate(datasets):
+            name = ds.get("name", f"source_{i}")
+            data = ds.get("data")
+            view = f"__fusion_src_{i}"
+            row_expr = "row_number() OVER () - 1"
+
+            if isinstance(data, list):
+                data = pd.DataFrame(data)
+            if is_file_source(data):
+                path = _lit(str(data))
+                if Path(data).suffix.lower() == ".parquet":
+                    con.execute(
+                        f"CREATE VIEW {view} AS SELECT * FROM read_parquet({path}, file_row_number = true)"
+                    )
+                    row_expr = "file_row_number"
+                else:
+                    con.execute(f"CREATE VIEW {view} AS SELECT * FROM read_csv_auto({path})")
+                row_count = con.execute(f"SELECT count(*) FROM {view}").fetchone()[0]
+            elif isinstance(data, pd.DataFrame) or hasattr(data, "num_rows"):
+                con.register(view, data)
+                row_count = len(data) if isinstance(data, pd.DataFrame) else data.num_rows
+            else:
+                continue
+
+            columns = [
+                row[0] for row in con.execute(f"DESCRIBE {view}").fetchall()
+                if row[0] != "file_row_number" or row_expr != "file_row_number"
+            ]
+            source_counts[name] = int(row_count)
+            sources.append(_Source(i, name, view, columns, int(row_count), row_expr))
+        return sources, source_counts
+
+    def fuse(self, datasets: List[Dict[str, Any]]) -> FusionResult:
+        """Run the configured strategy over ``datasets``."""
+        con = self._connect()
+        try:
+            sources, source_counts = self._register(con, datasets)
+            if not sources:
+                return FusionResult(success=False, errors=["No valid data found in datasets"])
+
+            if self.config.strategy == "join":
+                return self._join(con, sources, source_counts)
+            if self.config.strategy == "merge":
+                return self._merge(con, sources, source_counts)
+            return self._union(con, sources, source_counts)
+        finally:
+            con.close()
+
+    # ------------------------------------------------------------------
+    # Union
+    # ------------------------------------------------------------------
+
+    def _union_columns(self, sources: List[_Source]) -> List[str]:
+        """Output columns in first-seen order, provenance columns last (as the pandas path)."""
+        columns: List[str] = []
+        seen = set()
+        for src in sources:
+            for c in src.columns:
+                if c not in seen:
+                    seen.add(c)
+                    columns.append(c)
+        if self.config.track_provenance:
+            columns += [c for c in ("_source", "_source_idx") if c not in seen]
+        return columns
+
+    def _union_sql(self, sources: List[_Source]) -> Tuple[str, List[str]]:
+        """
+        SQL for the (deduplicated) union.
+
+        Every row carries ``__fusion_ord``, its position in the concatenated
+        input (source offset + row index), which orders the output and
+        determines provenance without carrying string columns through the plan.
+        """
+        columns = self._union_columns(sources)
+        data_cols = [c for c in columns if not self._is_provenance(c)]
+        parts = []
+        offset = 0
+        for src in sources:
+            select = [_q(c) if c in src.columns else f"NULL AS {_q(c)}" for c in data_cols]
+            select.append(f"{offset} + {src.row_expr} AS __fusion_ord")
+            parts.append(f"SELECT {', '.join(select)} FROM {src.view}")
+            offset += src.row_count
+        sql = " UNION ALL ".join(parts)
+
+        dedup_cols = [c for c in data_cols if not c.startswith("_")]
+        if self.config.dedup and dedup_cols:
+            # Keep the first occurrence of each distinct row; other "_"
+            # columns come from that occurrence
+            select = [
+                _q(c) if c in dedup_cols else f"arg_min({_q(c)}, __fusion_ord) AS {_q(c)}"
+                for c in data_cols
+            ]
+            group = ", ".join(_q(c) for c in dedup_cols)
+            sql = (
+                f"SELECT {', '.join(select)}, min(__fusion_ord) AS __fusion_ord"
+                f" FROM ({sql}) GROUP BY {group}"
+            )
+        return sql, columns
+
+    def _is_provenance(self, column: str) -> bool:
+        return self.config.track_provenance and column in ("_source", "_source_idx")
+
+    def _output_select(self, sources: List[_Source], columns: List[str]) -> str:
+        """
+        Select list for the final columns, deriving provenance from __fusion_ord.
+
+        For DataFrame output the ordinal itself is selected and provenance is
+        attached in numpy (see _attach_provenance), which avoids building a
+        Python string per row in the result conversion.
+        """
+        if not self.config.output_path:
+            select = [_q(c) for c in columns if not self._is_provenance(c)]
+            if self.config.track_provenance:
+                select.append("__fusion_ord")
+            return ", ".join(select)
+
+        bounds = []
+        offset = 0
+        for src in sources:
+            bounds.append((offset, src))
+            offset += src.row_count
+        select = []
+        for c in columns:
+            if not self._is_provenance(c):
+                select.append(_q(c))
+                continue
+            whens = []
+            for start, src in bounds[1:][::-1]:
+                value = _lit(src.name) if c == "_source" else f"__fusion_ord - {start}"
+                whens.append(f"WHEN __fusion_ord >= {start} THEN {value}")
+            default = _lit(bounds[0][1].name) if c == "_source" else "__fusion_ord"
+            expr = f"CASE {' '.join(whens)} ELSE {default} END" if whens else default
+            select.append(f"{expr} AS {_q(c)}")
+        return ", ".join(select)
+
+    def _union(self, con, sources, source_counts) -> FusionResult:
+        sql, columns = self._union_sql(sources)
+        select = self._output_select(sources, columns)
+        fused, count = self._materialize(
+            con, f"SELECT {select} FROM ({sql}) ORDER BY __fusion_ord", sources, columns
+        )
+        total = sum(src.row_count for src in sources)
+        return FusionResult(
+            success=True,
+            fused_data=fused,
+            record_count=count,
+            source_counts=source_counts,
+            duplicates_removed=total - count,
+        )
+
+    # ------------------------------------------------------------------
+    # Join
+    # ------------------------------------------------------------------
+
+    def _join(self, con, sources, source_counts) -> FusionResult:
+        keys = list(self.config.join_keys or [])
+        if not keys:
+            return FusionResult(success=False, errors=["join_keys must be specified for join strategy"])
+        if len(sources) < 2:
+            return FusionResult(success=False, errors=["At least 2 datasets required for join"])
+
+        how = self.config.join_type
+        if how not in _JOIN_SQL:
+            return FusionResult(success=False, errors=[f"Unknown join type: {how}"])
+
+        # Column naming matches the pandas path: later sources get a suffix
+        renamed: Dict[int, List[Tuple[str, str]]] = {}
+        for n, src in enumerate(sources):
+            renamed[src.position] = [
+                (c, c if n == 0 or c in keys else f"{c}_{src.name}")
+                for c in src.columns
+            ]
+
+        def subquery(src: _Source) -> str:
+            select = ", ".join(f"{_q(c)} AS {_q(alias)}" for c, alias in renamed[src.position])
+            return f"(SELECT {select} FROM {src.view}) AS {_q(src.view)}"
+
+        # Inner joins are commutative: probe from the smallest input up so
+        # intermediate results stay small
+        plan = sorted(sources, key=lambda s: s.row_count) if how == "inner" else list(sources)
+        using = ", ".join(_q(k) for k in keys)
+        from_sql = subquery(plan[0])
+        for src in plan[1:]:
+            from_sql += f" {_JOIN_SQL[how]} {subquery(src)} USING ({using})"
+
+        select = []
+        for src in sources:
+            for _, alias in renamed[src.position]:
+                if alias in keys:
+                    if src is sources[0]:
+                        select.append(_q(alias))
+                else:
+                    select.append(f"{_q(src.view)}.{_q(alias)}")
+        missing_keys = [k for k in keys if k not in sources[0].columns]
+        select = [_q(k) for k in missing_keys] + select
+
+        fused, count = self._materialize(con, f"SELECT {', '.join(select)} FROM {from_sql}")
+        return FusionResult(
+            success=True,
+            fused_data=fused,
+            record_count=count,
+            source_counts=source_counts,
+        )
+
+    # ------------------------------------------------------------------
+    # Merge
+    # ------------------------------------------------------------------
+
+    def _merge(self, con, sources, source_counts) -> FusionResult:
+        sql, columns = self._union_sql(sources)
+        keys = [k for k in (self.config.join_keys or []) if k in columns]
+        mode = self.config.handle_conflicts
+        total = sum(src.row_count for src in sources)
+
+        con.execute(f"CREATE TEMP TABLE __fusion_union AS {sql}")
+        union_count = con.execute("SELECT count(*) FROM __fusion_union").fetchone()[0]
+
+        conflicts_count = 0
+        value_cols = [c for c in columns if c not in keys and not c.startswith("_")]
+        if keys and value_cols:
+            group = ", ".join(_q(k) for k in keys)
+            conflict_terms = " + ".join(
+                f"(count(DISTINCT {_q(c)}) > 1)::BIGINT" for c in value_cols
+            )
+            conflicts_count = con.execute(
+                f"SELECT coalesce(sum(n), 0) FROM (SELECT {conflict_terms} AS n"
+                f" FROM __fusion_union GROUP BY {group})"
+            ).fetchone()[0]
+
+        if conflicts_count and mode == "raise":
+            raise ValueError(f"{conflicts_count} conflicting values across sources")
+
+        select = self._output_select(sources, columns)
+        if not keys or mode == "both":
+            query = f"SELECT {select} FROM __fusion_union ORDER BY __fusion_ord"
+        else:
+            order = "ORDER BY __fusion_ord DESC" if mode == "last" else "ORDER BY __fusion_ord"
+            aggregates = []
+            for c in columns:
+                if c in keys or self._is_provenance(c):
+                    continue
+                if c.startswith("_"):
+                    aggregates.append(f"first({_q(c)} {order}) AS {_q(c)}")
+                else:
+                    aggregates.append(
+                        f"first({_q(c)} {order}) FILTER (WHERE {_q(c)} IS NOT NULL) AS {_q(c)}"
+                    )
+            # Provenance follows the first (or last) row of the group; groups
+            # come out in order of their first row, like groupby(sort=False)
+            row_ord = "max(__fusion_ord)" if mode == "last" else "min(__fusion_ord)"
+            group = ", ".join(_q(k) for k in keys)
+            query = (
+                f"SELECT {select} FROM (SELECT {group}, {', '.join(aggregates + [''])}"
+                f"{row_ord} AS __fusion_ord, min(__fusion_ord) AS __fusion_group_ord"
+                f" FROM __fusion_union GROUP BY {group}) ORDER BY __fusion_group_ord"
+            )
+
+        fused, count = self._materialize(con, query, sources, columns)
+        return FusionResult(
+            success=True,
+            fused_data=fused,
+            record_count=count,
+            source_counts=source_counts,
+            duplicates_removed=total - union_count,
+            conflicts_count=int(conflicts_count),
+        )
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def _attach_provenance(self, df, sources: List[_Source], columns: List[str]):
+        """Replace __fusion_ord with _source/_source_idx columns."""
+        import numpy as np
+
+        ords = df.pop("__fusion_ord").to_numpy(dtype=np.int64)
+        offsets = np.cumsum([0] + [src.row_count for src in sources[:-1]])
+        positions = np.searchsorted(offsets, ords, side="right") - 1
+        names = np.array([src.name for src in sources], dtype=object)
+        df["_source"] = names[positions]
+        df["_source_idx"] = ords - offsets[positions]
+        return df[columns]
+
+    def _materialize(self, con, query: str, sources: Optional[List[_Source]] = None,
+                     columns: Optional[List[str]] = None) -> Tuple[Any, int]:
+        """Run ``query`` into a DataFrame, or a Parquet file if output_path is set."""
+        if self.config.output_path:
+            path = str(self.config.output_path)
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            con.execute(f"COPY ({query}) TO {_lit(path)} (FORMAT PARQUET)")
+            count = con.execute(f"SELECT count(*) FROM read_parquet({_lit(path)})").fetchone()[0]
+            return path, int(count)
+        df = con.execute(query).df()
+        if "__fusion_ord" in df.columns:
+            df = self._attach_provenance(df, sources, columns)
+        return df, len(df)
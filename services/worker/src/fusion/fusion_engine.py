@@ -2,6 +2,9 @@
 Data Fusion Engine
 
 Combines data from multiple sources with provenance tracking.
+
+Small inputs are fused in pandas. Large inputs, or inputs given as Parquet/CSV
+paths, run on DuckDB (see duckdb_backend) when it is installed.
 """
 
 from __future__ import annotations
@@ -28,6 +31,15 @@ class FusionConfig:
     dedup: bool = True
     track_provenance: bool = True
     handle_conflicts: str = "first"  # first, last, both, raise
+    backend: str = "auto"  # auto, pandas, duckdb
+    memory_limit: Optional[str] = None  # DuckDB memory limit, e.g. "8GB"
+    temp_directory: Optional[str] = None  # DuckDB spill directory
+    threads: Optional[int] = None
+    output_path: Optional[str] = None  # DuckDB: write result to Parquet instead of a DataFrame
+
+
+# Total input rows above which backend="auto" switches to DuckDB
+DUCKDB_ROW_THRESHOLD = 1_000_000
 
 
 @dataclass
@@ -91,6 +103,21 @@ class FusionEngine:
                 errors=["No datasets provided for fusion"],
             )
 
+        if self._use_duckdb(datasets):
+            from .duckdb_backend import DuckDBFusionBackend
+
+            try:
+                result = DuckDBFusionBackend(self.config).fuse(datasets)
+                if save_artifact and result.success:
+                    self._save_artifact(result, datasets)
+                return result
+            except Exception as e:
+                logger.exception(f"Fusion error: {e}")
+                return FusionResult(
+                    success=False,
+                    errors=[str(e)],
+                )
+
         if len(datasets) == 1:
             return FusionResult(
                 success=True,
@@ -125,6 +152,26 @@ class FusionEngine:
                 errors=[str(e)],
             )
 
+    def _use_duckdb(self, datasets: List[Dict[str, Any]]) -> bool:
+        """Decide whether this fusion runs on the DuckDB backend."""
+        backend = self.config.backend
+        if backend == "pandas":
+            return False
+        from .duckdb_backend import DUCKDB_AVAILABLE, is_file_source
+
+        if backend == "duckdb":
+            if not DUCKDB_AVAILABLE:
+                raise RuntimeError("duckdb is required for backend='duckdb'")
+            return True
+        if not DUCKDB_AVAILABLE:
+            return False
+
+        datas = [ds.get("data") for ds in datasets]
+        if any(is_file_source(d) for d in datas):
+            return True
+        total_rows = sum(len(d) for d in datas if hasattr(d, "__len__") and not isinstance(d, str))
+        return total_rows >= DUCKDB_ROW_THRESHOLD
+
     def _fuse_union(self, datasets: List[Dict[str, Any]]) -> FusionResult:
         """Fuse datasets using union (vertical stack)."""
         try:
@@ -132,28 +179,25 @@ class FusionEngine:
         except ImportError:
             return self._fuse_union_records(datasets)
 
+        import numpy as np
+
         dfs = []
+        names = []
         source_counts = {}
-        provenance = []
 
         for i, ds in enumerate(datasets):
             name = ds.get("name", f"source_{i}")
             data = ds.get("data")
 
             if isinstance(data, pd.DataFrame):
-                df = data.copy()
+                df = data
             elif isinstance(data, list):
                 df = pd.DataFrame(data)
             else:
                 continue
 
             source_counts[name] = len(df)
-
-            # Add provenance column
-            if self.config.track_provenance:
-                df["_source"] = name
-                df["_source_idx"] = range(len(df))
-
+            names.append(name)
             dfs.append(df)
 
         if not dfs:
@@ -162,10 +206,17 @@ class FusionEngine:
                 errors=["No valid data found in datasets"],
             )
 
-        # Concatenate
+        # Concatenate (the only copy of the inputs), then attach provenance
+        # columns built from the source lengths
         fused = pd.concat(dfs, ignore_index=True, sort=False)
         original_count = len(fused)
 
+        if self.config.track_provenance:
+            lengths = [len(df) for df in dfs]
+            fused["_source"] = np.repeat(np.array(names, dtype=object), lengths)
+            offsets = np.repeat(np.cumsum([0] + lengths[:-1]), lengths)
+            fused["_source_idx"] = np.arange(original_count) - offsets
+
         # Deduplicate
         duplicates_removed = 0
         if self.config.dedup:
@@ -203,16 +254,15 @@ class FusionEngine:
                 if not isinstance(record, dict):
                     continue
 
-                # Add provenance
-                if self.config.track_provenance:
-                    record = {**record, "_source": name, "_source_idx": j}
-
-                # Dedup check
+                # Dedup check on the source record, before provenance is added;
+                # only records carrying their own "_" keys need a filtered copy
                 if self.config.dedup:
-                    # Create hash of record (excluding provenance)
-                    clean_record = {k: v for k, v in record.items() if not k.startswith("_")}
+                    if any(k.startswith("_") for k in record):
+                        key_record = {k: v for k, v in record.items() if not k.startswith("_")}
+                    else:
+                        key_record = record
                     record_hash = hashlib.md5(
-                        json.dumps(clean_record, sort_keys=True, default=str).encode()
+                        json.dumps(key_record, sort_keys=True, default=str).encode()
                     ).hexdigest()
 
                     if record_hash in seen_hashes:
@@ -220,6 +270,10 @@ class FusionEngine:
                         continue
                     seen_hashes.add(record_hash)
 
+                # Add provenance
+                if self.config.track_provenance:
+                    record = {**record, "_source": name, "_source_idx": j}
+
                 all_records.append(record)
 
         return FusionResult(
@@ -254,7 +308,7 @@ class FusionEngine:
             data = ds.get("data")
 
             if isinstance(data, pd.DataFrame):
-                df = data.copy()
+                df = data
             elif isinstance(data, list):
                 df = pd.DataFrame(data)
             else:
@@ -279,15 +333,24 @@ class FusionEngine:
                 errors=["At least 2 datasets required for join"],
             )
 
-        # Perform join
-        result_df = dfs[0]
-        for df in dfs[1:]:
+        # Perform join; inner joins are commutative, so join the smallest
+        # inputs first to keep intermediate frames small
+        if self.config.join_type == "inner":
+            first, rest = dfs[0], sorted(dfs[1:], key=len)
+            columns = list(first.columns) + [c for df in dfs[1:] for c in df.columns if c not in first.columns]
+        else:
+            first, rest, columns = dfs[0], dfs[1:], None
+        result_df = first
+        for df in rest:
             result_df = result_df.merge(
                 df,
                 on=self.config.join_keys,
                 how=self.config.join_type,
             )
 
+        if columns is not None:
+            result_df = result_df[list(dict.fromkeys(columns))]
+
         return FusionResult(
             success=True,
             fused_data=result_df,
@@ -296,18 +359,38 @@ class FusionEngine:
         )
 
     def _fuse_merge(self, datasets: List[Dict[str, Any]]) -> FusionResult:
-        """Fuse datasets with conflict resolution."""
-        # For merge, we first align schemas, then combine with conflict handling
+        """
+        Fuse datasets with conflict resolution.
+
+        Rows are unioned, then collapsed to one row per join_keys value. A
+        conflict is a (key, column) pair with more than one distinct non-null
+        value; handle_conflicts picks the first or last non-null value in
+        source order, keeps every row ("both"), or fails ("raise").
+        """
         result = self._fuse_union(datasets)
 
-        if not result.success:
+        if not result.success or not isinstance(result.fused_data, _pandas_frame_type()):
+            return result
+
+        fused = result.fused_data
+        keys = [k for k in (self.config.join_keys or []) if k in fused.columns]
+        if not keys:
             return result
 
-        # Handle conflicts in overlapping columns
+        value_cols = [c for c in fused.columns if c not in keys and not c.startswith("_")]
+        grouped = fused.groupby(keys, sort=False, dropna=False)
         conflicts_count = 0
-        if self.config.handle_conflicts == "raise":
-            # Check for conflicts and report
-            pass  # Implementation depends on specific requirements
+        if value_cols:
+            conflicts_count = int((grouped[value_cols].nunique() > 1).to_numpy().sum())
+
+        mode = self.config.handle_conflicts
+        if conflicts_count and mode == "raise":
+            raise ValueError(f"{conflicts_count} conflicting values across sources")
+
+        if mode != "both":
+            resolved = grouped.last() if mode == "last" else grouped.first()
+            result.fused_data = resolved.reset_index()[list(fused.columns)]
+            result.record_count = len(result.fused_data)
 
         result.conflicts_count = conflicts_count
         return result
@@ -335,6 +418,7 @@ class FusionEngine:
                     "join_keys": self.config.join_keys,
                     "dedup": self.config.dedup,
                     "handle_conflicts": self.config.handle_conflicts,
+                    "backend": self.config.backend,
                 },
             }
 
@@ -352,6 +436,14 @@ class FusionEngine:
             logger.warning(f"Failed to save artifact: {e}")
 
 
+def _pandas_frame_type():
+    try:
+        import pandas as pd
+    except ImportError:
+        return ()
+    return pd.DataFrame
+
+
 def fuse_datasets(
     datasets: List[Dict[str, Any]],
     strategy: str = "union",
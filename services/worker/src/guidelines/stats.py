@@ -8,12 +8,18 @@ Metrics include:
 - Discrimination: AUC-ROC, C-statistic (Harrell's concordance)
 - Calibration: Calibration slope, intercept, calibration-in-the-large
 - Stage separation: Kaplan-Meier curves, log-rank test
+
+The C-index is computed in O(n log n) by counting concordant pairs over a
+binary partition of the distinct follow-up times. Bootstrap replicates are
+drawn as batched index matrices (seeded per batch, so results do not depend
+on how batches are spread over worker processes).
 """
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -29,6 +35,245 @@ class ValidationResult:
     interpretation: str = ""
 
 
+# Bootstrap replicates are generated in batches of about this many cells
+# (replicates x subjects) to bound memory
+BOOTSTRAP_BATCH_CELLS = 4_000_000
+
+
+def concordance_counts(
+    times: np.ndarray,
+    scores: np.ndarray,
+    events: np.ndarray,
+    weights: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Weighted concordant and comparable pair counts for Harrell's C-index.
+
+    A pair is comparable when the subject with the shorter time had an event
+    (or both had events at the same time); a higher score for the earlier
+    event is concordant, a tied score counts one half, and tied event times
+    count one half. Subject weights act as multiplicities, so a bootstrap
+    replicate is a column of resample counts.
+
+    Args:
+        times: Follow-up times, shape (n,)
+        scores: Risk scores (higher = higher risk), shape (n,)
+        events: Event indicators (1=event), shape (n,)
+        weights: Multiplicities, shape (n,) or (n, B); default all ones
+
+    Returns:
+        (concordant, comparable), each of shape (B,)
+    """
+    times = np.asarray(times, dtype=float)
+    scores = np.asarray(scores, dtype=float)
+    is_event = np.asarray(events) == 1
+    n = len(times)
+    if weights is None:
+        weights = np.ones((n, 1))
+    weights = np.asarray(weights, dtype=float).reshape(n, -1)
+    n_reps = weights.shape[1]
+
+    # Subjects without a time are never comparable
+    keep = ~np.isnan(times)
+    times, scores, is_event, weights = times[keep], scores[keep], is_event[keep], weights[keep]
+    if len(times) == 0:
+        return np.zeros(n_reps), np.zeros(n_reps)
+
+    unique_times, group = np.unique(times, return_inverse=True)
+    n_groups = len(unique_times)
+
+    # Comparable: each event against every subject with a later time, plus
+    # pairs of events sharing a time
+    total_by_group = np.zeros((n_groups, n_reps))
+    np.add.at(total_by_group, group, weights)
+    events_by_group = np.zeros((n_groups, n_reps))
+    np.add.at(events_by_group, group[is_event], weights[is_event])
+    later = total_by_group.sum(axis=0) - np.cumsum(total_by_group, axis=0)
+    tied_events = (events_by_group * (events_by_group - 1) / 2).sum(axis=0)
+    comparable = (events_by_group * later).sum(axis=0) + tied_events
+
+    # Concordant: a pair (earlier event i, later subject j) is counted at
+    # the level where the binary partition of time groups splits them
+    has_score = ~np.isnan(scores)
+    _, rank = np.unique(scores[has_score], return_inverse=True)
+    score_rank = np.full(len(scores), -1, dtype=np.int64)
+    score_rank[has_score] = rank
+    stride = int(rank.max()) + 2 if len(rank) else 1
+
+    concordant = 0.5 * tied_events
+    level = 0
+    while (1 << level) < n_groups:
+        side = (group >> level) & 1
+        node = (group >> (level + 1)).astype(np.int64)
+
+        later_side = np.flatnonzero((side == 1) & has_score)
+        queries = np.flatnonzero((side == 0) & has_score & is_event)
+        level += 1
+        if len(later_side) == 0 or len(queries) == 0:
+            continue
+
+        keys = node[later_side] * stride + score_rank[later_side]
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        cum = np.zeros((len(keys) + 1, n_reps))
+        np.cumsum(weights[later_side[order]], axis=0, out=cum[1:])
+
+        base = node[queries] * stride
+        start = np.searchsorted(keys, base, side="left")
+        below = np.searchsorted(keys, base + score_rank[queries], side="left")
+        through = np.searchsorted(keys, base + score_rank[queries], side="right")
+        lower = cum[below] - cum[start]
+        equal = cum[through] - cum[below]
+        concordant = concordant + (weights[queries] * (lower + 0.5 * equal)).sum(axis=0)
+
+    return np.asarray(concordant, dtype=float), comparable
+
+
+def concordance_index(
+    times: np.ndarray,
+    scores: np.ndarray,
+    events: np.ndarray,
+    weights: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Harrell's C-index, per weight column (0.5 when no pair is comparable).
+
+    See concordance_counts for arguments.
+    """
+    concordant, comparable = concordance_counts(times, scores, events, weights)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(comparable > 0, concordant / comparable, 0.5)
+
+
+def kaplan_meier(times: np.ndarray, events: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Kaplan-Meier estimate at each distinct event time.
+
+    Subjects leave the risk set at event times (events and censorings
+    recorded at that time), and the curve is a cumulative product over
+    event times.
+
+    Args:
+        times: Follow-up times
+        events: Event indicators (1=event, 0=censored)
+
+    Returns:
+        (times starting at 0, survival probabilities starting at 1)
+    """
+    times = np.asarray(times)
+    events = np.asarray(events)
+    event_times = np.sort(times[events == 1])
+    censored_times = np.sort(times[events == 0])
+    unique_times = np.unique(event_times)
+
+    n_events = (
+        np.searchsorted(event_times, unique_times, side="right")
+        - np.searchsorted(event_times, unique_times, side="left")
+    )
+    n_censored = (
+        np.searchsorted(censored_times, unique_times, side="right")
+        - np.searchsorted(censored_times, unique_times, side="left")
+    )
+    removed_before = np.concatenate([[0], np.cumsum(n_events + n_censored)[:-1]])
+    n_at_risk = len(times) - removed_before
+
+    survival = np.ones(len(unique_times) + 1)
+    survival[1:] = np.cumprod(1 - n_events / n_at_risk)
+    return np.concatenate([[0], unique_times]), survival
+
+
+def auc_rows(y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    """AUC-ROC (trapezoidal rule) for each row of 2-D label/score arrays."""
+    order = np.argsort(y_pred, axis=1)[:, ::-1]
+    y_sorted = np.take_along_axis(y_true, order, axis=1)
+    n_pos = y_sorted.sum(axis=1)
+    n_neg = y_sorted.shape[1] - n_pos
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        tpr = np.cumsum(y_sorted, axis=1) / n_pos[:, None]
+        fpr = np.cumsum(1 - y_sorted, axis=1) / n_neg[:, None]
+    zeros = np.zeros((len(y_sorted), 1))
+    auc = np.trapz(np.hstack([zeros, tpr]), np.hstack([zeros, fpr]), axis=1)
+    return np.where((n_pos == 0) | (n_neg == 0), 0.5, auc)
+
+
+def _auc_replicates(arrays: Tuple[np.ndarray, ...], idx: np.ndarray) -> np.ndarray:
+    y_true, y_pred = arrays
+    return auc_rows(y_true[idx], y_pred[idx])
+
+
+def _brier_replicates(arrays: Tuple[np.ndarray, ...], idx: np.ndarray) -> np.ndarray:
+    y_true, y_pred = arrays
+    return np.mean((y_pred[idx] - y_true[idx]) ** 2, axis=1)
+
+
+def _c_index_replicates(arrays: Tuple[np.ndarray, ...], idx: np.ndarray) -> np.ndarray:
+    times, scores, events = arrays
+    n_reps, n = idx.shape
+    # Resample counts per subject, one column per replicate
+    counts = np.bincount(
+        (idx + np.arange(n_reps)[:, None] * n).ravel(), minlength=n_reps * n
+    ).reshape(n_reps, n).T
+    return concordance_index(times, scores, events, counts)
+
+
+def _bootstrap_batch(
+    statistic: Callable[[Tuple[np.ndarray, ...], np.ndarray], np.ndarray],
+    arrays: Tuple[np.ndarray, ...],
+    n_reps: int,
+    seed: np.random.SeedSequence,
+) -> np.ndarray:
+    """Evaluate ``statistic`` on one batch of resampled index rows."""
+    n = len(arrays[0])
+    idx = np.random.default_rng(seed).integers(0, n, size=(n_reps, n))
+    return statistic(arrays, idx)
+
+
+def bootstrap_replicates(
+    statistic: Callable[[Tuple[np.ndarray, ...], np.ndarray], np.ndarray],
+    arrays: Tuple[np.ndarray, ...],
+    n_bootstrap: int,
+    random_state: Optional[int] = None,
+    n_jobs: int = 1,
+) -> np.ndarray:
+    """
+    Bootstrap a statistic over paired resamples of ``arrays``.
+
+    Replicates are generated in batches; each batch has its own child seed
+    of ``random_state``, so the values are identical for any ``n_jobs``.
+
+    Args:
+        statistic: Module-level function (arrays, index matrix) -> values
+        arrays: Equal-length arrays resampled together
+        n_bootstrap: Number of replicates
+        random_state: Seed (None for fresh entropy)
+        n_jobs: Worker processes for the batches
+
+    Returns:
+        Array of n_bootstrap statistic values
+    """
+    n = len(arrays[0])
+    batch = max(1, min(n_bootstrap, BOOTSTRAP_BATCH_CELLS // max(n, 1)))
+    sizes = [min(batch, n_bootstrap - start) for start in range(0, n_bootstrap, batch)]
+    seeds = np.random.SeedSequence(random_state).spawn(len(sizes))
+
+    if n_jobs > 1 and len(sizes) > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            parts = list(executor.map(
+                _bootstrap_batch,
+                [statistic] * len(sizes),
+                [arrays] * len(sizes),
+                sizes,
+                seeds,
+            ))
+    else:
+        parts = [
+            _bootstrap_batch(statistic, arrays, size, seed)
+            for size, seed in zip(sizes, seeds)
+        ]
+    return np.concatenate(parts) if parts else np.array([])
+
+
 class ValidationStats:
     """
     Calculate validation statistics for clinical prediction models.
@@ -59,6 +304,8 @@ class ValidationStats:
         predicted_prob: str,
         outcome: str,
         n_bootstrap: int = 1000,
+        random_state: Optional[int] = None,
+        n_jobs: int = 1,
     ) -> List[ValidationResult]:
         """
         Calculate discrimination metrics for binary outcomes.
@@ -67,6 +314,8 @@ class ValidationStats:
             predicted_prob: Column name for predicted probabilities (0-1)
             outcome: Column name for binary outcome (0/1)
             n_bootstrap: Number of bootstrap samples for confidence intervals
+            random_state: Seed for the bootstrap resamples
+            n_jobs: Worker processes for bootstrap batches
 
         Returns:
             List of ValidationResult for AUC-ROC and Brier score
@@ -77,21 +326,15 @@ class ValidationStats:
         # AUC-ROC
         auc = self._calculate_auc(y_true, y_pred)
         auc_ci = self._bootstrap_ci(
-            lambda: self._calculate_auc(
-                np.random.choice(y_true, size=len(y_true), replace=True),
-                np.random.choice(y_pred, size=len(y_pred), replace=True),
-            ),
-            n_bootstrap,
+            _auc_replicates, (y_true, y_pred), n_bootstrap,
+            random_state=random_state, n_jobs=n_jobs,
         )
 
         # Brier score
         brier = self._calculate_brier(y_true, y_pred)
         brier_ci = self._bootstrap_ci(
-            lambda: self._calculate_brier(
-                np.random.choice(y_true, size=len(y_true), replace=True),
-                np.random.choice(y_pred, size=len(y_pred), replace=True),
-            ),
-            n_bootstrap,
+            _brier_replicates, (y_true, y_pred), n_bootstrap,
+            random_state=random_state, n_jobs=n_jobs,
         )
 
         return [
@@ -117,6 +360,8 @@ class ValidationStats:
         time_col: str,
         event_col: str,
         n_bootstrap: int = 1000,
+        random_state: Optional[int] = None,
+        n_jobs: int = 1,
     ) -> List[ValidationResult]:
         """
         Calculate discrimination for time-to-event outcomes.
@@ -126,24 +371,23 @@ class ValidationStats:
             time_col: Column with follow-up time
             event_col: Column with event indicator (1=event, 0=censored)
             n_bootstrap: Number of bootstrap samples for CI
+            random_state: Seed for the bootstrap resamples
+            n_jobs: Worker processes for bootstrap batches
 
         Returns:
             List of ValidationResult with C-index
         """
         # C-index (Harrell's concordance)
-        c_index = self._calculate_c_index(
+        arrays = (
             self.data[time_col].values,
             self.data[score_col].values,
             self.data[event_col].values,
         )
+        c_index = self._calculate_c_index(*arrays)
 
         c_ci = self._bootstrap_ci(
-            lambda: self._calculate_c_index(
-                self.data[time_col].values,
-                self.data[score_col].values,
-                self.data[event_col].values,
-            ),
-            n_bootstrap,
+            _c_index_replicates, arrays, n_bootstrap,
+            random_state=random_state, n_jobs=n_jobs,
         )
 
         return [
@@ -295,54 +539,13 @@ class ValidationStats:
 
         Higher score should indicate higher risk (shorter survival).
         """
-        n = len(times)
-        concordant = 0
-        comparable = 0
-
-        for i in range(n):
-            for j in range(i + 1, n):
-                # Skip pairs where neither had event or both censored before comparison
-                if events[i] == 0 and events[j] == 0:
-                    continue
-
-                # Determine which subject had shorter time (if comparable)
-                if times[i] < times[j] and events[i] == 1:
-                    comparable += 1
-                    if scores[i] > scores[j]:
-                        concordant += 1
-                    elif scores[i] == scores[j]:
-                        concordant += 0.5
-                elif times[j] < times[i] and events[j] == 1:
-                    comparable += 1
-                    if scores[j] > scores[i]:
-                        concordant += 1
-                    elif scores[i] == scores[j]:
-                        concordant += 0.5
-                elif times[i] == times[j] and events[i] == 1 and events[j] == 1:
-                    comparable += 1
-                    concordant += 0.5
-
-        return concordant / comparable if comparable > 0 else 0.5
+        return float(concordance_index(times, scores, events)[0])
 
     def _kaplan_meier(
         self, times: np.ndarray, events: np.ndarray
     ) -> Tuple[np.ndarray, np.ndarray]:
         """Simple Kaplan-Meier survival estimate."""
-        # Get unique event times
-        unique_times = np.unique(times[events == 1])
-        unique_times = np.sort(unique_times)
-
-        survival = np.ones(len(unique_times) + 1)
-        km_times = np.concatenate([[0], unique_times])
-
-        n_at_risk = len(times)
-        for i, t in enumerate(unique_times):
-            n_events = np.sum((times == t) & (events == 1))
-            n_censored = np.sum((times == t) & (events == 0))
-            survival[i + 1] = survival[i] * (1 - n_events / n_at_risk)
-            n_at_risk -= (n_events + n_censored)
-
-        return km_times, survival
+        return kaplan_meier(times, events)
 
     def _log_rank_test(
         self, data: pd.DataFrame, stage_col: str, time_col: str, event_col: str
@@ -396,10 +599,18 @@ class ValidationStats:
         return slope, intercept
 
     def _bootstrap_ci(
-        self, func: callable, n_bootstrap: int, alpha: float = 0.05
+        self,
+        statistic: Callable[[Tuple[np.ndarray, ...], np.ndarray], np.ndarray],
+        arrays: Tuple[np.ndarray, ...],
+        n_bootstrap: int,
+        alpha: float = 0.05,
+        random_state: Optional[int] = None,
+        n_jobs: int = 1,
     ) -> Tuple[float, float]:
-        """Calculate bootstrap confidence interval."""
-        bootstrap_values = [func() for _ in range(n_bootstrap)]
+        """Calculate percentile bootstrap confidence interval."""
+        bootstrap_values = bootstrap_replicates(
+            statistic, arrays, n_bootstrap, random_state=random_state, n_jobs=n_jobs
+        )
         lower = np.percentile(bootstrap_values, 100 * alpha / 2)
         upper = np.percentile(bootstrap_values, 100 * (1 - alpha / 2))
         return lower, upper
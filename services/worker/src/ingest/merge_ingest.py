@@ -6,6 +6,8 @@ Handles ingestion and merging of multiple files/sheets with:
 - Automatic ID column detection using fuzzy matching
 - Support for CSV, TSV, Excel (xlsx/xls), Parquet
 - Large file handling via Dask chunking
+- Concurrent file/sheet reading through a bounded worker pool
+- Out-of-core merge in DuckDB (merge_backend="duckdb")
 - Audit manifests for provenance tracking
 - PHI governance mode awareness
 
@@ -14,9 +16,10 @@ Part of the multi-file ingestion feature.
 import os
 import json
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Union, Any, Tuple
+from typing import Callable, Dict, List, Optional, Union, Any, Tuple
 from dataclasses import dataclass, field, asdict
 import pandas as pd
 
@@ -71,6 +74,98 @@ except ImportError:
     )
 
 
+MERGE_BACKENDS = ("pandas", "duckdb")
+
+_JOIN_SQL = {
+    "inner": "INNER JOIN",
+    "left": "LEFT JOIN",
+    "right": "RIGHT JOIN",
+    "outer": "FULL OUTER JOIN",
+}
+
+# Sources joined per DuckDB statement; bounds the hash tables alive at once
+MERGE_JOIN_BATCH = 16
+
+# File types DuckDB scans in place; others are read with pandas and registered
+_DUCKDB_SCANS = {
+    ".csv": "read_csv_auto({path})",
+    ".tsv": "read_csv_auto({path}, delim='\\t')",
+    ".parquet": "read_parquet({path})",
+}
+
+
+def _q(identifier: str) -> str:
+    """Quote a SQL identifier."""
+    return '"' + str(identifier).replace('"', '""') + '"'
+
+
+def _lit(value: Any) -> str:
+    """Quote a SQL string literal."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _read_path(
+    file_path: Path,
+    use_dask: bool = False,
+    use_polars: bool = False,
+    chunk_size: str = "50MB",
+) -> pd.DataFrame:
+    """Read one file by extension (module-level so process pools can run it)."""
+    suffix = file_path.suffix.lower()
+
+    if suffix == '.csv':
+        if use_dask:
+            ddf = dd.read_csv(file_path, blocksize=chunk_size)
+            return ddf.compute()
+        return pd.read_csv(file_path)
+
+    elif suffix == '.tsv':
+        if use_dask:
+            ddf = dd.read_csv(file_path, sep='\t', blocksize=chunk_size)
+            return ddf.compute()
+        return pd.read_csv(file_path, sep='\t')
+
+    elif suffix in ['.xlsx', '.xls']:
+        return pd.read_excel(file_path)
+
+    elif suffix == '.parquet':
+        if use_polars:
+            return pl.read_parquet(file_path).to_pandas()
+        return pd.read_parquet(file_path)
+
+    else:
+        raise ValueError(f"Unsupported file type: {suffix}")
+
+
+def _sniff_scan(conn, file_path: Path) -> str:
+    """
+    DuckDB scan expression for a file, sniffing CSV dialect and types once.
+
+    The sniffed read_csv call has auto-detection disabled, so views built
+    on it are not re-sniffed every time a query binds them.
+    """
+    scan = _DUCKDB_SCANS[file_path.suffix.lower()].format(path=_lit(file_path))
+    if file_path.suffix.lower() == '.parquet':
+        return scan
+
+    options = ", delim='\\t'" if file_path.suffix.lower() == '.tsv' else ""
+    cursor = conn.cursor()
+    try:
+        prompt = cursor.execute(
+            f"SELECT Prompt FROM sniff_csv({_lit(file_path)}{options})"
+        ).fetchone()[0].strip().rstrip(';')
+    except duckdb.Error:
+        return scan
+    finally:
+        cursor.close()
+    return prompt[len("FROM "):] if prompt.startswith("FROM read_csv(") else scan
+
+
+def _read_sheet(file_path: Path, sheet: str) -> pd.DataFrame:
+    """Read one workbook sheet (module-level so process pools can run it)."""
+    return pd.read_excel(file_path, sheet_name=sheet)
+
+
 @dataclass
 class MergeManifest:
     """Audit manifest for merge operations."""
@@ -117,16 +212,28 @@ class MergeResult:
     needs_confirmation: bool = False
     confirmation_prompt: Optional[str] = None
     candidates: List[IDCandidate] = field(default_factory=list)
+    # Set instead of dataframe when the merge ran in DuckDB
+    duckdb_path: Optional[str] = None
+    duckdb_table: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
+        if self.dataframe is not None:
+            row_count, column_count = len(self.dataframe), len(self.dataframe.columns)
+        elif self.duckdb_table is not None:
+            row_count = self.manifest.rows_after_merge or 0
+            column_count = len(self.manifest.columns_merged)
+        else:
+            row_count, column_count = 0, 0
         return {
             'success': self.success,
             'needs_confirmation': self.needs_confirmation,
             'confirmation_prompt': self.confirmation_prompt,
             'manifest': self.manifest.to_dict(),
             'candidates': [c.to_dict() for c in self.candidates],
-            'row_count': len(self.dataframe) if self.dataframe is not None else 0,
-            'column_count': len(self.dataframe.columns) if self.dataframe is not None else 0,
+            'row_count': row_count,
+            'column_count': column_count,
+            'duckdb_path': self.duckdb_path,
+            'duckdb_table': self.duckdb_table,
         }
 
 
@@ -142,7 +249,10 @@ class MultiFileIngestEngine:
     - Automatic ID column detection using fuzzy matching
     - Support for CSV, TSV, Excel (xlsx/xls), Parquet
     - Large file handling via Dask chunking
+    - Concurrent reads through a bounded thread or process pool
     - Optional DuckDB persistence for provenance
+    - Out-of-core DuckDB merge: files are scanned in place as views and the
+      merged table never passes through pandas
     - PHI governance mode awareness
     """
 
@@ -155,6 +265,9 @@ class MultiFileIngestEngine:
         use_dask: bool = True,
         use_polars: bool = False,
         use_duckdb: bool = False,
+        max_workers: Optional[int] = None,
+        use_processes: bool = False,
+        merge_backend: str = "pandas",
     ):
         """
         Initialize the multi-file ingest engine.
@@ -167,13 +280,27 @@ class MultiFileIngestEngine:
             use_dask: Enable Dask for large file processing
             use_polars: Enable Polars for high-performance operations
             use_duckdb: Enable DuckDB for persistent storage
+            max_workers: Maximum files/sheets read concurrently
+                (default min(4, CPU count); 1 = sequential)
+            use_processes: Use a process pool instead of threads (for
+                GIL-bound readers such as Excel)
+            merge_backend: "pandas" (in memory) or "duckdb" (out of core;
+                the result is a table in the provenance database)
         """
+        if merge_backend not in MERGE_BACKENDS:
+            raise ValueError(f"Unknown merge backend: {merge_backend}")
         self.governance_mode = governance_mode
         self.chunk_size = chunk_size
         self.fuzzy_threshold = fuzzy_threshold
         self.use_dask = use_dask and DASK_AVAILABLE
         self.use_polars = use_polars and POLARS_AVAILABLE
         self.use_duckdb = use_duckdb and DUCKDB_AVAILABLE
+        self.max_workers = max(1, max_workers or min(4, os.cpu_count() or 1))
+        self.use_processes = use_processes
+        if merge_backend == "duckdb" and not DUCKDB_AVAILABLE:
+            logger.warning("duckdb not available - falling back to pandas merge")
+            merge_backend = "pandas"
+        self.merge_backend = merge_backend
 
         # Setup artifacts directory
         if artifacts_dir:
@@ -188,9 +315,60 @@ class MultiFileIngestEngine:
         logger.info(
             f"MultiFileIngestEngine initialized: "
             f"governance={governance_mode}, dask={self.use_dask}, "
-            f"polars={self.use_polars}, duckdb={self.use_duckdb}"
+            f"polars={self.use_polars}, duckdb={self.use_duckdb}, "
+            f"workers={self.max_workers}, merge_backend={self.merge_backend}"
         )
 
+    def _run_concurrently(
+        self,
+        func: Callable[..., Any],
+        arg_tuples: List[Tuple[Any, ...]],
+        use_processes: Optional[bool] = None,
+    ) -> List[Any]:
+        """
+        Run func over argument tuples in the bounded worker pool.
+
+        Args:
+            func: Module-level function (picklable for process pools)
+            arg_tuples: Positional arguments per call
+            use_processes: Override the engine's pool type
+
+        Returns:
+            Results in input order; failed calls yield their exception
+        """
+        if use_processes is None:
+            use_processes = self.use_processes
+        if self.max_workers <= 1 or len(arg_tuples) <= 1:
+            results = []
+            for args in arg_tuples:
+                try:
+                    results.append(func(*args))
+                except Exception as e:
+                    results.append(e)
+            return results
+
+        pool_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with pool_cls(max_workers=min(self.max_workers, len(arg_tuples))) as executor:
+            futures = [executor.submit(func, *args) for args in arg_tuples]
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append(e)
+        return results
+
+    def _list_files(self, directory: Path, file_pattern: str) -> List[Path]:
+        """Files matching comma-separated glob patterns, first match wins."""
+        file_paths = []
+        seen = set()
+        for pattern in (p.strip() for p in file_pattern.split(',')):
+            for file_path in directory.glob(pattern):
+                if file_path not in seen:
+                    seen.add(file_path)
+                    file_paths.append(file_path)
+        return file_paths
+
     def read_directory(
         self,
         directory: Union[str, Path],
@@ -211,16 +389,18 @@ class MultiFileIngestEngine:
             raise FileNotFoundError(f"Directory not found: {directory}")
 
         dataframes = {}
-        patterns = [p.strip() for p in file_pattern.split(',')]
+        file_paths = self._list_files(directory, file_pattern)
+        results = self._run_concurrently(
+            _read_path,
+            [(p, self.use_dask, self.use_polars, self.chunk_size) for p in file_paths],
+        )
 
-        for pattern in patterns:
-            for file_path in directory.glob(pattern):
-                try:
-                    df = self._read_single_file(file_path)
-                    dataframes[file_path.name] = df
-                    logger.info(f"Read {file_path.name}: {len(df)} rows, {len(df.columns)} columns")
-                except Exception as e:
-                    logger.error(f"Failed to read {file_path.name}: {e}")
+        for file_path, df in zip(file_paths, results):
+            if isinstance(df, Exception):
+                logger.error(f"Failed to read {file_path.name}: {df}")
+                continue
+            dataframes[file_path.name] = df
+            logger.info(f"Read {file_path.name}: {len(df)} rows, {len(df.columns)} columns")
 
         return dataframes
 
@@ -251,6 +431,19 @@ class MultiFileIngestEngine:
         sheet_names = sheets if sheets else xl.sheet_names
         dataframes = {}
 
+        # Excel parsing holds the GIL, so sheets are only split across processes
+        if self.use_processes and self.max_workers > 1 and len(sheet_names) > 1:
+            results = self._run_concurrently(
+                _read_sheet, [(file_path, sheet) for sheet in sheet_names]
+            )
+            for sheet, df in zip(sheet_names, results):
+                if isinstance(df, Exception):
+                    logger.error(f"Failed to read sheet '{sheet}': {df}")
+                    continue
+                dataframes[f"{file_path.stem}_{sheet}"] = df
+                logger.info(f"Read sheet '{sheet}': {len(df)} rows, {len(df.columns)} columns")
+            return dataframes
+
         for sheet in sheet_names:
             try:
                 df = pd.read_excel(xl, sheet_name=sheet)
@@ -272,30 +465,7 @@ class MultiFileIngestEngine:
         Returns:
             DataFrame with file contents
         """
-        suffix = file_path.suffix.lower()
-
-        if suffix == '.csv':
-            if self.use_dask:
-                ddf = dd.read_csv(file_path, blocksize=self.chunk_size)
-                return ddf.compute()
-            return pd.read_csv(file_path)
-
-        elif suffix == '.tsv':
-            if self.use_dask:
-                ddf = dd.read_csv(file_path, sep='\t', blocksize=self.chunk_size)
-                return ddf.compute()
-            return pd.read_csv(file_path, sep='\t')
-
-        elif suffix in ['.xlsx', '.xls']:
-            return pd.read_excel(file_path)
-
-        elif suffix == '.parquet':
-            if self.use_polars:
-                return pl.read_parquet(file_path).to_pandas()
-            return pd.read_parquet(file_path)
-
-        else:
-            raise ValueError(f"Unsupported file type: {suffix}")
+        return _read_path(file_path, self.use_dask, self.use_polars, self.chunk_size)
 
     def ingest_and_detect(
         self,
@@ -443,6 +613,9 @@ class MultiFileIngestEngine:
         try:
             source = Path(source)
 
+            if self.merge_backend == "duckdb":
+                return self._complete_merge_duckdb(source, id_column, manifest, file_pattern, merge_strategy)
+
             # Re-read files
             if source.is_dir():
                 dataframes = self.read_directory(source, file_pattern)
@@ -565,6 +738,252 @@ class MultiFileIngestEngine:
 
         return result
 
+    def _complete_merge_duckdb(
+        self,
+        source: Path,
+        id_column: str,
+        manifest: MergeManifest,
+        file_pattern: str,
+        merge_strategy: str,
+    ) -> MergeResult:
+        """
+        Merge sources inside DuckDB (Phase 2, out-of-core backend).
+
+        CSV/TSV/Parquet files are registered as views over in-place scans;
+        Excel files and sheets are read concurrently and registered as
+        frames. The merge produces the same columns as _merge_dataframes
+        and is written to a table in the provenance database; ID checks
+        run as SQL aggregates. Row order is not guaranteed and null IDs
+        do not join each other (SQL semantics).
+
+        Args:
+            source: Directory path, workbook or single file
+            id_column: Confirmed ID column to merge on
+            manifest: Manifest from Phase 1
+            file_pattern: Glob pattern for files
+            merge_strategy: Merge strategy ('outer', 'inner', 'left', 'right')
+
+        Returns:
+            MergeResult with duckdb_path/duckdb_table set
+        """
+        if merge_strategy not in _JOIN_SQL:
+            raise ValueError(f"Unknown merge strategy: {merge_strategy}")
+
+        db_path = self.artifacts_dir / "merge_provenance.duckdb"
+        conn = duckdb.connect(str(db_path))
+        try:
+            sources = self._register_duckdb_sources(conn, source, file_pattern)
+            if not sources:
+                manifest.errors.append("No data files found")
+                return MergeResult(success=False, dataframe=None, manifest=manifest)
+
+            # Validate ID column exists in all sources (schemas only)
+            schemas = {name: pd.DataFrame(columns=cols) for name, _, cols in sources}
+            is_valid, error = validate_id_column(schemas, id_column, self.fuzzy_threshold)
+            if not is_valid:
+                manifest.errors.append(error)
+                return MergeResult(success=False, dataframe=None, manifest=manifest)
+
+            logger.info(f"Merging {len(sources)} sources in DuckDB on '{id_column}' using {merge_strategy} join")
+            subqueries = self._build_merge_sql(sources, id_column, manifest)
+            table = f"merge_{manifest.run_id}"
+            self._run_merge_batches(conn, subqueries, id_column, merge_strategy, table)
+
+            total, non_null, distinct = conn.execute(
+                f"SELECT count(*), count({_q(id_column)}), count(DISTINCT {_q(id_column)}) "
+                f"FROM {_q(table)}"
+            ).fetchone()
+            manifest.completed_at = datetime.utcnow().isoformat()
+            manifest.rows_after_merge = int(total)
+            manifest.columns_merged = [
+                row[0] for row in conn.execute(f"DESCRIBE {_q(table)}").fetchall()
+            ]
+
+            # Nulls count as one distinct value, as in pandas duplicated()
+            dup_count = total - distinct - (1 if non_null < total else 0)
+            manifest.warnings.extend(self._id_warnings(int(dup_count), int(total - non_null)))
+
+            manifest_path = self.artifacts_dir / f"merge_manifest_{manifest.run_id}.json"
+            manifest.save(str(manifest_path))
+            self._record_manifest(conn, manifest)
+
+            logger.info(f"Merge complete: {total} rows, {len(manifest.columns_merged)} columns in {table}")
+
+            return MergeResult(
+                success=True,
+                dataframe=None,
+                manifest=manifest,
+                duckdb_path=str(db_path),
+                duckdb_table=table,
+            )
+        finally:
+            conn.close()
+
+    def _register_duckdb_sources(
+        self,
+        conn,
+        source: Path,
+        file_pattern: str,
+    ) -> List[Tuple[str, str, List[str]]]:
+        """
+        Register every source as a DuckDB view.
+
+        Returns:
+            List of (source name, view name, column names) in merge order
+        """
+        if source.is_dir():
+            file_paths = self._list_files(source, file_pattern)
+        elif source.suffix.lower() in ['.xlsx', '.xls']:
+            file_paths = []
+        else:
+            file_paths = [source]
+
+        # Files DuckDB cannot scan are read concurrently up front
+        frames: Dict[str, pd.DataFrame] = {}
+        if source.is_file() and source.suffix.lower() in ['.xlsx', '.xls']:
+            frames = self.read_multi_sheet_workbook(source)
+        else:
+            to_read = [p for p in file_paths if p.suffix.lower() not in _DUCKDB_SCANS]
+            results = self._run_concurrently(
+                _read_path,
+                [(p, self.use_dask, self.use_polars, self.chunk_size) for p in to_read],
+            )
+            for file_path, df in zip(to_read, results):
+                if isinstance(df, Exception):
+                    logger.error(f"Failed to read {file_path.name}: {df}")
+                else:
+                    frames[file_path.name] = df
+
+        to_scan = [p for p in file_paths if p.suffix.lower() in _DUCKDB_SCANS]
+        scans = dict(zip(
+            (p.name for p in to_scan),
+            # DuckDB releases the GIL, so sniffing always uses threads
+            self._run_concurrently(_sniff_scan, [(conn, p) for p in to_scan], use_processes=False),
+        ))
+
+        ordered = [p.name for p in file_paths] if file_paths else list(frames)
+        sources = []
+        for i, name in enumerate(ordered):
+            view = f"__merge_src_{i}"
+            if name in frames:
+                conn.register(view, frames[name])
+            elif isinstance(scans.get(name), str):
+                try:
+                    conn.execute(f"CREATE OR REPLACE TEMP VIEW {view} AS SELECT * FROM {scans[name]}")
+                except duckdb.Error as e:
+                    logger.error(f"Failed to read {name}: {e}")
+                    continue
+            else:
+                if isinstance(scans.get(name), Exception):
+                    logger.error(f"Failed to read {name}: {scans[name]}")
+                continue
+            columns = [row[0] for row in conn.execute(f"DESCRIBE {view}").fetchall()]
+            sources.append((name, view, columns))
+        return sources
+
+    def _build_merge_sql(
+        self,
+        sources: List[Tuple[str, str, List[str]]],
+        id_column: str,
+        manifest: MergeManifest,
+    ) -> List[Tuple[str, List[str]]]:
+        """
+        Build per-source projections with the column naming of _merge_dataframes.
+
+        Returns:
+            One (SELECT renaming the source's columns, output names) per source
+        """
+        result_columns: List[str] = []
+        subqueries = []
+
+        for position, (name, view, columns) in enumerate(sources):
+            alias = find_matching_column(columns, id_column, self.fuzzy_threshold)
+            manifest.id_column_aliases[name] = alias
+
+            select = []
+            names = []
+            for col in columns:
+                if col == alias:
+                    select.append(f"{_q(alias)} AS {_q(id_column)}")
+                    names.append(id_column)
+                    continue
+                if col == '_source':
+                    continue
+                out = col
+                if position > 0 and col != id_column and col in result_columns:
+                    out = f"{col}_{name}"
+                if position > 0 and out in result_columns:
+                    out = f"{out}_{name}"
+                select.append(f"{_q(col)} AS {_q(out)}")
+                names.append(out)
+
+            source_col = '_source' if position == 0 else f"_source_{name}"
+            select.append(f"{_lit(name)} AS {_q(source_col)}")
+            names.append(source_col)
+
+            subqueries.append((f"SELECT {', '.join(select)} FROM {view}", names))
+            result_columns += [n for n in names if n not in result_columns]
+
+        return subqueries
+
+    def _run_merge_batches(
+        self,
+        conn,
+        subqueries: List[Tuple[str, List[str]]],
+        id_column: str,
+        strategy: str,
+        table: str,
+    ) -> None:
+        """
+        Join the sources left-deep into ``table``.
+
+        Joins run MERGE_JOIN_BATCH sources per statement into an
+        intermediate table, so memory does not grow with the number of
+        files (a single 200-way join keeps every hash table alive). The
+        merged ID follows pandas: the left key for inner/left joins, the
+        right key for right joins, and the first non-null key for outer.
+        """
+        key = _q(id_column)
+        current, columns = f"({subqueries[0][0]})", subqueries[0][1]
+        start = 1
+        step = 0
+        while True:
+            batch = subqueries[start:start + MERGE_JOIN_BATCH]
+            start += len(batch)
+
+            key_exprs = [f"acc.{key}"]
+            select = [f"acc.{_q(c)}" for c in columns if c != id_column]
+            joins = []
+            for i, (sub, names) in enumerate(batch):
+                if strategy == "outer":
+                    left_key = f"COALESCE({', '.join(key_exprs)})" if len(key_exprs) > 1 else key_exprs[0]
+                else:
+                    left_key = key_exprs[-1] if strategy == "right" else key_exprs[0]
+                joins.append(f"{_JOIN_SQL[strategy]} ({sub}) AS t{i} ON {left_key} = t{i}.{key}")
+                key_exprs.append(f"t{i}.{key}")
+                select += [f"t{i}.{_q(c)}" for c in names if c != id_column]
+
+            if strategy == "outer" and len(key_exprs) > 1:
+                merged_key = f"COALESCE({', '.join(key_exprs)})"
+            else:
+                merged_key = key_exprs[-1] if strategy == "right" else key_exprs[0]
+
+            # Keep the ID at its position in the first source
+            position = columns.index(id_column)
+            select.insert(position, f"{merged_key} AS {key}")
+            query = f"SELECT {', '.join(select)} FROM {current} AS acc {' '.join(joins)}"
+
+            columns = columns + [c for _, names in batch for c in names if c != id_column]
+            done = start >= len(subqueries)
+            target = _q(table) if done else f"__merge_acc_{step}"
+            conn.execute(f"CREATE OR REPLACE {'' if done else 'TEMP '}TABLE {target} AS {query}")
+            if step > 0:
+                conn.execute(f"DROP TABLE IF EXISTS __merge_acc_{step - 1}")
+            if done:
+                return
+            current = target
+            step += 1
+
     def _validate_merged_df(
         self,
         df: pd.DataFrame,
@@ -580,22 +999,21 @@ class MultiFileIngestEngine:
         Returns:
             List of validation warning messages
         """
-        warnings = []
-
         try:
-            # Check for duplicate IDs
-            if df[id_column].duplicated().any():
-                dup_count = df[id_column].duplicated().sum()
-                warnings.append(f"Found {dup_count} duplicate ID values after merge")
-
-            # Check for null IDs
-            null_count = df[id_column].isna().sum()
-            if null_count > 0:
-                warnings.append(f"Found {null_count} null ID values after merge")
-
+            return self._id_warnings(
+                int(df[id_column].duplicated().sum()),
+                int(df[id_column].isna().sum()),
+            )
         except Exception as e:
-            warnings.append(f"Validation error: {e}")
+            return [f"Validation error: {e}"]
 
+    def _id_warnings(self, dup_count: int, null_count: int) -> List[str]:
+        """Warning messages for duplicate and null merged IDs."""
+        warnings = []
+        if dup_count > 0:
+            warnings.append(f"Found {dup_count} duplicate ID values after merge")
+        if null_count > 0:
+            warnings.append(f"Found {null_count} null ID values after merge")
         return warnings
 
     def _store_in_duckdb(
@@ -621,21 +1039,24 @@ class MultiFileIngestEngine:
             table_name = f"merge_{manifest.run_id}"
             conn.execute(f"CREATE TABLE IF NOT EXISTS {table_name} AS SELECT * FROM df")
 
-            # Store manifest
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS merge_manifests (
-                    run_id VARCHAR PRIMARY KEY,
-                    manifest JSON,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            conn.execute(
-                "INSERT OR REPLACE INTO merge_manifests (run_id, manifest) VALUES (?, ?)",
-                [manifest.run_id, json.dumps(manifest.to_dict())]
-            )
+            self._record_manifest(conn, manifest)
 
             conn.close()
             logger.info(f"Stored merge result in DuckDB: {table_name}")
 
         except Exception as e:
             logger.error(f"Failed to store in DuckDB: {e}")
+
+    def _record_manifest(self, conn, manifest: MergeManifest) -> None:
+        """Insert or replace the manifest row in the provenance database."""
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS merge_manifests (
+                run_id VARCHAR PRIMARY KEY,
+                manifest JSON,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.execute(
+            "INSERT OR REPLACE INTO merge_manifests (run_id, manifest) VALUES (?, ?)",
+            [manifest.run_id, json.dumps(manifest.to_dict())]
+        )
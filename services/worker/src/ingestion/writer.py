@@ -28,6 +28,11 @@ import pandas as pd
 
 from .config import IngestionConfig, get_ingestion_config
 
+try:
+    from ..utils.file_hash import file_sha256, get_file_hash_cache
+except ImportError:
+    from utils.file_hash import file_sha256, get_file_hash_cache
+
 logger = logging.getLogger("writer")
 
 # Try to import Dask and PyArrow
@@ -222,7 +227,7 @@ def _write_dask_dataframe(
     column_count = len(ddf.columns)
     
     # Compute manifest checksum (hash of all partition checksums)
-    partition_checksums = [_compute_file_checksum(Path(p)) for p in partition_paths]
+    partition_checksums = _compute_partition_checksums(partition_paths)
     manifest_checksum = hashlib.sha256(
         "".join(partition_checksums).encode()
     ).hexdigest()
@@ -286,7 +291,7 @@ def _write_chunk_iterator(
     total_bytes = sum(Path(p).stat().st_size for p in partition_paths)
     
     # Compute manifest checksum
-    partition_checksums = [_compute_file_checksum(Path(p)) for p in partition_paths]
+    partition_checksums = _compute_partition_checksums(partition_paths)
     manifest_checksum = hashlib.sha256(
         "".join(partition_checksums).encode()
     ).hexdigest()
@@ -310,12 +315,14 @@ def _write_chunk_iterator(
 
 
 def _compute_file_checksum(path: Path) -> str:
-    """Compute SHA-256 checksum of a file."""
-    sha256 = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+    """Compute SHA-256 checksum of a file (cached by file identity)."""
+    return file_sha256(path)
+
+
+def _compute_partition_checksums(partition_paths: List[str]) -> List[str]:
+    """Checksums of partition files in order, hashed concurrently."""
+    checksums = get_file_hash_cache().digest_many(partition_paths)
+    return [checksums.get(str(p)) or _compute_file_checksum(Path(p)) for p in partition_paths]
 
 
 def write_manifest(
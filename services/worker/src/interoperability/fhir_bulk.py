@@ -0,0 +1,416 @@
+"""
+Bulk FHIR ↔ Canonical Signal Transforms
+
+Batch counterparts to ``fhir_observation_to_signal`` (fhir_to_canonical) and
+``signal_to_fhir_observation`` (fhir_transforms) for ingest paths that move
+whole NDJSON streams or DataFrames of observations/signals.
+
+**Differences from the per-record functions:**
+- Output is columnar (a DataFrame, one row per input record)
+- Category/method/code mappings are resolved once per distinct value via
+  lookup tables instead of once per record
+- Each output record is serialized to canonical JSON exactly once; the same
+  string is hashed for provenance and (for signal → FHIR) returned as the
+  ``observation`` column, ready to write as NDJSON
+- Serialization and SHA-256 hashing can run in a process pool (``n_workers``)
+
+Hashes are identical to the per-record functions for the same input dicts.
+For DataFrame input, the signal hash covers the row as a dict of all frame
+columns, with NaN/NaT converted to None and datetime columns converted to
+ISO 8601 UTC strings.
+
+**Governance:**
+- Same guarantees as the per-record transforms: pure functions over
+  in-memory data (no network, no file system access)
+
+**Usage:**
+    from src.interoperability.fhir_bulk import (
+        iter_ndjson,
+        fhir_observations_to_signal_frame,
+        signal_frame_to_fhir,
+    )
+
+    with open("observations.ndjson") as f:
+        signals = fhir_observations_to_signal_frame(iter_ndjson(f), n_workers=4)
+
+    fhir = signal_frame_to_fhir(signals_df, n_workers=4)
+    with open("out.ndjson", "w") as f:
+        f.writelines(obs + "\n" for obs in fhir["observation"])
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+import hashlib
+import json
+import logging
+
+import pandas as pd
+
+from . import fhir_to_canonical as inbound
+from . import fhir_transforms as outbound
+
+logger = logging.getLogger(__name__)
+
+CANONICAL_SIGNAL_COLUMNS = [
+    "research_id",
+    "signal_time",
+    "signal_type",
+    "signal_name",
+    "signal_value_num",
+    "signal_value_text",
+    "unit",
+    "source_system",
+    "collection_mode",
+    "quality_flag",
+    "notes",
+    "episode_id",
+    "encounter_id_deid",
+]
+
+DEFAULT_CHUNK_SIZE = 5000
+
+
+def iter_ndjson(lines: Iterable[Union[str, bytes]]) -> Iterator[Dict[str, Any]]:
+    """Parse an NDJSON stream (file object or iterable of lines), skipping blanks."""
+    for line in lines:
+        if line and line.strip():
+            yield json.loads(line)
+
+
+def _chunks(items: Sequence[Any], chunk_size: int) -> List[Sequence[Any]]:
+    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+
+def _map_chunks(func, items: Sequence[Any], n_workers: int, chunk_size: int) -> List[Any]:
+    """Apply ``func`` to chunks of ``items`` (in a process pool if n_workers > 1)."""
+    chunks = _chunks(items, chunk_size)
+    if n_workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            parts = list(executor.map(func, chunks))
+    else:
+        parts = [func(chunk) for chunk in chunks]
+    return [item for part in parts for item in part]
+
+
+def _hash_chunk(records: Sequence[Dict[str, Any]]) -> List[str]:
+    return [
+        hashlib.sha256(json.dumps(r, sort_keys=True).encode("utf-8")).hexdigest()
+        for r in records
+    ]
+
+
+def hash_records(
+    records: Sequence[Dict[str, Any]],
+    n_workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> List[str]:
+    """
+    SHA-256 of the canonical JSON (sorted keys) of each record.
+
+    Matches ``_compute_fhir_hash`` / ``_compute_signal_hash`` per record.
+    """
+    return _map_chunks(_hash_chunk, records, n_workers, chunk_size)
+
+
+# =============================================================================
+# FHIR Observation → canonical signal
+# =============================================================================
+
+
+def _first_code(concept: Optional[Dict[str, Any]]) -> str:
+    if not concept:
+        return ""
+    coding = concept.get("coding", [])
+    return coding[0].get("code", "") if coding else ""
+
+
+def fhir_observations_to_signal_frame(
+    observations: Iterable[Dict[str, Any]],
+    config: Optional[Dict[str, Any]] = None,
+    n_workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    on_error: str = "raise",
+) -> pd.DataFrame:
+    """
+    Transform many FHIR R4 Observations to a canonical signal DataFrame.
+
+    Args:
+        observations: Observation dicts (e.g. from ``iter_ndjson``)
+        config: Optional configuration overrides (see fhir_to_canonical)
+        n_workers: Processes used for provenance hashing
+        chunk_size: Records per hashing task
+        on_error: "raise" to fail on the first invalid observation, or
+            "skip" to drop invalid observations with a warning
+
+    Returns:
+        DataFrame with the 13 canonical signal columns plus ``fhir_hash``,
+        ``transform_timestamp`` and ``transform_version``
+
+    Raises:
+        ValueError: If an observation is invalid and on_error="raise"
+    """
+    if on_error not in ("raise", "skip"):
+        raise ValueError(f"on_error must be 'raise' or 'skip' (got: {on_error})")
+
+    cfg = {**inbound.DEFAULT_CONFIG, **(config or {})}
+
+    kept: List[Dict[str, Any]] = []
+    columns: Dict[str, List[Any]] = {col: [] for col in CANONICAL_SIGNAL_COLUMNS}
+    category_codes: List[Any] = []
+    has_device: List[bool] = []
+    method_codes: List[Any] = []
+    skipped = 0
+
+    for i, observation in enumerate(observations):
+        try:
+            if observation.get("resourceType") != "Observation":
+                raise ValueError("Input must be a FHIR Observation resource")
+            research_id = inbound._extract_research_id(observation, cfg)
+            signal_time = inbound._extract_effective_datetime(observation)
+            signal_name = inbound._extract_signal_name(observation)
+        except ValueError as e:
+            if on_error == "raise":
+                raise ValueError(f"Observation {i}: {e}") from e
+            skipped += 1
+            continue
+
+        categories = observation.get("category", [])
+        category_codes.append(_first_code(categories[0]) if categories else None)
+        has_device.append(bool(observation.get("device")))
+        method_codes.append(_first_code(observation.get("method")) or None)
+
+        value = inbound._extract_value(observation)
+        columns["research_id"].append(research_id)
+        columns["signal_time"].append(signal_time)
+        columns["signal_name"].append(signal_name)
+        columns["signal_value_num"].append(value["signal_value_num"])
+        columns["signal_value_text"].append(value["signal_value_text"])
+        columns["unit"].append(value["unit"])
+        columns["source_system"].append(inbound._extract_source_system(observation))
+        columns["quality_flag"].append(
+            "invalid" if observation.get("status") == "entered-in-error" else None
+        )
+        columns["notes"].append(inbound._extract_notes(observation))
+        columns["episode_id"].append(inbound._extract_episode_context(observation))
+        kept.append(observation)
+
+    if skipped:
+        logger.warning(f"Skipped {skipped} invalid FHIR observations")
+
+    n = len(kept)
+    default_type = cfg["default_signal_type"]
+
+    # Lookup-table mapping over the whole batch
+    signal_type = pd.Series(category_codes, dtype=object).map(
+        inbound.CATEGORY_TO_SIGNAL_TYPE
+    ).fillna(default_type)
+    signal_type = signal_type.where(
+        ~((signal_type == "symptom") & pd.Series(has_device, dtype=bool)), "wearable"
+    )
+    columns["signal_type"] = signal_type.tolist()
+    columns["collection_mode"] = (
+        pd.Series(method_codes, dtype=object)
+        .map(inbound.METHOD_TO_COLLECTION_MODE)
+        .astype(object)
+        .where(lambda s: s.notna(), None)
+        .tolist()
+    )
+    columns["encounter_id_deid"] = [None] * n
+
+    frame = pd.DataFrame(columns, columns=CANONICAL_SIGNAL_COLUMNS)
+    frame["signal_value_num"] = pd.to_numeric(frame["signal_value_num"])
+    frame["fhir_hash"] = ["sha256:" + h for h in hash_records(kept, n_workers, chunk_size)]
+    frame["transform_timestamp"] = datetime.now(timezone.utc).isoformat()
+    frame["transform_version"] = inbound.__version__
+
+    return frame
+
+
+# =============================================================================
+# Canonical signal → FHIR Observation
+# =============================================================================
+
+
+def _build_lookup_tables(
+    signals: pd.DataFrame,
+) -> Tuple[Dict[Any, Any], Dict[Tuple[Any, Any], Any], Dict[Any, Any]]:
+    """Resolve category, code and method once per distinct value in the batch."""
+    categories = {
+        t: [outbound.SIGNAL_TYPE_TO_CATEGORY.get(t, outbound.SIGNAL_TYPE_TO_CATEGORY["other"])]
+        for t in signals["signal_type"].dropna().unique()
+    }
+    codes = {
+        (name, t): outbound._map_code(name, t)
+        for name, t in signals[["signal_name", "signal_type"]]
+        .dropna()
+        .drop_duplicates()
+        .itertuples(index=False)
+    }
+    methods = {}
+    if "collection_mode" in signals.columns:
+        methods = {
+            mode: outbound.COLLECTION_MODE_TO_METHOD.get(mode)
+            for mode in signals["collection_mode"].dropna().unique()
+        }
+    return categories, codes, methods
+
+
+def _signal_chunk_to_fhir(
+    payload: Tuple[Sequence[Dict[str, Any]], Dict[str, Any], Tuple[Any, Any, Any]]
+) -> List[Tuple[str, str, str]]:
+    """
+    Build, serialize and hash observations for a chunk of validated signals.
+
+    Returns (observation_json, fhir_hash, signal_hash) per signal. Shared
+    lookup-table values are only serialized, never mutated.
+    """
+    records, cfg, (categories, codes, methods) = payload
+    out = []
+
+    for signal in records:
+        signal_type = signal["signal_type"]
+        observation = {
+            "resourceType": "Observation",
+            "status": outbound._map_status(signal.get("quality_flag"), cfg["default_status"]),
+            "category": categories[signal_type],
+            "code": codes[(signal["signal_name"], signal_type)],
+            "subject": outbound._map_subject(signal["research_id"]),
+            "effectiveDateTime": signal["signal_time"],
+        }
+        observation.update(outbound._map_value(
+            signal.get("signal_value_num"),
+            signal.get("signal_value_text"),
+            signal.get("unit"),
+        ))
+
+        method = methods.get(signal.get("collection_mode"))
+        if method:
+            observation["method"] = method
+
+        device = outbound._map_device(signal.get("source_system"), signal_type)
+        if device:
+            observation["device"] = device
+
+        encounter = outbound._map_episode_context(
+            signal.get("episode_id"), cfg["use_encounter_for_episode"]
+        )
+        if encounter:
+            observation["encounter"] = encounter
+
+        if cfg["include_notes"]:
+            note = outbound._map_note(signal.get("notes"), signal["signal_time"])
+            if note:
+                observation["note"] = note
+
+        observation_json = json.dumps(observation, sort_keys=True)
+        out.append((
+            observation_json,
+            hashlib.sha256(observation_json.encode("utf-8")).hexdigest(),
+            hashlib.sha256(json.dumps(signal, sort_keys=True).encode("utf-8")).hexdigest(),
+        ))
+
+    return out
+
+
+def _isoformat_datetimes(signals: pd.DataFrame) -> pd.DataFrame:
+    """
+    Replace datetime columns with ISO 8601 UTC strings.
+
+    Frames read from Parquet carry ``signal_time`` as datetime64, which
+    json.dumps cannot serialize. Naive values are taken as UTC. Whole-second
+    values render as ``2024-01-15T14:30:00Z``, others with microseconds.
+    """
+    converted = {}
+    for name in signals.columns:
+        col = signals[name]
+        if not pd.api.types.is_datetime64_any_dtype(col.dtype):
+            if col.dtype != object or pd.api.types.infer_dtype(col, skipna=True) not in ("datetime", "datetime64"):
+                continue
+            col = pd.to_datetime(col, utc=True)
+        col = col.dt.tz_convert("UTC") if col.dt.tz is not None else col.dt.tz_localize("UTC")
+        fmt = "%Y-%m-%dT%H:%M:%SZ" if (col.dropna().dt.microsecond == 0).all() else "%Y-%m-%dT%H:%M:%S.%fZ"
+        converted[name] = col.dt.strftime(fmt).astype(object).where(col.notna(), None)
+    return signals.assign(**converted) if converted else signals
+
+
+def _invalid_signal_mask(signals: pd.DataFrame) -> pd.Series:
+    """Vectorized version of signal_to_fhir_observation's input validation."""
+    invalid = pd.Series(False, index=signals.index)
+    for field in ("research_id", "signal_time", "signal_type", "signal_name"):
+        if field not in signals.columns:
+            raise ValueError(f"Required field '{field}' is missing or empty")
+        col = signals[field]
+        invalid |= col.isna() | (col.astype(str) == "")
+
+    value_num = signals.get("signal_value_num", pd.Series(None, index=signals.index, dtype=float))
+    value_text = signals.get("signal_value_text", pd.Series(None, index=signals.index, dtype=object))
+    no_num = value_num.isna() | (pd.to_numeric(value_num, errors="coerce") == 0)
+    no_text = value_text.isna() | (value_text.astype(str) == "")
+    invalid |= no_num & no_text
+    return invalid
+
+
+def signal_frame_to_fhir(
+    signals: pd.DataFrame,
+    config: Optional[Dict[str, Any]] = None,
+    n_workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    on_error: str = "raise",
+) -> pd.DataFrame:
+    """
+    Transform a canonical signal DataFrame to FHIR R4 Observations.
+
+    Args:
+        signals: DataFrame with canonical signal columns
+        config: Optional configuration overrides (see fhir_transforms)
+        n_workers: Processes used for serialization and hashing
+        chunk_size: Signals per worker task
+        on_error: "raise" to fail if any signal is invalid, or "skip" to
+            drop invalid signals with a warning
+
+    Returns:
+        DataFrame indexed like the (valid) input rows with columns
+        ``observation`` (canonical JSON string), ``signal_hash``,
+        ``fhir_hash``, ``transform_timestamp`` and ``transform_version``
+
+    Raises:
+        ValueError: If any signal is invalid and on_error="raise"
+    """
+    if on_error not in ("raise", "skip"):
+        raise ValueError(f"on_error must be 'raise' or 'skip' (got: {on_error})")
+
+    cfg = {**outbound.DEFAULT_CONFIG, **(config or {})}
+
+    invalid = _invalid_signal_mask(signals)
+    if invalid.any():
+        if on_error == "raise":
+            first = invalid[invalid].index[0]
+            raise ValueError(
+                f"{int(invalid.sum())} invalid signals (first at index {first!r}): "
+                "required fields missing or no signal value"
+            )
+        logger.warning(f"Skipped {int(invalid.sum())} invalid signals")
+        signals = signals[~invalid]
+
+    signals = _isoformat_datetimes(signals)
+    records = signals.astype(object).where(signals.notna(), None).to_dict("records")
+    tables = _build_lookup_tables(signals)
+
+    chunks = [(chunk, cfg, tables) for chunk in _chunks(records, chunk_size)]
+    if n_workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            parts = list(executor.map(_signal_chunk_to_fhir, chunks))
+    else:
+        parts = [_signal_chunk_to_fhir(chunk) for chunk in chunks]
+    results = [item for part in parts for item in part]
+
+    frame = pd.DataFrame(
+        results, columns=["observation", "fhir_hash", "signal_hash"], index=signals.index
+    )
+    frame["fhir_hash"] = "sha256:" + frame["fhir_hash"]
+    frame["signal_hash"] = "sha256:" + frame["signal_hash"]
+    frame["transform_timestamp"] = datetime.now(timezone.utc).isoformat()
+    frame["transform_version"] = "v1.0.0"
+
+    return frame[["observation", "signal_hash", "fhir_hash", "transform_timestamp", "transform_version"]]
@@ -54,6 +54,21 @@ DEFAULT_CONFIG = {
     "default_signal_type": "other",
 }
 
+# Reverse mapping from FHIR category code to signal_type
+CATEGORY_TO_SIGNAL_TYPE = {
+    "survey": "PROM",
+    "vital-signs": "symptom",  # Default; will check for device to distinguish wearable
+    "therapy": "adherence",
+    "exam": "other",
+}
+
+# Reverse mapping from FHIR method code to collection_mode
+METHOD_TO_COLLECTION_MODE = {
+    "self-reported": "self_report",
+    "device-automated": "passive_sensing",
+    "clinician-entered": "clinician_entered",
+}
+
 
 def fhir_observation_to_signal(
     observation: Dict[str, Any], config: Optional[Dict[str, Any]] = None
@@ -176,15 +191,7 @@ def _extract_signal_type(observation: Dict[str, Any], cfg: Dict[str, Any]) -> st
 
     category_code = coding[0].get("code", "")
 
-    # Reverse mapping from FHIR category to signal_type
-    category_map = {
-        "survey": "PROM",
-        "vital-signs": "symptom",  # Default; will check for device to distinguish wearable
-        "therapy": "adherence",
-        "exam": "other",
-    }
-
-    signal_type = category_map.get(category_code, cfg["default_signal_type"])
+    signal_type = CATEGORY_TO_SIGNAL_TYPE.get(category_code, cfg["default_signal_type"])
 
     # If vital-signs and device present, reclassify as wearable
     if signal_type == "symptom" and observation.get("device"):
@@ -289,14 +296,7 @@ def _extract_collection_mode(observation: Dict[str, Any]) -> Optional[str]:
 
     method_code = coding[0].get("code", "")
 
-    # Reverse mapping
-    method_map = {
-        "self-reported": "self_report",
-        "device-automated": "passive_sensing",
-        "clinician-entered": "clinician_entered",
-    }
-
-    return method_map.get(method_code)
+    return METHOD_TO_COLLECTION_MODE.get(method_code)
 
 
 def _extract_quality_flag(observation: Dict[str, Any]) -> Optional[str]:
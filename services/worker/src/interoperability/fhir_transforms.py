@@ -38,6 +38,7 @@ FHIR Transformation Library (INF-15)
 
 from typing import Optional, Dict, List, Any, Tuple
 from datetime import datetime, timezone
+import copy
 import hashlib
 import json
 
@@ -48,6 +49,70 @@ DEFAULT_CONFIG = {
     "default_status": "final",
 }
 
+# Signal type → FHIR Observation category
+SIGNAL_TYPE_TO_CATEGORY = {
+    "PROM": {
+        "coding": [{
+            "system": "http://terminology.hl7.org/CodeSystem/observation-category",
+            "code": "survey",
+            "display": "Survey"
+        }]
+    },
+    "symptom": {
+        "coding": [{
+            "system": "http://terminology.hl7.org/CodeSystem/observation-category",
+            "code": "vital-signs",
+            "display": "Vital Signs"
+        }]
+    },
+    "wearable": {
+        "coding": [{
+            "system": "http://terminology.hl7.org/CodeSystem/observation-category",
+            "code": "vital-signs",
+            "display": "Vital Signs"
+        }]
+    },
+    "adherence": {
+        "coding": [{
+            "system": "http://terminology.hl7.org/CodeSystem/observation-category",
+            "code": "therapy",
+            "display": "Therapy"
+        }]
+    },
+    "other": {
+        "coding": [{
+            "system": "http://terminology.hl7.org/CodeSystem/observation-category",
+            "code": "exam",
+            "display": "Exam"
+        }]
+    },
+}
+
+# Collection mode → FHIR Observation method
+COLLECTION_MODE_TO_METHOD = {
+    "self_report": {
+        "coding": [{
+            "system": "https://research-os.example.org/collection-methods",
+            "code": "self-reported",
+            "display": "Self-Reported"
+        }]
+    },
+    "passive_sensing": {
+        "coding": [{
+            "system": "https://research-os.example.org/collection-methods",
+            "code": "device-automated",
+            "display": "Device Automated"
+        }]
+    },
+    "clinician_entered": {
+        "coding": [{
+            "system": "https://research-os.example.org/collection-methods",
+            "code": "clinician-entered",
+            "display": "Clinician Entered"
+        }]
+    },
+}
+
 
 def signal_to_fhir_observation(
     signal_dict: Dict[str, Any], config: Optional[Dict[str, Any]] = None
@@ -169,44 +234,7 @@ def _map_category(signal_type: str) -> List[Dict[str, Any]]:
     Returns:
         FHIR category array
     """
-    category_mapping = {
-        "PROM": {
-            "coding": [{
-                "system": "http://terminology.hl7.org/CodeSystem/observation-category",
-                "code": "survey",
-                "display": "Survey"
-            }]
-        },
-        "symptom": {
-            "coding": [{
-                "system": "http://terminology.hl7.org/CodeSystem/observation-category",
-                "code": "vital-signs",
-                "display": "Vital Signs"
-            }]
-        },
-        "wearable": {
-            "coding": [{
-                "system": "http://terminology.hl7.org/CodeSystem/observation-category",
-                "code": "vital-signs",
-                "display": "Vital Signs"
-            }]
-        },
-        "adherence": {
-            "coding": [{
-                "system": "http://terminology.hl7.org/CodeSystem/observation-category",
-                "code": "therapy",
-                "display": "Therapy"
-            }]
-        },
-        "other": {
-            "coding": [{
-                "system": "http://terminology.hl7.org/CodeSystem/observation-category",
-                "code": "exam",
-                "display": "Exam"
-            }]
-        },
-    }
-    return [category_mapping.get(signal_type, category_mapping["other"])]
+    return [copy.deepcopy(SIGNAL_TYPE_TO_CATEGORY.get(signal_type, SIGNAL_TYPE_TO_CATEGORY["other"]))]
 
 
 def _map_code(signal_name: str, signal_type: str) -> Dict[str, Any]:
@@ -297,30 +325,8 @@ def _map_method(collection_mode: Optional[str]) -> Optional[Dict[str, Any]]:
     if not collection_mode:
         return None
 
-    method_mapping = {
-        "self_report": {
-            "coding": [{
-                "system": "https://research-os.example.org/collection-methods",
-                "code": "self-reported",
-                "display": "Self-Reported"
-            }]
-        },
-        "passive_sensing": {
-            "coding": [{
-                "system": "https://research-os.example.org/collection-methods",
-                "code": "device-automated",
-                "display": "Device Automated"
-            }]
-        },
-        "clinician_entered": {
-            "coding": [{
-                "system": "https://research-os.example.org/collection-methods",
-                "code": "clinician-entered",
-                "display": "Clinician Entered"
-            }]
-        },
-    }
-    return method_mapping.get(collection_mode)
+    method = COLLECTION_MODE_TO_METHOD.get(collection_mode)
+    return copy.deepcopy(method) if method else None
 
 
 def _map_device(source_system: Optional[str], signal_type: str) -> Optional[Dict[str, Any]]:
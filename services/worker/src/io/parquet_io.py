@@ -68,6 +68,13 @@ SCHEMA_ID_KEY = "ros.schema_id"
 SCHEMA_VERSION_KEY = "ros.schema_version"
 
 
+def _read_footer_metadata(path: Path) -> Dict[str, str]:
+    """Decode the key-value schema metadata from the Parquet footer (no data read)."""
+    schema = pq.read_schema(str(path), memory_map=True)
+    metadata = schema.metadata or {}
+    return {k.decode(): v.decode() for k, v in metadata.items()}
+
+
 def write_parquet_with_schema(
     df: pd.DataFrame,
     path: Union[Path, str],
@@ -177,12 +184,8 @@ def read_parquet_with_schema(
     if not path.exists():
         raise FileNotFoundError(f"Parquet file not found: {path}")
 
-    # Read metadata first
-    parquet_file = pq.read_table(str(path))
-    metadata = parquet_file.schema.metadata or {}
-
-    # Decode metadata
-    decoded_metadata = {k.decode(): v.decode() for k, v in metadata.items()}
+    # Read metadata first (footer only)
+    decoded_metadata = _read_footer_metadata(path)
 
     actual_schema_id = decoded_metadata.get(SCHEMA_ID_KEY)
     actual_schema_version = decoded_metadata.get(SCHEMA_VERSION_KEY)
@@ -253,11 +256,7 @@ def get_parquet_schema_metadata(path: Union[Path, str]) -> Dict[str, Optional[st
         raise FileNotFoundError(f"Parquet file not found: {path}")
 
     # Read metadata only (no data)
-    parquet_file = pq.read_table(str(path))
-    metadata = parquet_file.schema.metadata or {}
-
-    # Decode metadata
-    decoded_metadata = {k.decode(): v.decode() for k, v in metadata.items()}
+    decoded_metadata = _read_footer_metadata(path)
 
     return {
         "schema_id": decoded_metadata.get(SCHEMA_ID_KEY),
@@ -25,6 +25,7 @@ from .reference_intervals import (
     load_registry,
     validate_registry,
     lookup_reference_interval,
+    flag_lab_values,
 )
 
 __all__ = [
@@ -42,4 +43,5 @@ __all__ = [
     "load_registry",
     "validate_registry",
     "lookup_reference_interval",
+    "flag_lab_values",
 ]
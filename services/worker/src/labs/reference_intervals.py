@@ -9,6 +9,8 @@ Design Principles:
 - Temporal validity (effective_start/effective_end)
 - Read-only (no data transformations)
 - Population/sex-specific ranges supported
+- Indexed by (analyte, unit, sex, population) with effective-date intervals
+  sorted per key, for scalar lookups and vectorized flagging of lab frames
 
 See: config/reference_intervals/lab_reference_intervals.yaml
 
@@ -17,12 +19,29 @@ Date: 2025-12-26
 Status: PRE-ANALYSIS SCAFFOLD
 """
 
+import numpy as np
+import pandas as pd
 import yaml
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import date, datetime
 
+from .ucum import UCUMValidator
+
+# Index key: (analyte lower, unit_ucum, sex lower, population lower)
+IntervalKey = Tuple[str, str, str, str]
+
+# Flag categories produced by flag_frame (codes 0, 1, 2)
+FLAG_CATEGORIES = ["L", "N", "H"]
+
+# Row sex values recognized by flag_frame; anything else matches "all" only
+_SEX_ALIASES = {"male": "male", "m": "male", "female": "female", "f": "female"}
+
+# Day-number sentinels for open-ended effective dates
+_MIN_DAY = np.iinfo(np.int64).min
+_MAX_DAY = np.iinfo(np.int64).max
+
 
 @dataclass
 class ReferenceInterval:
@@ -39,6 +58,8 @@ class ReferenceInterval:
     source: str
     method: Optional[str] = None
     notes: Optional[str] = None
+    critical_low: Optional[float] = None
+    critical_high: Optional[float] = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ReferenceInterval":
@@ -75,6 +96,12 @@ class ReferenceInterval:
             source=data.get("source", ""),
             method=data.get("method"),
             notes=data.get("notes"),
+            critical_low=(
+                float(data["critical_low"]) if data.get("critical_low") is not None else None
+            ),
+            critical_high=(
+                float(data["critical_high"]) if data.get("critical_high") is not None else None
+            ),
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -95,8 +122,19 @@ class ReferenceInterval:
             "source": self.source,
             "method": self.method,
             "notes": self.notes,
+            "critical_low": self.critical_low,
+            "critical_high": self.critical_high,
         }
 
+    def index_key(self) -> IntervalKey:
+        """Key this interval is indexed under in the registry."""
+        return (
+            self.analyte.lower(),
+            self.unit_ucum,
+            self.sex.lower(),
+            self.population.lower(),
+        )
+
     def is_effective_on(self, query_date: date) -> bool:
         """Check if this interval is effective on a given date.
 
@@ -113,6 +151,78 @@ class ReferenceInterval:
         return True
 
 
+def _day_number(value: Optional[date], default: int) -> int:
+    """Days since the epoch for a date (``default`` if None)."""
+    if value is None:
+        return default
+    return int(np.datetime64(value, "D").astype(np.int64))
+
+
+@dataclass
+class _IntervalBucket:
+    """Intervals sharing one index key, sorted by effective_start.
+
+    ``starts``/``ends`` are day numbers (open ends use sentinels) and
+    ``positions`` are indexes into the registry's interval list.
+    """
+
+    starts: np.ndarray
+    ends: np.ndarray
+    positions: np.ndarray
+
+    @classmethod
+    def build(cls, intervals: List[Tuple[int, "ReferenceInterval"]]) -> "_IntervalBucket":
+        ordered = sorted(
+            intervals,
+            key=lambda item: (_day_number(item[1].effective_start, _MIN_DAY), item[0]),
+        )
+        return cls(
+            starts=np.array(
+                [_day_number(i.effective_start, _MIN_DAY) for _, i in ordered], dtype=np.int64
+            ),
+            ends=np.array(
+                [_day_number(i.effective_end, _MAX_DAY) for _, i in ordered], dtype=np.int64
+            ),
+            positions=np.array([pos for pos, _ in ordered], dtype=np.int64),
+        )
+
+    def effective_on(self, day: Optional[int]) -> List[int]:
+        """Registry positions of intervals effective on ``day`` (all if None)."""
+        if day is None:
+            return self.positions.tolist()
+        n = int(np.searchsorted(self.starts, day, side="right"))
+        return [
+            int(pos)
+            for pos, end in zip(self.positions[:n], self.ends[:n])
+            if end >= day
+        ]
+
+    def match(self, days: np.ndarray, has_day: np.ndarray) -> np.ndarray:
+        """Vectorized match: position of the latest-starting effective interval per day.
+
+        Rows without a date take the latest-starting interval. Returns -1
+        where nothing is effective.
+        """
+        # Index of the last interval starting on or before each day
+        candidate = np.where(
+            has_day,
+            np.searchsorted(self.starts, days, side="right") - 1,
+            len(self.starts) - 1,
+        )
+        result = np.full(len(days), -1, dtype=np.int64)
+        unresolved = np.flatnonzero(candidate >= 0)
+        # Step back past intervals that ended before the day (only overlapping
+        # or gapped ranges need more than one step)
+        while len(unresolved):
+            cand = candidate[unresolved]
+            ok = ~has_day[unresolved] | (self.ends[cand] >= days[unresolved])
+            result[unresolved[ok]] = self.positions[cand[ok]]
+            unresolved = unresolved[~ok]
+            candidate[unresolved] -= 1
+            unresolved = unresolved[candidate[unresolved] >= 0]
+        return result
+
+
 @dataclass
 class RegistryValidationResult:
     """Result of validating the reference interval registry."""
@@ -158,6 +268,8 @@ class ReferenceIntervalRegistry:
         self._intervals: List[ReferenceInterval] = []
         self._metadata: Dict[str, Any] = {}
         self._loaded: bool = False
+        self._index: Dict[IntervalKey, _IntervalBucket] = {}
+        self._keys_by_analyte: Dict[str, List[IntervalKey]] = {}
 
     def _load(self) -> None:
         """Load registry from configuration file."""
@@ -188,8 +300,20 @@ class ReferenceIntervalRegistry:
         # Load metadata
         self._metadata = config.get("registry_metadata", {})
 
+        self._build_index()
         self._loaded = True
 
+    def _build_index(self) -> None:
+        """Group intervals by index key with effective dates sorted per key."""
+        grouped: Dict[IntervalKey, List[Tuple[int, ReferenceInterval]]] = {}
+        for pos, interval in enumerate(self._intervals):
+            grouped.setdefault(interval.index_key(), []).append((pos, interval))
+
+        self._index = {key: _IntervalBucket.build(items) for key, items in grouped.items()}
+        self._keys_by_analyte = {}
+        for key in self._index:
+            self._keys_by_analyte.setdefault(key[0], []).append(key)
+
     @property
     def intervals(self) -> List[ReferenceInterval]:
         """Get all loaded reference intervals."""
@@ -233,35 +357,166 @@ class ReferenceIntervalRegistry:
         """
         self._load()
 
-        results = []
-        for interval in self._intervals:
-            # Match analyte (case-insensitive)
-            if interval.analyte.lower() != analyte.lower():
-                continue
+        day = _day_number(query_date, _MIN_DAY) if query_date else None
+        positions = []
+        for key in self._keys_by_analyte.get(analyte.lower(), []):
+            _, key_unit, key_sex, key_population = key
 
             # Match unit if specified
-            if unit and interval.unit_ucum != unit:
-                continue
-
-            # Check temporal validity
-            if query_date and not interval.is_effective_on(query_date):
+            if unit and key_unit != unit:
                 continue
 
             # Match population if specified
-            if population and interval.population.lower() != population.lower():
+            if population and key_population != population.lower():
                 continue
 
             # Match sex if specified
-            if sex:
-                if (
-                    interval.sex.lower() != "all"
-                    and interval.sex.lower() != sex.lower()
-                ):
-                    continue
+            if sex and key_sex != "all" and key_sex != sex.lower():
+                continue
+
+            # Check temporal validity
+            positions.extend(self._index[key].effective_on(day))
+
+        # Registry order, as before indexing
+        return [self._intervals[pos] for pos in sorted(positions)]
+
+    def flag_frame(
+        self,
+        df: pd.DataFrame,
+        analyte_col: str = "analyte",
+        value_col: str = "value",
+        unit_col: str = "unit",
+        date_col: Optional[str] = "date",
+        sex_col: Optional[str] = None,
+        population_col: Optional[str] = None,
+        default_population: str = "adult",
+        validator: Optional[UCUMValidator] = None,
+    ) -> pd.DataFrame:
+        """Match and flag every row of a long-format lab frame in one pass.
+
+        Units are normalized to canonical UCUM, then each row is matched to
+        the interval for its (analyte, unit, sex, population) that is
+        effective on its date, preferring a sex-specific interval over
+        ``sex == "all"``. Where several intervals are effective, the one that
+        started latest wins; rows without a date take the latest-starting
+        interval. Work is per distinct key and per index bucket, not per row.
 
-            results.append(interval)
+        Args:
+            df: Lab results, one row per measurement
+            analyte_col: Analyte name column (matched case-insensitively)
+            value_col: Numeric result column
+            unit_col: Unit column (raw; normalized via ``validator``)
+            date_col: Collection date column (None to ignore dates)
+            sex_col: Sex column (None matches only ``sex == "all"`` intervals)
+            population_col: Population column (None uses ``default_population``)
+            default_population: Population for rows without one
+            validator: UCUM validator for unit normalization (default config)
+
+        Returns:
+            DataFrame aligned to ``df.index`` with columns ``unit_normalized``,
+            ``interval_idx`` (position in ``intervals``, -1 if no match),
+            ``ref_low``, ``ref_high``, ``flag`` (categorical L/N/H, null
+            without a value or interval) and ``critical`` (bool).
+        """
+        self._load()
+        validator = validator or UCUMValidator()
+        n = len(df)
+
+        unit_normalized = validator.normalize_series(df[unit_col])
+
+        def _lower_codes(series: Optional[pd.Series], default: str) -> Tuple[np.ndarray, List[str]]:
+            if series is None:
+                return np.zeros(n, dtype=np.int64), [default]
+            codes, uniques = pd.factorize(series, sort=False)
+            labels = [str(u).strip().lower() for u in uniques] + [default]
+            return np.where(codes < 0, len(uniques), codes), labels
+
+        analyte_codes, analytes = _lower_codes(df[analyte_col], "")
+        # Units are case-sensitive in UCUM; recover canonical spellings
+        unit_codes, unit_uniques = pd.factorize(unit_normalized, sort=False)
+        unit_codes = np.where(unit_codes < 0, len(unit_uniques), unit_codes)
+        units = [str(u) for u in unit_uniques] + [""]
+        sex_codes, sexes = _lower_codes(df[sex_col] if sex_col else None, "all")
+        pop_codes, populations = _lower_codes(
+            df[population_col] if population_col else None, default_population.lower()
+        )
+        sexes = [_SEX_ALIASES.get(s, "all") for s in sexes]
+
+        # Collapse to distinct (analyte, unit, sex, population) combinations
+        radices = [len(analytes), len(units), len(sexes), len(populations)]
+        packed = analyte_codes.astype(np.int64)
+        for codes, radix in zip((unit_codes, sex_codes, pop_codes), radices[1:]):
+            packed = packed * radix + codes
+        combo_codes, packed_combos = pd.factorize(packed, sort=False)
+        combos = []
+        for value in packed_combos.tolist():
+            parts = []
+            for radix in reversed(radices[1:]):
+                value, part = divmod(value, radix)
+                parts.append(part)
+            combos.append((value, *reversed(parts)))
+
+        if date_col is not None:
+            dates = pd.to_datetime(df[date_col], errors="coerce").to_numpy("datetime64[D]")
+            has_day = ~np.isnat(dates)
+            days = np.where(has_day, dates.astype(np.int64), 0)
+        else:
+            has_day = np.zeros(n, dtype=bool)
+            days = np.zeros(n, dtype=np.int64)
+
+        interval_idx = np.full(n, -1, dtype=np.int64)
+        for pass_all_sex in (False, True):
+            # Bucket id per combination for this pass (-1: no bucket)
+            bucket_keys: List[IntervalKey] = []
+            combo_bucket = np.full(len(combos), -1, dtype=np.int64)
+            for c, (a, u, sx, p) in enumerate(combos):
+                sex = sexes[sx]
+                if pass_all_sex:
+                    if sex == "all":
+                        continue
+                    sex = "all"
+                key = (analytes[a], units[u], sex, populations[p])
+                if key in self._index:
+                    combo_bucket[c] = len(bucket_keys)
+                    bucket_keys.append(key)
+            if not bucket_keys:
+                continue
 
-        return results
+            row_bucket = combo_bucket[combo_codes]
+            row_bucket[interval_idx >= 0] = -1
+            order = np.argsort(row_bucket, kind="stable")
+            bounds = np.searchsorted(row_bucket[order], np.arange(len(bucket_keys) + 1))
+            for b, key in enumerate(bucket_keys):
+                rows = order[bounds[b]:bounds[b + 1]]
+                if len(rows):
+                    interval_idx[rows] = self._index[key].match(days[rows], has_day[rows])
+
+        # Gather interval bounds by position (+1 slot for "no match")
+        def _bounds(attr: str) -> np.ndarray:
+            values = [getattr(i, attr) for i in self._intervals] + [None]
+            return np.array([np.nan if v is None else v for v in values], dtype=np.float64)[interval_idx]
+
+        ref_low = _bounds("ref_low")
+        ref_high = _bounds("ref_high")
+        critical_low = _bounds("critical_low")
+        critical_high = _bounds("critical_high")
+
+        values = pd.to_numeric(df[value_col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        flag_codes = np.where(values < ref_low, 0, np.where(values > ref_high, 2, 1))
+        flag_codes[np.isnan(values) | (interval_idx < 0)] = -1
+        critical = (values < critical_low) | (values > critical_high)
+
+        return pd.DataFrame(
+            {
+                "unit_normalized": unit_normalized.to_numpy(),
+                "interval_idx": interval_idx,
+                "ref_low": ref_low,
+                "ref_high": ref_high,
+                "flag": pd.Categorical.from_codes(flag_codes, categories=FLAG_CATEGORIES),
+                "critical": critical,
+            },
+            index=df.index,
+        )
 
     def validate(self) -> RegistryValidationResult:
         """Validate the registry structure and content.
@@ -354,6 +609,25 @@ def validate_registry(config_path: Optional[Path] = None) -> RegistryValidationR
     return registry.validate()
 
 
+def flag_lab_values(
+    df: pd.DataFrame,
+    config_path: Optional[Path] = None,
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """Flag a long-format lab frame against the reference interval registry.
+
+    Args:
+        df: Lab results, one row per measurement
+        config_path: Optional path to config file
+        **kwargs: Column names and options for
+            ReferenceIntervalRegistry.flag_frame
+
+    Returns:
+        DataFrame of normalized units, interval positions, bounds and flags
+    """
+    return ReferenceIntervalRegistry(config_path).flag_frame(df, **kwargs)
+
+
 def lookup_reference_interval(
     analyte: str,
     unit: Optional[str] = None,
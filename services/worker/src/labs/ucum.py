@@ -17,6 +17,8 @@ Date: 2025-12-26
 Status: PRE-ANALYSIS SCAFFOLD
 """
 
+import numpy as np
+import pandas as pd
 import yaml
 from pathlib import Path
 from typing import Set, Dict, Optional, List, Tuple
@@ -246,13 +248,48 @@ class UCUMValidator:
     def validate_series(self, units: List[str]) -> List[UCUMValidationResult]:
         """Validate a list of unit values.
 
+        Each distinct unit is validated once; repeated units share the same
+        result object.
+
         Args:
             units: List of unit strings
 
         Returns:
             List of validation results
         """
-        return [self.validate(u) for u in units]
+        results: Dict[object, UCUMValidationResult] = {}
+        out = []
+        for u in units:
+            try:
+                result = results.get(u)
+            except TypeError:
+                out.append(self.validate(u))
+                continue
+            if result is None:
+                result = results[u] = self.validate(u)
+            out.append(result)
+        return out
+
+    def normalize_series(self, units: pd.Series) -> pd.Series:
+        """Normalize a column of units to canonical UCUM form.
+
+        Each distinct unit is normalized once and the results are broadcast
+        back to the rows, so cost scales with the number of distinct units,
+        not rows.
+
+        Args:
+            units: Series of unit strings
+
+        Returns:
+            Object Series (same index) of canonical units, None where the unit
+            is missing or not mappable
+        """
+        codes, uniques = pd.factorize(units, sort=False)
+        normalized = np.empty(len(uniques) + 1, dtype=object)
+        for i, unit in enumerate(uniques):
+            normalized[i] = self.normalize_unit(unit)
+        normalized[-1] = None  # factorize codes missing values as -1
+        return pd.Series(normalized[codes], index=units.index, name=units.name)
 
 
 # =============================================================================
@@ -14,6 +14,7 @@ Components:
 - linkage_engine.py: Core linkage logic with date tolerances
 - linkage_validators.py: CI validation checks and guardrails
 - audit_log.py: Immutable audit trail for link decisions
+- audit_segments.py: Segmented append-only audit log for batch logging
 
 Author: Research Operating System
 Date: 2025-12-22
@@ -46,6 +47,8 @@ from .audit_log import (
     export_audit_log,
 )
 
+from .audit_segments import SegmentedAuditLog
+
 __all__ = [
     # Core linkage functions
     "LinkageConfig",
@@ -65,4 +68,5 @@ __all__ = [
     "log_linkage_decision",
     "get_audit_trail",
     "export_audit_log",
+    "SegmentedAuditLog",
 ]
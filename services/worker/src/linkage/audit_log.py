@@ -19,13 +19,166 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import hashlib
 import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+AUDIT_COLUMNS = [
+    "audit_id",
+    "timestamp",
+    "linkage_id",
+    "source_id",
+    "target_id",
+    "source_type",
+    "target_type",
+    "days_gap",
+    "abs_days_gap",
+    "tolerance_days",
+    "link_confidence",
+    "validation_status",
+    "validation_checks",
+    "created_by",
+    "log_hash",
+    "prev_log_hash",
+]
+
+GENESIS_HASH = hashlib.sha256(b"GENESIS_BLOCK").hexdigest()[:16]
+
+
+def compute_entry_hash(entry: Dict[str, any], prev_hash: str) -> str:
+    """
+    Compute the chained hash of a single audit entry.
+
+    ``entry`` must not contain ``log_hash``. The hash covers every field plus
+    the previous entry's hash, so any edit, deletion or insertion breaks the
+    chain from that point onwards.
+    """
+    hash_input = json.dumps(entry, sort_keys=True, default=str)
+    hash_input += prev_hash
+    return hashlib.sha256(hash_input.encode()).hexdigest()[:16]
+
+
+def build_chained_entries(
+    linkage_df: pd.DataFrame,
+    source_type: str,
+    target_type: str,
+    tolerance_days: int,
+    prev_hash: str,
+    start_index: int = 0,
+    validation_results: Optional[Dict[str, any]] = None,
+    created_by: str = "linkage_engine_v1",
+) -> Tuple[pd.DataFrame, str]:
+    """
+    Build audit entries for a whole linkage table in a single pass.
+
+    Columns are pulled out once as Python lists and the hash chain is walked
+    over them directly, avoiding ``iterrows`` and per-row DataFrame appends.
+
+    Parameters
+    ----------
+    linkage_df : pd.DataFrame
+        Linkage table from linkage_engine
+    source_type : str
+        Source data type
+    target_type : str
+        Target data type
+    tolerance_days : int
+        Date tolerance window used
+    prev_hash : str
+        Hash of the entry preceding this batch (chain anchor)
+    start_index : int
+        Sequence number of the first entry (used in audit IDs)
+    validation_results : dict, optional
+        Validation summary from LinkageValidator
+    created_by : str
+        Software/user that created the links
+
+    Returns
+    -------
+    tuple of (pd.DataFrame, str)
+        Audit entries in ``AUDIT_COLUMNS`` order and the tail hash of the chain
+    """
+    if len(linkage_df) == 0:
+        return pd.DataFrame(columns=AUDIT_COLUMNS), prev_hash
+
+    # Extract source/target IDs (column names vary by source type)
+    source_id_col = [
+        col
+        for col in linkage_df.columns
+        if col.endswith("_id") and "linkage" not in col and "pathology" not in col
+    ][0]
+    target_id_col = "pathology_id"
+
+    validation_status = "PASSED"
+    if validation_results and not validation_results.get("all_checks_passed", True):
+        validation_status = "WARNING"
+    validation_checks = json.dumps(validation_results) if validation_results else "{}"
+
+    now = datetime.utcnow()
+    stamp = now.strftime("%Y%m%d%H%M%S")
+
+    linkage_ids = linkage_df["linkage_id"].tolist()
+    source_ids = linkage_df[source_id_col].tolist()
+    target_ids = linkage_df[target_id_col].tolist()
+    days_gaps = linkage_df["days_gap"].astype("int64").tolist()
+    abs_days_gaps = linkage_df["abs_days_gap"].astype("int64").tolist()
+    confidences = linkage_df["link_confidence"].astype("float64").tolist()
+
+    n = len(linkage_ids)
+    audit_ids = [f"AUDIT_{stamp}_{start_index + i:06d}" for i in range(n)]
+    log_hashes = [""] * n
+    prev_hashes = [""] * n
+
+    last_hash = prev_hash
+    for i in range(n):
+        entry = {
+            "audit_id": audit_ids[i],
+            "timestamp": now,
+            "linkage_id": linkage_ids[i],
+            "source_id": source_ids[i],
+            "target_id": target_ids[i],
+            "source_type": source_type,
+            "target_type": target_type,
+            "days_gap": days_gaps[i],
+            "abs_days_gap": abs_days_gaps[i],
+            "tolerance_days": tolerance_days,
+            "link_confidence": confidences[i],
+            "validation_status": validation_status,
+            "validation_checks": validation_checks,
+            "created_by": created_by,
+            "prev_log_hash": last_hash,
+        }
+        prev_hashes[i] = last_hash
+        last_hash = compute_entry_hash(entry, last_hash)
+        log_hashes[i] = last_hash
+
+    entries = pd.DataFrame(
+        {
+            "audit_id": audit_ids,
+            "timestamp": [now] * n,
+            "linkage_id": linkage_ids,
+            "source_id": source_ids,
+            "target_id": target_ids,
+            "source_type": source_type,
+            "target_type": target_type,
+            "days_gap": days_gaps,
+            "abs_days_gap": abs_days_gaps,
+            "tolerance_days": tolerance_days,
+            "link_confidence": confidences,
+            "validation_status": validation_status,
+            "validation_checks": validation_checks,
+            "created_by": created_by,
+            "log_hash": log_hashes,
+            "prev_log_hash": prev_hashes,
+        },
+        columns=AUDIT_COLUMNS,
+    )
+
+    return entries, last_hash
+
 
 class AuditLogger:
     """Immutable audit logger for linkage decisions"""
@@ -49,26 +202,7 @@ class AuditLogger:
             self.log_df = pd.read_parquet(self.log_file)
             logger.info(f"Loaded existing audit log: {len(self.log_df)} entries")
         else:
-            self.log_df = pd.DataFrame(
-                columns=[
-                    "audit_id",
-                    "timestamp",
-                    "linkage_id",
-                    "source_id",
-                    "target_id",
-                    "source_type",
-                    "target_type",
-                    "days_gap",
-                    "abs_days_gap",
-                    "tolerance_days",
-                    "link_confidence",
-                    "validation_status",
-                    "validation_checks",
-                    "created_by",
-                    "log_hash",
-                    "prev_log_hash",
-                ]
-            )
+            self.log_df = pd.DataFrame(columns=AUDIT_COLUMNS)
             logger.info("Initialized new audit log")
 
         self.last_hash = self._get_last_hash()
@@ -76,7 +210,7 @@ class AuditLogger:
     def _get_last_hash(self) -> str:
         """Get hash of most recent log entry (for hash chain)"""
         if len(self.log_df) == 0:
-            return hashlib.sha256(b"GENESIS_BLOCK").hexdigest()[:16]
+            return GENESIS_HASH
         return self.log_df.iloc[-1]["log_hash"]
 
     def _compute_log_hash(self, entry: Dict[str, any]) -> str:
@@ -87,12 +221,8 @@ class AuditLogger:
         - All entry fields
         - Previous log hash (creates tamper-evident chain)
         """
-        # Create deterministic string representation
-        hash_input = json.dumps(entry, sort_keys=True, default=str)
-        hash_input += self.last_hash
-
         # SHA-256 hash (truncated to 16 chars for readability)
-        return hashlib.sha256(hash_input.encode()).hexdigest()[:16]
+        return compute_entry_hash(entry, self.last_hash)
 
     def log_linkage_decision(
         self,
@@ -216,42 +346,27 @@ class AuditLogger:
         """
         logger.info(f"Logging batch of {len(linkage_df)} linkages to audit trail")
 
-        audit_ids = []
-
-        for _, row in linkage_df.iterrows():
-            # Determine validation status
-            validation_status = "PASSED"
-            if validation_results and not validation_results.get(
-                "all_checks_passed", True
-            ):
-                validation_status = "WARNING"
-
-            # Extract source/target IDs (column names vary by source type)
-            source_id_col = [
-                col
-                for col in row.index
-                if col.endswith("_id")
-                and "linkage" not in col
-                and "pathology" not in col
-            ][0]
-            target_id_col = "pathology_id"
-
-            audit_id = self.log_linkage_decision(
-                linkage_id=row["linkage_id"],
-                source_id=row[source_id_col],
-                target_id=row[target_id_col],
-                source_type=source_type,
-                target_type=target_type,
-                days_gap=int(row["days_gap"]),
-                abs_days_gap=int(row["abs_days_gap"]),
-                tolerance_days=tolerance_days,
-                link_confidence=float(row["link_confidence"]),
-                validation_status=validation_status,
-                validation_checks=validation_results,
-                created_by=created_by,
-            )
+        entries, tail_hash = build_chained_entries(
+            linkage_df,
+            source_type=source_type,
+            target_type=target_type,
+            tolerance_days=tolerance_days,
+            prev_hash=self.last_hash,
+            start_index=len(self.log_df),
+            validation_results=validation_results,
+            created_by=created_by,
+        )
+        if len(entries) == 0:
+            return []
+
+        # Append to log in one step (immutable - no updates/deletes)
+        if len(self.log_df) == 0:
+            self.log_df = entries
+        else:
+            self.log_df = pd.concat([self.log_df, entries], ignore_index=True)
+        self.last_hash = tail_hash
 
-            audit_ids.append(audit_id)
+        audit_ids = entries["audit_id"].tolist()
 
         logger.info(f"Logged {len(audit_ids)} linkage decisions")
 
@@ -287,7 +402,7 @@ class AuditLogger:
         hash_mismatches = []
         chain_breaks = []
 
-        prev_hash = hashlib.sha256(b"GENESIS_BLOCK").hexdigest()[:16]
+        prev_hash = GENESIS_HASH
 
         for idx, row in self.log_df.iterrows():
             # Verify hash chain continuity
@@ -298,7 +413,7 @@ class AuditLogger:
             entry = row.to_dict()
             expected_hash = entry["log_hash"]
             del entry["log_hash"]  # Remove hash before recomputing
-            recomputed_hash = self._compute_log_hash(entry)
+            recomputed_hash = compute_entry_hash(entry, entry["prev_log_hash"])
 
             if recomputed_hash != expected_hash:
                 hash_mismatches.append(row["audit_id"])
@@ -0,0 +1,326 @@
+"""
+Segmented Append-Only Audit Log for Linkage Decisions
+
+Batch-oriented companion to ``AuditLogger``. Instead of holding the whole
+audit trail in memory and rewriting ``audit_log.parquet`` on every save, each
+batch of linkages is hashed in one pass and written as a new, immutable
+Parquet segment. A JSON manifest records the anchor (previous tail) and tail
+hash of every segment, which lets the chain be verified segment-by-segment in
+parallel.
+
+Layout::
+
+    audit_log/
+        manifest.json
+        segment_000000.parquet
+        segment_000001.parquet
+        ...
+
+Entries use the same columns and hash scheme as ``AuditLogger``.
+
+Author: Research Operating System
+Date: 2026-10-18
+"""
+
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from .audit_log import AUDIT_COLUMNS, GENESIS_HASH, build_chained_entries, compute_entry_hash
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+def _verify_segment(
+    segment_path: str, expected_prev_hash: str, expected_tail_hash: str
+) -> Dict[str, Any]:
+    """
+    Verify the hash chain inside a single segment.
+
+    Module-level so it can be shipped to worker processes.
+    """
+    df = pd.read_parquet(segment_path)
+    records = df[AUDIT_COLUMNS].to_dict("records")
+
+    hash_mismatches = []
+    chain_breaks = []
+    prev_hash = expected_prev_hash
+
+    for entry in records:
+        if entry["prev_log_hash"] != prev_hash:
+            chain_breaks.append(entry["audit_id"])
+
+        expected_hash = entry.pop("log_hash")
+        if compute_entry_hash(entry, entry["prev_log_hash"]) != expected_hash:
+            hash_mismatches.append(entry["audit_id"])
+
+        prev_hash = expected_hash
+
+    tail_matches = prev_hash == expected_tail_hash
+
+    return {
+        "segment": Path(segment_path).name,
+        "entries": len(records),
+        "hash_mismatches": hash_mismatches,
+        "chain_breaks": chain_breaks,
+        "tail_matches": tail_matches,
+        "valid": not hash_mismatches and not chain_breaks and tail_matches,
+    }
+
+
+class SegmentedAuditLog:
+    """Append-only, segmented audit log with a manifest of segment tail hashes"""
+
+    def __init__(
+        self, log_dir: Path = Path("data/processed/linkage/audit_log")
+    ):
+        """
+        Initialize segmented audit log.
+
+        Parameters
+        ----------
+        log_dir : Path
+            Directory holding the manifest and Parquet segments (created if
+            it doesn't exist). Only the manifest is read on construction.
+        """
+        self.log_dir = Path(log_dir)
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.log_dir / MANIFEST_NAME
+
+        if self.manifest_path.exists():
+            with open(self.manifest_path) as f:
+                self.manifest = json.load(f)
+            logger.info(
+                f"Loaded audit manifest: {len(self.manifest['segments'])} segments, "
+                f"{self.total_entries} entries"
+            )
+        else:
+            self.manifest = {
+                "version": MANIFEST_VERSION,
+                "genesis_hash": GENESIS_HASH,
+                "segments": [],
+            }
+            logger.info("Initialized new segmented audit log")
+
+    @property
+    def segments(self) -> List[Dict[str, Any]]:
+        return self.manifest["segments"]
+
+    @property
+    def total_entries(self) -> int:
+        return sum(seg["entries"] for seg in self.segments)
+
+    @property
+    def last_hash(self) -> str:
+        """Tail hash of the most recent segment (chain anchor for the next one)"""
+        if not self.segments:
+            return self.manifest["genesis_hash"]
+        return self.segments[-1]["tail_hash"]
+
+    def _write_manifest(self):
+        """Atomically replace the manifest on disk"""
+        tmp_path = self.manifest_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def append_batch(
+        self,
+        linkage_df: pd.DataFrame,
+        source_type: str,
+        target_type: str,
+        tolerance_days: int,
+        validation_results: Optional[Dict[str, Any]] = None,
+        created_by: str = "linkage_engine_v1",
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Hash a whole linkage table and append it as a new segment.
+
+        Parameters
+        ----------
+        linkage_df : pd.DataFrame
+            Linkage table from linkage_engine
+        source_type : str
+            Source data type
+        target_type : str
+            Target data type
+        tolerance_days : int
+            Date tolerance window used
+        validation_results : dict, optional
+            Validation summary from LinkageValidator
+        created_by : str
+            Software/user that created the links
+
+        Returns
+        -------
+        dict or None
+            Manifest record for the new segment, or None if the batch was empty
+        """
+        if len(linkage_df) == 0:
+            logger.info("Empty linkage batch; no segment written")
+            return None
+
+        prev_hash = self.last_hash
+        entries, tail_hash = build_chained_entries(
+            linkage_df,
+            source_type=source_type,
+            target_type=target_type,
+            tolerance_days=tolerance_days,
+            prev_hash=prev_hash,
+            start_index=self.total_entries,
+            validation_results=validation_results,
+            created_by=created_by,
+        )
+
+        segment_id = len(self.segments)
+        segment_file = f"segment_{segment_id:06d}.parquet"
+        segment_path = self.log_dir / segment_file
+        if segment_path.exists():
+            raise FileExistsError(
+                f"Audit segment already exists (manifest out of sync): {segment_path}"
+            )
+
+        # Write segment first, then publish it via the manifest
+        tmp_path = segment_path.with_suffix(".parquet.tmp")
+        entries.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, segment_path)
+
+        record = {
+            "segment_id": segment_id,
+            "file": segment_file,
+            "entries": len(entries),
+            "first_audit_id": entries["audit_id"].iloc[0],
+            "last_audit_id": entries["audit_id"].iloc[-1],
+            "source_type": source_type,
+            "target_type": target_type,
+            "prev_hash": prev_hash,
+            "tail_hash": tail_hash,
+            "created_at": datetime.utcnow().isoformat(),
+        }
+        self.segments.append(record)
+        self._write_manifest()
+
+        logger.info(
+            f"Appended audit segment {segment_file} ({len(entries)} entries, "
+            f"tail {tail_hash})"
+        )
+
+        return record
+
+    def read_log(
+        self,
+        columns: Optional[List[str]] = None,
+        source_type: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Load audit entries from segments.
+
+        Parameters
+        ----------
+        columns : list of str, optional
+            Columns to read (default: all audit columns)
+        source_type : str, optional
+            Only read segments logged for this source type
+
+        Returns
+        -------
+        pd.DataFrame
+            Concatenated audit entries in chain order
+        """
+        segments = self.segments
+        if source_type:
+            segments = [seg for seg in segments if seg["source_type"] == source_type]
+
+        if not segments:
+            return pd.DataFrame(columns=columns or AUDIT_COLUMNS)
+
+        frames = [
+            pd.read_parquet(self.log_dir / seg["file"], columns=columns)
+            for seg in segments
+        ]
+        return pd.concat(frames, ignore_index=True)
+
+    def verify_hash_chain(self, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Verify audit log integrity, one segment per worker.
+
+        Cross-segment continuity is checked against the manifest (each
+        segment's anchor must equal the previous tail), so segments can be
+        verified independently.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Process pool size. ``1`` verifies in-process.
+
+        Returns
+        -------
+        dict
+            {
+                'valid': bool,
+                'total_entries': int,
+                'verified_entries': int,
+                'hash_mismatches': list of audit_ids,
+                'chain_breaks': list of audit_ids,
+                'manifest_breaks': list of segment files,
+                'segments': list of per-segment results
+            }
+        """
+        logger.info(f"Verifying {len(self.segments)} audit segments...")
+
+        manifest_breaks = []
+        expected_prev = self.manifest["genesis_hash"]
+        for seg in self.segments:
+            if seg["prev_hash"] != expected_prev:
+                manifest_breaks.append(seg["file"])
+            expected_prev = seg["tail_hash"]
+
+        jobs = [
+            (str(self.log_dir / seg["file"]), seg["prev_hash"], seg["tail_hash"])
+            for seg in self.segments
+        ]
+
+        if max_workers == 1 or len(jobs) <= 1:
+            segment_results = [_verify_segment(*job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                segment_results = list(executor.map(_verify_segment, *zip(*jobs)))
+
+        hash_mismatches = [a for r in segment_results for a in r["hash_mismatches"]]
+        chain_breaks = [a for r in segment_results for a in r["chain_breaks"]]
+        manifest_breaks.extend(
+            r["segment"] for r in segment_results if not r["tail_matches"]
+        )
+        total_entries = sum(r["entries"] for r in segment_results)
+
+        result = {
+            "valid": not hash_mismatches and not chain_breaks and not manifest_breaks,
+            "total_entries": total_entries,
+            "verified_entries": total_entries - len(hash_mismatches) - len(chain_breaks),
+            "hash_mismatches": hash_mismatches,
+            "chain_breaks": chain_breaks,
+            "manifest_breaks": manifest_breaks,
+            "segments": segment_results,
+        }
+
+        if result["valid"]:
+            logger.info(
+                f"✅ Audit log integrity: VERIFIED ({total_entries} entries, "
+                f"{len(segment_results)} segments)"
+            )
+        else:
+            logger.error("❌ Audit log integrity: FAILED")
+            logger.error(f"  Hash mismatches: {len(hash_mismatches)}")
+            logger.error(f"  Chain breaks: {len(chain_breaks)}")
+            logger.error(f"  Manifest breaks: {len(manifest_breaks)}")
+
+        return result
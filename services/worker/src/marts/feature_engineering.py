@@ -22,11 +22,12 @@ Date: 2025-12-22
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import List, Optional, Tuple
 import warnings
 
 warnings.filterwarnings("ignore")
@@ -225,103 +226,19 @@ class FeatureEngineer:
         """
         print("\nAggregating laboratory values...")
 
-        lab_features = []
+        blocks = []
+        for key, lab_type, label in [
+            ("anti_tg", "anti_tg", "anti-Tg antibody"),
+            ("thyroglobulin", "thyroglobulin", "thyroglobulin"),
+        ]:
+            if self.datasets.get(key) is None:
+                continue
+            block = self._aggregate_wide_labs(self.datasets[key], lab_type)
+            if block is not None:
+                blocks.append(block)
+                print(f"  ✓ Aggregated {label} for {len(block):,} patients")
 
-        # Process Anti-Tg antibody
-        if self.datasets["anti_tg"] is not None:
-            anti_tg_df = self.datasets["anti_tg"].copy()
-            id_col = self._find_id_column(anti_tg_df)
-
-            if id_col:
-                for rid in anti_tg_df[id_col].unique():
-                    patient_labs = anti_tg_df[anti_tg_df[id_col] == rid].iloc[0]
-
-                    # Extract lab results (lab1_result through labN_result)
-                    result_cols = [
-                        c
-                        for c in anti_tg_df.columns
-                        if c.startswith("lab") and c.endswith("_result")
-                    ]
-                    date_cols = [
-                        c
-                        for c in anti_tg_df.columns
-                        if c.startswith("lab") and c.endswith("_specimen_collect_dt")
-                    ]
-
-                    results = []
-                    dates = []
-
-                    for res_col, date_col in zip(result_cols, date_cols):
-                        if pd.notna(patient_labs.get(res_col)):
-                            # Parse numeric value (handle <, >, inequalities)
-                            val = self._parse_lab_value(str(patient_labs[res_col]))
-                            if val is not None:
-                                results.append(val)
-                                if pd.notna(patient_labs.get(date_col)):
-                                    dates.append(patient_labs[date_col])
-
-                    if results:
-                        features = self._compute_lab_stats(
-                            self._normalize_id(rid), results, dates, "anti_tg"
-                        )
-                        lab_features.append(features)
-
-                print(
-                    f"  ✓ Aggregated anti-Tg antibody for {len(lab_features):,} patients"
-                )
-
-        # Process Thyroglobulin
-        if self.datasets["thyroglobulin"] is not None:
-            tg_df = self.datasets["thyroglobulin"].copy()
-            id_col = self._find_id_column(tg_df)
-
-            if id_col:
-                tg_count = 0
-                for rid in tg_df[id_col].unique():
-                    patient_labs = tg_df[tg_df[id_col] == rid].iloc[0]
-
-                    result_cols = [
-                        c
-                        for c in tg_df.columns
-                        if c.startswith("lab") and c.endswith("_result")
-                    ]
-                    date_cols = [
-                        c
-                        for c in tg_df.columns
-                        if c.startswith("lab") and c.endswith("_specimen_collect_dt")
-                    ]
-
-                    results = []
-                    dates = []
-
-                    for res_col, date_col in zip(result_cols, date_cols):
-                        if pd.notna(patient_labs.get(res_col)):
-                            val = self._parse_lab_value(str(patient_labs[res_col]))
-                            if val is not None:
-                                results.append(val)
-                                if pd.notna(patient_labs.get(date_col)):
-                                    dates.append(patient_labs[date_col])
-
-                    if results:
-                        norm_id = self._normalize_id(rid)
-                        features = self._compute_lab_stats(
-                            norm_id, results, dates, "thyroglobulin"
-                        )
-
-                        # Merge with existing record or create new
-                        existing = next(
-                            (f for f in lab_features if f["research_id"] == norm_id),
-                            None,
-                        )
-                        if existing:
-                            existing.update(features)
-                        else:
-                            lab_features.append(features)
-                        tg_count += 1
-
-                print(f"  ✓ Aggregated thyroglobulin for {tg_count:,} patients")
-
-        labs_df = pd.DataFrame(lab_features)
+        labs_df = self._join_blocks(blocks)
 
         if len(labs_df) > 0:
             print(f"\n  Total patients with lab features: {len(labs_df):,}")
@@ -343,65 +260,53 @@ class FeatureEngineer:
         """
         print("\nExtracting imaging features...")
 
-        imaging_features = []
+        blocks = []
 
         # Extract TI-RADS from ultrasound
-        if self.datasets["ultrasound"] is not None:
-            us_df = self.datasets["ultrasound"].copy()
+        if self.datasets.get("ultrasound") is not None:
+            us_df = self.datasets["ultrasound"]
             id_col = self._find_id_column(us_df)
 
             if id_col:
-                # Group by patient and aggregate TI-RADS scores
                 tirads_cols = [
                     c
                     for c in us_df.columns
                     if "tirads" in c.lower() or "ti-rads" in c.lower()
                 ]
+                size_cols = [
+                    c
+                    for c in us_df.columns
+                    if "size" in c.lower() or "dimension" in c.lower()
+                ]
+                # TI-RADS max is the worst nodule; nodule_count is the number of reports
+                measure_cols = list(dict.fromkeys(tirads_cols + size_cols))
+                numeric = pd.DataFrame(
+                    {c: pd.to_numeric(us_df[c], errors="coerce") for c in measure_cols},
+                    index=us_df.index,
+                )
+                grouped = numeric.groupby(
+                    self._normalize_id_series(us_df[id_col]), sort=False
+                )
 
-                for rid in us_df[id_col].unique():
-                    patient_us = us_df[us_df[id_col] == rid]
-
-                    features = {"research_id": self._normalize_id(rid)}
-
-                    # Extract TI-RADS scores (if available)
-                    for col in tirads_cols:
-                        if col in patient_us.columns:
-                            # Get max TI-RADS score (worst nodule)
-                            scores = pd.to_numeric(
-                                patient_us[col], errors="coerce"
-                            ).dropna()
-                            if len(scores) > 0:
-                                features[f"{col}_max"] = scores.max()
-                                features[f"{col}_mean"] = scores.mean()
-
-                    # Nodule characteristics
-                    nodule_cols = [c for c in us_df.columns if "nodule" in c.lower()]
-                    features["nodule_count"] = len(patient_us)
-
-                    # Size features (if available)
-                    size_cols = [
-                        c
-                        for c in us_df.columns
-                        if "size" in c.lower() or "dimension" in c.lower()
-                    ]
-                    for col in size_cols:
-                        if col in patient_us.columns:
-                            sizes = pd.to_numeric(
-                                patient_us[col], errors="coerce"
-                            ).dropna()
-                            if len(sizes) > 0:
-                                features[f"{col}_max"] = sizes.max()
-                                features[f"{col}_mean"] = sizes.mean()
-
-                    imaging_features.append(features)
+                features = pd.DataFrame({"nodule_count": grouped.size()})
+                if measure_cols:
+                    stats = grouped.agg(["max", "mean"])
+                    stats.columns = [f"{col}_{stat}" for col, stat in stats.columns]
+                    features = features.join(stats.dropna(axis=1, how="all"))
+                ordered = [f"{c}_{stat}" for c in tirads_cols for stat in ("max", "mean")]
+                ordered += ["nodule_count"]
+                ordered += [f"{c}_{stat}" for c in size_cols for stat in ("max", "mean")]
+                features = features[[c for c in dict.fromkeys(ordered) if c in features.columns]]
+                features.index.name = "research_id"
+                blocks.append(features)
 
                 print(
-                    f"  ✓ Extracted ultrasound features for {len(imaging_features):,} patients"
+                    f"  ✓ Extracted ultrasound features for {len(features):,} patients"
                 )
 
         # Extract thyroid volume measurements
-        if self.datasets["thyroid_sizes"] is not None:
-            sizes_df = self.datasets["thyroid_sizes"].copy()
+        if self.datasets.get("thyroid_sizes") is not None:
+            sizes_df = self.datasets["thyroid_sizes"]
             id_col = self._find_id_column(sizes_df)
 
             if id_col:
@@ -410,28 +315,13 @@ class FeatureEngineer:
                     for c in sizes_df.columns
                     if "volume" in c.lower() and "cm3" in c.lower()
                 ]
-
-                for rid in sizes_df[id_col].unique():
-                    patient_sizes = sizes_df[sizes_df[id_col] == rid].iloc[0]
-                    norm_id = self._normalize_id(rid)
-
-                    # Find or create feature record
-                    existing = next(
-                        (f for f in imaging_features if f["research_id"] == norm_id),
-                        None,
-                    )
-                    if not existing:
-                        existing = {"research_id": norm_id}
-                        imaging_features.append(existing)
-
-                    # Extract volume features
-                    for col in volume_cols:
-                        if col in patient_sizes.index and pd.notna(patient_sizes[col]):
-                            existing[col] = patient_sizes[col]
+                blocks.append(
+                    self._first_row_features(sizes_df, id_col, volume_cols)
+                )
 
                 print(f"  ✓ Added thyroid volume features")
 
-        imaging_df = pd.DataFrame(imaging_features)
+        imaging_df = self._join_blocks(blocks)
 
         if len(imaging_df) > 0:
             print(f"\n  Total patients with imaging features: {len(imaging_df):,}")
@@ -454,126 +344,96 @@ class FeatureEngineer:
         """
         print("\nExtracting clinical features...")
 
-        clinical_features = []
+        blocks = []
 
         # Extract from benign pathology
-        if self.datasets["benign_path"] is not None:
-            benign_df = self.datasets["benign_path"].copy()
+        if self.datasets.get("benign_path") is not None:
+            benign_df = self.datasets["benign_path"]
             id_col = self._find_id_column(benign_df)
 
             if id_col:
-                for rid in benign_df[id_col].unique():
-                    patient_path = benign_df[benign_df[id_col] == rid].iloc[0]
-
-                    features = {"research_id": self._normalize_id(rid)}
-
-                    # Demographics
-                    if "age_at_surgery" in patient_path.index:
-                        features["age_at_surgery"] = patient_path["age_at_surgery"]
-                    if "sex" in patient_path.index or "gender" in patient_path.index:
-                        gender_col = "sex" if "sex" in patient_path.index else "gender"
-                        features["gender"] = patient_path[gender_col]
-
-                    # Surgery type
-                    if "surgery_type" in patient_path.index:
-                        features["surgery_type"] = patient_path["surgery_type"]
-
-                    # Gland measurements
-                    weight_cols = [
-                        c for c in benign_df.columns if "weight" in c.lower()
-                    ]
-                    dim_cols = [c for c in benign_df.columns if "dim" in c.lower()]
-
-                    for col in weight_cols + dim_cols:
-                        if col in patient_path.index and pd.notna(patient_path[col]):
-                            features[col] = patient_path[col]
-
-                    clinical_features.append(features)
+                # Demographics and surgery type are kept even when missing
+                kept = {}
+                if "age_at_surgery" in benign_df.columns:
+                    kept["age_at_surgery"] = "age_at_surgery"
+                if "sex" in benign_df.columns or "gender" in benign_df.columns:
+                    kept["gender"] = "sex" if "sex" in benign_df.columns else "gender"
+                if "surgery_type" in benign_df.columns:
+                    kept["surgery_type"] = "surgery_type"
+
+                # Gland measurements
+                measure_cols = [c for c in benign_df.columns if "weight" in c.lower()]
+                measure_cols += [c for c in benign_df.columns if "dim" in c.lower()]
+
+                first = self._first_row_features(
+                    benign_df, id_col, list(kept.values()), dropna=False
+                ).rename(columns={v: k for k, v in kept.items()})
+                measures = self._first_row_features(benign_df, id_col, measure_cols)
+                block = pd.concat([first, measures], axis=1)
+                block = block.loc[:, ~block.columns.duplicated(keep="last")]
+                blocks.append(block)
 
                 print(
-                    f"  ✓ Extracted clinical features from benign pathology: {len(clinical_features):,} patients"
+                    f"  ✓ Extracted clinical features from benign pathology: {len(block):,} patients"
                 )
 
         # Extract from tumor pathology (malignant cases)
-        if self.datasets["tumor_path"] is not None:
-            tumor_df = self.datasets["tumor_path"].copy()
+        if self.datasets.get("tumor_path") is not None:
+            tumor_df = self.datasets["tumor_path"]
             id_col = self._find_id_column(tumor_df)
 
             if id_col:
-                tumor_count = 0
-                for rid in tumor_df[id_col].unique():
-                    patient_tumor = tumor_df[tumor_df[id_col] == rid].iloc[0]
-                    norm_id = self._normalize_id(rid)
+                # Tumor characteristics (tumor_1 features)
+                tumor_cols = [
+                    "tumor_1_size_cm",
+                    "tumor_1_histology",
+                    "tumor_1_capsular_invasion",
+                    "tumor_1_lymphatic_invasion",
+                    "tumor_1_vascular_invasion",
+                    "tumor_1_gross_ete",
+                    "histology_1_T_stage_ajcc8",
+                    "histology_1_N_stage_ajcc8",
+                    "histology_1_M_stage_ajcc8",
+                    "histology_1_overall_stage_ajcc8",
+                ]
+                block = self._first_row_features(
+                    tumor_df, id_col, [c for c in tumor_cols if c in tumor_df.columns]
+                )
+                blocks.append(block)
 
-                    # Find or create feature record
-                    existing = next(
-                        (f for f in clinical_features if f["research_id"] == norm_id),
-                        None,
-                    )
-                    if not existing:
-                        existing = {"research_id": norm_id}
-                        clinical_features.append(existing)
-
-                    # Tumor characteristics (tumor_1 features)
-                    tumor_cols = [
-                        "tumor_1_size_cm",
-                        "tumor_1_histology",
-                        "tumor_1_capsular_invasion",
-                        "tumor_1_lymphatic_invasion",
-                        "tumor_1_vascular_invasion",
-                        "tumor_1_gross_ete",
-                        "histology_1_T_stage_ajcc8",
-                        "histology_1_N_stage_ajcc8",
-                        "histology_1_M_stage_ajcc8",
-                        "histology_1_overall_stage_ajcc8",
-                    ]
-
-                    for col in tumor_cols:
-                        if col in patient_tumor.index and pd.notna(patient_tumor[col]):
-                            existing[col] = patient_tumor[col]
-
-                    tumor_count += 1
-
-                print(f"  ✓ Added tumor characteristics for {tumor_count:,} patients")
+                print(f"  ✓ Added tumor characteristics for {len(block):,} patients")
 
         # Extract from FNA for Bethesda scores
-        if self.datasets["fna"] is not None:
-            fna_df = self.datasets["fna"].copy()
+        if self.datasets.get("fna") is not None:
+            fna_df = self.datasets["fna"]
             id_col = self._find_id_column(fna_df)
 
             if id_col:
-                fna_count = 0
-                for rid in fna_df[id_col].unique():
-                    patient_fna = fna_df[fna_df[id_col] == rid]
-                    norm_id = self._normalize_id(rid)
-
-                    # Find or create feature record
-                    existing = next(
-                        (f for f in clinical_features if f["research_id"] == norm_id),
-                        None,
+                # Bethesda scores (max and most recent non-missing)
+                bethesda_cols = [
+                    c
+                    for c in ["bethesda_2023_num", "bethesda_2015_num", "bethesda_2010_num"]
+                    if c in fna_df.columns
+                ]
+                grouped = fna_df[bethesda_cols].groupby(
+                    self._normalize_id_series(fna_df[id_col]), sort=False
+                )
+                block = pd.DataFrame(index=grouped.size().index)
+                if bethesda_cols:
+                    scores = grouped.agg(
+                        **{
+                            f"{col}_{name}": (col, stat)
+                            for col in bethesda_cols
+                            for name, stat in (("max", "max"), ("latest", "last"))
+                        }
                     )
-                    if not existing:
-                        existing = {"research_id": norm_id}
-                        clinical_features.append(existing)
-
-                    # Bethesda scores (use most recent or max)
-                    bethesda_cols = [
-                        "bethesda_2023_num",
-                        "bethesda_2015_num",
-                        "bethesda_2010_num",
-                    ]
-                    for col in bethesda_cols:
-                        if col in patient_fna.columns:
-                            scores = patient_fna[col].dropna()
-                            if len(scores) > 0:
-                                existing[f"{col}_max"] = scores.max()
-                                existing[f"{col}_latest"] = scores.iloc[-1]
-
-                    fna_count += 1
+                    block = block.join(scores.dropna(axis=1, how="all"))
+                block.index.name = "research_id"
+                blocks.append(block)
 
-                print(f"  ✓ Added FNA Bethesda scores for {fna_count:,} patients")
+                print(f"  ✓ Added FNA Bethesda scores for {len(block):,} patients")
 
-        clinical_df = pd.DataFrame(clinical_features)
+        clinical_df = self._join_blocks(blocks)
 
         if len(clinical_df) > 0:
             print(f"\n  Total patients with clinical features: {len(clinical_df):,}")
@@ -601,27 +461,20 @@ class FeatureEngineer:
         """
         print("\nCreating integrated feature matrix...")
 
-        # Start with labels as base
+        # Start with labels as base; feature blocks have one row per patient,
+        # so each is a left join against its research_id index
         feature_matrix = labels_df.copy()
 
-        # Merge lab features
-        if len(labs_df) > 0:
-            feature_matrix = feature_matrix.merge(labs_df, on="research_id", how="left")
-            print(f"  ✓ Merged lab features: {len(labs_df.columns)-1} columns")
-
-        # Merge imaging features
-        if len(imaging_df) > 0:
-            feature_matrix = feature_matrix.merge(
-                imaging_df, on="research_id", how="left"
-            )
-            print(f"  ✓ Merged imaging features: {len(imaging_df.columns)-1} columns")
-
-        # Merge clinical features
-        if len(clinical_df) > 0:
-            feature_matrix = feature_matrix.merge(
-                clinical_df, on="research_id", how="left"
-            )
-            print(f"  ✓ Merged clinical features: {len(clinical_df.columns)-1} columns")
+        for label, block in [
+            ("lab", labs_df),
+            ("imaging", imaging_df),
+            ("clinical", clinical_df),
+        ]:
+            if len(block) > 0:
+                feature_matrix = feature_matrix.join(
+                    block.set_index("research_id"), on="research_id"
+                )
+                print(f"  ✓ Merged {label} features: {len(block.columns)-1} columns")
 
         print(
             f"\n  Final feature matrix: {len(feature_matrix):,} patients × {len(feature_matrix.columns)} features"
@@ -670,8 +523,13 @@ class FeatureEngineer:
 
         print(f"\n{'='*80}\n")
 
-    def run(self):
-        """Execute full feature engineering pipeline."""
+    def run(self, parallel: bool = False):
+        """
+        Execute full feature engineering pipeline.
+
+        Args:
+            parallel: Compute the label and feature blocks concurrently
+        """
         print(f"\n{'='*80}")
         print("  FEATURE ENGINEERING PIPELINE")
         print(f"  Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -680,11 +538,22 @@ class FeatureEngineer:
         # Load data
         self.load_datasets()
 
-        # Derive features
-        labels_df = self.derive_malignancy_labels()
-        labs_df = self.aggregate_labs()
-        imaging_df = self.extract_imaging_features()
-        clinical_df = self.extract_clinical_features()
+        # Derive features (blocks are independent; pandas releases the GIL
+        # in most groupby kernels, so threads overlap well)
+        blocks = [
+            self.derive_malignancy_labels,
+            self.aggregate_labs,
+            self.extract_imaging_features,
+            self.extract_clinical_features,
+        ]
+        if parallel:
+            with ThreadPoolExecutor(max_workers=len(blocks)) as executor:
+                futures = [executor.submit(block) for block in blocks]
+                labels_df, labs_df, imaging_df, clinical_df = [
+                    f.result() for f in futures
+                ]
+        else:
+            labels_df, labs_df, imaging_df, clinical_df = [block() for block in blocks]
 
         # Create integrated matrix
         feature_matrix = self.create_feature_matrix(
@@ -731,57 +600,158 @@ class FeatureEngineer:
 
         return rid_str
 
-    def _parse_lab_value(self, value_str: str) -> Optional[float]:
-        """Parse lab result value (handles <, >, inequalities)."""
-        if pd.isna(value_str) or value_str == "":
-            return None
-
-        # Remove inequality symbols
-        value_str = str(value_str).strip()
-        value_str = (
-            value_str.replace("<", "")
-            .replace(">", "")
-            .replace("≤", "")
-            .replace("≥", "")
+    def _normalize_id_series(self, ids: pd.Series) -> pd.Series:
+        """Normalize a column of patient IDs (each distinct value once)."""
+        codes, uniques = pd.factorize(ids)
+        normalized = np.array(
+            [self._normalize_id(rid) for rid in uniques] + [None], dtype=object
         )
+        # Missing IDs have code -1, which picks the trailing None
+        return pd.Series(normalized[codes], index=ids.index, name="research_id")
 
-        try:
-            return float(value_str)
-        except ValueError:
-            return None
+    def _first_row_features(
+        self, df: pd.DataFrame, id_col: str, columns: List[str], dropna: bool = True
+    ) -> pd.DataFrame:
+        """
+        Take ``columns`` from each patient's first row, indexed by research_id.
 
-    def _compute_lab_stats(
-        self, research_id: str, results: List[float], dates: List, lab_type: str
-    ) -> Dict:
-        """Compute summary statistics for longitudinal lab values."""
-        features = {
-            "research_id": research_id,
-            f"{lab_type}_mean": np.mean(results),
-            f"{lab_type}_median": np.median(results),
-            f"{lab_type}_min": np.min(results),
-            f"{lab_type}_max": np.max(results),
-            f"{lab_type}_std": np.std(results),
-            f"{lab_type}_count": len(results),
-            f"{lab_type}_first": results[0],
-            f"{lab_type}_last": results[-1],
-        }
+        With ``dropna`` a column that is missing for every patient is dropped,
+        as it would never have been set per patient.
+        """
+        ids = self._normalize_id_series(df[id_col])
+        keep = (ids.notna() & ~ids.duplicated()).to_numpy()
+        block = df.loc[keep, columns]
+        block.index = pd.Index(ids[keep].to_numpy(), name="research_id")
+        if dropna:
+            block = block.dropna(axis=1, how="all")
+        return block
+
+    def _join_blocks(self, blocks: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Outer-join feature blocks indexed by research_id.
 
-        # Compute trend (if multiple values)
-        if len(results) >= 2:
-            features[f"{lab_type}_trend"] = results[-1] - results[0]
-            features[f"{lab_type}_trend_pct"] = (
-                ((results[-1] - results[0]) / results[0] * 100)
-                if results[0] != 0
-                else 0
+        Patients keep first-seen order across blocks. Where blocks share a
+        column, later non-missing values win.
+        """
+        if not blocks:
+            return pd.DataFrame()
+
+        index = blocks[0].index
+        for block in blocks[1:]:
+            index = index.append(block.index[~block.index.isin(index)])
+
+        result = blocks[0].reindex(index)
+        for block in blocks[1:]:
+            block = block.reindex(index)
+            shared = [c for c in block.columns if c in result.columns]
+            for col in shared:
+                result[col] = block[col].where(block[col].notna(), result[col])
+            result = pd.concat(
+                [result, block[[c for c in block.columns if c not in shared]]], axis=1
             )
 
-        # Time span (if dates available)
-        if len(dates) >= 2:
-            dates_sorted = sorted([pd.to_datetime(d) for d in dates])
-            time_span = (dates_sorted[-1] - dates_sorted[0]).days
-            features[f"{lab_type}_timespan_days"] = time_span
+        result.index.name = "research_id"
+        return result.reset_index()
+
+    def _aggregate_wide_labs(
+        self, df: pd.DataFrame, lab_type: str
+    ) -> Optional[pd.DataFrame]:
+        """
+        Summary statistics for one wide lab table (lab1_result .. labN_result).
+
+        Uses each patient's first row. Result columns are paired with date
+        columns by position, and values are kept in column order, so first and
+        last are the earliest and latest slots.
+
+        Returns:
+            Lab features indexed by research_id, or None without usable results
+        """
+        id_col = self._find_id_column(df)
+        if not id_col:
+            return None
+
+        result_cols = [
+            c for c in df.columns if c.startswith("lab") and c.endswith("_result")
+        ]
+        date_cols = [
+            c
+            for c in df.columns
+            if c.startswith("lab") and c.endswith("_specimen_collect_dt")
+        ]
+        pairs = list(zip(result_cols, date_cols))
+        if not pairs:
+            return None
+
+        ids = self._normalize_id_series(df[id_col])
+        keep = (ids.notna() & ~ids.duplicated()).to_numpy()
+        rows = df.loc[keep]
+        patient_ids = ids[keep].to_numpy()
+
+        # Long format: one row per (patient, slot) with a parseable value
+        long = pd.concat(
+            [
+                pd.DataFrame(
+                    {
+                        "research_id": patient_ids,
+                        "value": self._parse_lab_series(rows[res_col]).to_numpy(),
+                        "date": pd.to_datetime(rows[date_col], errors="coerce").to_numpy(),
+                    }
+                )
+                for res_col, date_col in pairs
+            ],
+            ignore_index=True,
+        ).dropna(subset=["value"])
+        if long.empty:
+            return None
 
-        return features
+        grouped = long.groupby("research_id", sort=False)
+        stats = grouped["value"].agg(
+            mean="mean",
+            median="median",
+            min="min",
+            max="max",
+            std="std",
+            count="size",
+            first="first",
+            last="last",
+        )
+        dates = grouped["date"].agg(date_min="min", date_max="max", date_count="count")
+
+        count = stats["count"]
+        # Population standard deviation (ddof=0); a single value has std 0
+        stats["std"] = np.where(
+            count > 1, stats["std"] * np.sqrt((count - 1) / count), 0.0
+        )
+        has_trend = count >= 2
+        change = stats["last"] - stats["first"]
+        stats["trend"] = change.where(has_trend)
+        stats["trend_pct"] = pd.Series(
+            np.where(stats["first"] != 0, change / stats["first"].where(stats["first"] != 0) * 100, 0.0),
+            index=stats.index,
+        ).where(has_trend)
+        stats["timespan_days"] = (dates["date_max"] - dates["date_min"]).dt.days.where(
+            dates["date_count"] >= 2
+        )
+        stats = stats.dropna(axis=1, how="all")
+
+        # Patients in table order
+        order = pd.Index(patient_ids)
+        stats = stats.reindex(order[order.isin(stats.index)])
+        stats.columns = [f"{lab_type}_{c}" for c in stats.columns]
+        stats.index.name = "research_id"
+        return stats
+
+    def _parse_lab_series(self, values: pd.Series) -> pd.Series:
+        """Parse lab result values (strips <, >, ≤, ≥); unparseable values become NaN."""
+        if pd.api.types.is_numeric_dtype(values.dtype):
+            return values.astype(float)
+        text = (
+            values.dropna()
+            .astype(str)
+            .str.replace(r"[<>≤≥]", "", regex=True)
+            .str.strip()
+        )
+        return pd.to_numeric(text, errors="coerce").reindex(values.index)
 
 
 def main():
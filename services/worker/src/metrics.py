@@ -4,16 +4,30 @@ Prometheus Metrics Module
 Exposes /metrics endpoint for Prometheus scraping.
 Phase 08: Observability + Worker Parallelism
 
+Histograms keep fixed bucket counters with a running sum and count, so
+memory and scrape time do not grow with the number of observations.
+
+With multiple uvicorn workers, set PROMETHEUS_MULTIPROC_DIR to a directory
+shared by all workers (empty at startup). Each process then mirrors its
+values into an mmap'd file there and /metrics reports the aggregate across
+workers. Process CPU/memory metrics remain per scraped process.
+
 See docs/architecture/perf-optimization-roadmap.md
 """
 
 from __future__ import annotations
 
+import json
+import mmap
 import os
+import struct
+import threading
 import time
 import logging
-from functools import wraps
-from typing import Callable, TypeVar, ParamSpec
+from bisect import bisect_left
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import Callable, Iterator, TypeVar, ParamSpec
 from dataclasses import dataclass, field
 from collections import defaultdict
 
@@ -34,6 +48,218 @@ def _parse_bool(value: str | None, default: bool) -> bool:
 METRICS_ENABLED = _parse_bool(os.getenv("METRICS_ENABLED"), True)
 
 
+# Multiprocess aggregation (e.g. UVICORN_WORKERS > 1): when set, every process
+# mirrors its metric values into an mmap-backed file in this directory and
+# /metrics aggregates all files, so any worker can answer a scrape.
+MULTIPROC_ENV_VAR = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def _labels_key(labels: dict[str, str]) -> str:
+    """Create a string key from labels."""
+    if not labels:
+        return ""
+    sorted_items = sorted(labels.items())
+    return ",".join(f'{k}="{v}"' for k, v in sorted_items)
+
+
+class MmapedValues:
+    """
+    Append-only ``key -> float64`` map stored in an mmap'd file.
+
+    One file per process and metric kind. Values are updated in place, so an
+    update is a single 8-byte store; other processes read the file without
+    locking. Layout::
+
+        [uint32 used][4 bytes pad]
+        ([uint32 key_len][key utf-8, padded to 8][float64 value])*
+
+    ``used`` is written after each new entry is complete, so readers never
+    see a partial entry.
+    """
+
+    _HEADER = struct.Struct("<I4x")
+    _KEY_LEN = struct.Struct("<I")
+    _VALUE = struct.Struct("<d")
+
+    def __init__(self, path: str | Path, initial_size: int = 1 << 16) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._positions: dict[str, int] = {}
+
+        exists = self.path.exists() and self.path.stat().st_size > 0
+        self._file = open(self.path, "a+b")
+        if not exists:
+            self._file.truncate(initial_size)
+        self._capacity = os.fstat(self._file.fileno()).st_size
+        self._mmap = mmap.mmap(self._file.fileno(), self._capacity)
+
+        if exists:
+            for key, _value, pos in self._iter_entries(self._mmap):
+                self._positions[key] = pos
+            self._used = self._HEADER.unpack_from(self._mmap, 0)[0]
+        else:
+            self._used = self._HEADER.size
+            self._HEADER.pack_into(self._mmap, 0, self._used)
+
+    @classmethod
+    def _iter_entries(cls, buf) -> Iterator[tuple[str, float, int]]:
+        """Yield (key, value, value_offset) for every entry in ``buf``."""
+        used = cls._HEADER.unpack_from(buf, 0)[0]
+        pos = cls._HEADER.size
+        while pos < used:
+            key_len = cls._KEY_LEN.unpack_from(buf, pos)[0]
+            pos += cls._KEY_LEN.size
+            key = bytes(buf[pos:pos + key_len]).decode("utf-8")
+            pos += key_len + (-(cls._KEY_LEN.size + key_len) % 8)
+            yield key, cls._VALUE.unpack_from(buf, pos)[0], pos
+            pos += cls._VALUE.size
+
+    @classmethod
+    def read_all(cls, path: str | Path) -> list[tuple[str, float]]:
+        """Read every entry of a file written by another (or this) process."""
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < cls._HEADER.size:
+            return []
+        return [(key, value) for key, value, _pos in cls._iter_entries(data)]
+
+    def _append(self, key: str) -> int:
+        encoded = key.encode("utf-8")
+        padding = -(self._KEY_LEN.size + len(encoded)) % 8
+        entry_size = self._KEY_LEN.size + len(encoded) + padding + self._VALUE.size
+
+        while self._used + entry_size > self._capacity:
+            self._capacity *= 2
+            self._mmap.close()
+            self._file.truncate(self._capacity)
+            self._mmap = mmap.mmap(self._file.fileno(), self._capacity)
+
+        pos = self._used
+        self._KEY_LEN.pack_into(self._mmap, pos, len(encoded))
+        pos += self._KEY_LEN.size
+        self._mmap[pos:pos + len(encoded)] = encoded
+        pos += len(encoded) + padding
+        self._VALUE.pack_into(self._mmap, pos, 0.0)
+
+        self._used += entry_size
+        self._HEADER.pack_into(self._mmap, 0, self._used)
+        self._positions[key] = pos
+        return pos
+
+    def write(self, key: str, value: float) -> None:
+        """Set ``key`` to ``value``."""
+        with self._lock:
+            pos = self._positions.get(key)
+            if pos is None:
+                pos = self._append(key)
+            self._VALUE.pack_into(self._mmap, pos, value)
+
+    def close(self) -> None:
+        self._mmap.close()
+        self._file.close()
+
+
+_mp_stores: dict[str, MmapedValues] = {}
+_mp_pid: int | None = None
+_mp_lock = threading.Lock()
+
+
+def _multiproc_dir() -> str | None:
+    return os.getenv(MULTIPROC_ENV_VAR) or None
+
+
+def _mp_store(kind: str) -> MmapedValues | None:
+    """This process's value file for ``kind`` ("counter" or "gauge_<mode>"), if enabled."""
+    global _mp_pid
+    directory = _multiproc_dir()
+    if not directory:
+        return None
+
+    pid = os.getpid()
+    store = _mp_stores.get(kind)
+    if store is not None and _mp_pid == pid:
+        return store
+
+    with _mp_lock:
+        if _mp_pid != pid:
+            # Forked child: never write into the parent's files
+            _mp_stores.clear()
+            _mp_pid = pid
+        store = _mp_stores.get(kind)
+        if store is None:
+            Path(directory).mkdir(parents=True, exist_ok=True)
+            store = MmapedValues(Path(directory) / f"{kind}_{pid}.db")
+            _mp_stores[kind] = store
+        return store
+
+
+@lru_cache(maxsize=4096)
+def _sample_key(metric: str, sample: str, labels_key: str) -> str:
+    return json.dumps([metric, sample, labels_key])
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+GAUGE_MULTIPROCESS_MODES = ("livesum", "sum", "max", "min")
+
+_MP_COMBINE: dict[str, Callable[[float, float], float]] = {
+    "sum": lambda a, b: a + b,
+    "livesum": lambda a, b: a + b,
+    "max": max,
+    "min": min,
+}
+
+
+def _file_mode(kind: str) -> str:
+    """Aggregation mode for a value file kind ("counter", "gauge_max", ...)."""
+    if kind == "counter":
+        return "sum"
+    # Bare "gauge" files predate per-mode files and were always live sums
+    return kind.partition("_")[2] or "livesum"
+
+
+def _collect_multiprocess(directory: str) -> dict[str, dict[tuple[str, str], float]]:
+    """
+    Aggregate samples across all process files.
+
+    Counters and histograms are summed over every file, including processes
+    that have exited (their counts still happened). Gauges follow their
+    ``multiprocess_mode``: ``livesum`` sums live processes only, ``sum``
+    sums every file, ``max``/``min`` take the extreme over every file.
+
+    Returns:
+        metric name -> {(sample, labels_key): value}
+    """
+    merged: dict[str, dict[tuple[str, str], float]] = defaultdict(dict)
+
+    for path in sorted(Path(directory).glob("*.db")):
+        kind, _, pid_text = path.stem.rpartition("_")
+        mode = _file_mode(kind)
+        if mode == "livesum" and pid_text.isdigit() and not _pid_alive(int(pid_text)):
+            continue
+        combine = _MP_COMBINE[mode]
+        try:
+            entries = MmapedValues.read_all(path)
+        except OSError as e:
+            logger.warning(f"Could not read metrics file {path}: {e}")
+            continue
+        for key, value in entries:
+            metric, sample, labels_key = json.loads(key)
+            samples = merged[metric]
+            sample_key = (sample, labels_key)
+            samples[sample_key] = value if sample_key not in samples else combine(samples[sample_key], value)
+
+    return merged
+
+
 @dataclass
 class MetricValue:
     """Container for a metric value with labels."""
@@ -41,6 +267,22 @@ class MetricValue:
     labels: dict[str, str] = field(default_factory=dict)
 
 
+def _format_simple(name: str, help: str, kind: str, values: dict[str, float]) -> str:
+    lines = [
+        f"# HELP {name} {help}",
+        f"# TYPE {name} {kind}",
+    ]
+    if not values:
+        lines.append(f"{name} 0")
+    else:
+        for labels_key, value in values.items():
+            if labels_key:
+                lines.append(f"{name}{{{labels_key}}} {value}")
+            else:
+                lines.append(f"{name} {value}")
+    return "\n".join(lines)
+
+
 @dataclass
 class Counter:
     """Prometheus counter metric."""
@@ -50,138 +292,142 @@ class Counter:
 
     def inc(self, amount: float = 1.0, **labels: str) -> None:
         """Increment counter."""
-        key = self._labels_key(labels)
+        key = _labels_key(labels)
         self.values[key] += amount
+        store = _mp_store("counter")
+        if store is not None:
+            store.write(_sample_key(self.name, "", key), self.values[key])
 
     def _labels_key(self, labels: dict[str, str]) -> str:
         """Create a string key from labels."""
-        if not labels:
-            return ""
-        sorted_items = sorted(labels.items())
-        return ",".join(f'{k}="{v}"' for k, v in sorted_items)
+        return _labels_key(labels)
 
-    def format(self) -> str:
-        """Format as Prometheus text."""
-        lines = [
-            f"# HELP {self.name} {self.help}",
-            f"# TYPE {self.name} counter",
-        ]
-        if not self.values:
-            lines.append(f"{self.name} 0")
-        else:
-            for labels_key, value in self.values.items():
-                if labels_key:
-                    lines.append(f"{self.name}{{{labels_key}}} {value}")
-                else:
-                    lines.append(f"{self.name} {value}")
-        return "\n".join(lines)
+    def format(self, values: dict[str, float] | None = None) -> str:
+        """Format as Prometheus text (optionally from aggregated ``values``)."""
+        return _format_simple(self.name, self.help, "counter", self.values if values is None else values)
 
 
 @dataclass
 class Gauge:
-    """Prometheus gauge metric."""
+    """
+    Prometheus gauge metric.
+
+    ``multiprocess_mode`` picks how values from several worker processes
+    are combined: "livesum" (default), "sum", "max" or "min".
+    """
     name: str
     help: str
     values: dict[str, float] = field(default_factory=lambda: defaultdict(float))
+    multiprocess_mode: str = "livesum"
+
+    def __post_init__(self) -> None:
+        if self.multiprocess_mode not in GAUGE_MULTIPROCESS_MODES:
+            raise ValueError(
+                f"Invalid multiprocess_mode {self.multiprocess_mode!r}; "
+                f"expected one of {GAUGE_MULTIPROCESS_MODES}"
+            )
+
+    def _publish(self, key: str) -> None:
+        store = _mp_store(f"gauge_{self.multiprocess_mode}")
+        if store is not None:
+            store.write(_sample_key(self.name, "", key), self.values[key])
 
     def set(self, value: float, **labels: str) -> None:
         """Set gauge value."""
-        key = self._labels_key(labels)
+        key = _labels_key(labels)
         self.values[key] = value
+        self._publish(key)
 
     def inc(self, amount: float = 1.0, **labels: str) -> None:
         """Increment gauge."""
-        key = self._labels_key(labels)
+        key = _labels_key(labels)
         self.values[key] += amount
+        self._publish(key)
 
     def dec(self, amount: float = 1.0, **labels: str) -> None:
         """Decrement gauge."""
-        key = self._labels_key(labels)
+        key = _labels_key(labels)
         self.values[key] -= amount
+        self._publish(key)
 
     def _labels_key(self, labels: dict[str, str]) -> str:
-        if not labels:
-            return ""
-        sorted_items = sorted(labels.items())
-        return ",".join(f'{k}="{v}"' for k, v in sorted_items)
+        return _labels_key(labels)
 
-    def format(self) -> str:
-        """Format as Prometheus text."""
-        lines = [
-            f"# HELP {self.name} {self.help}",
-            f"# TYPE {self.name} gauge",
-        ]
-        if not self.values:
-            lines.append(f"{self.name} 0")
-        else:
-            for labels_key, value in self.values.items():
-                if labels_key:
-                    lines.append(f"{self.name}{{{labels_key}}} {value}")
-                else:
-                    lines.append(f"{self.name} {value}")
-        return "\n".join(lines)
+    def format(self, values: dict[str, float] | None = None) -> str:
+        """Format as Prometheus text (optionally from aggregated ``values``)."""
+        return _format_simple(self.name, self.help, "gauge", self.values if values is None else values)
+
+
+@dataclass
+class HistogramState:
+    """Fixed-size histogram state for one label set."""
+    bucket_counts: list[int]  # Non-cumulative; last slot is the +Inf overflow
+    sum: float = 0.0
+    count: int = 0
 
 
 @dataclass
 class Histogram:
-    """Prometheus histogram metric."""
+    """
+    Prometheus histogram metric.
+
+    Each label set keeps one counter per bucket plus a running sum and count,
+    so memory is constant in the number of observations and ``format()`` is
+    O(labels x buckets).
+    """
     name: str
     help: str
     buckets: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
-    observations: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    states: dict[str, HistogramState] = field(default_factory=dict)
 
     def observe(self, value: float, **labels: str) -> None:
         """Record an observation."""
-        key = self._labels_key(labels)
-        self.observations[key].append(value)
+        key = _labels_key(labels)
+        state = self.states.get(key)
+        if state is None:
+            state = HistogramState(bucket_counts=[0] * (len(self.buckets) + 1))
+            self.states[key] = state
+
+        # Upper bounds are inclusive (v <= le)
+        idx = bisect_left(self.buckets, value)
+        state.bucket_counts[idx] += 1
+        state.sum += value
+        state.count += 1
+
+        store = _mp_store("counter")
+        if store is not None:
+            store.write(_sample_key(self.name, f"bucket:{idx}", key), state.bucket_counts[idx])
+            store.write(_sample_key(self.name, "sum", key), state.sum)
+            store.write(_sample_key(self.name, "count", key), state.count)
 
     def _labels_key(self, labels: dict[str, str]) -> str:
-        if not labels:
-            return ""
-        sorted_items = sorted(labels.items())
-        return ",".join(f'{k}="{v}"' for k, v in sorted_items)
+        return _labels_key(labels)
 
-    def format(self) -> str:
-        """Format as Prometheus text."""
+    def format(self, states: dict[str, HistogramState] | None = None) -> str:
+        """Format as Prometheus text (optionally from aggregated ``states``)."""
+        states = self.states if states is None else states
         lines = [
             f"# HELP {self.name} {self.help}",
             f"# TYPE {self.name} histogram",
         ]
 
-        for labels_key, obs in self.observations.items():
-            label_prefix = f"{{{labels_key}," if labels_key else "{"
-            label_suffix = "}" if labels_key else ""
+        for labels_key, state in states.items():
+            label_prefix = f"{labels_key}," if labels_key else ""
 
-            # Calculate bucket counts
-            bucket_counts = {b: 0 for b in self.buckets}
-            bucket_counts[float("inf")] = 0
-
-            for v in obs:
-                for bucket in self.buckets:
-                    if v <= bucket:
-                        bucket_counts[bucket] += 1
-                bucket_counts[float("inf")] += 1
-
-            # Output buckets
             cumulative = 0
-            for bucket in self.buckets:
-                cumulative += bucket_counts[bucket]
-                if labels_key:
-                    lines.append(f'{self.name}_bucket{{{labels_key},le="{bucket}"}} {cumulative}')
-                else:
-                    lines.append(f'{self.name}_bucket{{le="{bucket}"}} {cumulative}')
+            for bucket, count in zip(self.buckets, state.bucket_counts):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{label_prefix}le="{bucket}"}} {cumulative}')
 
-            cumulative += bucket_counts[float("inf")] - cumulative
+            lines.append(f'{self.name}_bucket{{{label_prefix}le="+Inf"}} {state.count}')
             if labels_key:
-                lines.append(f'{self.name}_bucket{{{labels_key},le="+Inf"}} {len(obs)}')
-                lines.append(f"{self.name}_sum{{{labels_key[:-1]}}} {sum(obs)}")
-                lines.append(f"{self.name}_count{{{labels_key[:-1]}}} {len(obs)}")
+                lines.append(f"{self.name}_sum{{{labels_key}}} {state.sum}")
+                lines.append(f"{self.name}_count{{{labels_key}}} {state.count}")
             else:
-                lines.append(f'{self.name}_bucket{{le="+Inf"}} {len(obs)}')
-                lines.append(f"{self.name}_sum {sum(obs)}")
-                lines.append(f"{self.name}_count {len(obs)}")
+                lines.append(f"{self.name}_sum {state.sum}")
+                lines.append(f"{self.name}_count {state.count}")
 
-        if not self.observations:
+        if not states:
             for bucket in self.buckets:
                 lines.append(f'{self.name}_bucket{{le="{bucket}"}} 0')
             lines.append(f'{self.name}_bucket{{le="+Inf"}} 0')
@@ -190,6 +436,22 @@ class Histogram:
 
         return "\n".join(lines)
 
+    def states_from_samples(self, samples: dict[tuple[str, str], float]) -> dict[str, HistogramState]:
+        """Rebuild per-label states from aggregated multiprocess samples."""
+        states: dict[str, HistogramState] = {}
+        for (sample, labels_key), value in samples.items():
+            state = states.get(labels_key)
+            if state is None:
+                state = HistogramState(bucket_counts=[0] * (len(self.buckets) + 1))
+                states[labels_key] = state
+            if sample == "sum":
+                state.sum = value
+            elif sample == "count":
+                state.count = int(value)
+            elif sample.startswith("bucket:"):
+                state.bucket_counts[int(sample[len("bucket:"):])] = int(value)
+        return states
+
 
 # Define metrics
 REQUEST_COUNT = Counter(
@@ -324,16 +586,29 @@ def get_metrics_text() -> str:
     if not METRICS_ENABLED:
         return "# Metrics disabled\n"
 
-    sections = [
-        REQUEST_COUNT.format(),
-        REQUEST_LATENCY.format(),
-        CACHE_HITS.format(),
-        CACHE_MISSES.format(),
-        ACTIVE_REQUESTS.format(),
-        AI_INVOCATIONS.format(),
-        PHI_SCANS.format(),
+    metrics = [
+        REQUEST_COUNT,
+        REQUEST_LATENCY,
+        CACHE_HITS,
+        CACHE_MISSES,
+        ACTIVE_REQUESTS,
+        AI_INVOCATIONS,
+        PHI_SCANS,
     ]
 
+    directory = _multiproc_dir()
+    if directory:
+        merged = _collect_multiprocess(directory)
+        sections = []
+        for metric in metrics:
+            samples = merged.get(metric.name, {})
+            if isinstance(metric, Histogram):
+                sections.append(metric.format(metric.states_from_samples(samples)))
+            else:
+                sections.append(metric.format({labels: v for (_s, labels), v in samples.items()}))
+    else:
+        sections = [metric.format() for metric in metrics]
+
     # Add process metrics
     try:
         import resource
@@ -2,14 +2,22 @@
 Entity Extraction using scispaCy
 
 Extracts biomedical and scientific entities from text using scispaCy models.
+
+Large corpora should go through ``EntityExtractor.iter_extract``, which
+streams texts through ``nlp.pipe`` (optionally across processes) with
+components NER does not need disabled, and can reuse results for repeated
+texts via a content-hash cache.
 """
 
 from __future__ import annotations
 
+import hashlib
+import itertools
 import logging
 import os
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +25,11 @@ logger = logging.getLogger(__name__)
 SCISPACY_ENABLED = os.getenv("SCISPACY_ENABLED", "false").lower() == "true"
 SCISPACY_MODEL = os.getenv("SCISPACY_MODEL", "en_core_sci_sm")
 
+# Pipeline components entity extraction depends on; everything else is
+# disabled in batch mode unless UMLS linking is on (the linker's abbreviation
+# resolution needs the full pipeline).
+NER_COMPONENTS = {"tok2vec", "transformer", "ner"}
+
 
 @dataclass
 class Entity:
@@ -63,9 +76,20 @@ class EntityExtractor:
         self,
         model: Optional[str] = None,
         enable_umls_linking: bool = False,
+        cache_size: int = 0,
     ):
+        """
+        Args:
+            model: scispaCy model name (defaults to SCISPACY_MODEL)
+            enable_umls_linking: Add the scispaCy UMLS entity linker
+            cache_size: Number of results to keep in an LRU cache keyed by
+                text content hash (0 disables caching). Cached results are
+                shared between calls and should be treated as read-only.
+        """
         self.model_name = model or SCISPACY_MODEL
         self.enable_umls_linking = enable_umls_linking
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, Optional[Tuple[str, ...]]], EntityResult]" = OrderedDict()
         self._nlp = None
         self._available = None
 
@@ -167,61 +191,212 @@ class EntityExtractor:
             text = text[:max_length]
             logger.warning(f"Text truncated to {max_length} characters")
 
+        key = self._cache_key(text, entity_types)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         try:
             nlp = self._load_model()
-            doc = nlp(text)
+            result = self._doc_to_result(nlp(text), entity_types)
+            self._cache_put(key, result)
+            return result
 
-            entities = []
-            type_counts: Dict[str, int] = {}
-            seen_entities: Set[str] = set()
+        except Exception as e:
+            logger.exception(f"Entity extraction error: {e}")
+            return EntityResult(
+                success=False,
+                model=self.model_name,
+                errors=[str(e)],
+            )
 
-            for ent in doc.ents:
-                # Filter by entity type if specified
-                if entity_types and ent.label_ not in entity_types:
-                    continue
+    def _doc_to_result(
+        self,
+        doc: Any,
+        entity_types: Optional[Set[str]] = None,
+    ) -> EntityResult:
+        """Build an EntityResult from a processed spaCy Doc."""
+        entities = []
+        type_counts: Dict[str, int] = {}
+        seen_entities: Set[str] = set()
+
+        for ent in doc.ents:
+            # Filter by entity type if specified
+            if entity_types and ent.label_ not in entity_types:
+                continue
+
+            entity = Entity(
+                text=ent.text,
+                label=ent.label_,
+                start=ent.start_char,
+                end=ent.end_char,
+            )
 
-                entity = Entity(
-                    text=ent.text,
-                    label=ent.label_,
-                    start=ent.start_char,
-                    end=ent.end_char,
-                )
+            # Add UMLS info if available
+            if hasattr(ent, "_.kb_ents") and ent._.kb_ents:
+                top_match = ent._.kb_ents[0]
+                entity.cui = top_match[0]
+                entity.confidence = top_match[1]
+
+            entities.append(entity)
+
+            # Track statistics
+            type_counts[ent.label_] = type_counts.get(ent.label_, 0) + 1
+            seen_entities.add(ent.text.lower())
+
+        return EntityResult(
+            success=True,
+            entities=entities,
+            entity_types=type_counts,
+            unique_entities=len(seen_entities),
+            total_entities=len(entities),
+            text_length=len(doc.text),
+            model=self.model_name,
+        )
+
+    def _cache_key(
+        self,
+        text: str,
+        entity_types: Optional[Set[str]],
+    ) -> Tuple[str, Optional[Tuple[str, ...]]]:
+        """Cache key: content hash of the (truncated) text plus the type filter."""
+        digest = hashlib.sha256(text.encode("utf-8", errors="surrogatepass")).hexdigest()
+        return digest, tuple(sorted(entity_types)) if entity_types else None
+
+    def _cache_get(self, key) -> Optional[EntityResult]:
+        if not self.cache_size:
+            return None
+        result = self._cache.get(key)
+        if result is not None:
+            self._cache.move_to_end(key)
+        return result
+
+    def _cache_put(self, key, result: EntityResult) -> None:
+        if not self.cache_size:
+            return
+        self._cache[key] = result
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Drop all cached results."""
+        self._cache.clear()
+
+    def _disabled_components(self, nlp: Any) -> List[str]:
+        """Pipeline components not needed for entity extraction."""
+        if self.enable_umls_linking:
+            return []
+        return [name for name in nlp.pipe_names if name not in NER_COMPONENTS]
 
-                # Add UMLS info if available
-                if hasattr(ent, "_.kb_ents") and ent._.kb_ents:
-                    top_match = ent._.kb_ents[0]
-                    entity.cui = top_match[0]
-                    entity.confidence = top_match[1]
+    def iter_extract(
+        self,
+        texts: Iterable[str],
+        entity_types: Optional[Set[str]] = None,
+        batch_size: int = 100,
+        n_process: int = 1,
+        max_length: int = 1000000,
+    ) -> Iterator[EntityResult]:
+        """
+        Stream entity extraction over many texts with ``nlp.pipe``.
 
-                entities.append(entity)
+        Results are yielded in input order. Empty texts and cache hits skip
+        the model; everything else is batched through ``nlp.pipe`` with
+        components NER doesn't use disabled. If the pipeline fails, the
+        affected and remaining texts yield failed results.
 
-                # Track statistics
-                type_counts[ent.label_] = type_counts.get(ent.label_, 0) + 1
-                seen_entities.add(ent.text.lower())
+        Args:
+            texts: Texts to process (any iterable, consumed lazily)
+            entity_types: Filter to specific entity types
+            batch_size: Texts per ``nlp.pipe`` batch
+            n_process: Worker processes for ``nlp.pipe``
+            max_length: Maximum text length to process
 
-            return EntityResult(
-                success=True,
-                entities=entities,
-                entity_types=type_counts,
-                unique_entities=len(seen_entities),
-                total_entities=len(entities),
-                text_length=len(text),
-                model=self.model_name,
-            )
+        Yields:
+            EntityResult per input text
+        """
+        if not self.is_available():
+            for _ in texts:
+                yield EntityResult(
+                    success=False,
+                    model=self.model_name,
+                    errors=["scispaCy is not available"],
+                )
+            return
 
+        try:
+            nlp = self._load_model()
         except Exception as e:
             logger.exception(f"Entity extraction error: {e}")
-            return EntityResult(
-                success=False,
-                model=self.model_name,
-                errors=[str(e)],
-            )
+            for _ in texts:
+                yield EntityResult(success=False, model=self.model_name, errors=[str(e)])
+            return
+
+        # One slot per input text, in order; slot[0] is filled once the
+        # result is known. Texts sent to nlp.pipe carry a sequence number as
+        # their context (contexts are pickled under n_process > 1), and the
+        # pending queue stays within the batches nlp.pipe has read ahead.
+        pending: deque = deque()
+        waiting: Dict[int, list] = {}
+        sequence = itertools.count()
+
+        def to_pipe() -> Iterator[Tuple[str, int]]:
+            for text in texts:
+                if not text or not text.strip():
+                    pending.append([EntityResult(
+                        success=True,
+                        model=self.model_name,
+                        text_length=0,
+                    )])
+                    continue
+
+                if len(text) > max_length:
+                    text = text[:max_length]
+                    logger.warning(f"Text truncated to {max_length} characters")
+
+                key = self._cache_key(text, entity_types)
+                cached = self._cache_get(key)
+                slot = [cached, key]
+                pending.append(slot)
+                if cached is None:
+                    seq = next(sequence)
+                    waiting[seq] = slot
+                    yield text, seq
+
+        def drain() -> Iterator[EntityResult]:
+            while pending and pending[0][0] is not None:
+                yield pending.popleft()[0]
+
+        feed = to_pipe()
+        try:
+            for doc, seq in nlp.pipe(
+                feed,
+                as_tuples=True,
+                batch_size=batch_size,
+                n_process=n_process,
+                disable=self._disabled_components(nlp),
+            ):
+                slot = waiting.pop(seq)
+                slot[0] = self._doc_to_result(doc, entity_types)
+                self._cache_put(slot[1], slot[0])
+                yield from drain()
+        except Exception as e:
+            logger.exception(f"Batch entity extraction error: {e}")
+            failed = EntityResult(success=False, model=self.model_name, errors=[str(e)])
+            for _ in feed:
+                pass  # consume the rest of the input into ``pending``
+            for slot in pending:
+                if slot[0] is None:
+                    slot[0] = failed
+
+        yield from drain()
 
     def extract_batch(
         self,
         texts: List[str],
         entity_types: Optional[Set[str]] = None,
         batch_size: int = 100,
+        n_process: int = 1,
     ) -> List[EntityResult]:
         """
         Extract entities from multiple texts.
@@ -230,26 +405,17 @@ class EntityExtractor:
             texts: List of texts to process
             entity_types: Filter to specific entity types
             batch_size: Batch size for processing
+            n_process: Worker processes for ``nlp.pipe``
 
         Returns:
             List of EntityResult objects
         """
-        if not self.is_available():
-            return [
-                EntityResult(
-                    success=False,
-                    model=self.model_name,
-                    errors=["scispaCy is not available"],
-                )
-                for _ in texts
-            ]
-
-        results = []
-        for text in texts:
-            result = self.extract(text, entity_types)
-            results.append(result)
-
-        return results
+        return list(self.iter_extract(
+            texts,
+            entity_types=entity_types,
+            batch_size=batch_size,
+            n_process=n_process,
+        ))
 
     def get_entity_types(self) -> List[str]:
         """Get available entity types for the loaded model."""
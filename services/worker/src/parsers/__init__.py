@@ -21,6 +21,7 @@ from .ocr_pipeline import (
     extract_text_ocr,
     is_ocr_available,
 )
+from .model_pool import ModelPool, get_model_pool
 
 __all__ = [
     # Registry
@@ -38,4 +39,7 @@ __all__ = [
     "OcrConfig",
     "extract_text_ocr",
     "is_ocr_available",
+    # Model pool
+    "ModelPool",
+    "get_model_pool",
 ]
@@ -8,15 +8,24 @@ from __future__ import annotations
 
 import logging
 import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .model_pool import get_model_pool
 
 logger = logging.getLogger(__name__)
 
 # Feature flags
 TRANSCRIPTION_ENABLED = os.getenv("TRANSCRIPTION_ENABLED", "false").lower() == "true"
 WHISPER_MODEL = os.getenv("WHISPER_MODEL", "small")
+WHISPER_NUM_WORKERS = int(os.getenv("WHISPER_NUM_WORKERS", "1"))
+
+SUPPORTED_AUDIO_SUFFIXES = {".mp3", ".wav", ".flac", ".m4a", ".ogg", ".webm", ".mp4"}
 
 
 @dataclass
@@ -54,6 +63,38 @@ class TranscriptionConfig:
     vad_filter: bool = True  # Voice activity detection
     word_timestamps: bool = False
     compute_type: str = "float16"  # float16, int8, int8_float16
+    num_workers: int = WHISPER_NUM_WORKERS  # Concurrent transcriptions per model
+
+
+@lru_cache(maxsize=1)
+def _whisper_available() -> bool:
+    """Whether transcription is enabled and faster-whisper is importable."""
+    if not TRANSCRIPTION_ENABLED:
+        return False
+
+    try:
+        from faster_whisper import WhisperModel  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+@lru_cache(maxsize=None)
+def _resolve_device(compute_type: str) -> Tuple[str, str]:
+    """Pick (device, compute_type) once per process; importing torch is slow."""
+    device = "cpu"
+
+    try:
+        import torch
+        if torch.cuda.is_available():
+            device = "cuda"
+        elif hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
+            device = "mps"
+            compute_type = "float32"  # MPS doesn't support float16 well
+    except ImportError:
+        pass
+
+    return device, compute_type
 
 
 class AudioTranscriber:
@@ -69,7 +110,6 @@ class AudioTranscriber:
 
     def __init__(self, config: Optional[TranscriptionConfig] = None):
         self.config = config or TranscriptionConfig(model=WHISPER_MODEL)
-        self._model = None
         self._available = None
 
     def is_available(self) -> bool:
@@ -77,138 +117,129 @@ class AudioTranscriber:
         if self._available is not None:
             return self._available
 
-        if not TRANSCRIPTION_ENABLED:
-            self._available = False
-            return False
+        self._available = _whisper_available()
+        return self._available
 
-        try:
+    def _model_key(self, cfg: TranscriptionConfig) -> Tuple[Any, ...]:
+        device, compute_type = _resolve_device(cfg.compute_type)
+        return ("whisper", cfg.model, device, compute_type, cfg.num_workers)
+
+    def _model_loader(self, cfg: TranscriptionConfig):
+        def load():
             from faster_whisper import WhisperModel
-            self._available = True
-        except ImportError:
-            self._available = False
 
-        return self._available
+            device, compute_type = _resolve_device(cfg.compute_type)
+            logger.info(f"Loading Whisper model: {cfg.model}")
+            model = WhisperModel(
+                cfg.model,
+                device=device,
+                compute_type=compute_type,
+                num_workers=cfg.num_workers,
+            )
+            logger.info(f"Whisper model loaded on {device}")
+            return model
 
-    def _load_model(self):
-        """Lazy load the Whisper model."""
-        if self._model is not None:
-            return self._model
+        return load
 
+    @contextmanager
+    def _model_lease(self, cfg: Optional[TranscriptionConfig] = None) -> Iterator[Any]:
+        """Hold the pooled Whisper model for ``cfg`` (loading it if needed)."""
         if not self.is_available():
             raise RuntimeError("Transcription is not available")
 
-        from faster_whisper import WhisperModel
-
-        logger.info(f"Loading Whisper model: {self.config.model}")
-
-        # Determine device
-        device = "cpu"
-        compute_type = self.config.compute_type
-
-        try:
-            import torch
-            if torch.cuda.is_available():
-                device = "cuda"
-            elif hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
-                device = "mps"
-                compute_type = "float32"  # MPS doesn't support float16 well
-        except ImportError:
-            pass
-
-        self._model = WhisperModel(
-            self.config.model,
-            device=device,
-            compute_type=compute_type,
-        )
+        cfg = cfg or self.config
+        with get_model_pool().lease(self._model_key(cfg), self._model_loader(cfg)) as model:
+            yield model
 
-        logger.info(f"Whisper model loaded on {device}")
-        return self._model
-
-    def transcribe(
-        self,
-        audio_path: Union[str, Path],
-        config: Optional[TranscriptionConfig] = None,
-    ) -> TranscriptionResult:
+    def warm_up(self, config: Optional[TranscriptionConfig] = None) -> bool:
         """
-        Transcribe an audio file.
-
-        Args:
-            audio_path: Path to the audio file
-            config: Transcription configuration
+        Load the Whisper model into the process pool ahead of the first job.
 
         Returns:
-            TranscriptionResult with transcript
+            True if the model is loaded, False if transcription is unavailable
         """
         if not self.is_available():
-            return TranscriptionResult(
-                success=False,
-                model=self.config.model,
-                errors=["Transcription is not available. Set TRANSCRIPTION_ENABLED=true and install faster-whisper."],
-            )
-
+            return False
         cfg = config or self.config
-        path = Path(audio_path)
+        get_model_pool().warm(self._model_key(cfg), self._model_loader(cfg))
+        return True
 
+    def _check_input(
+        self, path: Path, cfg: TranscriptionConfig
+    ) -> Optional[TranscriptionResult]:
+        """Return a failed result if ``path`` cannot be transcribed, else None."""
         if not path.exists():
             return TranscriptionResult(
                 success=False,
                 model=cfg.model,
-                errors=[f"File not found: {audio_path}"],
+                errors=[f"File not found: {path}"],
             )
 
-        # Check file format
-        supported_formats = {".mp3", ".wav", ".flac", ".m4a", ".ogg", ".webm", ".mp4"}
-        if path.suffix.lower() not in supported_formats:
+        if path.suffix.lower() not in SUPPORTED_AUDIO_SUFFIXES:
             return TranscriptionResult(
                 success=False,
                 model=cfg.model,
                 errors=[f"Unsupported audio format: {path.suffix}"],
             )
 
-        try:
-            model = self._load_model()
-
-            # Transcribe
-            segments_gen, info = model.transcribe(
-                str(path),
-                language=cfg.language,
-                task=cfg.task,
-                beam_size=cfg.beam_size,
-                vad_filter=cfg.vad_filter,
-                word_timestamps=cfg.word_timestamps,
+        return None
+
+    def _unavailable_result(self, cfg: TranscriptionConfig) -> TranscriptionResult:
+        return TranscriptionResult(
+            success=False,
+            model=cfg.model,
+            errors=["Transcription is not available. Set TRANSCRIPTION_ENABLED=true and install faster-whisper."],
+        )
+
+    def _iter_segments(
+        self, model: Any, path: Path, cfg: TranscriptionConfig, info_out: List[Any]
+    ) -> Iterator[TranscriptSegment]:
+        """Decode ``path`` segment by segment, yielding each as it is produced."""
+        segments_gen, info = model.transcribe(
+            str(path),
+            language=cfg.language,
+            task=cfg.task,
+            beam_size=cfg.beam_size,
+            vad_filter=cfg.vad_filter,
+            word_timestamps=cfg.word_timestamps,
+        )
+        info_out.append(info)
+
+        for seg in segments_gen:
+            segment = TranscriptSegment(
+                id=seg.id,
+                start=seg.start,
+                end=seg.end,
+                text=seg.text.strip(),
+                confidence=seg.avg_logprob if hasattr(seg, "avg_logprob") else None,
             )
 
-            # Collect segments
-            segments = []
-            all_text = []
-
-            for seg in segments_gen:
-                segment = TranscriptSegment(
-                    id=seg.id,
-                    start=seg.start,
-                    end=seg.end,
-                    text=seg.text.strip(),
-                    confidence=seg.avg_logprob if hasattr(seg, "avg_logprob") else None,
-                )
-
-                # Add word-level timestamps if available
-                if cfg.word_timestamps and hasattr(seg, "words") and seg.words:
-                    segment.words = [
-                        {
-                            "word": w.word,
-                            "start": w.start,
-                            "end": w.end,
-                            "probability": w.probability,
-                        }
-                        for w in seg.words
-                    ]
-
-                segments.append(segment)
-                all_text.append(seg.text.strip())
+            # Add word-level timestamps if available
+            if cfg.word_timestamps and hasattr(seg, "words") and seg.words:
+                segment.words = [
+                    {
+                        "word": w.word,
+                        "start": w.start,
+                        "end": w.end,
+                        "probability": w.probability,
+                    }
+                    for w in seg.words
+                ]
+
+            yield segment
+
+    def _transcribe_with(
+        self, model: Any, path: Path, cfg: TranscriptionConfig
+    ) -> TranscriptionResult:
+        """Transcribe one validated file with an already loaded model."""
+        try:
+            info_out: List[Any] = []
+            segments = list(self._iter_segments(model, path, cfg, info_out))
+            info = info_out[0]
 
             return TranscriptionResult(
                 success=True,
-                text=" ".join(all_text),
+                text=" ".join(seg.text for seg in segments),
                 segments=segments,
                 language=info.language,
                 language_confidence=info.language_probability,
@@ -224,6 +255,126 @@ class AudioTranscriber:
                 errors=[str(e)],
             )
 
+    def transcribe(
+        self,
+        audio_path: Union[str, Path],
+        config: Optional[TranscriptionConfig] = None,
+    ) -> TranscriptionResult:
+        """
+        Transcribe an audio file.
+
+        Args:
+            audio_path: Path to the audio file
+            config: Transcription configuration
+
+        Returns:
+            TranscriptionResult with transcript
+        """
+        cfg = config or self.config
+        if not self.is_available():
+            return self._unavailable_result(cfg)
+
+        path = Path(audio_path)
+        error = self._check_input(path, cfg)
+        if error is not None:
+            return error
+
+        try:
+            with self._model_lease(cfg) as model:
+                return self._transcribe_with(model, path, cfg)
+        except Exception as e:
+            logger.exception(f"Transcription error: {e}")
+            return TranscriptionResult(
+                success=False,
+                model=cfg.model,
+                errors=[str(e)],
+            )
+
+    def iter_segments(
+        self,
+        audio_path: Union[str, Path],
+        config: Optional[TranscriptionConfig] = None,
+    ) -> Iterator[TranscriptSegment]:
+        """
+        Stream transcript segments as they are decoded.
+
+        Unlike ``transcribe`` this does not wait for the whole recording,
+        and errors are raised rather than returned.
+
+        Args:
+            audio_path: Path to the audio file
+            config: Transcription configuration
+
+        Yields:
+            TranscriptSegment objects in time order
+        """
+        cfg = config or self.config
+        path = Path(audio_path)
+        error = self._check_input(path, cfg)
+        if error is not None:
+            raise ValueError(error.errors[0])
+
+        with self._model_lease(cfg) as model:
+            yield from self._iter_segments(model, path, cfg, [])
+
+    def transcribe_many(
+        self,
+        audio_paths: Iterable[Union[str, Path]],
+        config: Optional[TranscriptionConfig] = None,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[Tuple[Path, TranscriptionResult]]:
+        """
+        Transcribe a batch of files with one shared model.
+
+        The pooled model is leased once for the whole batch and files are
+        decoded by a thread pool (CTranslate2 releases the GIL; the model
+        is loaded with ``num_workers`` so calls run concurrently). At most
+        ``2 * max_workers`` files are in flight, and results are yielded in
+        input order as soon as each is ready.
+
+        Args:
+            audio_paths: Paths to audio files
+            config: Transcription configuration
+            max_workers: Concurrent transcriptions (defaults to config.num_workers)
+
+        Yields:
+            (path, TranscriptionResult) tuples in input order
+        """
+        cfg = config or self.config
+        paths = [Path(p) for p in audio_paths]
+        if not self.is_available():
+            for path in paths:
+                yield path, self._unavailable_result(cfg)
+            return
+
+        workers = max(1, max_workers or cfg.num_workers)
+
+        def run(model: Any, path: Path) -> TranscriptionResult:
+            error = self._check_input(path, cfg)
+            return error if error is not None else self._transcribe_with(model, path, cfg)
+
+        with self._model_lease(cfg) as model:
+            if workers == 1:
+                for path in paths:
+                    yield path, run(model, path)
+                return
+
+            window = 2 * workers
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pending: Deque[Tuple[Path, Future]] = deque()
+                remaining = iter(paths)
+                for path in remaining:
+                    pending.append((path, executor.submit(run, model, path)))
+                    if len(pending) >= window:
+                        break
+                while pending:
+                    path, future = pending.popleft()
+                    result = future.result()
+                    next_path = next(remaining, None)
+                    if next_path is not None:
+                        pending.append((next_path, executor.submit(run, model, next_path)))
+                    yield path, result
+
     def transcribe_to_srt(
         self,
         audio_path: Union[str, Path],
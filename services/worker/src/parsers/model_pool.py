@@ -0,0 +1,204 @@
+"""
+Process-level Model Pool
+
+Keeps expensive models (Whisper, Tesseract engines) loaded across jobs.
+
+Models are loaded lazily on first use and shared by key. Each ``lease``
+holds a reference; a model with no references that has been idle for
+``idle_seconds`` is evicted on the next pool access (or by ``evict_idle``)
+and handed to the lease's ``close`` callable, if any, to free native
+resources. Concurrent first calls for the same key wait for a single load.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MODEL_POOL_IDLE_SECONDS = float(os.getenv("MODEL_POOL_IDLE_SECONDS", "900"))
+
+
+@dataclass
+class _PoolEntry:
+    """A loaded (or loading) model and its bookkeeping."""
+    model: Any = None
+    refs: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+    loaded: threading.Event = field(default_factory=threading.Event)
+    error: Optional[BaseException] = None
+    close: Optional[Callable[[Any], None]] = None
+
+
+class ModelPool:
+    """
+    Lazily loaded, reference-counted models with idle eviction.
+
+    Usage:
+        pool = get_model_pool()
+        with pool.lease(("whisper", "small"), lambda: WhisperModel("small")) as model:
+            model.transcribe(...)
+    """
+
+    def __init__(self, idle_seconds: float = MODEL_POOL_IDLE_SECONDS):
+        """
+        Initialize an empty pool.
+
+        Args:
+            idle_seconds: Unreferenced models idle this long are evicted
+                (0 evicts as soon as the last lease is released)
+        """
+        self.idle_seconds = idle_seconds
+        self._entries: Dict[Hashable, _PoolEntry] = {}
+        self._lock = threading.Lock()
+
+    def _acquire(
+        self, key: Hashable, loader: Callable[[], Any], close: Optional[Callable[[Any], None]]
+    ) -> Any:
+        with self._lock:
+            evicted = self._evict_idle_locked(exclude=key)
+            entry = self._entries.get(key)
+            owner = entry is None
+            if owner:
+                entry = self._entries[key] = _PoolEntry(close=close)
+            entry.refs += 1
+        self._close(evicted)
+
+        if owner:
+            try:
+                logger.info(f"Loading pooled model: {key}")
+                entry.model = loader()
+            except BaseException as e:
+                entry.error = e
+                with self._lock:
+                    self._entries.pop(key, None)
+                raise
+            finally:
+                entry.loaded.set()
+        else:
+            entry.loaded.wait()
+            if entry.error is not None:
+                with self._lock:
+                    entry.refs -= 1
+                raise entry.error
+
+        return entry.model
+
+    def _release(self, key: Hashable) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry.refs -= 1
+            entry.last_used = time.monotonic()
+            evicted = self._evict_idle_locked()
+        self._close(evicted)
+
+    @contextmanager
+    def lease(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        close: Optional[Callable[[Any], None]] = None,
+    ) -> Iterator[Any]:
+        """
+        Hold a reference to the model for ``key``, loading it if needed.
+
+        The model may be evicted once the lease is released, so it must not
+        be used outside the ``with`` block.
+
+        Args:
+            key: Hashable model identity (name, device, options...)
+            loader: Zero-argument callable that builds the model
+            close: Called with the model when it is evicted (kept from the
+                lease that loaded it)
+
+        Yields:
+            The shared model
+        """
+        model = self._acquire(key, loader, close)
+        try:
+            yield model
+        finally:
+            self._release(key)
+
+    def warm(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        close: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        """Load the model for ``key`` now without holding a reference."""
+        with self.lease(key, loader, close):
+            pass
+
+    def _evict_idle_locked(self, exclude: Optional[Hashable] = None) -> List[Tuple[Hashable, _PoolEntry]]:
+        now = time.monotonic()
+        evicted = [
+            (key, entry) for key, entry in self._entries.items()
+            if key != exclude
+            and entry.refs == 0
+            and entry.loaded.is_set()
+            and now - entry.last_used >= self.idle_seconds
+        ]
+        for key, _ in evicted:
+            del self._entries[key]
+            logger.info(f"Evicted idle pooled model: {key}")
+        return evicted
+
+    @staticmethod
+    def _close(evicted: List[Tuple[Hashable, _PoolEntry]]) -> None:
+        # Outside the pool lock: closing a model may be slow
+        for key, entry in evicted:
+            if entry.close is None:
+                continue
+            try:
+                entry.close(entry.model)
+            except Exception as e:
+                logger.warning(f"Failed to close pooled model {key}: {e}")
+
+    def evict_idle(self) -> List[Hashable]:
+        """Drop unreferenced models idle for ``idle_seconds``; returns their keys."""
+        with self._lock:
+            evicted = self._evict_idle_locked()
+        self._close(evicted)
+        return [key for key, _ in evicted]
+
+    def clear(self) -> None:
+        """Drop all unreferenced models."""
+        with self._lock:
+            evicted = [
+                (key, entry) for key, entry in self._entries.items()
+                if entry.refs == 0 and entry.loaded.is_set()
+            ]
+            for key, _ in evicted:
+                del self._entries[key]
+        self._close(evicted)
+
+    def stats(self) -> Dict[Hashable, int]:
+        """Reference counts of the models currently held."""
+        with self._lock:
+            return {key: entry.refs for key, entry in self._entries.items()}
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+
+_model_pool: Optional[ModelPool] = None
+_model_pool_lock = threading.Lock()
+
+
+def get_model_pool() -> ModelPool:
+    """Return the process-wide model pool."""
+    global _model_pool
+    with _model_pool_lock:
+        if _model_pool is None:
+            _model_pool = ModelPool()
+        return _model_pool
@@ -2,22 +2,53 @@
 OCR Pipeline with Tesseract
 
 Extracts text from images and scanned PDFs using Tesseract OCR.
+
+PDFs are processed page by page: pages that already carry a text layer
+(at least ``min_text_chars`` characters via pdfplumber) are taken as-is,
+and only the remaining pages are rasterized and OCR'd, one page image at a
+time. With ``max_workers > 1`` page ranges are handed to a process pool and
+results stream back in page order.
+
+When tesserocr is installed, recognition runs on persistent Tesseract
+engines held in the process model pool (one per thread and language/mode),
+so each page is recognized once by an already initialized engine instead
+of launching the tesseract CLI twice per page through pytesseract.
 """
 
 from __future__ import annotations
 
 import logging
 import os
-import tempfile
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .pdf_parser import (
+    DEFAULT_PAGES_PER_TASK,
+    extract_page_range,
+    iter_open_pages,
+    iter_ordered_results,
+    page_ranges,
+)
+from .model_pool import get_model_pool
 
 logger = logging.getLogger(__name__)
 
 # Feature flag for OCR
 OCR_ENABLED = os.getenv("OCR_ENABLED", "false").lower() == "true"
 OCR_LANG = os.getenv("OCR_LANG", "eng")
+OCR_MAX_WORKERS = int(os.getenv("OCR_MAX_WORKERS", "1"))
+
+# Try to import tesserocr - optional persistent Tesseract API
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
 
 
 @dataclass
@@ -43,6 +74,266 @@ class OcrConfig:
     preprocess: bool = True  # Apply preprocessing
     preserve_layout: bool = False  # Try to preserve text layout
     confidence_threshold: float = 0.0  # Minimum confidence to include
+    skip_text_layer: bool = True  # Skip OCR for PDF pages that already have text
+    min_text_chars: int = 20  # Text-layer characters needed to skip OCR
+
+
+def _preprocess_image(img):
+    """Apply preprocessing to improve OCR quality."""
+    from PIL import ImageFilter, ImageOps
+
+    # Convert to grayscale
+    if img.mode != "L":
+        img = img.convert("L")
+
+    # Apply slight sharpening
+    img = img.filter(ImageFilter.SHARPEN)
+
+    # Increase contrast
+    img = ImageOps.autocontrast(img)
+
+    return img
+
+
+@lru_cache(maxsize=None)
+def _config_string(psm: int, oem: int, preserve_layout: bool) -> str:
+    parts = [
+        f"--psm {psm}",
+        f"--oem {oem}",
+    ]
+
+    if preserve_layout:
+        parts.append("-c preserve_interword_spaces=1")
+
+    return " ".join(parts)
+
+
+def _build_config_string(cfg: OcrConfig) -> str:
+    """Build Tesseract config string from OcrConfig."""
+    return _config_string(cfg.psm, cfg.oem, cfg.preserve_layout)
+
+
+@lru_cache(maxsize=1)
+def _tesseract_available() -> bool:
+    """Whether OCR is enabled and a Tesseract backend works (checked once per process)."""
+    if not OCR_ENABLED:
+        return False
+
+    if TESSEROCR_AVAILABLE:
+        return True
+
+    try:
+        import pytesseract
+        pytesseract.get_tesseract_version()
+        return True
+    except Exception:
+        return False
+
+
+def _engine_key(cfg: OcrConfig) -> Tuple[Any, ...]:
+    # Tesseract engines are not thread-safe: one per thread
+    return ("tesseract", cfg.language, cfg.psm, cfg.oem, cfg.preserve_layout, threading.get_ident())
+
+
+def _engine_loader(cfg: OcrConfig):
+    def load():
+        api = tesserocr.PyTessBaseAPI(
+            lang=cfg.language,
+            psm=cfg.psm,  # plain ints; tesserocr's PSM/OEM are int constants
+            oem=cfg.oem,
+        )
+        if cfg.preserve_layout:
+            api.SetVariable("preserve_interword_spaces", "1")
+        return api
+
+    return load
+
+
+def _end_engine(api) -> None:
+    """Free an evicted engine's native Tesseract memory."""
+    api.End()
+
+
+def _ocr_image_tesserocr(img, cfg: OcrConfig) -> Tuple[str, Optional[float]]:
+    """Recognize once on a pooled engine, reading text and word confidences."""
+    with get_model_pool().lease(_engine_key(cfg), _engine_loader(cfg), _end_engine) as api:
+        try:
+            api.SetImage(img)
+            text = api.GetUTF8Text()
+            confidences = [c for c in api.AllWordConfidences() if c >= 0]
+        finally:
+            # Release the image so a failed page cannot leak into the next
+            api.Clear()
+
+    avg_confidence = (
+        sum(confidences) / len(confidences) / 100.0
+        if confidences else None
+    )
+    return text.strip(), avg_confidence
+
+
+def _ocr_image(img, cfg: OcrConfig) -> Tuple[str, Optional[float]]:
+    """Run Tesseract on an in-memory image, returning (text, mean confidence)."""
+    if cfg.preprocess:
+        img = _preprocess_image(img)
+
+    if TESSEROCR_AVAILABLE:
+        return _ocr_image_tesserocr(img, cfg)
+
+    import pytesseract
+
+    text = pytesseract.image_to_string(
+        img,
+        lang=cfg.language,
+        config=_build_config_string(cfg),
+    )
+
+    # Get detailed data for confidence
+    data = pytesseract.image_to_data(
+        img,
+        lang=cfg.language,
+        output_type=pytesseract.Output.DICT,
+    )
+
+    confidences = [
+        int(c) for c in data.get("conf", [])
+        if str(c).isdigit() and int(c) >= 0
+    ]
+    avg_confidence = (
+        sum(confidences) / len(confidences) / 100.0
+        if confidences else None
+    )
+    return text.strip(), avg_confidence
+
+
+@contextmanager
+def _open_pdf(pdf_path: Path) -> Iterator[Any]:
+    """Open a PDF with pdfplumber, or yield None if pdfplumber is not installed."""
+    try:
+        import pdfplumber
+    except ImportError:
+        yield None
+        return
+
+    with pdfplumber.open(pdf_path) as pdf:
+        yield pdf
+
+
+def _pdf_page_count(pdf_path: Path) -> int:
+    """Number of pages in a PDF, without rasterizing anything."""
+    try:
+        import pdfplumber
+
+        with pdfplumber.open(pdf_path) as pdf:
+            return len(pdf.pages)
+    except ImportError:
+        from pdf2image import pdfinfo_from_path
+
+        return int(pdfinfo_from_path(pdf_path)["Pages"])
+
+
+def _iter_text_layer(
+    pdf_path: Path,
+    first_page: int,
+    last_page: int,
+    pdf: Any = None,
+) -> Iterator[Optional[Dict[str, Any]]]:
+    """
+    Yield each page's pdfplumber text layer, or None where it is unavailable.
+
+    With an open ``pdf`` pages are extracted lazily, one at a time;
+    otherwise the range is read from ``pdf_path`` in one go.
+    """
+    yielded = 0
+    try:
+        if pdf is not None:
+            pages = iter_open_pages(pdf, first_page, last_page, extract_tables=False)
+        else:
+            pages = iter(extract_page_range(pdf_path, first_page, last_page, extract_tables=False))
+        for page in pages:
+            yield None if "error" in page else page
+            yielded += 1
+        return
+    except ImportError:
+        pass
+    except Exception as e:
+        logger.warning(f"Text layer extraction failed for {pdf_path}: {e}")
+
+    for _ in range(last_page - first_page + 1 - yielded):
+        yield None
+
+
+def _iter_ocr_page_range(
+    pdf_path: Path,
+    first_page: int,
+    last_page: int,
+    cfg: OcrConfig,
+    pdf: Any = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Text-layer-or-OCR extraction for pages ``first_page..last_page``, one page at a time.
+
+    Pages are rasterized one at a time, so at most one page image is held.
+    In-process callers may pass an already open pdfplumber ``pdf`` for the
+    text layer, which is then also read page by page.
+    """
+    from pdf2image import convert_from_path
+
+    if cfg.skip_text_layer:
+        layers = _iter_text_layer(pdf_path, first_page, last_page, pdf)
+    else:
+        layers = repeat(None)
+
+    for page_number, layer in zip(range(first_page, last_page + 1), layers):
+        if layer is not None and len(layer["text"].strip()) >= cfg.min_text_chars:
+            yield {
+                "page_number": page_number,
+                "text": layer["text"].strip(),
+                "confidence": None,
+                "width": layer["width"],
+                "height": layer["height"],
+                "source": "text_layer",
+            }
+            continue
+
+        try:
+            images = convert_from_path(
+                pdf_path,
+                dpi=cfg.dpi,
+                first_page=page_number,
+                last_page=page_number,
+            )
+            if not images:
+                raise ValueError("page could not be rasterized")
+            img = images[0]
+            text, confidence = _ocr_image(img, cfg)
+            page = {
+                "page_number": page_number,
+                "text": text,
+                "confidence": confidence,
+                "width": img.width,
+                "height": img.height,
+                "source": "ocr",
+            }
+            img.close()
+        except Exception as e:
+            page = {"page_number": page_number, "error": str(e)}
+        yield page
+
+
+def _ocr_page_range(
+    pdf_path: Path,
+    first_page: int,
+    last_page: int,
+    cfg: OcrConfig,
+) -> List[Dict[str, Any]]:
+    """
+    Text-layer-or-OCR extraction for one worker chunk of pages.
+
+    Module-level so it can run in a worker process; results are returned as
+    a list so they can be sent back to the parent.
+    """
+    return list(_iter_ocr_page_range(pdf_path, first_page, last_page, cfg))
 
 
 class OcrPipeline:
@@ -63,18 +354,24 @@ class OcrPipeline:
         if self._tesseract_available is not None:
             return self._tesseract_available
 
-        if not OCR_ENABLED:
-            self._tesseract_available = False
-            return False
+        self._tesseract_available = _tesseract_available()
+        return self._tesseract_available
 
-        try:
-            import pytesseract
-            pytesseract.get_tesseract_version()
-            self._tesseract_available = True
-        except Exception:
-            self._tesseract_available = False
+    def warm_up(self, config: Optional[OcrConfig] = None) -> bool:
+        """
+        Initialize a pooled Tesseract engine for the calling thread.
 
-        return self._tesseract_available
+        Only meaningful with tesserocr; the pytesseract backend has no
+        persistent engine to warm.
+
+        Returns:
+            True if an engine is loaded
+        """
+        if not self.is_available() or not TESSEROCR_AVAILABLE:
+            return False
+        cfg = config or self.config
+        get_model_pool().warm(_engine_key(cfg), _engine_loader(cfg), _end_engine)
+        return True
 
     def process_image(
         self,
@@ -109,55 +406,17 @@ class OcrPipeline:
             )
 
         try:
-            import pytesseract
             from PIL import Image
 
-            # Load and preprocess image
             img = Image.open(path)
-
-            if cfg.preprocess:
-                img = self._preprocess_image(img)
-
-            # Build Tesseract config string
-            tess_config = self._build_config_string(cfg)
-
-            # Run OCR
-            if cfg.preserve_layout:
-                text = pytesseract.image_to_string(
-                    img,
-                    lang=cfg.language,
-                    config=tess_config,
-                )
-            else:
-                text = pytesseract.image_to_string(
-                    img,
-                    lang=cfg.language,
-                    config=tess_config,
-                )
-
-            # Get detailed data for confidence
-            data = pytesseract.image_to_data(
-                img,
-                lang=cfg.language,
-                output_type=pytesseract.Output.DICT,
-            )
-
-            # Calculate average confidence
-            confidences = [
-                int(c) for c in data.get("conf", [])
-                if str(c).isdigit() and int(c) >= 0
-            ]
-            avg_confidence = (
-                sum(confidences) / len(confidences) / 100.0
-                if confidences else None
-            )
+            text, avg_confidence = _ocr_image(img, cfg)
 
             return OcrResult(
                 success=True,
-                text=text.strip(),
+                text=text,
                 pages=[{
                     "page_number": 1,
-                    "text": text.strip(),
+                    "text": text,
                     "confidence": avg_confidence,
                     "width": img.width,
                     "height": img.height,
@@ -191,14 +450,18 @@ class OcrPipeline:
         pdf_path: Union[str, Path],
         max_pages: Optional[int] = None,
         config: Optional[OcrConfig] = None,
+        max_workers: Optional[int] = None,
+        pages_per_task: int = DEFAULT_PAGES_PER_TASK,
     ) -> OcrResult:
         """
-        Process a PDF file (converts pages to images first).
+        Process a PDF file, OCRing pages that have no text layer.
 
         Args:
             pdf_path: Path to the PDF file
             max_pages: Maximum pages to process
             config: OCR configuration
+            max_workers: Worker processes (defaults to OCR_MAX_WORKERS)
+            pages_per_task: Pages per worker task
 
         Returns:
             OcrResult with extracted text from all pages
@@ -221,48 +484,37 @@ class OcrPipeline:
             )
 
         try:
-            from pdf2image import convert_from_path
-
-            # Convert PDF to images
-            images = convert_from_path(
-                path,
-                dpi=cfg.dpi,
-                first_page=1,
-                last_page=max_pages,
-            )
-
             pages = []
             all_text = []
             total_confidence = 0
             confidence_count = 0
             warnings = []
 
-            for i, img in enumerate(images):
-                try:
-                    # Process each page image
-                    with tempfile.NamedTemporaryFile(suffix=".png", delete=True) as tmp:
-                        img.save(tmp.name, "PNG")
-                        result = self.process_image(tmp.name, cfg)
-
-                        if result.success:
-                            page_data = {
-                                "page_number": i + 1,
-                                "text": result.text,
-                                "confidence": result.confidence,
-                                "width": img.width,
-                                "height": img.height,
-                            }
-                            pages.append(page_data)
-                            all_text.append(f"--- Page {i + 1} ---\n{result.text}")
-
-                            if result.confidence is not None:
-                                total_confidence += result.confidence
-                                confidence_count += 1
-                        else:
-                            warnings.extend(result.errors)
-
-                except Exception as e:
-                    warnings.append(f"Error processing page {i + 1}: {str(e)}")
+            # One open document serves the page count and the serial text layer
+            with _open_pdf(path) as pdf:
+                total_pages = len(pdf.pages) if pdf is not None else _pdf_page_count(path)
+
+                for page in self._iter_pdf_pages(
+                    path,
+                    max_pages=max_pages,
+                    cfg=cfg,
+                    max_workers=max_workers,
+                    pages_per_task=pages_per_task,
+                    total_pages=total_pages,
+                    pdf=pdf,
+                ):
+                    if "error" in page:
+                        warnings.append(
+                            f"Error processing page {page['page_number']}: {page['error']}"
+                        )
+                        continue
+
+                    pages.append(page)
+                    all_text.append(f"--- Page {page['page_number']} ---\n{page['text']}")
+
+                    if page["confidence"] is not None:
+                        total_confidence += page["confidence"]
+                        confidence_count += 1
 
             avg_confidence = (
                 total_confidence / confidence_count
@@ -278,8 +530,10 @@ class OcrPipeline:
                 warnings=warnings,
                 metadata={
                     "source": str(path),
-                    "total_pages": len(images),
+                    "total_pages": total_pages,
                     "pages_processed": len(pages),
+                    "ocr_pages": sum(1 for p in pages if p["source"] == "ocr"),
+                    "text_layer_pages": sum(1 for p in pages if p["source"] == "text_layer"),
                     "dpi": cfg.dpi,
                 },
             )
@@ -298,6 +552,77 @@ class OcrPipeline:
                 errors=[str(e)],
             )
 
+    def iter_pdf_pages(
+        self,
+        pdf_path: Union[str, Path],
+        max_pages: Optional[int] = None,
+        config: Optional[OcrConfig] = None,
+        max_workers: Optional[int] = None,
+        pages_per_task: int = DEFAULT_PAGES_PER_TASK,
+        total_pages: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream per-page results for a PDF in page order.
+
+        Page ranges are rasterized and OCR'd in a process pool when
+        ``max_workers > 1``; at most ``2 * max_workers`` ranges are in
+        flight. Each page dict has ``page_number``, ``text``, ``confidence``,
+        ``width``, ``height`` and ``source`` ("text_layer" or "ocr"); a page
+        that failed has ``page_number`` and ``error`` only.
+
+        Args:
+            pdf_path: Path to the PDF file
+            max_pages: Maximum pages to process
+            config: OCR configuration
+            max_workers: Worker processes (defaults to OCR_MAX_WORKERS)
+            pages_per_task: Pages per worker task
+            total_pages: Page count, if already known
+
+        Yields:
+            Page dicts
+        """
+        cfg = config or self.config
+        path = Path(pdf_path)
+
+        if (max_workers or OCR_MAX_WORKERS) <= 1:
+            with _open_pdf(path) as pdf:
+                yield from self._iter_pdf_pages(
+                    path, max_pages, cfg, max_workers, pages_per_task, total_pages, pdf
+                )
+        else:
+            yield from self._iter_pdf_pages(
+                path, max_pages, cfg, max_workers, pages_per_task, total_pages
+            )
+
+    def _iter_pdf_pages(
+        self,
+        path: Path,
+        max_pages: Optional[int],
+        cfg: OcrConfig,
+        max_workers: Optional[int],
+        pages_per_task: int,
+        total_pages: Optional[int],
+        pdf: Any = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """iter_pdf_pages body; the serial path reuses the open ``pdf``."""
+        workers = max_workers or OCR_MAX_WORKERS
+
+        if total_pages is None:
+            total_pages = len(pdf.pages) if pdf is not None else _pdf_page_count(path)
+        if max_pages:
+            total_pages = min(max_pages, total_pages)
+
+        if workers <= 1:
+            # In process: stream pages as they are extracted or OCR'd
+            yield from _iter_ocr_page_range(path, 1, total_pages, cfg, pdf)
+            return
+
+        tasks = [
+            (path, first, last, cfg)
+            for first, last in page_ranges(total_pages, pages_per_task)
+        ]
+        yield from iter_ordered_results(_ocr_page_range, tasks, workers)
+
     def process_file(
         self,
         file_path: Union[str, Path],
@@ -331,31 +656,11 @@ class OcrPipeline:
 
     def _preprocess_image(self, img):
         """Apply preprocessing to improve OCR quality."""
-        from PIL import Image, ImageFilter, ImageOps
-
-        # Convert to grayscale
-        if img.mode != "L":
-            img = img.convert("L")
-
-        # Apply slight sharpening
-        img = img.filter(ImageFilter.SHARPEN)
-
-        # Increase contrast
-        img = ImageOps.autocontrast(img)
-
-        return img
+        return _preprocess_image(img)
 
     def _build_config_string(self, cfg: OcrConfig) -> str:
         """Build Tesseract config string from OcrConfig."""
-        parts = [
-            f"--psm {cfg.psm}",
-            f"--oem {cfg.oem}",
-        ]
-
-        if cfg.preserve_layout:
-            parts.append("-c preserve_interword_spaces=1")
-
-        return " ".join(parts)
+        return _build_config_string(cfg)
 
 
 def extract_text_ocr(
@@ -2,11 +2,17 @@
 Parquet File Parser
 
 Parses Apache Parquet files using pyarrow.
+
+Metadata, schema and (on request) column statistics come from the file
+footer only, and previews decode just the rows and columns they return
+from memory-mapped files, so inspecting a multi-gigabyte upload costs
+about the same as a small one.
 """
 
 from __future__ import annotations
 
 import logging
+import random
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -47,6 +53,11 @@ class ParquetParser(BaseParser):
             columns: List of columns to read (None for all)
             include_data: Whether to include data in result
             **options: Additional options
+                sample: With max_rows, draw rows from random row groups
+                    instead of the first rows
+                seed: Random seed for sampling
+                column_statistics: Add footer row-group statistics to
+                    metadata (costs one lookup per row group and column)
 
         Returns:
             ParseResult with parsed data
@@ -61,8 +72,8 @@ class ParquetParser(BaseParser):
             )
 
         try:
-            # Read Parquet file
-            parquet_file = pq.ParquetFile(file_path)
+            # Open lazily: only the footer is read here
+            parquet_file = pq.ParquetFile(file_path, memory_map=True)
 
             # Get metadata
             metadata = parquet_file.metadata
@@ -73,14 +84,12 @@ class ParquetParser(BaseParser):
 
             # Read data
             if include_data:
-                if max_rows:
-                    table = parquet_file.read_row_groups(
-                        range(min(parquet_file.metadata.num_row_groups,
-                              (max_rows // 1000) + 1)),
-                        columns=columns
+                if max_rows and options.get("sample"):
+                    table = sample_row_groups(
+                        parquet_file, max_rows, columns=columns, seed=options.get("seed")
                     )
-                    if len(table) > max_rows:
-                        table = table.slice(0, max_rows)
+                elif max_rows:
+                    table = read_head(parquet_file, max_rows, columns=columns)
                 else:
                     table = parquet_file.read(columns=columns)
 
@@ -93,7 +102,7 @@ class ParquetParser(BaseParser):
                 record_count = metadata.num_rows
                 column_names = [field.name for field in schema]
 
-            return ParseResult(
+            result = ParseResult(
                 success=True,
                 format=self.name,
                 record_count=record_count,
@@ -109,6 +118,9 @@ class ParquetParser(BaseParser):
                     "compression": self._get_compression_info(parquet_file),
                 },
             )
+            if options.get("column_statistics"):
+                result.metadata["column_statistics"] = row_group_statistics(metadata, columns)
+            return result
 
         except Exception as e:
             logger.exception(f"Error parsing Parquet file: {e}")
@@ -158,6 +170,233 @@ class ParquetParser(BaseParser):
         return None
 
 
+def _statistic_value(value: Any) -> Any:
+    """Make a statistics min/max JSON friendly."""
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def _leaf_count(arrow_type) -> int:
+    """Number of Parquet leaf columns an Arrow type is stored as."""
+    import pyarrow as pa
+
+    if pa.types.is_struct(arrow_type):
+        return sum(_leaf_count(arrow_type.field(i).type) for i in range(arrow_type.num_fields))
+    if pa.types.is_map(arrow_type):
+        return _leaf_count(arrow_type.key_type) + _leaf_count(arrow_type.item_type)
+    if pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type) \
+            or pa.types.is_fixed_size_list(arrow_type):
+        return _leaf_count(arrow_type.value_type)
+    return 1
+
+
+def row_group_statistics(
+    metadata, columns: Optional[List[str]] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Combine per-row-group column statistics from the Parquet footer.
+
+    No data pages are read. ``min``/``max`` are None unless every
+    row group with non-null values recorded them; ``null_count`` likewise.
+    Cost is one metadata lookup per (row group, selected leaf column), so
+    callers should request it only when statistics are needed.
+
+    Args:
+        metadata: pyarrow FileMetaData
+        columns: Top-level columns to include (None for all)
+
+    Returns:
+        Mapping of leaf column path to num_values, null_count, min, max,
+        compressed and uncompressed size in bytes
+    """
+    # Map leaf columns to top-level fields by position, so names containing
+    # "." are matched exactly
+    wanted = set(columns) if columns else None
+    indices = []
+    leaf = 0
+    for field in metadata.schema.to_arrow_schema():
+        n_leaves = _leaf_count(field.type)
+        if wanted is None or field.name in wanted:
+            indices.extend(range(leaf, leaf + n_leaves))
+        leaf += n_leaves
+
+    names = [metadata.schema.column(i).path for i in indices]
+    combined = [
+        {
+            "num_values": 0,
+            "null_count": 0,
+            "min": None,
+            "max": None,
+            "compressed_bytes": 0,
+            "uncompressed_bytes": 0,
+        }
+        for _ in indices
+    ]
+    complete_nulls = [True] * len(indices)
+    complete_bounds = [True] * len(indices)
+
+    for rg in range(metadata.num_row_groups):
+        row_group = metadata.row_group(rg)
+        if row_group.num_rows == 0:
+            continue
+        for j, i in enumerate(indices):
+            chunk = row_group.column(i)
+            stats = combined[j]
+            stats["num_values"] += chunk.num_values
+            stats["compressed_bytes"] += chunk.total_compressed_size
+            stats["uncompressed_bytes"] += chunk.total_uncompressed_size
+
+            chunk_stats = chunk.statistics if chunk.is_stats_set else None
+            if chunk_stats is None or not chunk_stats.has_null_count:
+                complete_nulls[j] = False
+            else:
+                stats["null_count"] += chunk_stats.null_count
+
+            if chunk_stats is not None and chunk_stats.num_values == 0:
+                # All-null chunk: no bounds, and none needed
+                continue
+            if chunk_stats is None or not chunk_stats.has_min_max:
+                complete_bounds[j] = False
+                continue
+            lo, hi = chunk_stats.min, chunk_stats.max
+            if stats["min"] is None or lo < stats["min"]:
+                stats["min"] = lo
+            if stats["max"] is None or hi > stats["max"]:
+                stats["max"] = hi
+
+    result: Dict[str, Dict[str, Any]] = {}
+    for j, name in enumerate(names):
+        stats = combined[j]
+        if not complete_nulls[j]:
+            stats["null_count"] = None
+        if not complete_bounds[j]:
+            stats["min"] = stats["max"] = None
+        stats["min"] = _statistic_value(stats["min"])
+        stats["max"] = _statistic_value(stats["max"])
+        result[name] = stats
+
+    return result
+
+
+def read_head(parquet_file, n_rows: int, columns: Optional[List[str]] = None):
+    """
+    Read the first ``n_rows`` rows, decoding no more batches than needed.
+
+    Args:
+        parquet_file: Open pyarrow ParquetFile
+        n_rows: Number of rows
+        columns: Columns to read (None for all)
+
+    Returns:
+        pyarrow Table with at most n_rows rows
+    """
+    import pyarrow as pa
+
+    batches = []
+    remaining = n_rows
+    for batch in parquet_file.iter_batches(batch_size=min(n_rows, 65536), columns=columns):
+        batches.append(batch.slice(0, remaining))
+        remaining -= len(batches[-1])
+        if remaining <= 0:
+            break
+    if not batches:
+        return parquet_file.schema_arrow.empty_table().select(columns or parquet_file.schema_arrow.names)
+    return pa.Table.from_batches(batches)
+
+
+def sample_row_groups(
+    parquet_file,
+    n_rows: int,
+    columns: Optional[List[str]] = None,
+    seed: Optional[int] = None,
+):
+    """
+    Sample about ``n_rows`` rows spread over randomly chosen row groups.
+
+    Up to ``n_rows`` row groups are chosen at random and the leading rows
+    of each are read (only the requested columns), so the sample covers
+    the whole file while decoding a small fraction of it. Rows within a
+    row group are contiguous; rows are returned in file order.
+
+    Args:
+        parquet_file: Open pyarrow ParquetFile
+        n_rows: Number of rows to sample
+        columns: Columns to read (None for all)
+        seed: Random seed
+
+    Returns:
+        pyarrow Table with at most n_rows rows
+    """
+    import pyarrow as pa
+
+    metadata = parquet_file.metadata
+    sizes = {
+        rg: metadata.row_group(rg).num_rows
+        for rg in range(metadata.num_row_groups)
+        if metadata.row_group(rg).num_rows > 0
+    }
+    if n_rows >= metadata.num_rows or len(sizes) <= 1:
+        return read_head(parquet_file, n_rows, columns)
+
+    rng = random.Random(seed)
+    chosen = rng.sample(sorted(sizes), min(len(sizes), n_rows))
+
+    # Split n_rows across the chosen groups, capped by each group's size
+    quotas = dict.fromkeys(chosen, 0)
+    remaining = n_rows
+    while remaining > 0:
+        open_groups = [rg for rg in chosen if quotas[rg] < sizes[rg]]
+        if not open_groups:
+            break
+        share = max(1, remaining // len(open_groups))
+        for rg in open_groups:
+            take = min(share, sizes[rg] - quotas[rg], remaining)
+            quotas[rg] += take
+            remaining -= take
+            if remaining == 0:
+                break
+
+    batches = []
+    for rg in sorted(chosen):
+        if quotas[rg] == 0:
+            continue
+        batch = next(parquet_file.iter_batches(
+            batch_size=quotas[rg], row_groups=[rg], columns=columns
+        ))
+        batches.append(batch.slice(0, quotas[rg]))
+    return pa.Table.from_batches(batches)
+
+
+def read_parquet_metadata(
+    file_path: Path, columns: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Read row counts, schema and column statistics from the footer only.
+
+    Args:
+        file_path: Path to the Parquet file
+        columns: Columns to include in statistics (None for all)
+
+    Returns:
+        Metadata dictionary (empty if the file cannot be read)
+    """
+    parser = ParquetParser()
+    result = parser.parse(
+        file_path, columns=columns, include_data=False, column_statistics=True
+    )
+    if not result.success:
+        return {}
+    return {
+        "record_count": result.record_count,
+        "columns": result.columns,
+        "schema": result.schema,
+        **result.metadata,
+    }
+
+
 def read_parquet_schema(file_path: Path) -> Dict[str, Any]:
     """
     Read only the schema from a Parquet file (no data).
@@ -177,6 +416,8 @@ def read_parquet_sample(
     file_path: Path,
     n_rows: int = 100,
     columns: Optional[List[str]] = None,
+    random_sample: bool = False,
+    seed: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
     """
     Read a sample of rows from a Parquet file.
@@ -185,10 +426,14 @@ def read_parquet_sample(
         file_path: Path to the Parquet file
         n_rows: Number of rows to read
         columns: Columns to include
+        random_sample: Draw rows from random row groups instead of the head
+        seed: Random seed for sampling
 
     Returns:
         List of row dictionaries
     """
     parser = ParquetParser()
-    result = parser.parse(file_path, max_rows=n_rows, columns=columns)
+    result = parser.parse(
+        file_path, max_rows=n_rows, columns=columns, sample=random_sample, seed=seed
+    )
     return result.data if result.success and result.data else []
@@ -2,18 +2,201 @@
 PDF File Parser
 
 Parses PDF files using pdfplumber for text extraction.
+
+Large documents can be parsed page-parallel: the page range is split into
+contiguous chunks that worker processes open and extract independently,
+and results are streamed back in page order with a bounded number of
+chunks in flight.
 """
 
 from __future__ import annotations
 
 import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from .registry import BaseParser, ParseResult
 
 logger = logging.getLogger(__name__)
 
+# Pages handed to one worker task in page-parallel mode
+DEFAULT_PAGES_PER_TASK = 8
+
+
+def page_ranges(
+    total_pages: int,
+    pages_per_task: int = DEFAULT_PAGES_PER_TASK,
+) -> List[Tuple[int, int]]:
+    """
+    Split pages 1..total_pages into inclusive (first, last) chunks.
+
+    Args:
+        total_pages: Number of pages to cover
+        pages_per_task: Pages per chunk
+
+    Returns:
+        List of 1-based inclusive page ranges
+    """
+    step = max(1, pages_per_task)
+    return [
+        (first, min(first + step - 1, total_pages))
+        for first in range(1, total_pages + 1, step)
+    ]
+
+
+def iter_ordered_results(
+    fn: Callable[..., List[Dict[str, Any]]],
+    tasks: List[Tuple[Any, ...]],
+    max_workers: int,
+    max_in_flight: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Run ``fn(*task)`` in a process pool and yield the items of each result in task order.
+
+    At most ``max_in_flight`` tasks (default ``2 * max_workers``) are
+    submitted or buffered at once, so resident pages stay bounded no matter
+    how long the document is. With ``max_workers <= 1`` tasks run inline.
+
+    Args:
+        fn: Module-level (picklable) function returning a list of page dicts
+        tasks: Argument tuples, one per task
+        max_workers: Worker processes
+        max_in_flight: Maximum submitted-but-unconsumed tasks
+
+    Yields:
+        Page dicts in task order
+    """
+    if max_workers <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield from fn(*task)
+        return
+
+    window = max(1, max_in_flight or 2 * max_workers)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        remaining = iter(tasks)
+        for task in remaining:
+            pending.append(executor.submit(fn, *task))
+            if len(pending) >= window:
+                break
+        while pending:
+            result = pending.popleft().result()
+            next_task = next(remaining, None)
+            if next_task is not None:
+                pending.append(executor.submit(fn, *next_task))
+            yield from result
+
+
+def _extract_page(
+    page: Any,
+    page_number: int,
+    extract_tables: bool,
+    extract_images: bool,
+) -> Dict[str, Any]:
+    """Extract text, tables and image metadata from one pdfplumber page."""
+    text = page.extract_text() or ""
+    page_data: Dict[str, Any] = {
+        "page_number": page_number,
+        "text": text,
+        "char_count": len(text),
+        "width": page.width,
+        "height": page.height,
+        "tables": [],
+        "images": [],
+    }
+
+    if extract_tables:
+        for j, table in enumerate(page.extract_tables()):
+            if table:
+                page_data["tables"].append({
+                    "page_number": page_number,
+                    "table_index": j,
+                    "rows": len(table),
+                    "cols": len(table[0]) if table else 0,
+                    "data": table[:100],  # Limit table rows
+                })
+
+    if extract_images and hasattr(page, "images"):
+        for img in page.images:
+            page_data["images"].append({
+                "page_number": page_number,
+                "x0": img.get("x0"),
+                "y0": img.get("y0"),
+                "x1": img.get("x1"),
+                "y1": img.get("y1"),
+                "width": img.get("width"),
+                "height": img.get("height"),
+            })
+
+    return page_data
+
+
+def iter_open_pages(
+    pdf: Any,
+    first_page: int,
+    last_page: int,
+    extract_tables: bool = True,
+    extract_images: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Extract pages ``first_page..last_page`` from an already open pdfplumber document.
+
+    A page that fails to extract is yielded with an ``error`` key instead of
+    text. Each page's parsed objects are released once extracted.
+
+    Args:
+        pdf: Open pdfplumber PDF
+        first_page: First page number (1-based)
+        last_page: Last page number (inclusive)
+        extract_tables: Whether to extract tables
+        extract_images: Whether to extract image metadata
+
+    Yields:
+        Page dicts in page order
+    """
+    for page_number in range(first_page, last_page + 1):
+        page = pdf.pages[page_number - 1]
+        try:
+            yield _extract_page(page, page_number, extract_tables, extract_images)
+        except Exception as e:
+            yield {"page_number": page_number, "error": str(e)}
+        finally:
+            if hasattr(page, "close"):
+                page.close()
+
+
+def extract_page_range(
+    file_path: Path,
+    first_page: int,
+    last_page: int,
+    extract_tables: bool = True,
+    extract_images: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Extract pages ``first_page..last_page`` (1-based, inclusive) from a PDF.
+
+    Opens the file independently so it can run in a worker process. A page
+    that fails to extract is returned with an ``error`` key instead of text.
+
+    Args:
+        file_path: Path to the PDF file
+        first_page: First page number
+        last_page: Last page number
+        extract_tables: Whether to extract tables
+        extract_images: Whether to extract image metadata
+
+    Returns:
+        List of page dicts in page order
+    """
+    import pdfplumber
+
+    with pdfplumber.open(file_path) as pdf:
+        return list(
+            iter_open_pages(pdf, first_page, last_page, extract_tables, extract_images)
+        )
+
 
 class PDFParser(BaseParser):
     """Parser for PDF files using pdfplumber."""
@@ -36,6 +219,8 @@ class PDFParser(BaseParser):
         max_pages: Optional[int] = None,
         extract_tables: bool = True,
         extract_images: bool = False,
+        max_workers: int = 1,
+        pages_per_task: int = DEFAULT_PAGES_PER_TASK,
         **options
     ) -> ParseResult:
         """
@@ -46,6 +231,8 @@ class PDFParser(BaseParser):
             max_pages: Maximum pages to parse (None for all)
             extract_tables: Whether to extract tables
             extract_images: Whether to extract image metadata
+            max_workers: Worker processes for page-parallel parsing (1 = serial)
+            pages_per_task: Pages per worker task in page-parallel mode
             **options: Additional options
 
         Returns:
@@ -61,109 +248,93 @@ class PDFParser(BaseParser):
             )
 
         try:
+            page_texts = []
+            tables = []
+            image_info = []
+            warnings = []
+
+            # The serial path extracts from this same open document
             with pdfplumber.open(file_path) as pdf:
-                # Get metadata
                 metadata = pdf.metadata or {}
-
-                # Determine pages to process
                 total_pages = len(pdf.pages)
+
                 pages_to_process = (
                     min(max_pages, total_pages) if max_pages else total_pages
                 )
 
-                # Extract text from each page
-                page_texts = []
-                tables = []
-                image_info = []
-                warnings = []
-
-                for i, page in enumerate(pdf.pages[:pages_to_process]):
-                    try:
-                        # Extract text
-                        text = page.extract_text() or ""
-                        page_texts.append({
-                            "page_number": i + 1,
-                            "text": text,
-                            "char_count": len(text),
-                            "width": page.width,
-                            "height": page.height,
-                        })
-
-                        # Extract tables
-                        if extract_tables:
-                            page_tables = page.extract_tables()
-                            for j, table in enumerate(page_tables):
-                                if table:
-                                    tables.append({
-                                        "page_number": i + 1,
-                                        "table_index": j,
-                                        "rows": len(table),
-                                        "cols": len(table[0]) if table else 0,
-                                        "data": table[:100],  # Limit table rows
-                                    })
-
-                        # Extract image metadata
-                        if extract_images and hasattr(page, "images"):
-                            for img in page.images:
-                                image_info.append({
-                                    "page_number": i + 1,
-                                    "x0": img.get("x0"),
-                                    "y0": img.get("y0"),
-                                    "x1": img.get("x1"),
-                                    "y1": img.get("y1"),
-                                    "width": img.get("width"),
-                                    "height": img.get("height"),
-                                })
-
-                    except Exception as e:
-                        warnings.append(f"Error processing page {i + 1}: {str(e)}")
-                        logger.warning(f"Error processing page {i + 1}: {e}")
-
-                # Combine all text
-                full_text = "\n\n".join(
-                    f"--- Page {p['page_number']} ---\n{p['text']}"
-                    for p in page_texts
-                )
+                if max_workers <= 1:
+                    pages = iter_open_pages(
+                        pdf, 1, pages_to_process, extract_tables, extract_images
+                    )
+                else:
+                    pages = self.iter_pages(
+                        file_path,
+                        max_pages=pages_to_process,
+                        extract_tables=extract_tables,
+                        extract_images=extract_images,
+                        max_workers=max_workers,
+                        pages_per_task=pages_per_task,
+                        total_pages=total_pages,
+                    )
+
+                for page in pages:
+                    if "error" in page:
+                        warnings.append(
+                            f"Error processing page {page['page_number']}: {page['error']}"
+                        )
+                        logger.warning(
+                            f"Error processing page {page['page_number']}: {page['error']}"
+                        )
+                        continue
+                    tables.extend(page.pop("tables"))
+                    image_info.extend(page.pop("images"))
+                    page_texts.append(page)
+
+            # Combine all text
+            full_text = "\n\n".join(
+                f"--- Page {p['page_number']} ---\n{p['text']}"
+                for p in page_texts
+            )
 
-                return ParseResult(
-                    success=True,
-                    format=self.name,
-                    record_count=pages_to_process,
-                    columns=["page_number", "text", "char_count"],
-                    schema={
-                        "pages": {
-                            "type": "array",
-                            "items": {
-                                "page_number": "integer",
-                                "text": "string",
-                                "char_count": "integer",
-                            }
-                        },
-                        "tables": {
-                            "type": "array",
-                            "items": {
-                                "page_number": "integer",
-                                "rows": "integer",
-                                "cols": "integer",
-                            }
+            return ParseResult(
+                success=True,
+                format=self.name,
+                record_count=pages_to_process,
+                columns=["page_number", "text", "char_count"],
+                schema={
+                    "pages": {
+                        "type": "array",
+                        "items": {
+                            "page_number": "integer",
+                            "text": "string",
+                            "char_count": "integer",
                         }
                     },
-                    data={
-                        "pages": page_texts,
-                        "tables": tables if extract_tables else [],
-                        "images": image_info if extract_images else [],
-                    },
-                    text_content=full_text,
-                    metadata={
-                        "total_pages": total_pages,
-                        "pages_processed": pages_to_process,
-                        "total_chars": sum(p["char_count"] for p in page_texts),
-                        "total_tables": len(tables),
-                        "total_images": len(image_info),
-                        "pdf_metadata": self._clean_metadata(metadata),
-                    },
-                    warnings=warnings,
-                )
+                    "tables": {
+                        "type": "array",
+                        "items": {
+                            "page_number": "integer",
+                            "rows": "integer",
+                            "cols": "integer",
+                        }
+                    }
+                },
+                data={
+                    "pages": page_texts,
+                    "tables": tables if extract_tables else [],
+                    "images": image_info if extract_images else [],
+                },
+                text_content=full_text,
+                metadata={
+                    "total_pages": total_pages,
+                    "pages_processed": pages_to_process,
+                    "total_chars": sum(p["char_count"] for p in page_texts),
+                    "total_tables": len(tables),
+                    "total_images": len(image_info),
+                    "pdf_metadata": self._clean_metadata(metadata),
+                },
+                warnings=warnings,
+            )
 
         except Exception as e:
             logger.exception(f"Error parsing PDF file: {e}")
@@ -173,6 +344,61 @@ class PDFParser(BaseParser):
                 errors=[str(e)],
             )
 
+    def iter_pages(
+        self,
+        file_path: Path,
+        max_pages: Optional[int] = None,
+        extract_tables: bool = True,
+        extract_images: bool = False,
+        max_workers: int = 1,
+        pages_per_task: int = DEFAULT_PAGES_PER_TASK,
+        total_pages: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream per-page extraction results in page order.
+
+        Each page dict carries ``page_number``, ``text``, ``char_count``,
+        ``width``, ``height``, ``tables`` and ``images``; a page that failed
+        carries ``page_number`` and ``error`` only.
+
+        Args:
+            file_path: Path to the PDF file
+            max_pages: Maximum pages to yield (None for all)
+            extract_tables: Whether to extract tables
+            extract_images: Whether to extract image metadata
+            max_workers: Worker processes (1 = extract in this process)
+            pages_per_task: Pages per worker task
+            total_pages: Page count, if already known
+
+        Yields:
+            Page dicts
+        """
+        if max_workers <= 1:
+            # One pass over a single open document
+            import pdfplumber
+
+            with pdfplumber.open(file_path) as pdf:
+                last = len(pdf.pages) if total_pages is None else total_pages
+                if max_pages:
+                    last = min(max_pages, last)
+                yield from iter_open_pages(pdf, 1, last, extract_tables, extract_images)
+            return
+
+        if total_pages is None:
+            import pdfplumber
+
+            with pdfplumber.open(file_path) as pdf:
+                total_pages = len(pdf.pages)
+
+        if max_pages:
+            total_pages = min(max_pages, total_pages)
+
+        tasks = [
+            (file_path, first, last, extract_tables, extract_images)
+            for first, last in page_ranges(total_pages, pages_per_task)
+        ]
+        yield from iter_ordered_results(extract_page_range, tasks, max_workers)
+
     def _clean_metadata(self, metadata: Dict) -> Dict:
         """Clean PDF metadata for JSON serialization."""
         cleaned = {}
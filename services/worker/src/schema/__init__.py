@@ -10,7 +10,9 @@ from .infer_schema import (
     ColumnSchema,
     infer_schema,
     infer_schema_from_file,
+    iter_file_chunks,
 )
+from .sketches import ColumnSketch, HyperLogLog, ReservoirSample
 
 __all__ = [
     "SchemaInference",
@@ -18,4 +20,8 @@ __all__ = [
     "ColumnSchema",
     "infer_schema",
     "infer_schema_from_file",
+    "iter_file_chunks",
+    "ColumnSketch",
+    "HyperLogLog",
+    "ReservoirSample",
 ]
@@ -2,6 +2,12 @@
 Schema Inference
 
 Automatically infers data schemas from various data sources.
+
+Large files can be inferred in streaming mode: the file is read in chunks
+(Parquet in record batches), each column is summarized in a mergeable
+ColumnSketch (approximate distinct counts, reservoir samples, running
+numeric stats), and the merged sketches produce the same InferredSchema as
+the in-memory path.
 """
 
 from __future__ import annotations
@@ -12,10 +18,12 @@ import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
 from src.provenance.artifact_store import store_text, new_run_id
 
+from .sketches import ColumnSketch
+
 logger = logging.getLogger(__name__)
 
 
@@ -179,6 +187,118 @@ class SchemaInference:
             },
         )
 
+    def infer_from_chunks(
+        self,
+        chunks: Iterable[Any],
+        source: Optional[str] = None,
+        format: Optional[str] = None,
+        distinct_tolerance: float = 0.02,
+    ) -> InferredSchema:
+        """
+        Infer schema from an iterable of DataFrame chunks in a single pass.
+
+        Memory is bounded by one chunk plus a fixed-size sketch per column.
+        Distinct counts are exact until a column exceeds 50k distinct values
+        and HyperLogLog estimates after that; such columns are listed in
+        ``metadata["approximate_distinct_columns"]`` and are primary key
+        candidates when the estimate is within ``distinct_tolerance`` of the
+        row count. Patterns are detected on a uniform reservoir sample.
+
+        Args:
+            chunks: pandas DataFrames with (mostly) the same columns
+            source: Optional source identifier
+            format: Format label for the result (default "dataframe")
+            distinct_tolerance: Relative error allowed for approximate keys
+
+        Returns:
+            InferredSchema object
+        """
+        sketches: Dict[str, ColumnSketch] = {}
+        dtypes: Dict[str, str] = {}
+        record_count = 0
+        chunk_count = 0
+
+        for chunk in chunks:
+            chunk_count += 1
+            for col in chunk.columns:
+                name = str(col)
+                sketch = sketches.get(name)
+                if sketch is None:
+                    # Column first seen mid-stream: earlier rows were null
+                    sketch = sketches[name] = ColumnSketch(
+                        name=name, count=record_count, null_count=record_count,
+                    )
+                col_data = chunk[col]
+                sketch.update(col_data, self._infer_column_type(col_data))
+                dtypes[name] = str(col_data.dtype)
+
+            record_count += len(chunk)
+            present = {str(c) for c in chunk.columns}
+            for name, sketch in sketches.items():
+                if name not in present:
+                    sketch.count += len(chunk)
+                    sketch.null_count += len(chunk)
+
+        columns = []
+        pk_candidates = []
+        approximate = []
+        for sketch in sketches.values():
+            columns.append(self._column_from_sketch(sketch))
+            if not sketch.distinct.is_exact:
+                approximate.append(sketch.name)
+
+            unique_count = columns[-1].unique_values
+            if sketch.null_count or unique_count is None:
+                continue
+            if unique_count == record_count or (
+                not sketch.distinct.is_exact
+                and abs(unique_count - record_count) <= distinct_tolerance * record_count
+            ):
+                pk_candidates.append(sketch.name)
+
+        return InferredSchema(
+            columns=columns,
+            record_count=record_count,
+            column_count=len(columns),
+            inferred_at=datetime.utcnow().isoformat() + "Z",
+            source=source,
+            format=format or "dataframe",
+            primary_key_candidates=pk_candidates,
+            metadata={
+                "dtypes": dtypes,
+                "streaming": True,
+                "chunk_count": chunk_count,
+                "approximate_distinct_columns": approximate,
+            },
+        )
+
+    def _column_from_sketch(self, sketch: ColumnSketch) -> ColumnSchema:
+        """Build a ColumnSchema from a merged column sketch."""
+        import pandas as pd
+
+        inferred_type = sketch.inferred_type
+        non_null_count = sketch.count - sketch.null_count
+
+        min_val = max_val = mean_val = None
+        if inferred_type in ("integer", "float") and sketch.numeric_count:
+            min_val, max_val = sketch.min_value, sketch.max_value
+            if inferred_type == "integer":
+                min_val, max_val = int(min_val), int(max_val)
+            mean_val = sketch.mean_value
+
+        return ColumnSchema(
+            name=sketch.name,
+            inferred_type=inferred_type,
+            nullable=sketch.null_count > 0,
+            unique_values=sketch.distinct.count() if non_null_count > 0 else None,
+            null_count=sketch.null_count,
+            sample_values=[self._convert_to_json_safe(v) for v in sketch.head_values],
+            min_value=min_val,
+            max_value=max_val,
+            mean_value=mean_val,
+            pattern=self._detect_pattern(pd.Series(sketch.sample.items, dtype=object)),
+        )
+
     def infer_from_records(
         self,
         records: List[Dict[str, Any]],
@@ -354,6 +474,51 @@ class SchemaInference:
         return value
 
 
+def _save_schema_artifact(result: InferredSchema) -> None:
+    """Store an inferred schema as a JSON artifact (best effort)."""
+    try:
+        run_id = new_run_id("schema_inference")
+
+        # Convert to dict for JSON
+        schema_dict = {
+            "columns": [
+                {
+                    "name": c.name,
+                    "type": c.inferred_type,
+                    "nullable": c.nullable,
+                    "unique_values": c.unique_values,
+                    "null_count": c.null_count,
+                    "sample_values": c.sample_values,
+                    "min_value": c.min_value,
+                    "max_value": c.max_value,
+                    "mean_value": c.mean_value,
+                    "pattern": c.pattern,
+                }
+                for c in result.columns
+            ],
+            "record_count": result.record_count,
+            "column_count": result.column_count,
+            "inferred_at": result.inferred_at,
+            "source": result.source,
+            "format": result.format,
+            "primary_key_candidates": result.primary_key_candidates,
+            "metadata": result.metadata,
+        }
+
+        store_text(
+            run_id=run_id,
+            category="schema_inference",
+            filename="schema.json",
+            text=json.dumps(schema_dict, indent=2, default=str),
+        )
+
+        result.metadata["artifact_run_id"] = run_id
+        logger.info(f"Saved schema artifact: {run_id}")
+
+    except Exception as e:
+        logger.warning(f"Failed to save artifact: {e}")
+
+
 def infer_schema(
     data: Union[Any, List[Dict]],
     source: Optional[str] = None,
@@ -384,61 +549,72 @@ def infer_schema(
 
     # Save artifact if requested
     if save_artifact:
-        try:
-            run_id = new_run_id("schema_inference")
-
-            # Convert to dict for JSON
-            schema_dict = {
-                "columns": [
-                    {
-                        "name": c.name,
-                        "type": c.inferred_type,
-                        "nullable": c.nullable,
-                        "unique_values": c.unique_values,
-                        "null_count": c.null_count,
-                        "sample_values": c.sample_values,
-                        "min_value": c.min_value,
-                        "max_value": c.max_value,
-                        "mean_value": c.mean_value,
-                        "pattern": c.pattern,
-                    }
-                    for c in result.columns
-                ],
-                "record_count": result.record_count,
-                "column_count": result.column_count,
-                "inferred_at": result.inferred_at,
-                "source": result.source,
-                "format": result.format,
-                "primary_key_candidates": result.primary_key_candidates,
-                "metadata": result.metadata,
-            }
-
-            store_text(
-                run_id=run_id,
-                category="schema_inference",
-                filename="schema.json",
-                text=json.dumps(schema_dict, indent=2, default=str),
-            )
+        _save_schema_artifact(result)
 
-            result.metadata["artifact_run_id"] = run_id
-            logger.info(f"Saved schema artifact: {run_id}")
+    return result
 
-        except Exception as e:
-            logger.warning(f"Failed to save artifact: {e}")
 
-    return result
+def iter_file_chunks(
+    file_path: Union[str, Path],
+    chunk_size: int = 100_000,
+) -> Iterator[Any]:
+    """
+    Read a data file as a sequence of DataFrame chunks.
+
+    CSV and JSONL are read with pandas' chunked readers and Parquet in
+    record batches; Excel and JSON documents cannot be streamed and are read
+    whole as a single chunk.
+
+    Args:
+        file_path: Path to the data file
+        chunk_size: Rows per chunk
+
+    Yields:
+        pandas DataFrames
+    """
+    import pandas as pd
+
+    path = Path(file_path)
+    ext = path.suffix.lower()
+
+    if ext == ".csv":
+        with pd.read_csv(path, chunksize=chunk_size) as reader:
+            yield from reader
+    elif ext == ".jsonl":
+        with pd.read_json(path, lines=True, chunksize=chunk_size) as reader:
+            yield from reader
+    elif ext == ".parquet":
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    elif ext in (".xlsx", ".xls"):
+        yield pd.read_excel(path)
+    elif ext == ".json":
+        yield pd.read_json(path)
+    else:
+        raise ValueError(f"Unsupported file format: {ext}")
 
 
 def infer_schema_from_file(
     file_path: Union[str, Path],
     save_artifact: bool = False,
+    streaming: bool = False,
+    chunk_size: int = 100_000,
 ) -> InferredSchema:
     """
     Infer schema from a file.
 
+    By default the first 10,000 rows (whole file for Parquet) are loaded and
+    profiled in memory. With ``streaming=True`` the entire file is profiled
+    chunk by chunk with bounded memory (see SchemaInference.infer_from_chunks).
+
     Args:
         file_path: Path to the data file
         save_artifact: Whether to save as artifact
+        streaming: Profile the whole file in chunks instead of loading it
+        chunk_size: Rows per chunk in streaming mode
 
     Returns:
         InferredSchema object
@@ -449,6 +625,16 @@ def infer_schema_from_file(
     try:
         import pandas as pd
 
+        if streaming:
+            result = SchemaInference().infer_from_chunks(
+                iter_file_chunks(path, chunk_size),
+                source=str(path),
+                format=ext.lstrip("."),
+            )
+            if save_artifact:
+                _save_schema_artifact(result)
+            return result
+
         if ext == ".csv":
             df = pd.read_csv(path, nrows=10000)
         elif ext in (".xlsx", ".xls"):
@@ -0,0 +1,245 @@
+"""
+Column Sketches
+
+Mergeable, fixed-memory column summaries for streaming schema inference:
+- HyperLogLog: approximate distinct counts (~0.4% standard error at p=16)
+- DistinctCounter: exact hash set for small cardinalities, HyperLogLog beyond
+- ReservoirSample: uniform fixed-size sample of an unbounded stream
+- ColumnSketch: per-column null/distinct/numeric/type statistics
+
+Every sketch supports ``merge`` so chunks (or Parquet row groups) can be
+summarized independently and combined in order.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def _hash_series(values: pd.Series) -> np.ndarray:
+    return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+
+def hash_values(values: pd.Series) -> np.ndarray:
+    """
+    64-bit hashes of the non-null values of a Series.
+
+    Integers are hashed as int64 (exact for large IDs). Floats holding
+    whole numbers are hashed as the same int64 so 5 and 5.0 collide across
+    chunks whose dtypes differ; other floats hash as float64.
+    """
+    if pd.api.types.is_bool_dtype(values.dtype) or pd.api.types.is_integer_dtype(values.dtype):
+        return _hash_series(values.astype("int64"))
+    if pd.api.types.is_float_dtype(values.dtype):
+        floats = values.to_numpy(dtype="float64")
+        whole = np.isfinite(floats) & (np.floor(floats) == floats) & (np.abs(floats) < 2.0 ** 63)
+        hashes = np.empty(len(floats), dtype=np.uint64)
+        hashes[whole] = _hash_series(pd.Series(floats[whole].astype("int64")))
+        hashes[~whole] = _hash_series(pd.Series(floats[~whole]))
+        return hashes
+    try:
+        return _hash_series(values)
+    except TypeError:
+        # Unhashable values (lists, dicts) hash by their string form
+        return _hash_series(values.astype(str))
+
+
+class HyperLogLog:
+    """HyperLogLog distinct-count sketch over precomputed 64-bit hashes."""
+
+    def __init__(self, precision: int = 14):
+        self.precision = precision
+        self.m = 1 << precision
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        if len(hashes) == 0:
+            return
+        hashes = hashes.astype(np.uint64, copy=False)
+        idx = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        rest = hashes << np.uint64(self.precision)
+        # Leading zeros of the remaining bits, via the float exponent
+        _, bit_length = np.frexp(rest.astype(np.float64))
+        rho = np.minimum(64 - bit_length, 64 - self.precision) + 1
+        np.maximum.at(self.registers, idx, rho.astype(np.uint8))
+
+    def merge(self, other: "HyperLogLog") -> None:
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self) -> int:
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            # Small-range correction (linear counting)
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+class DistinctCounter:
+    """Exact distinct count up to ``exact_limit`` values, HyperLogLog after.
+
+    Exact mode keeps a sorted uint64 array of hashes (8 bytes per value).
+    """
+
+    def __init__(self, exact_limit: int = 50_000, precision: int = 16):
+        self.exact_limit = exact_limit
+        self.precision = precision
+        self._exact: Optional[np.ndarray] = np.empty(0, dtype=np.uint64)
+        self._hll: Optional[HyperLogLog] = None
+
+    @property
+    def is_exact(self) -> bool:
+        return self._hll is None
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        if self._hll is not None:
+            self._hll.add_hashes(hashes)
+            return
+        self._exact = np.union1d(self._exact, hashes.astype(np.uint64, copy=False))
+        if len(self._exact) > self.exact_limit:
+            self._to_hll()
+
+    def _to_hll(self) -> None:
+        self._hll = HyperLogLog(self.precision)
+        self._hll.add_hashes(self._exact)
+        self._exact = None
+
+    def merge(self, other: "DistinctCounter") -> None:
+        if other._hll is not None:
+            if self._hll is None:
+                self._to_hll()
+            self._hll.merge(other._hll)
+        else:
+            self.add_hashes(other._exact)
+
+    def count(self) -> int:
+        return len(self._exact) if self._hll is None else self._hll.count()
+
+
+class ReservoirSample:
+    """Uniform random sample of at most ``size`` items from a stream (Algorithm R)."""
+
+    def __init__(self, size: int, seed: Optional[int] = None):
+        self.size = size
+        self.seen = 0
+        self.items: List[Any] = []
+        self._rng = np.random.default_rng(seed)
+
+    def add(self, values: np.ndarray) -> None:
+        n = len(values)
+        if n == 0:
+            return
+        fill = min(max(self.size - len(self.items), 0), n)
+        self.items.extend(values[:fill].tolist())
+        if fill < n:
+            # Item at stream position t replaces slot j ~ U[0, t] when j < size
+            positions = np.arange(self.seen + fill, self.seen + n)
+            slots = self._rng.integers(0, positions + 1)
+            for offset in np.flatnonzero(slots < self.size):
+                self.items[slots[offset]] = values[fill + offset]
+        self.seen += n
+
+    def merge(self, other: "ReservoirSample") -> None:
+        total = self.seen + other.seen
+        k = min(self.size, total)
+        if other.seen == 0:
+            return
+        if self.seen == 0:
+            self.items = list(other.items[:k])
+            self.seen = other.seen
+            return
+        # Items drawn from self ~ hypergeometric over the two populations
+        from_self = int(self._rng.hypergeometric(self.seen, other.seen, k))
+        mine = self._rng.permutation(len(self.items))[:from_self]
+        theirs = self._rng.permutation(len(other.items))[:k - from_self]
+        self.items = [self.items[i] for i in mine] + [other.items[i] for i in theirs]
+        self.seen = total
+
+
+# Type merge: chunks may infer different types for the same column
+_NUMERIC_TYPES = {"integer", "float"}
+
+
+def merge_inferred_types(types: List[str]) -> str:
+    """Combine per-chunk inferred types into one column type."""
+    distinct = set(types)
+    if not distinct:
+        return "string"
+    if len(distinct) == 1:
+        return distinct.pop()
+    if distinct <= _NUMERIC_TYPES:
+        return "float"
+    return "string"
+
+
+@dataclass
+class ColumnSketch:
+    """Streaming summary of one column."""
+
+    name: str
+    count: int = 0
+    null_count: int = 0
+    head_values: List[Any] = field(default_factory=list)  # first non-null values
+    chunk_types: List[str] = field(default_factory=list)  # types of non-empty chunks
+    numeric_count: int = 0
+    numeric_sum: float = 0.0
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+    distinct: DistinctCounter = field(default_factory=DistinctCounter)
+    sample: ReservoirSample = field(default_factory=lambda: ReservoirSample(100, seed=0))
+    head_size: int = 5
+
+    def update(self, values: pd.Series, chunk_type: str) -> None:
+        """Fold one chunk of the column into the sketch."""
+        self.count += len(values)
+        non_null = values.dropna()
+        self.null_count += len(values) - len(non_null)
+        if len(non_null) == 0:
+            return
+
+        self.chunk_types.append(chunk_type)
+        if len(self.head_values) < self.head_size:
+            self.head_values.extend(non_null.head(self.head_size - len(self.head_values)).tolist())
+
+        self.distinct.add_hashes(hash_values(non_null))
+        self.sample.add(non_null.to_numpy(dtype=object))
+
+        if chunk_type in _NUMERIC_TYPES:
+            numeric = pd.to_numeric(non_null, errors="coerce").dropna()
+            if len(numeric):
+                self._merge_numeric(len(numeric), float(numeric.astype("float64").sum()),
+                                    float(numeric.min()), float(numeric.max()))
+
+    def _merge_numeric(self, count: int, total: float, low: float, high: float) -> None:
+        self.numeric_count += count
+        self.numeric_sum += total
+        self.min_value = low if self.min_value is None else min(self.min_value, low)
+        self.max_value = high if self.max_value is None else max(self.max_value, high)
+
+    def merge(self, other: "ColumnSketch") -> None:
+        """Merge a sketch of later rows into this one."""
+        self.count += other.count
+        self.null_count += other.null_count
+        self.chunk_types.extend(other.chunk_types)
+        if len(self.head_values) < self.head_size:
+            self.head_values.extend(other.head_values[:self.head_size - len(self.head_values)])
+        self.distinct.merge(other.distinct)
+        self.sample.merge(other.sample)
+        if other.numeric_count:
+            self._merge_numeric(other.numeric_count, other.numeric_sum,
+                                other.min_value, other.max_value)
+
+    @property
+    def inferred_type(self) -> str:
+        return merge_inferred_types(self.chunk_types)
+
+    @property
+    def mean_value(self) -> Optional[float]:
+        return self.numeric_sum / self.numeric_count if self.numeric_count else None
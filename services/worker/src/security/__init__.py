@@ -3,6 +3,7 @@ Security module for Phase D: AI Ethics & Security
 
 Contains:
 - audit_anomaly_detector: ML-based anomaly detection for audit logs
+- streaming_anomaly_detector: Sliding-window detection over the audit stream
 """
 
 from .audit_anomaly_detector import (
@@ -14,6 +15,10 @@ from .audit_anomaly_detector import (
     detect_anomalies,
     is_anomaly_detection_available,
 )
+from .streaming_anomaly_detector import (
+    SlidingWindowCounter,
+    StreamingAnomalyDetector,
+)
 
 __all__ = [
     "AuditAnomalyDetector",
@@ -23,4 +28,6 @@ __all__ = [
     "AnomalySeverity",
     "detect_anomalies",
     "is_anomaly_detection_available",
+    "SlidingWindowCounter",
+    "StreamingAnomalyDetector",
 ]
@@ -0,0 +1,453 @@
+"""
+Streaming Audit Anomaly Detector
+
+Incremental counterpart to AuditAnomalyDetector for continuous detection over
+the audit stream. Instead of re-filtering the full entry list on every check,
+it keeps per-user and per-IP sliding-window counters (time-bucketed ring
+buffers) and emits AnomalyResults as entries arrive.
+
+Covered detections:
+- Brute force (auth failures per user / per IP)
+- PHI access spikes (current hour vs. baseline of previous hours)
+- Rate limit abuse (rate-limited requests per IP)
+
+Windows are driven by event timestamps, not wall-clock time, so batch
+replays of historical audit data produce the same alerts as live ingestion.
+Replays can be fed as columnar DataFrames via ``process_frame``.
+"""
+
+import math
+from collections import deque
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, List, Optional, Tuple
+import logging
+
+from .audit_anomaly_detector import (
+    AnomalyConfig,
+    AnomalyResult,
+    AnomalySeverity,
+    AnomalyType,
+    AuditEntry,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+AUTH_FAILURE_EVENTS = frozenset({"AUTH_FAILURE", "LOGIN_FAILED", "AUTHENTICATION_FAILURE"})
+PHI_EVENTS = frozenset({"PHI_ACCESS", "PHI_VIEW", "PHI_EXPORT"})
+RATE_LIMIT_EVENTS = frozenset({"RATE_LIMIT", "RATE_LIMITED", "429_ERROR"})
+
+# Number of completed hours kept as the PHI access baseline
+PHI_BASELINE_HOURS = 24
+
+_GLOBAL_KEY = "__all__"
+
+
+def _to_epoch_seconds(ts: datetime) -> float:
+    """Convert a datetime to epoch seconds, treating naive values as UTC."""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.timestamp()
+
+
+def _from_epoch_seconds(seconds: float) -> datetime:
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(tzinfo=None)
+
+
+class SlidingWindowCounter:
+    """
+    Fixed-size ring buffer of time buckets counting events in a sliding window.
+
+    The window is ``n_buckets * bucket_seconds`` long. Buckets are recycled
+    lazily as time advances, so memory is constant regardless of event rate.
+    Late events are counted while their bucket is still inside the window
+    ending at the newest bucket seen; older ones are dropped.
+    """
+
+    __slots__ = (
+        "bucket_seconds", "n_buckets", "_counts", "_bucket_ids", "_newest_bucket", "last_seen",
+    )
+
+    def __init__(self, window_seconds: float, bucket_seconds: float):
+        self.bucket_seconds = bucket_seconds
+        self.n_buckets = max(1, math.ceil(window_seconds / bucket_seconds))
+        self._counts = [0] * self.n_buckets
+        self._bucket_ids = [-1] * self.n_buckets
+        self._newest_bucket: Optional[int] = None
+        self.last_seen = 0.0
+
+    def add(self, epoch_seconds: float, count: int = 1) -> int:
+        """
+        Record ``count`` events at ``epoch_seconds`` and return the window total.
+
+        An event older than the window is dropped and 0 is returned, so it
+        can neither evict a live bucket nor raise an alert.
+        """
+        bucket = int(epoch_seconds // self.bucket_seconds)
+        if self._newest_bucket is not None and bucket <= self._newest_bucket - self.n_buckets:
+            return 0
+        if self._newest_bucket is None or bucket > self._newest_bucket:
+            self._newest_bucket = bucket
+
+        idx = bucket % self.n_buckets
+        # Buckets sharing a slot are n_buckets apart, so a surviving older id is stale
+        if self._bucket_ids[idx] < bucket:
+            self._bucket_ids[idx] = bucket
+            self._counts[idx] = 0
+        self._counts[idx] += count
+        self.last_seen = max(self.last_seen, epoch_seconds)
+        return self.total(epoch_seconds)
+
+    def total(self, epoch_seconds: float) -> int:
+        """Count of events in the window ending at ``epoch_seconds``."""
+        bucket = int(epoch_seconds // self.bucket_seconds)
+        oldest = bucket - self.n_buckets
+        return sum(
+            c for c, b in zip(self._counts, self._bucket_ids) if oldest < b <= bucket
+        )
+
+
+class _HourlyBaseline:
+    """Current-hour PHI access count plus a ring of completed hourly counts."""
+
+    __slots__ = ("current_hour", "current_count", "history")
+
+    def __init__(self, max_hours: int = PHI_BASELINE_HOURS):
+        self.current_hour = -1
+        self.current_count = 0
+        self.history: Deque[int] = deque(maxlen=max_hours)
+
+    def add(self, epoch_seconds: float) -> Tuple[int, Optional[float]]:
+        """
+        Record one access; return (current-hour count, baseline mean or None).
+
+        Accesses from an hour that has already closed are ignored (the
+        history keeps only counts, not hours) and return a None baseline.
+        """
+        hour = int(epoch_seconds // 3600)
+        if hour < self.current_hour:
+            return 0, None
+        if hour != self.current_hour:
+            if self.current_count > 0:
+                self.history.append(self.current_count)
+            self.current_hour = hour
+            self.current_count = 0
+        self.current_count += 1
+
+        baseline = sum(self.history) / len(self.history) if self.history else None
+        return self.current_count, baseline
+
+
+class StreamingAnomalyDetector:
+    """
+    Incremental anomaly detector over an audit entry stream.
+
+    Feed entries in (roughly) timestamp order with ``process_entry``,
+    ``process_entries`` or ``process_frame``. Each call returns the
+    AnomalyResults triggered by the new entries. An alert for a given
+    (type, user/IP) key is suppressed until its window has rolled over, so a
+    sustained attack produces one alert per window rather than one per entry.
+    """
+
+    def __init__(self, config: Optional[AnomalyConfig] = None):
+        self.config = config or AnomalyConfig()
+
+        self._brute_force_window = self.config.brute_force_window_minutes * 60
+        self._rate_limit_window = self.config.rate_limit_window_seconds
+
+        self._auth_by_user: Dict[str, SlidingWindowCounter] = {}
+        self._auth_by_ip: Dict[str, SlidingWindowCounter] = {}
+        self._auth_users_by_ip: Dict[str, Dict[str, float]] = {}
+        self._rate_by_ip: Dict[str, SlidingWindowCounter] = {}
+        self._rate_user_by_ip: Dict[str, Optional[str]] = {}
+        self._phi_by_user: Dict[str, _HourlyBaseline] = {}
+        self._suppressed_until: Dict[Tuple[AnomalyType, str], float] = {}
+
+        self.entries_processed = 0
+
+    # ------------------------------------------------------------------
+    # Window helpers
+    # ------------------------------------------------------------------
+
+    def _counter(
+        self,
+        table: Dict[str, SlidingWindowCounter],
+        key: str,
+        window_seconds: float,
+        bucket_seconds: float,
+    ) -> SlidingWindowCounter:
+        counter = table.get(key)
+        if counter is None:
+            counter = SlidingWindowCounter(window_seconds, bucket_seconds)
+            table[key] = counter
+        return counter
+
+    def _should_emit(
+        self, anomaly_type: AnomalyType, key: str, now: float, window_seconds: float
+    ) -> bool:
+        suppress_key = (anomaly_type, key)
+        if now < self._suppressed_until.get(suppress_key, float("-inf")):
+            return False
+        self._suppressed_until[suppress_key] = now + window_seconds
+        return True
+
+    def _passes_threshold(self, result: AnomalyResult) -> bool:
+        return result.detection_score >= self.config.alert_threshold
+
+    # ------------------------------------------------------------------
+    # Per-event detectors
+    # ------------------------------------------------------------------
+
+    def _on_auth_failure(
+        self, now: float, user_id: Optional[str], ip_address: Optional[str]
+    ) -> List[AnomalyResult]:
+        results: List[AnomalyResult] = []
+        threshold = self.config.brute_force_max_attempts
+        window_minutes = self.config.brute_force_window_minutes
+
+        if user_id:
+            count = self._counter(
+                self._auth_by_user, user_id, self._brute_force_window, 60
+            ).add(now)
+            if count >= threshold and self._should_emit(
+                AnomalyType.BRUTE_FORCE, f"user:{user_id}", now, self._brute_force_window
+            ):
+                results.append(AnomalyResult(
+                    anomaly_type=AnomalyType.BRUTE_FORCE,
+                    severity=AnomalySeverity.ALERT,
+                    user_id=user_id,
+                    ip_address=ip_address,
+                    description=f"Brute force detected: {count} failed logins for user {user_id[:8]}... in {window_minutes} minutes",
+                    detection_score=min(1.0, count / threshold),
+                    evidence={
+                        "attempt_count": count,
+                        "window_minutes": window_minutes,
+                        "threshold": threshold,
+                        "window_end": _from_epoch_seconds(now).isoformat(),
+                    }
+                ))
+
+        if ip_address:
+            count = self._counter(
+                self._auth_by_ip, ip_address, self._brute_force_window, 60
+            ).add(now)
+
+            users = self._auth_users_by_ip.setdefault(ip_address, {})
+            if user_id:
+                users[user_id] = now
+            cutoff = now - self._brute_force_window
+            for uid in [u for u, seen in users.items() if seen <= cutoff]:
+                del users[uid]
+
+            if count >= threshold and self._should_emit(
+                AnomalyType.BRUTE_FORCE, f"ip:{ip_address}", now, self._brute_force_window
+            ):
+                results.append(AnomalyResult(
+                    anomaly_type=AnomalyType.BRUTE_FORCE,
+                    severity=AnomalySeverity.CRITICAL,  # Higher severity for IP-based
+                    user_id=None,
+                    ip_address=ip_address,
+                    description=f"Distributed brute force from IP {ip_address}: {count} failed logins",
+                    detection_score=min(1.0, count / threshold),
+                    evidence={
+                        "attempt_count": count,
+                        "unique_users": len(users),
+                        "window_minutes": window_minutes,
+                        "window_end": _from_epoch_seconds(now).isoformat(),
+                    }
+                ))
+
+        return results
+
+    def _on_phi_access(
+        self, now: float, user_id: Optional[str], ip_address: Optional[str]
+    ) -> List[AnomalyResult]:
+        results: List[AnomalyResult] = []
+        multiplier = self.config.phi_spike_multiplier
+
+        keys = [_GLOBAL_KEY] + ([user_id] if user_id else [])
+        for key in keys:
+            baseline_tracker = self._phi_by_user.get(key)
+            if baseline_tracker is None:
+                baseline_tracker = _HourlyBaseline()
+                self._phi_by_user[key] = baseline_tracker
+
+            current_count, mean_count = baseline_tracker.add(now)
+            if not mean_count or current_count <= mean_count * multiplier:
+                continue
+            if not self._should_emit(AnomalyType.PHI_SPIKE, f"phi:{key}", now, 3600):
+                continue
+
+            results.append(AnomalyResult(
+                anomaly_type=AnomalyType.PHI_SPIKE,
+                severity=AnomalySeverity.ALERT,
+                user_id=None if key == _GLOBAL_KEY else key,
+                ip_address=ip_address,
+                description=f"PHI access spike: {current_count} accesses vs baseline of {mean_count:.1f}",
+                detection_score=min(1.0, current_count / (mean_count * multiplier)),
+                evidence={
+                    "current_count": current_count,
+                    "baseline_mean": round(mean_count, 2),
+                    "multiplier": round(current_count / mean_count, 2),
+                    "threshold_multiplier": multiplier,
+                    "baseline_hours": len(baseline_tracker.history),
+                }
+            ))
+
+        return results
+
+    def _on_rate_limited(
+        self, now: float, user_id: Optional[str], ip_address: Optional[str]
+    ) -> List[AnomalyResult]:
+        if not ip_address:
+            return []
+
+        threshold = self.config.rate_limit_threshold
+        count = self._counter(
+            self._rate_by_ip, ip_address, self._rate_limit_window, 1
+        ).add(now)
+        first_user = self._rate_user_by_ip.setdefault(ip_address, user_id)
+
+        if count < threshold or not self._should_emit(
+            AnomalyType.RATE_LIMIT_ABUSE, f"ip:{ip_address}", now, self._rate_limit_window
+        ):
+            return []
+
+        return [AnomalyResult(
+            anomaly_type=AnomalyType.RATE_LIMIT_ABUSE,
+            severity=AnomalySeverity.WARNING,
+            user_id=first_user,
+            ip_address=ip_address,
+            description=f"Rate limit abuse: {count} rate-limited requests from {ip_address}",
+            detection_score=min(1.0, count / threshold),
+            evidence={
+                "rate_limit_count": count,
+                "window_seconds": self._rate_limit_window,
+                "threshold": threshold,
+                "window_end": _from_epoch_seconds(now).isoformat(),
+            }
+        )]
+
+    def _process_event(
+        self,
+        event_type: str,
+        user_id: Optional[str],
+        ip_address: Optional[str],
+        now: float,
+    ) -> List[AnomalyResult]:
+        self.entries_processed += 1
+
+        if event_type in AUTH_FAILURE_EVENTS:
+            results = self._on_auth_failure(now, user_id, ip_address)
+        elif event_type in PHI_EVENTS:
+            results = self._on_phi_access(now, user_id, ip_address)
+        elif event_type in RATE_LIMIT_EVENTS:
+            results = self._on_rate_limited(now, user_id, ip_address)
+        else:
+            return []
+
+        return [r for r in results if self._passes_threshold(r)]
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def process_entry(self, entry: AuditEntry) -> List[AnomalyResult]:
+        """Update window state with a single entry and return new anomalies."""
+        return self._process_event(
+            entry.event_type,
+            entry.user_id,
+            entry.ip_address,
+            _to_epoch_seconds(entry.timestamp),
+        )
+
+    def process_entries(self, entries: Iterable[AuditEntry]) -> List[AnomalyResult]:
+        """Process entries in order and return all anomalies they trigger."""
+        results: List[AnomalyResult] = []
+        for entry in entries:
+            results.extend(self.process_entry(entry))
+        return results
+
+    def process_frame(self, df: "pd.DataFrame") -> List[AnomalyResult]:
+        """
+        Replay a columnar batch of audit entries.
+
+        Expects ``event_type``, ``user_id``, ``ip_address`` and ``timestamp``
+        columns. Rows are sorted by timestamp and irrelevant event types are
+        dropped up front, so only candidate rows reach the window counters.
+        """
+        import numpy as np
+        import pandas as pd
+
+        total_rows = len(df)
+        if total_rows == 0:
+            return []
+
+        relevant = AUTH_FAILURE_EVENTS | PHI_EVENTS | RATE_LIMIT_EVENTS
+        mask = df["event_type"].isin(relevant).to_numpy()
+        self.entries_processed += int(total_rows - mask.sum())
+
+        frame = df.loc[mask, ["event_type", "user_id", "ip_address", "timestamp"]]
+        if frame.empty:
+            return []
+
+        timestamps = pd.to_datetime(frame["timestamp"], utc=True)
+        # Unit-independent: datetime64[s]/[ms]/[us]/[ns] all map to seconds
+        epoch = (timestamps - pd.Timestamp(0, tz="UTC")) / pd.Timedelta(seconds=1)
+        order = np.argsort(epoch.to_numpy(), kind="stable")
+
+        event_types = frame["event_type"].to_numpy()[order]
+        user_ids = frame["user_id"].astype(object).where(frame["user_id"].notna(), None).to_numpy()[order]
+        ip_addresses = frame["ip_address"].astype(object).where(frame["ip_address"].notna(), None).to_numpy()[order]
+        epoch_seconds = epoch.to_numpy()[order]
+
+        results: List[AnomalyResult] = []
+        for event_type, user_id, ip_address, now in zip(
+            event_types, user_ids, ip_addresses, epoch_seconds
+        ):
+            results.extend(self._process_event(event_type, user_id, ip_address, float(now)))
+
+        logger.debug(
+            f"Streaming detector replayed {total_rows} entries "
+            f"({len(frame)} candidates), {len(results)} anomalies"
+        )
+        return results
+
+    def evict_idle(self, now: Optional[datetime] = None) -> int:
+        """
+        Drop per-key state that has seen no events for longer than its window.
+
+        Returns the number of evicted keys.
+        """
+        now_s = _to_epoch_seconds(now or datetime.utcnow())
+        evicted = 0
+
+        for table, window in (
+            (self._auth_by_user, self._brute_force_window),
+            (self._auth_by_ip, self._brute_force_window),
+            (self._rate_by_ip, self._rate_limit_window),
+        ):
+            for key in [k for k, c in table.items() if now_s - c.last_seen > window]:
+                del table[key]
+                evicted += 1
+
+        for ip in [ip for ip in self._auth_users_by_ip if ip not in self._auth_by_ip]:
+            del self._auth_users_by_ip[ip]
+        for ip in [ip for ip in self._rate_user_by_ip if ip not in self._rate_by_ip]:
+            del self._rate_user_by_ip[ip]
+        for key in [k for k, until in self._suppressed_until.items() if until < now_s]:
+            del self._suppressed_until[key]
+
+        return evicted
+
+    def get_state_summary(self) -> Dict[str, Any]:
+        """Summarize tracked keys for monitoring."""
+        return {
+            "entries_processed": self.entries_processed,
+            "tracked_users": len(self._auth_by_user),
+            "tracked_ips": len(set(self._auth_by_ip) | set(self._rate_by_ip)),
+            "phi_baselines": len(self._phi_by_user),
+            "suppressed_alerts": len(self._suppressed_until),
+        }
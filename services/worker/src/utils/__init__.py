@@ -9,6 +9,13 @@ from .template_loader import (
     RUO_DRAFT_DISCLAIMER,
 )
 
+from .file_hash import (
+    FileHashCache,
+    file_sha256,
+    get_file_hash_cache,
+    sha256_file,
+)
+
 from .keyword_extraction import (
     extract_keywords_tfidf,
     extract_keywords_rake,
@@ -28,4 +35,9 @@ __all__ = [
     "extract_keywords_rake",
     "extract_keywords_from_abstracts",
     "KeywordResult",
+    # File hashing
+    "FileHashCache",
+    "file_sha256",
+    "get_file_hash_cache",
+    "sha256_file",
 ]
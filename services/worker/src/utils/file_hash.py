@@ -0,0 +1,281 @@
+"""
+File Hash Cache
+
+Content-addressed SHA-256 digests of artifact files shared by bundling,
+export, figure provenance, ingestion manifests and Parquet fingerprinting.
+
+Digests are cached by file identity and version - (device, inode, size,
+mtime_ns) - in memory and, when ARTIFACT_HASH_CACHE_PATH is set, in a
+SQLite store shared by every worker process on the host. A file that is
+rewritten gets a new mtime (or inode) and is hashed again; unchanged
+files are hashed once no matter how many stages ask.
+
+Large files are hashed through mmap; many files are hashed with bounded
+thread parallelism (hashlib releases the GIL while digesting).
+
+Usage:
+    from utils.file_hash import file_sha256, get_file_hash_cache
+
+    digest = file_sha256("/data/artifacts/figure1.png")
+    digests = get_file_hash_cache().digest_many(paths)
+"""
+
+import hashlib
+import logging
+import mmap
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_HASH_CACHE_PATH = os.getenv("ARTIFACT_HASH_CACHE_PATH", "")
+
+# Files at least this large are hashed through mmap
+MMAP_MIN_BYTES = 16 * 1024 * 1024
+
+# Read size for smaller files
+READ_CHUNK_BYTES = 1024 * 1024
+
+# Files modified this recently are hashed but not cached: a rewrite within
+# the filesystem's timestamp granularity could keep size and mtime
+RACY_WINDOW_NS = 2_000_000_000
+
+StatKey = Tuple[int, int, int, int]
+PathLike = Union[str, Path]
+
+
+def stat_key(path: PathLike) -> StatKey:
+    """
+    Identity and version of a file: (device, inode, size, mtime_ns).
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    st = os.stat(path)
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def sha256_file(path: PathLike) -> str:
+    """
+    Compute the SHA-256 hex digest of a file without caching.
+
+    Args:
+        path: Path to file
+
+    Returns:
+        Hex digest of SHA-256 hash
+
+    Raises:
+        FileNotFoundError: If file does not exist
+    """
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                sha256.update(mm)
+        else:
+            while chunk := f.read(READ_CHUNK_BYTES):
+                sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+class FileHashCache:
+    """
+    SHA-256 digests of files, cached by (device, inode, size, mtime_ns).
+
+    Safe to share between threads; the SQLite store (optional) is safe to
+    share between processes on one host.
+
+    Usage:
+        cache = FileHashCache("/var/cache/researchflow/file_hashes.sqlite")
+        digest = cache.digest("/data/artifacts/bundle.zip")
+    """
+
+    def __init__(self, path: Optional[str] = None, max_workers: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite file for a persistent cache (None: memory only)
+            max_workers: Threads for digest_many (default: min(4, cpu_count))
+        """
+        self.path = Path(path) if path else None
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self._memory: Dict[StatKey, str] = {}
+        self._lock = threading.Lock()
+        self._conn = None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS file_hashes ("
+                " dev INTEGER NOT NULL,"
+                " ino INTEGER NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " mtime_ns INTEGER NOT NULL,"
+                " sha256 TEXT NOT NULL,"
+                " path TEXT,"
+                " hashed_at REAL NOT NULL,"
+                " PRIMARY KEY (dev, ino, size, mtime_ns))"
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the SQLite store."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def clear(self) -> None:
+        """Drop all cached digests."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM file_hashes")
+
+    def _lookup(self, key: StatKey) -> Optional[str]:
+        with self._lock:
+            digest = self._memory.get(key)
+            if digest is not None or self._conn is None:
+                return digest
+            row = self._conn.execute(
+                "SELECT sha256 FROM file_hashes"
+                " WHERE dev = ? AND ino = ? AND size = ? AND mtime_ns = ?",
+                key,
+            ).fetchone()
+            if row is not None:
+                self._memory[key] = row[0]
+                return row[0]
+        return None
+
+    def _store(self, key: StatKey, digest: str, path: PathLike) -> None:
+        with self._lock:
+            self._memory[key] = digest
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO file_hashes"
+                        " (dev, ino, size, mtime_ns, sha256, path, hashed_at)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (*key, digest, str(path), time.time()),
+                    )
+
+    def digest(self, path: PathLike) -> str:
+        """
+        SHA-256 hex digest of a file, hashing it only if not cached.
+
+        Args:
+            path: Path to file
+
+        Returns:
+            Hex digest of SHA-256 hash
+
+        Raises:
+            FileNotFoundError: If file does not exist
+        """
+        key = stat_key(path)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        started_ns = time.time_ns()
+        digest = sha256_file(path)
+        # Only cache if the file did not change while (or just before) hashing
+        if stat_key(path) == key and started_ns - key[3] > RACY_WINDOW_NS:
+            self._store(key, digest, path)
+        return digest
+
+    def digest_many(
+        self,
+        paths: Iterable[PathLike],
+        max_workers: Optional[int] = None
+    ) -> Dict[str, str]:
+        """
+        Digests of many files, hashing uncached files concurrently.
+
+        Paths naming the same file (repeats, hard links) are hashed once.
+        Missing or unreadable files are left out of the result.
+
+        Args:
+            paths: Paths to files
+            max_workers: Override the cache's thread count
+
+        Returns:
+            Dict mapping each path (as given, str) to its hex digest
+        """
+        by_key: Dict[StatKey, list] = {}
+        for path in paths:
+            try:
+                by_key.setdefault(stat_key(path), []).append(path)
+            except OSError as e:
+                logger.warning(f"Cannot hash {path}: {e}")
+
+        results: Dict[str, str] = {}
+        pending = []
+        for key, group in by_key.items():
+            cached = self._lookup(key)
+            if cached is None:
+                pending.append(group)
+            else:
+                results.update((str(p), cached) for p in group)
+
+        def _hash(group: list) -> Tuple[list, Optional[str]]:
+            try:
+                return group, self.digest(group[0])
+            except OSError as e:
+                logger.warning(f"Cannot hash {group[0]}: {e}")
+                return group, None
+
+        workers = min(max_workers or self.max_workers, len(pending))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                hashed = list(pool.map(_hash, pending))
+        else:
+            hashed = [_hash(group) for group in pending]
+
+        for group, digest in hashed:
+            if digest is not None:
+                results.update((str(p), digest) for p in group)
+        return results
+
+
+_default_cache: Optional[FileHashCache] = None
+_default_lock = threading.Lock()
+
+
+def get_file_hash_cache() -> FileHashCache:
+    """
+    Process-wide FileHashCache.
+
+    Persistent when ARTIFACT_HASH_CACHE_PATH is set; memory only otherwise,
+    or if the store cannot be opened.
+    """
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            try:
+                _default_cache = FileHashCache(ARTIFACT_HASH_CACHE_PATH or None)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"File hash store unavailable ({e}); using memory cache")
+                _default_cache = FileHashCache()
+        return _default_cache
+
+
+def file_sha256(path: PathLike) -> str:
+    """
+    Cached SHA-256 hex digest of a file (see FileHashCache.digest).
+
+    Raises:
+        FileNotFoundError: If file does not exist
+    """
+    return get_file_hash_cache().digest(path)
@@ -50,6 +50,11 @@ except ImportError:
     )
     sys.exit(1)
 
+try:
+    from ..utils.file_hash import file_sha256
+except ImportError:
+    from utils.file_hash import file_sha256
+
 
 def compute_file_hash(path: Path) -> str:
     """
@@ -67,13 +72,8 @@ def compute_file_hash(path: Path) -> str:
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
 
-    sha256 = hashlib.sha256()
-    with open(path, "rb") as f:
-        # Read in chunks for memory efficiency with large files
-        while chunk := f.read(8192):
-            sha256.update(chunk)
-
-    return sha256.hexdigest()
+    # Cached by (device, inode, size, mtime_ns); any rewrite is rehashed
+    return file_sha256(path)
 
 
 def compute_metadata_hash(path: Path) -> str:
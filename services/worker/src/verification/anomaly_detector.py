@@ -2,54 +2,294 @@
 Anomaly Detector - Layer 3
 
 Statistical outlier detection using IQR and Z-score.
+
+In-memory frames are checked with a single 2-D pass over all numeric
+columns. Chunked inputs (lists of frames, TextFileReader) and Dask
+DataFrames are checked out of core: per-chunk KLL quantile sketches and
+moments are merged, then outliers are counted exactly in a second pass
+when the input can be read twice, or estimated from the sketches when it
+cannot.
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+import warnings as py_warnings
+from functools import reduce
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 import pandas as pd
 import numpy as np
 
 from .layered_verifier import LayerResult, VerificationLayer, VerificationStatus
+from .quantile_sketch import KLLSketch
 
 logger = logging.getLogger(__name__)
 
+# Try to import Dask - may not be available in all environments
+try:
+    import dask
+    import dask.dataframe as dd
+    DASK_AVAILABLE = True
+except ImportError:
+    DASK_AVAILABLE = False
+    dd = None  # type: ignore
+
+
+class ColumnStats:
+    """
+    Mergeable per-column summary: KLL sketch plus count, mean and M2.
+
+    Built per chunk or partition and combined with ``merge``.
+    """
+
+    def __init__(self, sketch_k: int = 200):
+        self.sketch_k = sketch_k
+        self.rows = 0
+        self.columns: List[str] = []
+        self.sketches: Dict[str, KLLSketch] = {}
+        self.moments: Dict[str, Tuple[int, float, float]] = {}
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame, sketch_k: int = 200) -> "ColumnStats":
+        """Summarize the numeric columns of one chunk."""
+        stats = cls(sketch_k)
+        stats.rows = len(data)
+        numeric_cols = data.select_dtypes(include=[np.number]).columns
+        values = data[numeric_cols].to_numpy(dtype=float, na_value=np.nan)
+        counts = np.count_nonzero(~np.isnan(values), axis=0)
+        with py_warnings.catch_warnings():
+            py_warnings.simplefilter("ignore", RuntimeWarning)
+            means = np.nanmean(values, axis=0)
+            m2s = np.nansum((values - means) ** 2, axis=0)
+        for i, col in enumerate(numeric_cols):
+            sketch = KLLSketch(sketch_k)
+            sketch.update(values[:, i])
+            stats.columns.append(col)
+            stats.sketches[col] = sketch
+            stats.moments[col] = (int(counts[i]), float(means[i]) if counts[i] else 0.0, float(m2s[i]))
+        return stats
+
+    def merge(self, other: "ColumnStats") -> "ColumnStats":
+        """Merge another summary into this one (in place) and return self."""
+        self.rows += other.rows
+        for col in other.columns:
+            if col not in self.sketches:
+                self.columns.append(col)
+                self.sketches[col] = other.sketches[col]
+                self.moments[col] = other.moments[col]
+                continue
+            self.sketches[col].merge(other.sketches[col])
+            # Chan et al. parallel variance update
+            n_a, mean_a, m2_a = self.moments[col]
+            n_b, mean_b, m2_b = other.moments[col]
+            n = n_a + n_b
+            if n_b == 0:
+                continue
+            delta = mean_b - mean_a
+            self.moments[col] = (
+                n,
+                mean_a + delta * n_b / n,
+                m2_a + m2_b + delta ** 2 * n_a * n_b / n,
+            )
+        return self
+
+    def quantiles(self, q: List[float]) -> np.ndarray:
+        """Quantiles per column, shape (len(q), n_columns)."""
+        if not self.columns:
+            return np.empty((len(q), 0))
+        return np.column_stack([self.sketches[col].quantile(q) for col in self.columns])
+
+    def mean_std(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Mean and sample standard deviation per column."""
+        n, mean, m2 = (np.array(v, dtype=float) for v in zip(*self.moments.values())) \
+            if self.columns else (np.empty(0),) * 3
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std = np.sqrt(m2 / (n - 1))
+        return np.where(n > 0, mean, np.nan), std
+
 
 class AnomalyDetector:
     """Statistical anomaly detection for data quality"""
 
-    def __init__(self, iqr_multiplier: float = 1.5, zscore_threshold: float = 3.0):
+    def __init__(
+        self,
+        iqr_multiplier: float = 1.5,
+        zscore_threshold: float = 3.0,
+        sketch_k: int = 200,
+    ):
         self.iqr_multiplier = iqr_multiplier
         self.zscore_threshold = zscore_threshold
+        self.sketch_k = sketch_k
 
     def detect(
-        self, data: pd.DataFrame, context: Optional[Dict[str, Any]] = None
+        self, data: Any, context: Optional[Dict[str, Any]] = None
     ) -> LayerResult:
-        """Detect statistical anomalies in numeric columns"""
+        """
+        Detect statistical anomalies in numeric columns.
+
+        Accepts a pandas DataFrame, a Dask DataFrame, or an iterable of
+        DataFrame chunks (see detect_chunks).
+        """
+        if DASK_AVAILABLE and isinstance(data, dd.DataFrame):
+            return self.detect_dask(data, context)
+        if not isinstance(data, pd.DataFrame):
+            return self.detect_chunks(data, context)
+
         logger.info(f"Detecting anomalies in {len(data)} rows")
 
+        numeric_cols = data.select_dtypes(include=[np.number]).columns
+        if len(numeric_cols) == 0 or len(data) == 0:
+            # Nothing to measure; nanquantile rejects empty axes
+            no_outliers = np.zeros(len(numeric_cols), dtype=np.int64)
+            return self._result(list(numeric_cols), no_outliers, no_outliers, len(data))
+
+        values = data[numeric_cols].to_numpy(dtype=float, na_value=np.nan)
+
+        with py_warnings.catch_warnings():
+            # All-NaN columns yield NaN bounds and no outliers
+            py_warnings.simplefilter("ignore", RuntimeWarning)
+            q1, q3 = np.nanquantile(values, [0.25, 0.75], axis=0)
+            mean = np.nanmean(values, axis=0)
+            std = np.nanstd(values, axis=0, ddof=1)
+
+        lower, upper = self._iqr_bounds(q1, q3)
+        iqr_counts = ((values < lower) | (values > upper)).sum(axis=0)
+        z_counts = self._zscore_outliers(values, mean, std).sum(axis=0)
+
+        return self._result(list(numeric_cols), iqr_counts, z_counts, len(data))
+
+    def detect_chunks(
+        self, chunks: Iterable[pd.DataFrame], context: Optional[Dict[str, Any]] = None
+    ) -> LayerResult:
+        """
+        Detect anomalies over DataFrame chunks without holding them all.
+
+        Re-iterable inputs (e.g. a list of frames) are read twice: once to
+        build mergeable sketches and moments, once to count outliers
+        exactly against the sketched bounds. One-shot iterators (e.g.
+        TextFileReader) are read once and outlier counts are estimated
+        from the sketches.
+        """
+        single_pass = iter(chunks) is chunks
+        stats = reduce(
+            ColumnStats.merge,
+            (ColumnStats.from_frame(chunk, self.sketch_k) for chunk in chunks),
+            ColumnStats(self.sketch_k),
+        )
+        logger.info(f"Detecting anomalies in {stats.rows} rows (chunked)")
+
+        if single_pass:
+            return self._estimate_from_stats(stats)
+
+        lower, upper, mean, std = self._stats_bounds(stats)
+        counts = [self._count_chunk(chunk, stats.columns, lower, upper, mean, std) for chunk in chunks]
+        iqr_counts, z_counts = self._sum_counts(counts, stats.columns)
+        return self._result(stats.columns, iqr_counts, z_counts, stats.rows)
+
+    def detect_dask(
+        self, ddf: "dd.DataFrame", context: Optional[Dict[str, Any]] = None
+    ) -> LayerResult:
+        """Detect anomalies in a Dask DataFrame, summarizing partitions in parallel."""
+        if not DASK_AVAILABLE:
+            raise RuntimeError("Dask not available")
+
+        partitions = ddf.to_delayed()
+        partition_stats = dask.compute(*[
+            dask.delayed(ColumnStats.from_frame)(part, self.sketch_k) for part in partitions
+        ])
+        stats = reduce(ColumnStats.merge, partition_stats, ColumnStats(self.sketch_k))
+        logger.info(f"Detecting anomalies in {stats.rows} rows ({ddf.npartitions} partitions)")
+
+        lower, upper, mean, std = self._stats_bounds(stats)
+        counts = dask.compute(*[
+            dask.delayed(self._count_chunk)(part, stats.columns, lower, upper, mean, std)
+            for part in partitions
+        ])
+        iqr_counts, z_counts = self._sum_counts(counts, stats.columns)
+        return self._result(stats.columns, iqr_counts, z_counts, stats.rows)
+
+    def _iqr_bounds(self, q1: np.ndarray, q3: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        iqr = q3 - q1
+        return q1 - self.iqr_multiplier * iqr, q3 + self.iqr_multiplier * iqr
+
+    def _zscore_outliers(self, values: np.ndarray, mean: np.ndarray, std: np.ndarray) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            z = np.abs(values - mean) / np.where(std > 0, std, np.nan)
+        return z > self.zscore_threshold
+
+    def _stats_bounds(self, stats: ColumnStats):
+        q1, q3 = stats.quantiles([0.25, 0.75])
+        lower, upper = self._iqr_bounds(q1, q3)
+        mean, std = stats.mean_std()
+        return lower, upper, mean, std
+
+    def _count_chunk(
+        self,
+        chunk: pd.DataFrame,
+        columns: List[str],
+        lower: np.ndarray,
+        upper: np.ndarray,
+        mean: np.ndarray,
+        std: np.ndarray,
+    ) -> Dict[str, Tuple[int, int]]:
+        """IQR and z-score outlier counts for the numeric columns of one chunk."""
+        present = [i for i, col in enumerate(columns) if col in chunk.columns
+                   and pd.api.types.is_numeric_dtype(chunk[col])]
+        cols = [columns[i] for i in present]
+        values = chunk[cols].to_numpy(dtype=float, na_value=np.nan)
+        iqr = ((values < lower[present]) | (values > upper[present])).sum(axis=0)
+        z = self._zscore_outliers(values, mean[present], std[present]).sum(axis=0)
+        return {col: (int(iqr[j]), int(z[j])) for j, col in enumerate(cols)}
+
+    @staticmethod
+    def _sum_counts(
+        counts: Iterable[Dict[str, Tuple[int, int]]], columns: List[str]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Total per-chunk (iqr, zscore) counts in column order."""
+        totals = {col: [0, 0] for col in columns}
+        for chunk_counts in counts:
+            for col, (n_iqr, n_z) in chunk_counts.items():
+                totals[col][0] += n_iqr
+                totals[col][1] += n_z
+        arr = np.array([totals[col] for col in columns], dtype=np.int64).reshape(-1, 2)
+        return arr[:, 0], arr[:, 1]
+
+    def _estimate_from_stats(self, stats: ColumnStats) -> LayerResult:
+        lower, upper, mean, std = self._stats_bounds(stats)
+        iqr_counts = []
+        z_counts = []
+        for i, col in enumerate(stats.columns):
+            sketch = stats.sketches[col]
+            iqr_counts.append(round(sketch.count_below(lower[i]) + sketch.count_above(upper[i])))
+            if std[i] > 0:
+                cut = self.zscore_threshold * std[i]
+                z_counts.append(round(sketch.count_below(mean[i] - cut) + sketch.count_above(mean[i] + cut)))
+            else:
+                z_counts.append(0)
+        result = self._result(stats.columns, np.array(iqr_counts), np.array(z_counts), stats.rows)
+        result.metrics["approximate"] = not all(s.is_exact for s in stats.sketches.values())
+        return result
+
+    def _result(
+        self,
+        columns: List[str],
+        iqr_counts: np.ndarray,
+        z_counts: np.ndarray,
+        n_rows: int,
+    ) -> LayerResult:
         warnings = []
         metrics = {}
-        numeric_cols = data.select_dtypes(include=[np.number]).columns
 
         total_anomalies = 0
-        for col in numeric_cols:
-            # IQR method
-            Q1 = data[col].quantile(0.25)
-            Q3 = data[col].quantile(0.75)
-            IQR = Q3 - Q1
-            lower = Q1 - self.iqr_multiplier * IQR
-            upper = Q3 + self.iqr_multiplier * IQR
-            outliers = data[(data[col] < lower) | (data[col] > upper)]
-
-            if len(outliers) > 0:
-                pct = (len(outliers) / len(data)) * 100
-                warnings.append(f"{col}: {len(outliers)} outliers ({pct:.1f}%)")
-                total_anomalies += len(outliers)
-
-        metrics["columns_checked"] = len(numeric_cols)
+        for col, n_outliers in zip(columns, iqr_counts):
+            if n_outliers > 0:
+                pct = (n_outliers / n_rows) * 100
+                warnings.append(f"{col}: {n_outliers} outliers ({pct:.1f}%)")
+                total_anomalies += int(n_outliers)
+
+        metrics["columns_checked"] = len(columns)
         metrics["anomalies_detected"] = total_anomalies
+        metrics["zscore_outliers"] = int(np.sum(z_counts))
 
-        if total_anomalies > len(data) * 0.05:  # >5% anomalies
+        if total_anomalies > n_rows * 0.05:  # >5% anomalies
             status = VerificationStatus.WARNING
         else:
             status = VerificationStatus.PASSED
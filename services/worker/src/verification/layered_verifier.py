@@ -3,9 +3,14 @@ Layered Verification Framework
 
 Orchestrates multi-layer quality assurance checks with progressive validation.
 Each layer builds on the previous, providing defense-in-depth for data quality.
+
+The schema, concordance, anomaly and audit layers only read their inputs,
+so they can optionally run concurrently; results are still applied in
+layer order, giving the same outcome as a sequential run.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -110,11 +115,17 @@ class LayeredVerifier:
     - FAIL: Stop verification pipeline
     """
 
+    # Layers that depend on the results of earlier layers
+    DEPENDENT_LAYERS = (VerificationLayer.DIAGNOSTIC,)
+
     def __init__(
         self,
         stop_on_failure: bool = False,
         stop_on_warning: bool = False,
         enabled_layers: Optional[List[VerificationLayer]] = None,
+        concurrent_layers: bool = False,
+        max_workers: Optional[int] = None,
+        schema_chunk_size: Optional[int] = None,
     ):
         """
         Initialize layered verifier.
@@ -127,10 +138,20 @@ class LayeredVerifier:
             If True, stop verification on first WARNING layer
         enabled_layers : list of VerificationLayer, optional
             Layers to run (default: all layers)
+        concurrent_layers : bool
+            If True, run independent layers in a thread pool. Stop
+            conditions are applied in layer order, so the result matches
+            a sequential run (later layers may still have executed)
+        max_workers : int, optional
+            Threads for concurrent layers (default: one per layer)
+        schema_chunk_size : int, optional
+            Validate schemas in chunks of this many rows when possible
         """
         self.stop_on_failure = stop_on_failure
         self.stop_on_warning = stop_on_warning
         self.enabled_layers = enabled_layers or list(VerificationLayer)
+        self.concurrent_layers = concurrent_layers
+        self.max_workers = max_workers
 
         # Import layer implementations (avoid circular imports)
         from .schema_validator import SchemaValidator
@@ -140,7 +161,7 @@ class LayeredVerifier:
         from .explainable_diagnostics import ExplainableDiagnostics
 
         self.validators = {
-            VerificationLayer.SCHEMA: SchemaValidator(),
+            VerificationLayer.SCHEMA: SchemaValidator(chunk_size=schema_chunk_size),
             VerificationLayer.CONCORDANCE: ConcordanceChecker(),
             VerificationLayer.ANOMALY: AnomalyDetector(),
             VerificationLayer.AUDIT: AuditVerifier(),
@@ -189,57 +210,31 @@ class LayeredVerifier:
         logger.info(f"Data shape: {data.shape}")
         logger.info(f"Enabled layers: {[layer.name for layer in self.enabled_layers]}")
 
-        # Run each enabled layer
-        for layer in sorted(self.enabled_layers, key=lambda x: x.value):
-            logger.info(f"\n--- Layer {layer.value}: {layer.name} ---")
-
-            try:
-                layer_start = datetime.utcnow()
-
-                # Run layer-specific validation
-                if layer == VerificationLayer.SCHEMA and schema_name:
-                    result = self.validators[layer].validate(data, schema_name)
-                elif layer == VerificationLayer.CONCORDANCE and linkage_df is not None:
-                    result = self.validators[layer].check(data, linkage_df)
-                elif layer == VerificationLayer.ANOMALY:
-                    result = self.validators[layer].detect(data, context)
-                elif layer == VerificationLayer.AUDIT and audit_log is not None:
-                    result = self.validators[layer].verify(audit_log)
-                elif layer == VerificationLayer.DIAGNOSTIC:
-                    # Diagnostic layer uses results from previous layers
-                    result = self.validators[layer].diagnose(
-                        data, layer_results, context
-                    )
+        layers = sorted(self.enabled_layers, key=lambda x: x.value)
+        inputs = (data, schema_name, linkage_df, audit_log, context)
+
+        if self.concurrent_layers:
+            independent = [l for l in layers if l not in self.DEPENDENT_LAYERS]
+            pool = ThreadPoolExecutor(max_workers=self.max_workers or max(1, len(independent)))
+            futures = {
+                layer: pool.submit(self._run_layer, layer, *inputs, layer_results)
+                for layer in independent
+            }
+        else:
+            pool = None
+            futures = {}
+
+        try:
+            # Apply layer results in order
+            for layer in layers:
+                logger.info(f"\n--- Layer {layer.value}: {layer.name} ---")
+
+                if layer in futures:
+                    result = futures[layer].result()
                 else:
-                    logger.warning(
-                        f"Layer {layer.name} skipped (missing required data)"
-                    )
-                    result = LayerResult(
-                        layer=layer,
-                        status=VerificationStatus.SKIPPED,
-                        passed=True,
-                        warnings=[f"Layer skipped: missing required data"],
-                    )
-
-                layer_end = datetime.utcnow()
-                result.execution_time_ms = (
-                    layer_end - layer_start
-                ).total_seconds() * 1000
+                    result = self._run_layer(layer, *inputs, layer_results)
                 layer_results[layer] = result
-
-                # Log layer result
-                status_emoji = (
-                    "✅"
-                    if result.passed
-                    else ("⚠️" if result.status == VerificationStatus.WARNING else "❌")
-                )
-                logger.info(f"{status_emoji} {layer.name}: {result.status.value}")
-                if result.warnings:
-                    logger.warning(f"  Warnings: {len(result.warnings)}")
-                if result.errors:
-                    logger.error(f"  Errors: {len(result.errors)}")
-                if result.metrics:
-                    logger.info(f"  Metrics: {result.metrics}")
+                self._log_layer_result(layer, result)
 
                 # Check stop conditions
                 if result.status == VerificationStatus.FAILED and self.stop_on_failure:
@@ -248,17 +243,11 @@ class LayeredVerifier:
                 if result.status == VerificationStatus.WARNING and self.stop_on_warning:
                     logger.warning(f"Stopping verification: {layer.name} WARNING")
                     break
-
-            except Exception as e:
-                logger.exception(f"Layer {layer.name} raised exception")
-                layer_results[layer] = LayerResult(
-                    layer=layer,
-                    status=VerificationStatus.FAILED,
-                    passed=False,
-                    errors=[f"Exception: {str(e)}"],
-                )
-                if self.stop_on_failure:
-                    break
+        finally:
+            if pool is not None:
+                for future in futures.values():
+                    future.cancel()
+                pool.shutdown(wait=True)
 
         # Compute overall result
         end_time = datetime.utcnow()
@@ -304,6 +293,75 @@ class LayeredVerifier:
 
         return result
 
+    def _run_layer(
+        self,
+        layer: VerificationLayer,
+        data: pd.DataFrame,
+        schema_name: Optional[str],
+        linkage_df: Optional[pd.DataFrame],
+        audit_log: Optional[pd.DataFrame],
+        context: Optional[Dict[str, Any]],
+        layer_results: Dict[VerificationLayer, LayerResult],
+    ) -> LayerResult:
+        """Run one layer, converting exceptions into a FAILED result."""
+        try:
+            layer_start = datetime.utcnow()
+
+            # Run layer-specific validation
+            if layer == VerificationLayer.SCHEMA and schema_name:
+                result = self.validators[layer].validate(data, schema_name)
+            elif layer == VerificationLayer.CONCORDANCE and linkage_df is not None:
+                result = self.validators[layer].check(data, linkage_df)
+            elif layer == VerificationLayer.ANOMALY:
+                result = self.validators[layer].detect(data, context)
+            elif layer == VerificationLayer.AUDIT and audit_log is not None:
+                result = self.validators[layer].verify(audit_log)
+            elif layer == VerificationLayer.DIAGNOSTIC:
+                # Diagnostic layer uses results from previous layers
+                result = self.validators[layer].diagnose(
+                    data, layer_results, context
+                )
+            else:
+                logger.warning(
+                    f"Layer {layer.name} skipped (missing required data)"
+                )
+                result = LayerResult(
+                    layer=layer,
+                    status=VerificationStatus.SKIPPED,
+                    passed=True,
+                    warnings=[f"Layer skipped: missing required data"],
+                )
+
+            layer_end = datetime.utcnow()
+            result.execution_time_ms = (
+                layer_end - layer_start
+            ).total_seconds() * 1000
+            return result
+
+        except Exception as e:
+            logger.exception(f"Layer {layer.name} raised exception")
+            return LayerResult(
+                layer=layer,
+                status=VerificationStatus.FAILED,
+                passed=False,
+                errors=[f"Exception: {str(e)}"],
+            )
+
+    def _log_layer_result(self, layer: VerificationLayer, result: LayerResult) -> None:
+        """Log the outcome of one layer."""
+        status_emoji = (
+            "✅"
+            if result.passed
+            else ("⚠️" if result.status == VerificationStatus.WARNING else "❌")
+        )
+        logger.info(f"{status_emoji} {layer.name}: {result.status.value}")
+        if result.warnings:
+            logger.warning(f"  Warnings: {len(result.warnings)}")
+        if result.errors:
+            logger.error(f"  Errors: {len(result.errors)}")
+        if result.metrics:
+            logger.info(f"  Metrics: {result.metrics}")
+
     def verify_dataset(
         self,
         dataset_path: Path,
@@ -0,0 +1,136 @@
+"""
+Quantile Sketch
+
+Mergeable KLL quantile sketch for streaming and partitioned data.
+
+A sketch summarizes a stream of numbers in O(k log(n/k)) memory and
+answers quantile and rank queries with rank error of roughly 1.7/k of n.
+Sketches built on separate chunks or partitions merge into a sketch of
+the combined data. Until the first compaction (at most k values) all
+values are kept and answers are exact, matching numpy's linear quantiles.
+
+Reference: Karnin, Lang & Liberty, "Optimal Quantile Approximation in
+Streams" (FOCS 2016).
+"""
+
+import logging
+from typing import List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch over float values (NaNs are ignored).
+
+    Usage:
+        sketch = KLLSketch()
+        for chunk in chunks:
+            sketch.update(chunk["age"].to_numpy())
+        q1, q3 = sketch.quantile([0.25, 0.75])
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = 0):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            k: Accuracy parameter (capacity of the top compactor)
+            seed: Seed for the compaction coin flips (None: random)
+        """
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.count = 0
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def is_exact(self) -> bool:
+        """Whether all values are still held (no compaction yet)."""
+        return len(self.levels) == 1
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - 1 - level
+        return max(8, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if items.size > self._capacity(level):
+                items = np.sort(items)
+                # An odd item out stays behind so total weight is preserved
+                keep = items[items.size - items.size % 2:]
+                promoted = items[self._rng.integers(2):items.size - keep.size:2]
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+                self.levels[level] = keep
+            level += 1
+
+    def update(self, values) -> None:
+        """Add values (any array-like; NaNs are skipped)."""
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.count += values.size
+        self._compress()
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """Merge another sketch into this one (in place) and return self."""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def _weighted(self):
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([
+            np.full(items_h.size, 2 ** level, dtype=np.int64)
+            for level, items_h in enumerate(self.levels)
+        ])
+        order = np.argsort(items, kind="stable")
+        return items[order], np.cumsum(weights[order])
+
+    def quantile(self, q) -> np.ndarray:
+        """
+        Estimate quantiles.
+
+        Args:
+            q: Quantile or array of quantiles in [0, 1]
+
+        Returns:
+            Array of estimates (NaN for an empty sketch)
+        """
+        q = np.asarray(q, dtype=float)
+        if self.count == 0:
+            return np.full(q.shape, np.nan)
+        if self.is_exact:
+            return np.quantile(self.levels[0], q)
+        items, cumulative = self._weighted()
+        idx = np.searchsorted(cumulative, q * self.count, side="left")
+        return items[np.minimum(idx, items.size - 1)]
+
+    def count_below(self, x: float) -> float:
+        """Estimated number of values strictly below x."""
+        if self.is_exact:
+            return float(np.count_nonzero(self.levels[0] < x))
+        items, cumulative = self._weighted()
+        idx = np.searchsorted(items, x, side="left")
+        return float(cumulative[idx - 1]) if idx > 0 else 0.0
+
+    def count_above(self, x: float) -> float:
+        """Estimated number of values strictly above x."""
+        if self.is_exact:
+            return float(np.count_nonzero(self.levels[0] > x))
+        items, cumulative = self._weighted()
+        idx = np.searchsorted(items, x, side="right")
+        return float(self.count - (cumulative[idx - 1] if idx > 0 else 0))
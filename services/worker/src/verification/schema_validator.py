@@ -3,10 +3,15 @@ Schema Validator - Layer 1
 
 Validates data against Pandera schemas with type checking, null constraints,
 and range validation.
+
+Large frames can be validated in row chunks when every check in the schema
+is row-local; failure cases from all chunks are aggregated lazily and
+summarized with a capped number of examples per failing check. Whole-frame
+validation reports every failure case, in Pandera's order.
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import pandas as pd
 import pandera as pa
 from pathlib import Path
@@ -15,6 +20,120 @@ from .layered_verifier import LayerResult, VerificationLayer, VerificationStatus
 
 logger = logging.getLogger(__name__)
 
+# Built-in Pandera checks that only look at one value at a time
+ROW_LOCAL_CHECKS = frozenset({
+    "equal_to", "not_equal_to", "greater_than", "greater_than_or_equal_to",
+    "less_than", "less_than_or_equal_to", "in_range", "isin", "notin",
+    "str_matches", "str_contains", "str_startswith", "str_endswith", "str_length",
+})
+
+# Example failures listed per (column, check)
+MAX_FAILURE_EXAMPLES = 5
+
+
+def is_chunkable(schema: pa.DataFrameSchema) -> bool:
+    """
+    Whether validating row chunks separately gives the same failures.
+
+    False for uniqueness constraints, dataframe-wide checks and custom
+    checks that are not element-wise (they may aggregate over the column).
+    """
+    if schema.checks or getattr(schema, "unique", None):
+        return False
+    fields = list(schema.columns.values())
+    if schema.index is not None:
+        if isinstance(schema.index, pa.MultiIndex):
+            return False
+        fields.append(schema.index)
+    for field_schema in fields:
+        if field_schema.unique:
+            return False
+        for check in field_schema.checks:
+            if not (check.element_wise or check.name in ROW_LOCAL_CHECKS):
+                return False
+    return True
+
+
+def order_failure_cases(
+    failure_cases: pd.DataFrame, schema: pa.DataFrameSchema, data: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Put failure cases in a canonical order: schema-wide failures first,
+    then by schema column, check and row position.
+    """
+    positions = {name: i for i, name in enumerate(schema.columns)}
+    column_rank = failure_cases["column"].map(positions)
+    column_rank = column_rank.where(failure_cases["column"].notna(), -1).fillna(len(positions))
+    # First position of each index label (-1 for schema-wide failures)
+    row = pd.Index(data.index.unique()).get_indexer(failure_cases["index"])
+    return (
+        failure_cases.assign(
+            _rank=column_rank.to_numpy(), _check=failure_cases["check"].astype(str), _row=row
+        )
+        .sort_values(["_rank", "_check", "_row"], kind="stable")
+        .drop(columns=["_rank", "_check", "_row"])
+        .reset_index(drop=True)
+    )
+
+
+def failure_case_messages(failure_cases: pd.DataFrame) -> List[str]:
+    """One error message per failure case, in the given order."""
+    return [
+        f"Column '{column}', Index {index}: {check}"
+        for column, index, check in zip(
+            failure_cases["column"], failure_cases["index"], failure_cases["check"]
+        )
+    ]
+
+
+def failure_case_metrics(failure_cases: pd.DataFrame) -> Dict[str, Any]:
+    """Violation count overall and per column."""
+    return {
+        "total_violations": len(failure_cases),
+        "violation_summary": failure_cases.groupby("column")["check"].count().to_dict(),
+    }
+
+
+def summarize_failure_cases(
+    failure_cases: pd.DataFrame, max_examples: int = MAX_FAILURE_EXAMPLES
+) -> Tuple[List[str], Dict[str, Any]]:
+    """
+    Summarize Pandera failure cases without iterating over every row.
+
+    Parameters
+    ----------
+    failure_cases : pd.DataFrame
+        ``SchemaErrors.failure_cases``
+    max_examples : int
+        Example failures listed per (column, check)
+
+    Returns
+    -------
+    tuple
+        (error messages, metrics with total_violations and violation_summary)
+    """
+    column = failure_cases["column"].astype(str)
+    check = failure_cases["check"].astype(str)
+    grouped = pd.DataFrame({"column": column, "check": check}).groupby(
+        ["column", "check"], sort=False
+    )
+    counts = grouped.size()
+
+    shown = (grouped.cumcount() < max_examples).to_numpy()
+    messages = (
+        "Column '" + column[shown] + "', Index "
+        + failure_cases["index"][shown].astype(str) + ": " + check[shown]
+    )
+
+    errors = []
+    for key, group_messages in messages.groupby([column[shown], check[shown]], sort=False):
+        errors.extend(group_messages.tolist())
+        hidden = counts[key] - len(group_messages)
+        if hidden > 0:
+            errors.append(f"Column '{key[0]}': {hidden} more failures of {key[1]}")
+
+    return errors, failure_case_metrics(failure_cases)
+
 
 class SchemaValidator:
     """
@@ -27,7 +146,12 @@ class SchemaValidator:
     - Custom validators (regex, custom functions)
     """
 
-    def __init__(self, schema_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        schema_dir: Optional[Path] = None,
+        chunk_size: Optional[int] = None,
+        max_failure_examples: int = MAX_FAILURE_EXAMPLES,
+    ):
         """
         Initialize schema validator.
 
@@ -35,8 +159,16 @@ class SchemaValidator:
         ----------
         schema_dir : Path, optional
             Directory containing Pandera schema definitions
+        chunk_size : int, optional
+            Validate in chunks of this many rows when the schema allows it
+            (default: whole frame at once)
+        max_failure_examples : int
+            Example failures reported per failing (column, check) when
+            validating in chunks
         """
         self.schema_dir = schema_dir or Path("schemas/pandera")
+        self.chunk_size = chunk_size
+        self.max_failure_examples = max_failure_examples
         self.schemas = {}
         logger.info(f"Initialized SchemaValidator with schema_dir: {self.schema_dir}")
 
@@ -100,7 +232,28 @@ class SchemaValidator:
             schema = self.load_schema(schema_name)
 
             # Validate
-            validated_data = schema.validate(data, lazy=True)
+            failure_cases, chunked = self._failure_cases(schema, data)
+            if failure_cases is not None:
+                # Pandera schema errors (multiple violations)
+                logger.error(f"Schema validation FAILED: {len(failure_cases)} violations")
+
+                if chunked:
+                    # Summarize error details with capped examples
+                    errors, summary = summarize_failure_cases(
+                        order_failure_cases(failure_cases, schema, data), self.max_failure_examples
+                    )
+                else:
+                    errors = failure_case_messages(failure_cases)
+                    summary = failure_case_metrics(failure_cases)
+                metrics.update(summary)
+
+                return LayerResult(
+                    layer=VerificationLayer.SCHEMA,
+                    status=VerificationStatus.FAILED,
+                    passed=False,
+                    errors=errors,
+                    metrics=metrics,
+                )
 
             # Count validation checks passed
             metrics["rows_validated"] = len(data)
@@ -118,30 +271,6 @@ class SchemaValidator:
                 metrics=metrics,
             )
 
-        except pa.errors.SchemaErrors as e:
-            # Pandera schema errors (multiple violations)
-            logger.error(f"Schema validation FAILED: {len(e.failure_cases)} violations")
-
-            # Extract error details
-            for idx, row in e.failure_cases.iterrows():
-                error_msg = (
-                    f"Column '{row['column']}', Index {row['index']}: {row['check']}"
-                )
-                errors.append(error_msg)
-
-            metrics["total_violations"] = len(e.failure_cases)
-            metrics["violation_summary"] = (
-                e.failure_cases.groupby("column")["check"].count().to_dict()
-            )
-
-            return LayerResult(
-                layer=VerificationLayer.SCHEMA,
-                status=VerificationStatus.FAILED,
-                passed=False,
-                errors=errors,
-                metrics=metrics,
-            )
-
         except pa.errors.SchemaError as e:
             # Single schema error
             logger.error(f"Schema validation FAILED: {e}")
@@ -165,6 +294,40 @@ class SchemaValidator:
                 errors=errors,
             )
 
+    def _failure_cases(
+        self, schema: pa.DataFrameSchema, data: pd.DataFrame
+    ) -> Tuple[Optional[pd.DataFrame], bool]:
+        """
+        Validate lazily, chunk-wise when possible.
+
+        Returns
+        -------
+        tuple
+            (failure cases of all chunks combined, or None if the data is
+            valid; whether the data was validated in chunks)
+        """
+        if not self.chunk_size or len(data) <= self.chunk_size or not is_chunkable(schema):
+            try:
+                schema.validate(data, lazy=True)
+            except pa.errors.SchemaErrors as e:
+                return e.failure_cases, False
+            return None, False
+
+        chunk_failures = []
+        for start in range(0, len(data), self.chunk_size):
+            try:
+                schema.validate(data.iloc[start:start + self.chunk_size], lazy=True)
+            except pa.errors.SchemaErrors as e:
+                chunk_failures.append(e.failure_cases)
+
+        if not chunk_failures:
+            return None, True
+
+        failure_cases = pd.concat(chunk_failures, ignore_index=True)
+        # Schema-level failures (no row index) are reported by every chunk
+        repeated = failure_cases["index"].isna() & failure_cases.astype(str).duplicated()
+        return failure_cases[~repeated].reset_index(drop=True), True
+
 
 def validate_schema(
     data: pd.DataFrame, schema_name: str, strict: bool = False
@@ -8,7 +8,6 @@ Handles artifact packaging for sharing and archiving including:
 - Dublin Core metadata manifest generation
 """
 
-import hashlib
 import json
 import logging
 import os
@@ -19,6 +18,11 @@ from typing import Any, Dict, List, Optional
 from ..types import StageContext, StageResult
 from ..registry import register_stage
 
+try:
+    from ...utils.file_hash import file_sha256, get_file_hash_cache
+except ImportError:
+    from utils.file_hash import file_sha256, get_file_hash_cache
+
 logger = logging.getLogger("workflow_engine.stages.stage_15_bundling")
 
 # Supported bundle formats
@@ -56,6 +60,9 @@ def generate_bundle_id() -> str:
 def compute_artifact_checksum(artifact_path: str) -> Optional[str]:
     """Compute SHA256 checksum of an artifact file.
 
+    Digests come from the shared file hash cache, so artifacts already
+    hashed by earlier stages are not read again.
+
     Args:
         artifact_path: Path to the artifact file
 
@@ -65,12 +72,8 @@ def compute_artifact_checksum(artifact_path: str) -> Optional[str]:
     if not os.path.exists(artifact_path):
         return None
 
-    sha256 = hashlib.sha256()
     try:
-        with open(artifact_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        return file_sha256(artifact_path)
     except Exception:
         return None
 
@@ -251,9 +254,10 @@ class ArtifactBundlingStage:
             # Collect artifact metadata
             artifact_metadata: List[Dict[str, Any]] = []
             total_size = 0
+            checksums = get_file_hash_cache().digest_many(artifact_selection)
 
             for artifact_path in artifact_selection:
-                checksum = compute_artifact_checksum(artifact_path)
+                checksum = checksums.get(str(artifact_path))
                 if os.path.exists(artifact_path):
                     size = os.path.getsize(artifact_path)
                     total_size += size
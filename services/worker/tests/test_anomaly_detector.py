@@ -0,0 +1,126 @@
+"""
+Tests for vectorized and sketch-based streaming anomaly detection.
+
+The vectorized path must reproduce the original per-column loop; the
+chunked path must agree with it exactly when the input can be re-read
+and closely when counts are estimated from the sketches.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.verification.anomaly_detector import AnomalyDetector
+from src.verification.layered_verifier import VerificationStatus
+from src.verification.quantile_sketch import KLLSketch
+
+
+@pytest.fixture
+def cohort():
+    """Numeric columns with heavy tails, missing values and a constant."""
+    rng = np.random.default_rng(11)
+    n = 20_000
+    df = pd.DataFrame({
+        "age": rng.integers(18, 90, n),
+        "bmi": rng.normal(27, 4, n),
+        "crp": rng.lognormal(1, 1, n),
+        "visits": pd.array(rng.poisson(3, n), dtype="Int64"),
+        "site": 1,
+        "sex": rng.choice(["F", "M"], n),
+    })
+    df.loc[::50, "bmi"] = np.nan
+    df.loc[::13, "visits"] = pd.NA
+    return df
+
+
+def _loop_counts(data, multiplier=1.5):
+    """Reference: the original per-column IQR loop."""
+    counts = {}
+    for col in data.select_dtypes(include=[np.number]).columns:
+        values = data[col].dropna()
+        q1, q3 = values.quantile(0.25), values.quantile(0.75)
+        iqr = q3 - q1
+        outliers = values[(values < q1 - multiplier * iqr) | (values > q3 + multiplier * iqr)]
+        counts[col] = len(outliers)
+    return counts
+
+
+def _chunks(df, size):
+    return [df.iloc[i:i + size] for i in range(0, len(df), size)]
+
+
+def test_vectorized_matches_per_column_loop(cohort):
+    result = AnomalyDetector().detect(cohort)
+    expected = _loop_counts(cohort)
+
+    assert result.passed
+    assert result.metrics["columns_checked"] == len(expected)
+    assert result.metrics["anomalies_detected"] == sum(expected.values())
+    n_warned = sum(1 for n in expected.values() if n > 0)
+    assert len(result.warnings) == n_warned
+    pct = expected["crp"] / len(cohort) * 100
+    assert f"crp: {expected['crp']} outliers ({pct:.1f}%)" in result.warnings
+
+
+def test_chunked_two_pass_matches_in_memory(cohort):
+    whole = AnomalyDetector(sketch_k=50_000).detect(cohort)
+    chunked = AnomalyDetector(sketch_k=50_000).detect(_chunks(cohort, 3_000))
+
+    assert chunked.warnings == whole.warnings
+    assert chunked.metrics == whole.metrics
+    assert chunked.status == whole.status
+
+
+def test_single_pass_iterator_estimates_counts(cohort):
+    whole = AnomalyDetector().detect(cohort)
+    streamed = AnomalyDetector().detect(iter(_chunks(cohort, 3_000)))
+
+    assert streamed.metrics["approximate"]
+    assert streamed.metrics["columns_checked"] == whole.metrics["columns_checked"]
+    expected = whole.metrics["anomalies_detected"]
+    assert abs(streamed.metrics["anomalies_detected"] - expected) <= 0.1 * expected
+
+
+def test_all_outlier_frame_warns():
+    df = pd.DataFrame({"x": [0.0] * 90 + [100.0] * 10})
+    result = AnomalyDetector().detect(df)
+    assert result.metrics["anomalies_detected"] == 10
+    assert result.status == VerificationStatus.WARNING
+
+
+def test_merged_sketch_quantiles():
+    rng = np.random.default_rng(3)
+    parts = [rng.normal(i, 1, 25_000) for i in range(4)]
+    sketches = []
+    for part in parts:
+        sketch = KLLSketch(k=200)
+        sketch.update(part)
+        sketches.append(sketch)
+    merged = sketches[0]
+    for sketch in sketches[1:]:
+        merged.merge(sketch)
+
+    values = np.concatenate(parts)
+    assert merged.count == values.size
+    q = np.array([0.01, 0.25, 0.5, 0.75, 0.99])
+    ranks = np.searchsorted(np.sort(values), merged.quantile(q)) / values.size
+    assert np.all(np.abs(ranks - q) < 0.02)
+    assert abs(merged.count_below(np.median(values)) - values.size / 2) < 0.02 * values.size
+
+    exact = KLLSketch(k=200)
+    exact.update(values[:150])
+    assert exact.is_exact
+    np.testing.assert_allclose(exact.quantile(q), np.quantile(values[:150], q))
+
+
+@pytest.mark.parametrize("frame, n_numeric", [
+    (pd.DataFrame({"a": pd.Series(dtype=float), "b": pd.Series(dtype=int),
+                   "c": pd.Series(dtype=float)}), 3),
+    (pd.DataFrame({"name": ["x", "y"], "site": ["a", "b"]}), 0),
+])
+def test_frames_without_numeric_rows_pass(frame, n_numeric):
+    result = AnomalyDetector().detect(frame)
+    assert result.status == VerificationStatus.PASSED
+    assert result.metrics["columns_checked"] == n_numeric
+    assert result.metrics["anomalies_detected"] == 0
+    assert result.warnings == []
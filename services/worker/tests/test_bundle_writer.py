@@ -0,0 +1,161 @@
+"""
+Tests for the parallel, streaming conference bundle writer.
+
+Bundles must be ordinary ZIP files: readable by zipfile with valid CRCs,
+members in the order added, and a bundle SHA-256 equal to the file's.
+"""
+
+import hashlib
+import io
+import json
+import os
+import zipfile
+import zlib
+
+import pytest
+
+from src.conference_prep.bundle_writer import BundleWriter, _PrecompressedZipFile
+from src.conference_prep.export_bundle import validate_bundle
+
+
+@pytest.fixture
+def artifacts(tmp_path):
+    """Compressible text, an incompressible 'PNG', a large CSV and an empty file."""
+    src = tmp_path / "src"
+    src.mkdir()
+    files = {
+        "notes.txt": b"conference notes\n" * 5000,
+        "figure.png": os.urandom(200_000),
+        "table.csv": b"".join(f"{i},{i * i},value_{i % 7}\n".encode() for i in range(600_000)),
+        "empty.json": b"",
+        "random.bin": os.urandom(50_000),
+    }
+    for name, data in files.items():
+        (src / name).write_bytes(data)
+    return src, files
+
+
+def _write_bundle(path, src, files, **kwargs):
+    with BundleWriter(path, max_workers=3, **kwargs) as writer:
+        writer.add_bytes(b'{"files": []}', "manifest.json")
+        for name in files:
+            writer.add_file(src / name, f"materials/{name}")
+    return writer
+
+
+def test_bundle_roundtrip(artifacts, tmp_path):
+    src, files = artifacts
+    bundle = tmp_path / "bundle.zip"
+    writer = _write_bundle(bundle, src, files)
+
+    assert writer.sha256 == hashlib.sha256(bundle.read_bytes()).hexdigest()
+    with zipfile.ZipFile(bundle) as zf:
+        assert zf.testzip() is None
+        assert zf.namelist() == ["manifest.json"] + [f"materials/{n}" for n in files]
+        for name, data in files.items():
+            assert zf.read(f"materials/{name}") == data
+        infos = {i.filename: i for i in zf.infolist()}
+
+    assert infos["materials/notes.txt"].compress_type == zipfile.ZIP_DEFLATED
+    assert infos["materials/table.csv"].compress_type == zipfile.ZIP_DEFLATED
+    assert infos["materials/figure.png"].compress_type == zipfile.ZIP_STORED
+    # Deflate that does not shrink falls back to storing
+    assert infos["materials/random.bin"].compress_type == zipfile.ZIP_STORED
+
+    members = {m.arcname: m for m in writer.members}
+    for name, data in files.items():
+        assert members[f"materials/{name}"].sha256_hash == hashlib.sha256(data).hexdigest()
+
+
+def test_dedup_store_reuses_payloads(artifacts, tmp_path):
+    src, files = artifacts
+    store = tmp_path / "store"
+    first = _write_bundle(tmp_path / "a.zip", src, files, store_dir=store)
+    second = _write_bundle(tmp_path / "b.zip", src, files, store_dir=store)
+
+    assert not any(m.reused for m in first.members)
+    assert all(m.reused for m in second.members if m.arcname != "manifest.json")
+    with zipfile.ZipFile(tmp_path / "b.zip") as zf:
+        assert zf.testzip() is None
+        for name, data in files.items():
+            assert zf.read(f"materials/{name}") == data
+
+
+def test_failed_bundle_is_removed(artifacts, tmp_path):
+    src, files = artifacts
+    bundle = tmp_path / "bundle.zip"
+    with pytest.raises(FileNotFoundError):
+        with BundleWriter(bundle) as writer:
+            writer.add_file(src / "notes.txt")
+            writer.add_file(src / "missing.txt")
+    assert not bundle.exists()
+
+    writer = BundleWriter(bundle)
+    writer.add_bytes(b"a", "x")
+    with pytest.raises(ValueError):
+        writer.add_bytes(b"b", "x")
+    writer.abort()
+
+
+def test_validate_bundle_streams_members(artifacts, tmp_path):
+    src, files = artifacts
+    manifest = {
+        "files": [
+            {"relative_path": name, "sha256_hash": hashlib.sha256(data).hexdigest(),
+             "size_bytes": len(data)}
+            for name, data in files.items()
+        ],
+    }
+    (src / "manifest.json").write_text(json.dumps(manifest))
+    bundle = tmp_path / "bundle.zip"
+    with BundleWriter(bundle) as writer:
+        writer.add_file(src / "manifest.json")
+        for name in files:
+            writer.add_file(src / name, name)
+
+    result = validate_bundle(bundle)
+    assert result["valid"], result["errors"]
+    assert result["files_valid"] == len(files)
+
+
+@pytest.mark.parametrize("seekable", [True, False])
+def test_write_precompressed_members(seekable):
+    data = b"precompressed member " * 1000
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+    deflated = compressor.compress(data) + compressor.flush()
+
+    class _Unseekable(io.RawIOBase):
+        def __init__(self):
+            self.buffer = io.BytesIO()
+
+        def writable(self):
+            return True
+
+        def write(self, b):
+            return self.buffer.write(b)
+
+        def tell(self):
+            return self.buffer.tell()
+
+    raw = io.BytesIO() if seekable else _Unseekable()
+    with _PrecompressedZipFile(raw, "w") as zf:
+        zf.writestr("before.txt", b"written by zipfile")
+        for name, payload, compress_type in (
+            ("deflated.txt", deflated, zipfile.ZIP_DEFLATED),
+            ("stored.txt", data, zipfile.ZIP_STORED),
+        ):
+            zinfo = zipfile.ZipInfo(name)
+            zinfo.compress_type = compress_type
+            zinfo.CRC = zlib.crc32(data)
+            zinfo.file_size = len(data)
+            zinfo.compress_size = len(payload)
+            zf.write_precompressed(zinfo, io.BytesIO(payload))
+        zf.writestr("after.txt", b"also zipfile")
+
+    buffer = raw if seekable else raw.buffer
+    with zipfile.ZipFile(io.BytesIO(buffer.getvalue())) as zf:
+        assert zf.testzip() is None
+        assert zf.namelist() == ["before.txt", "deflated.txt", "stored.txt", "after.txt"]
+        assert zf.read("deflated.txt") == zf.read("stored.txt") == data
+        assert zf.getinfo("deflated.txt").compress_type == zipfile.ZIP_DEFLATED
+        assert zf.read("after.txt") == b"also zipfile"
@@ -0,0 +1,78 @@
+"""Tests for sort-based episode assignment and surgery linkage"""
+
+import pandas as pd
+import pytest
+
+from episodes.create_episodes import (
+    assign_events_to_episodes,
+    identify_index_events,
+    link_episodes_to_surgeries,
+    resolve_time_window,
+)
+
+
+@pytest.fixture
+def events():
+    rows = [
+        # patient 1: FNA on day 0, surgery on day 40
+        (1, "fna_biopsy", "2024-01-01", "E01"),
+        (1, "surgery", "2024-02-10", "E02"),
+        (1, "ultrasound", "2023-12-20", "E03"),  # 12 days before FNA
+        (1, "tsh_lab", "2024-01-21", "E04"),  # 20 days after FNA, 20 before surgery
+        (1, "tsh_lab", "2024-01-25", "E05"),  # nearer the surgery
+        (1, "ct_scan", "2024-06-01", "E06"),  # outside every window
+        # patient 2: FNA and molecular test on the same day
+        (2, "molecular_test", "2024-03-01", "E07"),
+        (2, "fna_biopsy", "2024-03-01", "E08"),
+        (2, "ultrasound", "2024-02-15", "E09"),
+        (2, "ultrasound", None, "E10"),
+    ]
+    df = pd.DataFrame(rows, columns=["research_id", "event_type", "event_date", "event_id"])
+    df["event_date"] = pd.to_datetime(df["event_date"])
+    return df
+
+
+def test_resolve_time_window():
+    assert resolve_time_window("narrow") == 14
+    assert resolve_time_window(21) == 21
+    with pytest.raises(ValueError):
+        resolve_time_window("huge")
+
+
+def test_assigns_nearest_episode(events):
+    episodes = identify_index_events(events)
+    links = assign_events_to_episodes(episodes, events, time_window_days="standard")
+    assigned = links.set_index("event_id")
+
+    assert "E06" not in assigned.index and "E10" not in assigned.index
+    assert assigned.loc["E03", "episode_id"] == "1_EP001"
+    assert assigned.loc["E03", "delta_days"] == -12
+    # Equidistant: the earlier episode wins
+    assert assigned.loc["E04", "episode_id"] == "1_EP001"
+    assert assigned.loc["E05", "episode_id"] == "1_EP002"
+    assert assigned.loc["E05", "delta_days"] == -16
+    # Same-day index events: the higher-priority FNA episode wins
+    assert episodes.set_index("episode_id").loc["2_EP001", "index_event_type"] == "fna_biopsy"
+    assert assigned.loc["E07", "episode_id"] == "2_EP001"
+    assert assigned.loc["E09", "episode_id"] == "2_EP001"
+
+    assert links["event_id"].is_unique
+    assert links["event_id"].is_monotonic_increasing
+    assert links["within_window"].all()
+
+    narrow = assign_events_to_episodes(episodes, events, time_window_days="narrow")
+    assert "E04" not in set(narrow["event_id"])
+
+
+def test_link_episodes_to_surgeries(events):
+    episodes = identify_index_events(events)
+    surgeries = pd.DataFrame({
+        "research_id": [1],
+        "surgery_id": ["S1"],
+        "surgery_date": pd.to_datetime(["2024-02-10"]),
+        "surgery_type": ["total_thyroidectomy"],
+    })
+    links = link_episodes_to_surgeries(episodes, surgeries).set_index("episode_id")
+    assert links.loc["1_EP001", "days_to_surgery"] == 40
+    assert links.loc["1_EP002", "relationship_type"] == "preop"  # same day
+    assert links.loc["2_EP001", "relationship_type"] == "no_surgery"
@@ -0,0 +1,91 @@
+"""Tests for batched entity extraction
+
+Uses a fake spaCy pipeline so scispaCy models are not required. Checks:
+- Results come back in input order, including empty texts and cache hits
+- nlp.pipe receives only non-empty, uncached texts with unused components disabled
+- Pipeline failures produce failed results instead of raising
+"""
+
+from types import SimpleNamespace
+
+from nlp.entity_extraction import EntityExtractor
+
+
+class _FakeNlp:
+    pipe_names = ["tok2vec", "tagger", "parser", "ner"]
+
+    def __init__(self, fail_after=None):
+        self.piped = []
+        self.disabled = None
+        self.fail_after = fail_after
+
+    def _doc(self, text):
+        ents = []
+        for word in text.split():
+            if word.isupper():
+                start = text.index(word)
+                ents.append(SimpleNamespace(
+                    text=word, label_="DISEASE", start_char=start, end_char=start + len(word),
+                ))
+        return SimpleNamespace(text=text, ents=ents)
+
+    def __call__(self, text):
+        return self._doc(text)
+
+    def pipe(self, texts, as_tuples, batch_size, n_process, disable):
+        self.disabled = disable
+        for text, context in texts:
+            if self.fail_after is not None and len(self.piped) >= self.fail_after:
+                raise RuntimeError("model crashed")
+            self.piped.append(text)
+            yield self._doc(text), context
+
+
+def _extractor(nlp, cache_size=0):
+    extractor = EntityExtractor(cache_size=cache_size)
+    extractor._available = True
+    extractor._nlp = nlp
+    return extractor
+
+
+def test_iter_extract_preserves_order_and_disables_components():
+    nlp = _FakeNlp()
+    texts = ["patient has COPD", "", "no findings", "CHF and AF noted"]
+    results = list(_extractor(nlp).iter_extract(texts, batch_size=2))
+
+    assert [r.total_entities for r in results] == [1, 0, 0, 2]
+    assert all(r.success for r in results)
+    assert results[3].entity_types == {"DISEASE": 2}
+    assert nlp.piped == ["patient has COPD", "no findings", "CHF and AF noted"]
+    assert nlp.disabled == ["tagger", "parser"]
+
+
+def test_batch_matches_single_extract():
+    nlp = _FakeNlp()
+    extractor = _extractor(nlp)
+    texts = ["CKD stage 3", "history of MI and CABG"]
+    batch = extractor.extract_batch(texts)
+    single = [extractor.extract(t) for t in texts]
+    assert [r.entities for r in batch] == [r.entities for r in single]
+
+
+def test_cache_skips_repeated_texts():
+    nlp = _FakeNlp()
+    extractor = _extractor(nlp, cache_size=10)
+    texts = ["DM2 on metformin", "HTN", "DM2 on metformin"]
+
+    first = extractor.extract_batch(texts)
+    second = extractor.extract_batch(texts)
+
+    assert first[0].entities == first[2].entities
+    assert second[1] is first[1]
+    # The second call is served entirely from the cache
+    assert nlp.piped.count("HTN") == 1
+
+
+def test_pipeline_failure_yields_failed_results():
+    nlp = _FakeNlp(fail_after=1)
+    results = _extractor(nlp).extract_batch(["COPD", "", "CHF", "AF"])
+
+    assert [r.success for r in results] == [True, True, False, False]
+    assert results[2].errors == ["model crashed"]
@@ -0,0 +1,195 @@
+"""Tests for Epic FHIR client paging, fan-out and bulk export
+
+Runs the client against a local stub FHIR server (http.server in a thread):
+- Search paging via Bundle link[rel=next], with and without prefetch
+- Concurrent per-patient searches
+- Bulk Data $export kick-off, status polling and NDJSON streaming
+
+Last Updated: 2026-10-18
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+pytest.importorskip("jwt")
+
+import requests
+
+from data_ingestion.epic import fhir_client as fhir_client_module
+from data_ingestion.epic.fhir_client import EpicFHIRClient, EpicFHIRError
+
+
+PAGE_SIZE = 3
+TOTAL_PROCEDURES = 8
+
+
+class _StubAuthenticator:
+    def get_access_token(self, *, force_refresh: bool = False) -> str:
+        return "stub-token"
+
+
+class _StubFHIRHandler(BaseHTTPRequestHandler):
+    polls = 0
+
+    def log_message(self, *args):
+        pass
+
+    def _send_json(self, payload, status=200, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/fhir+json")
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        base = f"http://127.0.0.1:{self.server.server_address[1]}/fhir"
+        parsed = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+
+        if self.headers.get("Authorization") != "Bearer stub-token":
+            self._send_json({"resourceType": "OperationOutcome"}, status=401)
+            return
+
+        if parsed.path in ("/fhir/Procedure", "/fhir/Encounter", "/fhir/DocumentReference"):
+            rtype = parsed.path.rsplit("/", 1)[1]
+            patient = query.get("patient", "p0")
+            total = TOTAL_PROCEDURES if rtype == "Procedure" else 1
+            offset = int(query.get("_offset", 0))
+            entries = [
+                {"resource": {"resourceType": rtype, "id": f"{patient}-{rtype}-{i}"}}
+                for i in range(offset, min(offset + PAGE_SIZE, total))
+            ]
+            links = [{"relation": "self", "url": f"{base}{self.path}"}]
+            if offset + PAGE_SIZE < total:
+                links.append({
+                    "relation": "next",
+                    "url": f"{base}/{rtype}?patient={patient}&_offset={offset + PAGE_SIZE}",
+                })
+            self._send_json({"resourceType": "Bundle", "link": links, "entry": entries})
+        elif parsed.path == "/fhir/Group/cohort1/$export":
+            assert self.headers.get("Prefer") == "respond-async"
+            self._send_json({}, status=202, headers={"Content-Location": f"{base}/export-status"})
+        elif parsed.path == "/fhir/export-status":
+            type(self).polls += 1
+            if type(self).polls < 2:
+                self._send_json({}, status=202, headers={"Retry-After": "0"})
+            else:
+                self._send_json({
+                    "requiresAccessToken": True,
+                    "output": [
+                        {"type": "Patient", "url": f"{base}/files/patient.ndjson"},
+                        {"type": "Encounter", "url": f"{base}/files/encounter.ndjson"},
+                    ],
+                    "error": [],
+                })
+        elif parsed.path.startswith("/fhir/files/"):
+            rtype = "Patient" if "patient" in parsed.path else "Encounter"
+            lines = [json.dumps({"resourceType": rtype, "id": str(i)}) for i in range(5)]
+            body = ("\n".join(lines) + "\n").encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/fhir+ndjson")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self._send_json({"resourceType": "OperationOutcome"}, status=404)
+
+
+@pytest.fixture
+def fhir_client():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubFHIRHandler)
+    _StubFHIRHandler.polls = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/fhir"
+    yield EpicFHIRClient(base_url, _StubAuthenticator(), timeout_s=5, max_requests_per_second=200)
+    server.shutdown()
+    server.server_close()
+
+
+class TestPagedSearch:
+    def test_search_returns_first_page_only(self, fhir_client):
+        bundle = fhir_client.search("Procedure", params={"patient": "p1"})
+        assert len(bundle["entry"]) == PAGE_SIZE
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_iter_search_follows_next_links(self, fhir_client, prefetch):
+        resources = list(
+            fhir_client.iter_search("Procedure", params={"patient": "p1"}, prefetch=prefetch)
+        )
+        assert [r["id"] for r in resources] == [f"p1-Procedure-{i}" for i in range(TOTAL_PROCEDURES)]
+
+    def test_max_pages(self, fhir_client):
+        pages = list(fhir_client.iter_search_pages("Procedure", params={"patient": "p1"}, max_pages=2))
+        assert len(pages) == 2
+
+    def test_http_error_raises(self, fhir_client):
+        with pytest.raises(EpicFHIRError):
+            fhir_client.search("Unknown", params={})
+
+
+class TestPatientFanOut:
+    def test_fetch_patient_resources(self, fhir_client):
+        results = list(fhir_client.fetch_patient_resources(["p1", "p2", "p3"], max_workers=4))
+        assert len(results) == 9
+
+        by_key = {(pid, rtype): res for pid, rtype, res in results}
+        assert len(by_key[("p2", "Procedure")]) == TOTAL_PROCEDURES
+        assert len(by_key[("p3", "DocumentReference")]) == 1
+
+    def test_fan_out_is_bounded_and_ordered(self, fhir_client):
+        consumed = []
+
+        def patient_ids():
+            for i in range(50):
+                consumed.append(i)
+                yield f"p{i}"
+
+        results = fhir_client.fetch_patient_resources(
+            patient_ids(), resource_types=("Encounter",), max_workers=2
+        )
+        first = next(results)
+        # 2 * max_workers tasks in flight, not the whole cohort
+        assert first[:2] == ("p0", "Encounter")
+        assert len(consumed) == 4
+        rest = list(results)
+        assert [pid for pid, _, _ in rest] == [f"p{i}" for i in range(1, 50)]
+
+    def test_worker_sessions_closed_on_shutdown(self, fhir_client, monkeypatch):
+        sessions = []
+
+        class _RecordingSession(requests.Session):
+            def __init__(self):
+                super().__init__()
+                self.closed = False
+                sessions.append(self)
+
+            def close(self):
+                self.closed = True
+                super().close()
+
+        monkeypatch.setattr(fhir_client_module.requests, "Session", _RecordingSession)
+        list(fhir_client.fetch_patient_resources(["p1", "p2"], max_workers=3))
+        list(fhir_client.iter_search("Procedure", params={"patient": "p1"}, prefetch=True))
+
+        assert len(sessions) == 4
+        assert all(session.closed for session in sessions)
+
+
+class TestBulkExport:
+    def test_bulk_export_and_stream(self, fhir_client):
+        manifest = fhir_client.bulk_export(group_id="cohort1", poll_interval_s=0)
+        assert [o["type"] for o in manifest["output"]] == ["Patient", "Encounter"]
+
+        encounters = list(fhir_client.iter_bulk_export(manifest, resource_type="Encounter"))
+        assert len(encounters) == 5
+        assert all(r["resourceType"] == "Encounter" for r in encounters)
+
+        assert len(list(fhir_client.iter_bulk_export(manifest))) == 10
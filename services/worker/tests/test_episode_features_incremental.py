@@ -0,0 +1,96 @@
+"""Tests for incremental episode feature materialization
+
+update_episode_features must leave the stored table equal to a full
+compute_episode_features run while recomputing only changed episodes.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from episodes.episode_features import (
+    FINGERPRINT_COL,
+    compute_episode_features,
+    load_episode_features,
+    update_episode_features,
+)
+
+
+@pytest.fixture
+def inputs():
+    n = 40
+    episodes = pd.DataFrame({
+        "episode_id": [f"{i}_EP001" for i in range(n)],
+        "research_id": np.arange(n),
+        "index_event_type": "fna_biopsy",
+        "index_event_date": pd.Timestamp("2024-01-01") + pd.to_timedelta(np.arange(n), unit="D"),
+    })
+    events = pd.DataFrame({
+        "episode_id": np.repeat(episodes["episode_id"].to_numpy(), 2),
+        "event_id": [f"E{i:03d}" for i in range(2 * n)],
+        "event_type": ["tsh_lab", "ultrasound"] * n,
+        "event_date": np.repeat(episodes["index_event_date"].to_numpy(), 2),
+        "delta_days": 0,
+        "within_window": True,
+    })
+    labs = pd.DataFrame({
+        "event_id": events["event_id"][::2].to_numpy(),
+        "thyroglobulin": np.linspace(0.1, 4.0, n),
+        "tsh": np.linspace(1.0, 2.0, n),
+        "t3": 1.0,
+        "t4": 1.0,
+        "anti_tg_antibody": np.where(np.arange(n) % 3 == 0, 2.0, 0.1),
+    })
+    imaging = pd.DataFrame({
+        "event_id": events["event_id"][1::2].to_numpy(),
+        "tirads_score": np.arange(n) % 5 + 1,
+        "nodule_count": 1,
+        "nodule_size_cm": np.linspace(0.5, 3.0, n),
+        "thyroid_volume_cc": 12.0,
+        "suspicious_features": 0,
+    })
+    return episodes, events, labs, imaging
+
+
+def _assert_matches_full(feature_dir, episodes, events, labs, imaging):
+    stored = load_episode_features(feature_dir).drop(columns=[FINGERPRINT_COL])
+    full = compute_episode_features(episodes, events, imaging_df=imaging, labs_df=labs)
+    stored = stored.sort_values("episode_id").reset_index(drop=True)[full.columns]
+    full = full.sort_values("episode_id").reset_index(drop=True)
+    pd.testing.assert_frame_equal(stored, full, check_dtype=False)
+
+
+def test_incremental_updates_only_changed_episodes(inputs, tmp_path):
+    episodes, events, labs, imaging = inputs
+    feature_dir = tmp_path / "episode_features"
+
+    first = update_episode_features(episodes, events, feature_dir,
+                                    imaging_df=imaging, labs_df=labs, n_buckets=8)
+    assert len(first) == len(episodes)
+    _assert_matches_full(feature_dir, episodes, events, labs, imaging)
+
+    # Nothing changed: nothing recomputed
+    assert update_episode_features(episodes, events, feature_dir,
+                                   imaging_df=imaging, labs_df=labs, n_buckets=8).empty
+
+    # Edit one lab value and drop one episode
+    labs = labs.copy()
+    labs.loc[labs["event_id"] == "E010", "thyroglobulin"] = 99.0
+    episodes = episodes[episodes["episode_id"] != "7_EP001"]
+    events = events[events["episode_id"] != "7_EP001"]
+    changed = update_episode_features(episodes, events, feature_dir,
+                                      imaging_df=imaging, labs_df=labs, n_buckets=8)
+    assert changed["episode_id"].tolist() == ["5_EP001"]
+    assert changed["thyroglobulin_max"].iloc[0] == 99.0
+    _assert_matches_full(feature_dir, episodes, events, labs, imaging)
+    assert "7_EP001" not in set(load_episode_features(feature_dir)["episode_id"])
+
+
+def test_modality_change_forces_rebuild(inputs, tmp_path):
+    episodes, events, labs, imaging = inputs
+    feature_dir = tmp_path / "episode_features"
+    update_episode_features(episodes, events, feature_dir, labs_df=labs, n_buckets=4)
+    rebuilt = update_episode_features(episodes, events, feature_dir,
+                                      imaging_df=imaging, labs_df=labs, n_buckets=4)
+    assert len(rebuilt) == len(episodes)
+    _assert_matches_full(feature_dir, episodes, events, labs, imaging)
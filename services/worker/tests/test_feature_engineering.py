@@ -0,0 +1,98 @@
+"""Tests for the columnar FeatureEngineer blocks
+
+Small hand-checked tables covering ID normalization, lab slot statistics,
+per-patient grouping and the final feature matrix join.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from marts.feature_engineering import FeatureEngineer
+
+
+@pytest.fixture
+def engineer(tmp_path):
+    fe = FeatureEngineer(interim_dir=tmp_path, output_dir=tmp_path / "marts")
+    fe.datasets = {
+        "fna": pd.DataFrame({
+            "research_id_number": ["001", "2", "2", "3"],
+            "bethesda_2023_num": [6.0, 2.0, np.nan, 2.0],
+        }),
+        "tumor_path": pd.DataFrame({
+            "research_id_number": ["1"],
+            "tumor_1_size_cm": [1.4],
+            "tumor_1_histology": [None],
+        }),
+        "benign_path": pd.DataFrame({
+            "research_id_number": ["2", "2"],
+            "age_at_surgery": [np.nan, 40.0],
+            "sex": ["F", "F"],
+            "gland_weight_g": [np.nan, 12.0],
+        }),
+        "ultrasound": pd.DataFrame({
+            "research_id_number": [" 1", "1", "3"],
+            "tirads_score": ["4", "5", "x"],
+            "nodule_size_cm": [1.0, 2.0, None],
+        }),
+        "thyroid_sizes": pd.DataFrame({
+            "research_id_number": ["4"],
+            "right_volume_cm3": [7.5],
+        }),
+        "anti_tg": None,
+        "thyroglobulin": pd.DataFrame({
+            "research_id_number": ["1", "2"],
+            "lab1_result": ["<2", "abc"],
+            "lab1_specimen_collect_dt": ["2024-01-01", "2024-01-01"],
+            "lab2_result": ["8", "5"],
+            "lab2_specimen_collect_dt": ["2024-03-01", None],
+        }),
+    }
+    return fe
+
+
+def test_normalize_id_series(engineer):
+    ids = pd.Series(["007", " a1 ", None, 7, "007"])
+    assert engineer._normalize_id_series(ids).tolist() == ["7", "A1", None, "7", "7"]
+
+
+def test_aggregate_labs(engineer):
+    labs = engineer.aggregate_labs().set_index("research_id")
+    assert labs.index.tolist() == ["1", "2"]
+    p1 = labs.loc["1"]
+    assert p1["thyroglobulin_mean"] == 5.0
+    assert p1["thyroglobulin_std"] == pytest.approx(np.std([2.0, 8.0]))
+    assert p1["thyroglobulin_trend_pct"] == 300.0
+    assert p1["thyroglobulin_timespan_days"] == 60
+    p2 = labs.loc["2"]
+    assert p2["thyroglobulin_count"] == 1 and p2["thyroglobulin_std"] == 0.0
+    assert np.isnan(p2["thyroglobulin_trend"])
+
+
+def test_imaging_and_clinical_blocks(engineer):
+    imaging = engineer.extract_imaging_features().set_index("research_id")
+    assert imaging.index.tolist() == ["1", "3", "4"]
+    assert imaging.loc["1", "tirads_score_max"] == 5
+    assert imaging.loc["1", "nodule_count"] == 2
+    assert np.isnan(imaging.loc["3", "tirads_score_max"])
+    assert imaging.loc["4", "right_volume_cm3"] == 7.5
+
+    clinical = engineer.extract_clinical_features().set_index("research_id")
+    # First benign row is used; missing age is kept, missing weight is not
+    assert np.isnan(clinical.loc["2", "age_at_surgery"])
+    assert "gland_weight_g" not in clinical.columns
+    assert "tumor_1_histology" not in clinical.columns
+    assert clinical.loc["2", "bethesda_2023_num_latest"] == 2.0
+    assert clinical.loc["1", "tumor_1_size_cm"] == 1.4
+
+
+def test_feature_matrix(engineer):
+    labels = engineer.derive_malignancy_labels()
+    matrix = engineer.create_feature_matrix(
+        labels,
+        engineer.aggregate_labs(),
+        engineer.extract_imaging_features(),
+        engineer.extract_clinical_features(),
+    )
+    assert matrix["research_id"].tolist() == labels["research_id"].tolist() == ["1", "2", "3"]
+    assert matrix.set_index("research_id").loc["1", "thyroglobulin_last"] == 8.0
@@ -0,0 +1,75 @@
+"""
+Tests for bulk canonical signal → FHIR Observation transforms.
+
+signal_frame_to_fhir must produce the same observation JSON and hashes as
+signal_to_fhir_observation on each row, including frames whose
+signal_time is datetime64 (the usual case after reading Parquet).
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.interoperability.fhir_bulk import signal_frame_to_fhir
+from src.interoperability.fhir_transforms import signal_to_fhir_observation
+
+
+ISO_TIMES = ["2024-01-15T14:30:00Z", "2024-01-15T15:00:00Z", "2024-01-16T08:05:30Z", "2024-02-01T00:00:00Z"]
+
+
+@pytest.fixture
+def signals():
+    return pd.DataFrame({
+        "research_id": ["R001", "R002", "R001", "R003"],
+        "signal_time": ISO_TIMES,
+        "signal_type": ["PROM", "wearable", "symptom", "PROM"],
+        "signal_name": ["phq9_total", "heart_rate", "fatigue", "gad7_total"],
+        "signal_value_num": [12.0, 71.0, np.nan, 5.0],
+        "signal_value_text": [None, None, "moderate", None],
+        "unit": [None, "bpm", None, None],
+        "collection_mode": ["self_report", "passive_sensing", "self_report", None],
+        "quality_flag": [None, None, "invalid", None],
+        "notes": ["baseline", None, None, None],
+    })
+
+
+def _expected(frame, config=None):
+    records = frame.astype(object).where(frame.notna(), None).to_dict("records")
+    return [signal_to_fhir_observation(r, config) for r in records]
+
+
+def _assert_matches(bulk, expected):
+    assert len(bulk) == len(expected)
+    for (_, row), (observation, provenance) in zip(bulk.iterrows(), expected):
+        assert json.loads(row["observation"]) == observation
+        assert row["observation"] == json.dumps(observation, sort_keys=True)
+        assert row["fhir_hash"] == provenance["fhir_hash"]
+        assert row["signal_hash"] == provenance["signal_hash"]
+
+
+@pytest.mark.parametrize("config", [None, {"include_notes": True}])
+def test_string_times_match_per_record(signals, config):
+    _assert_matches(signal_frame_to_fhir(signals, config), _expected(signals, config))
+
+
+@pytest.mark.parametrize("to_datetime", [
+    lambda s: pd.to_datetime(s).dt.tz_localize(None).astype("datetime64[us]"),
+    lambda s: pd.to_datetime(s, utc=True),
+    lambda s: pd.to_datetime(s).dt.tz_convert("America/New_York"),
+])
+def test_datetime_times_match_string_times(signals, to_datetime):
+    typed = signals.assign(signal_time=to_datetime(signals["signal_time"]))
+    bulk = signal_frame_to_fhir(typed, {"include_notes": True}, n_workers=2, chunk_size=2)
+
+    _assert_matches(bulk, _expected(signals, {"include_notes": True}))
+    assert [json.loads(o)["effectiveDateTime"] for o in bulk["observation"]] == ISO_TIMES
+
+
+def test_sub_second_times_keep_microseconds(signals):
+    typed = signals.assign(
+        signal_time=pd.to_datetime(signals["signal_time"]) + pd.Timedelta(milliseconds=250)
+    )
+    bulk = signal_frame_to_fhir(typed)
+    assert json.loads(bulk["observation"].iloc[0])["effectiveDateTime"] == "2024-01-15T14:30:00.250000Z"
@@ -0,0 +1,82 @@
+"""
+Tests for the shared file hash cache.
+
+Digests must always equal a plain SHA-256 of the file bytes; the cache
+may only skip work for files whose (device, inode, size, mtime_ns) is
+unchanged.
+"""
+
+import hashlib
+import os
+import time
+
+import pytest
+
+from utils import file_hash
+from utils.file_hash import FileHashCache, sha256_file
+
+
+def _write(path, data, age_s=60):
+    """Write bytes and backdate the mtime out of the racy window."""
+    path.write_bytes(data)
+    past = time.time() - age_s
+    os.utime(path, (past, past))
+    return path
+
+
+def _expected(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+@pytest.mark.parametrize("mmap_min", [1, file_hash.MMAP_MIN_BYTES])
+def test_sha256_file_matches_hashlib(tmp_path, monkeypatch, mmap_min):
+    monkeypatch.setattr(file_hash, "MMAP_MIN_BYTES", mmap_min)
+    data = os.urandom(3 * 1024 * 1024 + 17)
+    assert sha256_file(_write(tmp_path / "a.bin", data)) == _expected(data)
+    assert sha256_file(_write(tmp_path / "empty.bin", b"")) == _expected(b"")
+
+
+def test_cache_hits_and_rehashes_modified_files(tmp_path, monkeypatch):
+    path = _write(tmp_path / "a.bin", b"first")
+    cache = FileHashCache(str(tmp_path / "hashes.sqlite"))
+    calls = []
+    monkeypatch.setattr(file_hash, "sha256_file", lambda p: calls.append(p) or sha256_file(p))
+
+    assert cache.digest(path) == _expected(b"first")
+    assert cache.digest(path) == _expected(b"first")
+    assert len(calls) == 1
+
+    # Same size, new mtime
+    _write(path, b"final", age_s=30)
+    assert cache.digest(path) == _expected(b"final")
+    assert len(calls) == 2
+    cache.close()
+
+    # Persisted for other processes
+    reopened = FileHashCache(str(tmp_path / "hashes.sqlite"))
+    assert reopened.digest(path) == _expected(b"final")
+    assert len(calls) == 2
+    reopened.close()
+
+
+def test_recently_modified_files_are_not_cached(tmp_path):
+    path = tmp_path / "fresh.bin"
+    path.write_bytes(b"fresh")
+    cache = FileHashCache()
+    assert cache.digest(path) == _expected(b"fresh")
+    assert cache._lookup(file_hash.stat_key(path)) is None
+
+
+def test_digest_many(tmp_path):
+    files = {f"f{i}.bin": os.urandom(1000 + i) for i in range(6)}
+    paths = [_write(tmp_path / name, data) for name, data in files.items()]
+    link = tmp_path / "link.bin"
+    os.link(paths[0], link)
+
+    cache = FileHashCache(max_workers=3)
+    result = cache.digest_many(paths + [link, paths[1], tmp_path / "missing.bin"])
+
+    assert set(result) == {str(p) for p in paths} | {str(link)}
+    for name, data in files.items():
+        assert result[str(tmp_path / name)] == _expected(data)
+    assert result[str(link)] == result[str(paths[0])]
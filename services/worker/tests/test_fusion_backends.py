@@ -0,0 +1,127 @@
+"""Tests for FusionEngine strategies on the pandas and DuckDB backends
+
+The DuckDB backend must produce the same FusionResult as the pandas path
+(row order of joins aside), including from Parquet paths it scans in place.
+"""
+
+import pandas as pd
+import pytest
+
+from src.fusion.fusion_engine import FusionConfig, FusionEngine
+from src.fusion.duckdb_backend import DUCKDB_AVAILABLE
+
+requires_duckdb = pytest.mark.skipif(not DUCKDB_AVAILABLE, reason="duckdb not installed")
+
+
+@pytest.fixture
+def datasets():
+    return [
+        {"name": "ehr", "data": pd.DataFrame({
+            "mrn": [1, 2, 3, 4], "age": [50, 61, 47, 70], "sex": ["F", "M", "F", None],
+        })},
+        {"name": "labs", "data": pd.DataFrame({
+            "mrn": [2, 3, 3, 5, 5], "age": [61, 48, 47, 33, 33], "hba1c": [6.1, 7.2, 7.0, 5.4, 5.4],
+        })},
+        {"name": "claims", "data": pd.DataFrame({
+            "mrn": [3, 2, 1], "cost": [100.0, 250.0, 75.0],
+        })},
+    ]
+
+
+def _fuse(datasets, backend, **kwargs):
+    engine = FusionEngine(FusionConfig(backend=backend, **kwargs))
+    result = engine.fuse(datasets, save_artifact=False)
+    assert result.success, result.errors
+    return result
+
+
+def _sorted(df, by):
+    return df.sort_values(by).reset_index(drop=True)
+
+
+def test_pandas_merge_resolves_conflicts(datasets):
+    first = _fuse(datasets, "pandas", strategy="merge", join_keys=["mrn"])
+    assert first.record_count == 5
+    # mrn 3 has two ages and two hba1c values across sources
+    assert first.conflicts_count == 2
+    row = first.fused_data.set_index("mrn").loc[3]
+    assert row["age"] == 47 and row["hba1c"] == 7.2 and row["_source"] == "ehr"
+
+    last = _fuse(datasets, "pandas", strategy="merge", join_keys=["mrn"], handle_conflicts="last")
+    assert last.fused_data.set_index("mrn").loc[3, "hba1c"] == 7.0
+
+    both = _fuse(datasets, "pandas", strategy="merge", join_keys=["mrn"], handle_conflicts="both")
+    assert both.record_count == 11
+
+    engine = FusionEngine(FusionConfig(backend="pandas", strategy="merge", join_keys=["mrn"],
+                                       handle_conflicts="raise"))
+    failed = engine.fuse(datasets, save_artifact=False)
+    assert not failed.success and "conflicting" in failed.errors[0]
+
+
+def test_records_union_dedups_without_provenance(datasets):
+    records = [
+        {"name": "a", "data": [{"x": 1}, {"x": 2}]},
+        {"name": "b", "data": [{"x": 2}, {"x": 3, "_note": "kept"}, {"x": 3}]},
+    ]
+    result = FusionEngine()._fuse_union_records(records)
+    assert [r["x"] for r in result.fused_data] == [1, 2, 3]
+    assert result.duplicates_removed == 2
+    assert result.fused_data[2] == {"x": 3, "_note": "kept", "_source": "b", "_source_idx": 1}
+
+
+@requires_duckdb
+def test_union_parity(datasets):
+    expected = _fuse(datasets, "pandas")
+    got = _fuse(datasets, "duckdb")
+    assert got.record_count == expected.record_count
+    assert got.duplicates_removed == expected.duplicates_removed == 1
+    assert got.source_counts == expected.source_counts
+    pd.testing.assert_frame_equal(got.fused_data.reset_index(drop=True),
+                                  expected.fused_data.reset_index(drop=True),
+                                  check_dtype=False)
+
+
+@requires_duckdb
+@pytest.mark.parametrize("join_type", ["inner", "left", "right", "outer"])
+def test_join_parity(datasets, join_type):
+    expected = _fuse(datasets, "pandas", strategy="join", join_keys=["mrn"], join_type=join_type)
+    got = _fuse(datasets, "duckdb", strategy="join", join_keys=["mrn"], join_type=join_type)
+    assert got.record_count == expected.record_count
+    assert list(got.fused_data.columns) == list(expected.fused_data.columns)
+    pd.testing.assert_frame_equal(_sorted(got.fused_data, ["mrn", "age_labs"]),
+                                  _sorted(expected.fused_data, ["mrn", "age_labs"]),
+                                  check_dtype=False)
+
+
+@requires_duckdb
+@pytest.mark.parametrize("mode", ["first", "last", "both"])
+def test_merge_parity(datasets, mode):
+    kwargs = dict(strategy="merge", join_keys=["mrn"], handle_conflicts=mode)
+    expected = _fuse(datasets, "pandas", **kwargs)
+    got = _fuse(datasets, "duckdb", **kwargs)
+    assert got.conflicts_count == expected.conflicts_count
+    assert got.duplicates_removed == expected.duplicates_removed
+    pd.testing.assert_frame_equal(got.fused_data.reset_index(drop=True),
+                                  expected.fused_data.reset_index(drop=True),
+                                  check_dtype=False)
+
+
+@requires_duckdb
+def test_duckdb_scans_parquet_and_spills_to_output(datasets, tmp_path):
+    paths = []
+    for ds in datasets:
+        path = tmp_path / f"{ds['name']}.parquet"
+        ds["data"].to_parquet(path, index=False)
+        paths.append({"name": ds["name"], "data": str(path)})
+
+    expected = _fuse(datasets, "pandas")
+    out = tmp_path / "out" / "fused.parquet"
+    # backend="auto" picks DuckDB for file inputs
+    got = _fuse(paths, "auto", temp_directory=str(tmp_path / "spill"),
+                memory_limit="256MB", output_path=str(out))
+    assert got.fused_data == str(out)
+    assert got.record_count == expected.record_count
+    assert got.source_counts == expected.source_counts
+    pd.testing.assert_frame_equal(pd.read_parquet(out), expected.fused_data.reset_index(drop=True),
+                                  check_dtype=False)
@@ -0,0 +1,97 @@
+"""Tests for indexed reference interval lookup and vectorized lab flagging
+
+Uses a small registry with dated, sex-specific and critical-limit intervals
+and checks that flag_frame agrees with the scalar lookup.
+"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+import yaml
+
+from labs.reference_intervals import ReferenceIntervalRegistry
+from labs.ucum import UCUMValidator
+
+
+INTERVALS = [
+    {"analyte": "potassium", "unit_ucum": "mmol/L", "ref_low": 3.5, "ref_high": 5.1,
+     "effective_start": "2018-01-01", "effective_end": "2021-12-31",
+     "population": "adult", "sex": "all", "source": "old assay",
+     "critical_low": 2.5, "critical_high": 6.5},
+    {"analyte": "potassium", "unit_ucum": "mmol/L", "ref_low": 3.4, "ref_high": 5.0,
+     "effective_start": "2022-01-01", "effective_end": None,
+     "population": "adult", "sex": "all", "source": "new assay",
+     "critical_low": 2.8, "critical_high": 6.2},
+    {"analyte": "ferritin", "unit_ucum": "ng/mL", "ref_low": 24, "ref_high": 336,
+     "effective_start": "2020-01-01", "effective_end": None,
+     "population": "adult", "sex": "male", "source": "lab"},
+    {"analyte": "ferritin", "unit_ucum": "ng/mL", "ref_low": 11, "ref_high": 307,
+     "effective_start": "2020-01-01", "effective_end": None,
+     "population": "adult", "sex": "all", "source": "lab"},
+]
+
+
+@pytest.fixture
+def registry(tmp_path):
+    path = tmp_path / "intervals.yaml"
+    path.write_text(yaml.safe_dump({"reference_intervals": INTERVALS}))
+    return ReferenceIntervalRegistry(path)
+
+
+@pytest.fixture
+def validator(tmp_path):
+    path = tmp_path / "ucum.yaml"
+    path.write_text(yaml.safe_dump({
+        "concentration_units": [{"code": "mmol/L"}, {"code": "ng/mL"}],
+        "equivalence_mappings": {"mmol/l": "mmol/L", "ng/ml": "ng/mL"},
+    }))
+    return UCUMValidator(path)
+
+
+def test_lookup_uses_effective_dates(registry):
+    old = registry.lookup("Potassium", unit="mmol/L", query_date=date(2020, 6, 1))
+    new = registry.lookup("potassium", unit="mmol/L", query_date=date(2023, 6, 1))
+    assert [i.source for i in old] == ["old assay"]
+    assert [i.source for i in new] == ["new assay"]
+    assert len(registry.lookup("potassium")) == 2
+    assert registry.lookup("potassium", query_date=date(2017, 1, 1)) == []
+
+
+def test_lookup_sex_filter_keeps_registry_order(registry):
+    male = registry.lookup("ferritin", sex="male")
+    female = registry.lookup("ferritin", sex="female")
+    assert [i.sex for i in male] == ["male", "all"]
+    assert [i.sex for i in female] == ["all"]
+
+
+def test_normalize_series(validator):
+    units = pd.Series(["mmol/l", "ng/mL", None, "furlongs"], index=[10, 11, 12, 13])
+    out = validator.normalize_series(units)
+    assert out.tolist() == ["mmol/L", "ng/mL", None, None]
+    assert out.index.tolist() == [10, 11, 12, 13]
+
+
+def test_flag_frame(registry, validator):
+    df = pd.DataFrame({
+        "analyte": ["potassium", "POTASSIUM", "potassium", "ferritin", "ferritin", "ferritin", "sodium"],
+        "value": [2.6, 5.05, 7.0, 20, 20, None, 140],
+        "unit": ["mmol/L", "mmol/l", "mmol/L", "ng/ml", "ng/mL", "ng/mL", "mmol/L"],
+        "date": ["2020-03-01", "2023-03-01", "2023-03-01", "2024-01-01", "2024-01-01", None, "2024-01-01"],
+        "sex": ["F", "M", None, "M", "F", "M", "F"],
+    })
+    out = registry.flag_frame(df, sex_col="sex", validator=validator)
+
+    assert out["unit_normalized"].tolist()[:2] == ["mmol/L", "mmol/L"]
+    assert out["interval_idx"].tolist() == [0, 1, 1, 2, 3, 2, -1]
+    assert out["flag"].tolist()[:5] == ["L", "H", "H", "L", "N"]
+    assert out["flag"].isna().tolist()[5:] == [True, True]
+    assert out["critical"].tolist() == [False, False, True, False, False, False, False]
+
+    # Agrees with the scalar lookup for every matched row
+    for row, res in zip(df.itertuples(), out.itertuples()):
+        if res.interval_idx < 0:
+            continue
+        interval = registry.intervals[res.interval_idx]
+        assert interval.is_effective_on(pd.Timestamp(row.date).date()) if row.date else True
+        assert res.ref_low == interval.ref_low and res.ref_high == interval.ref_high
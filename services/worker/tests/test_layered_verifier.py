@@ -0,0 +1,138 @@
+"""
+Tests for concurrent layer execution and chunked schema validation.
+
+Concurrent layers are an execution strategy only: they must produce the
+same VerificationResult as the sequential run (timings aside). Chunked
+validation finds the same failures as the whole frame but reports them
+with capped examples; whole-frame errors list every failure case.
+"""
+
+import numpy as np
+import pandas as pd
+import pandera as pa
+import pytest
+
+from src.verification.layered_verifier import LayeredVerifier, VerificationLayer
+from src.verification.schema_validator import (
+    SchemaValidator,
+    is_chunkable,
+    order_failure_cases,
+    summarize_failure_cases,
+)
+
+
+ROW_LOCAL = pa.DataFrameSchema(
+    {
+        "age": pa.Column(int, pa.Check.in_range(0, 120)),
+        "sex": pa.Column(object, pa.Check.isin(["F", "M"]), nullable=False),
+        "bmi": pa.Column(float, pa.Check(lambda v: v > 10, element_wise=True)),
+        "site": pa.Column(int),
+    },
+    strict=True,
+)
+
+
+@pytest.fixture
+def registry():
+    """Linked registry extract with scattered violations."""
+    rng = np.random.default_rng(7)
+    n = 2000
+    df = pd.DataFrame({
+        "age": rng.integers(0, 100, n),
+        "sex": rng.choice(["F", "M"], n).astype(object),
+        "bmi": rng.normal(27, 4, n),
+        "site": np.arange(n, dtype=float),  # wrong dtype: schema-level failure
+        "extra": 1,  # not in strict schema
+    }, index=np.arange(n) * 3)
+    df.loc[df.index[::97], "age"] = 150
+    df.loc[df.index[5::301], "sex"] = None
+    df.loc[df.index[11::503], "bmi"] = 5.0
+    return df
+
+
+def _validate(df, schema, **kwargs):
+    validator = SchemaValidator(**kwargs)
+    validator.schemas["registry"] = schema
+    return validator.validate(df, "registry")
+
+
+def _pandera_failure_cases(df, schema):
+    with pytest.raises(pa.errors.SchemaErrors) as excinfo:
+        schema.validate(df, lazy=True)
+    return excinfo.value.failure_cases
+
+
+def test_chunked_validation_matches_whole_frame(registry):
+    whole = _validate(registry, ROW_LOCAL)
+    chunked = _validate(registry, ROW_LOCAL, chunk_size=300)
+    failure_cases = _pandera_failure_cases(registry, ROW_LOCAL)
+
+    assert not whole.passed and not chunked.passed
+    assert chunked.metrics == whole.metrics
+    assert whole.metrics["total_violations"] == 21 + 7 + 4 + 2
+
+    # Whole frame: every failure case, in Pandera's order
+    assert whole.errors == [
+        f"Column '{row['column']}', Index {row['index']}: {row['check']}"
+        for _, row in failure_cases.iterrows()
+    ]
+    # Chunked: the same failures, ordered, with examples capped per (column, check)
+    expected, _ = summarize_failure_cases(order_failure_cases(failure_cases, ROW_LOCAL, registry))
+    assert chunked.errors == expected
+    assert "Column 'age': 16 more failures of in_range(0, 120)" in chunked.errors
+    assert len(chunked.errors) < chunked.metrics["total_violations"]
+
+
+def test_small_frame_keeps_whole_frame_errors(registry):
+    whole = _validate(registry, ROW_LOCAL)
+    unchunked = _validate(registry, ROW_LOCAL, chunk_size=len(registry))
+    assert unchunked.errors == whole.errors
+    assert len(whole.errors) == whole.metrics["total_violations"]
+
+
+def test_non_row_local_schema_is_not_chunked(registry):
+    schema = ROW_LOCAL.update_column("site", unique=True)
+    assert is_chunkable(ROW_LOCAL)
+    assert not is_chunkable(schema)
+    assert not is_chunkable(ROW_LOCAL.update_column("age", checks=pa.Check(lambda s: s.mean() > 0)))
+
+    registry = registry.assign(site=registry["site"].astype(int) // 2)
+    whole = _validate(registry, schema)
+    chunked = _validate(registry, schema, chunk_size=300)
+    assert chunked.errors == whole.errors
+    assert chunked.metrics == whole.metrics
+
+
+def _comparable(result):
+    out = result.to_dict()
+    out.pop("execution_time_ms")
+    out.pop("timestamp")
+    for layer in out["layers"].values():
+        layer.pop("execution_time_ms")
+        layer.pop("timestamp")
+    return out
+
+
+@pytest.mark.parametrize("stop_on_failure", [False, True])
+def test_concurrent_layers_match_sequential(registry, stop_on_failure):
+    linkage = pd.DataFrame({"source_id": registry.index[:50], "target_id": range(50)})
+    audit = pd.DataFrame({
+        "audit_id": [1, 2, 2], "log_hash": ["a", "b", "c"], "prev_log_hash": [None, "a", "b"],
+    })
+
+    results = []
+    for concurrent in (False, True):
+        verifier = LayeredVerifier(
+            stop_on_failure=stop_on_failure,
+            concurrent_layers=concurrent,
+            schema_chunk_size=500,
+        )
+        verifier.validators[VerificationLayer.SCHEMA].schemas["registry"] = ROW_LOCAL
+        results.append(verifier.verify(
+            registry, schema_name="registry", linkage_df=linkage, audit_log=audit
+        ))
+
+    sequential, concurrent = results
+    assert _comparable(concurrent) == _comparable(sequential)
+    expected_layers = 1 if stop_on_failure else len(VerificationLayer)
+    assert len(sequential.layers) == expected_layers
@@ -0,0 +1,114 @@
+"""Tests for the segmented linkage audit log
+
+Covers:
+- Single-pass batch hashing matches the per-entry hash scheme
+- Segment + manifest layout and chain anchoring across segments
+- Per-segment (parallel) hash chain verification and tamper detection
+
+Last Updated: 2026-10-18
+"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from src.linkage.audit_log import (
+    AUDIT_COLUMNS,
+    GENESIS_HASH,
+    AuditLogger,
+    compute_entry_hash,
+)
+from src.linkage.audit_segments import SegmentedAuditLog
+
+
+@pytest.fixture
+def linkage_df() -> pd.DataFrame:
+    """A small FNA → pathology linkage table."""
+    n = 50
+    return pd.DataFrame({
+        "linkage_id": [f"LNK{i:04d}" for i in range(n)],
+        "fna_id": [f"FNA{i:04d}" for i in range(n)],
+        "pathology_id": [f"PATH{i:04d}" for i in range(n)],
+        "days_gap": [(i % 29) - 14 for i in range(n)],
+        "abs_days_gap": [abs((i % 29) - 14) for i in range(n)],
+        "link_confidence": [0.9] * n,
+    })
+
+
+class TestBatchHashing:
+    def test_batch_entries_chain_from_anchor(self, linkage_df, tmp_path):
+        audit = AuditLogger(tmp_path / "audit_log.parquet")
+        audit_ids = audit.log_batch_linkages(linkage_df, "fna_biopsy", "pathology", 14)
+
+        assert len(audit_ids) == len(linkage_df)
+        assert list(audit.log_df.columns) == AUDIT_COLUMNS
+        assert audit.log_df["prev_log_hash"].iloc[0] == GENESIS_HASH
+        assert audit.last_hash == audit.log_df["log_hash"].iloc[-1]
+
+        entry = {k: v for k, v in audit.log_df.iloc[0].to_dict().items() if k != "log_hash"}
+        entry["days_gap"] = int(entry["days_gap"])
+        entry["abs_days_gap"] = int(entry["abs_days_gap"])
+        entry["tolerance_days"] = int(entry["tolerance_days"])
+        assert compute_entry_hash(entry, GENESIS_HASH) == audit.log_df["log_hash"].iloc[0]
+
+
+class TestSegmentedAuditLog:
+    def test_append_writes_segment_and_manifest(self, linkage_df, tmp_path):
+        log = SegmentedAuditLog(tmp_path / "audit")
+        first = log.append_batch(linkage_df, "fna_biopsy", "pathology", 14)
+        second = log.append_batch(linkage_df, "fna_biopsy", "pathology", 14)
+
+        assert (tmp_path / "audit" / "segment_000000.parquet").exists()
+        assert (tmp_path / "audit" / "segment_000001.parquet").exists()
+        assert first["prev_hash"] == GENESIS_HASH
+        assert second["prev_hash"] == first["tail_hash"]
+
+        reopened = SegmentedAuditLog(tmp_path / "audit")
+        assert reopened.total_entries == 2 * len(linkage_df)
+        assert reopened.last_hash == second["tail_hash"]
+        assert len(reopened.read_log(columns=["audit_id"])) == 2 * len(linkage_df)
+
+    def test_empty_batch_writes_nothing(self, tmp_path):
+        log = SegmentedAuditLog(tmp_path / "audit")
+        assert log.append_batch(pd.DataFrame(), "fna_biopsy", "pathology", 14) is None
+        assert log.segments == []
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_verify_valid_chain(self, linkage_df, tmp_path, max_workers):
+        log = SegmentedAuditLog(tmp_path / "audit")
+        for _ in range(3):
+            log.append_batch(linkage_df, "fna_biopsy", "pathology", 14)
+
+        result = log.verify_hash_chain(max_workers=max_workers)
+        assert result["valid"]
+        assert result["total_entries"] == 3 * len(linkage_df)
+        assert len(result["segments"]) == 3
+
+    def test_verify_detects_modified_entry(self, linkage_df, tmp_path):
+        log = SegmentedAuditLog(tmp_path / "audit")
+        log.append_batch(linkage_df, "fna_biopsy", "pathology", 14)
+        log.append_batch(linkage_df, "fna_biopsy", "pathology", 14)
+
+        segment_path = tmp_path / "audit" / "segment_000001.parquet"
+        df = pd.read_parquet(segment_path)
+        df.loc[5, "link_confidence"] = 0.1
+        df.to_parquet(segment_path, index=False)
+
+        result = log.verify_hash_chain(max_workers=1)
+        assert not result["valid"]
+        assert result["hash_mismatches"] == [df.loc[5, "audit_id"]]
+
+    def test_verify_detects_manifest_break(self, linkage_df, tmp_path):
+        log = SegmentedAuditLog(tmp_path / "audit")
+        log.append_batch(linkage_df, "fna_biopsy", "pathology", 14)
+        log.append_batch(linkage_df, "fna_biopsy", "pathology", 14)
+
+        manifest_path = tmp_path / "audit" / "manifest.json"
+        manifest = json.loads(manifest_path.read_text())
+        del manifest["segments"][0]
+        manifest_path.write_text(json.dumps(manifest))
+
+        result = SegmentedAuditLog(tmp_path / "audit").verify_hash_chain(max_workers=1)
+        assert not result["valid"]
+        assert result["manifest_breaks"] == ["segment_000001.parquet"]
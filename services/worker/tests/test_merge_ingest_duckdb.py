@@ -0,0 +1,91 @@
+"""
+Tests for concurrent reads and the DuckDB merge backend of MultiFileIngestEngine.
+
+The DuckDB backend must produce the same columns, rows and ID warnings as
+the pandas merge (row order aside) without returning a DataFrame.
+"""
+
+import pytest
+import pandas as pd
+
+from ingest.merge_ingest import (
+    DUCKDB_AVAILABLE,
+    MergeManifest,
+    MultiFileIngestEngine,
+)
+
+requires_duckdb = pytest.mark.skipif(not DUCKDB_AVAILABLE, reason="duckdb not installed")
+
+PATTERN = "*.csv,*.parquet,*.xlsx,*.tsv"
+
+
+@pytest.fixture
+def site_dir(tmp_path):
+    """Site submission with mixed formats, an aliased ID and shared columns."""
+    source = tmp_path / "site"
+    source.mkdir()
+    pd.DataFrame({
+        "name": ["a", "b", "c", "d"], "patient_id": [1, 2, 3, 4], "age": [30, 40, 50, 60],
+    }).to_csv(source / "demo.csv", index=False)
+    pd.DataFrame({
+        "Patient_ID": [2, 3, 3, 5], "age": [41, 51, 52, 70], "lab": [1.5, 2.5, 3.5, 4.5],
+    }).to_parquet(source / "labs.parquet", index=False)
+    pd.DataFrame({
+        "patient_id": [1, 3, 6], "site": ["x", "y", "z"], "lab": [9, 8, 7],
+    }).to_excel(source / "site.xlsx", index=False)
+    pd.DataFrame({
+        "patient_id": [1.0, 2.0, None], "note": ["p", "q", "r"],
+    }).to_csv(source / "notes.tsv", sep="\t", index=False)
+    return source
+
+
+def _merge(engine, source, strategy, run_id):
+    manifest = MergeManifest(run_id=run_id, started_at="")
+    return engine.complete_merge(source, "patient_id", "yes", manifest, PATTERN, strategy)
+
+
+def _normalize(df):
+    """Sort rows and unify missing values for order-independent comparison."""
+    df = df.sort_values(["patient_id", "age_labs.parquet", "note"]).reset_index(drop=True)
+    return df.astype(object).where(df.notna(), None)
+
+
+def test_concurrent_read_matches_sequential(site_dir, tmp_path):
+    sequential = MultiFileIngestEngine(artifacts_dir=str(tmp_path), max_workers=1)
+    threaded = MultiFileIngestEngine(artifacts_dir=str(tmp_path), max_workers=4)
+    expected = sequential.read_directory(site_dir, PATTERN)
+    got = threaded.read_directory(site_dir, PATTERN)
+    assert list(got) == list(expected)
+    for name in expected:
+        pd.testing.assert_frame_equal(got[name], expected[name])
+
+
+@requires_duckdb
+@pytest.mark.parametrize("strategy", ["outer", "inner", "left", "right"])
+def test_duckdb_merge_matches_pandas(site_dir, tmp_path, strategy):
+    import duckdb
+
+    expected = _merge(MultiFileIngestEngine(artifacts_dir=str(tmp_path)), site_dir, strategy, "p")
+    engine = MultiFileIngestEngine(artifacts_dir=str(tmp_path), merge_backend="duckdb")
+    result = _merge(engine, site_dir, strategy, "d")
+
+    assert result.success, result.manifest.errors
+    assert result.dataframe is None
+    assert result.manifest.warnings == expected.manifest.warnings
+    assert result.manifest.id_column_aliases["labs.parquet"] == "Patient_ID"
+    assert result.to_dict()["row_count"] == len(expected.dataframe)
+
+    conn = duckdb.connect(result.duckdb_path)
+    got = conn.execute(f'SELECT * FROM "{result.duckdb_table}"').df()
+    conn.close()
+    assert list(got.columns) == list(expected.dataframe.columns) == result.manifest.columns_merged
+    pd.testing.assert_frame_equal(_normalize(got), _normalize(expected.dataframe), check_dtype=False)
+
+
+@requires_duckdb
+def test_duckdb_merge_skips_unreadable_files(site_dir, tmp_path):
+    (site_dir / "broken.parquet").write_bytes(b"not parquet")
+    engine = MultiFileIngestEngine(artifacts_dir=str(tmp_path), merge_backend="duckdb")
+    result = _merge(engine, site_dir, "outer", "broken")
+    assert result.success, result.manifest.errors
+    assert not any(c.endswith("broken.parquet") for c in result.manifest.columns_merged)
@@ -0,0 +1,153 @@
+"""
+Tests for the mmap-backed multiprocess metrics backend.
+
+Values written by each worker must survive reopening, aggregate across
+worker files according to metric kind and gauge mode, and a histogram
+split across workers must expose exactly what one process would.
+"""
+
+import multiprocessing
+import os
+
+import pytest
+
+from src import metrics
+from src.metrics import (
+    MULTIPROC_ENV_VAR,
+    Counter,
+    Gauge,
+    Histogram,
+    MmapedValues,
+    _collect_multiprocess,
+    _sample_key,
+)
+
+
+@pytest.fixture
+def multiproc_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv(MULTIPROC_ENV_VAR, str(tmp_path))
+    monkeypatch.setattr(metrics, "_mp_stores", {})
+    monkeypatch.setattr(metrics, "_mp_pid", None)
+    yield tmp_path
+    for store in metrics._mp_stores.values():
+        store.close()
+
+
+def _dead_pid():
+    proc = multiprocessing.get_context("fork").Process(target=lambda: None)
+    proc.start()
+    proc.join()
+    return proc.pid
+
+
+def _write(path, values):
+    store = MmapedValues(path, initial_size=64)
+    for key, value in values.items():
+        store.write(key, value)
+    store.close()
+
+
+def test_mmap_values_persist_and_grow(tmp_path):
+    path = tmp_path / "counter_1.db"
+    store = MmapedValues(path, initial_size=64)
+    keys = [_sample_key("m", "", f'route="/r{i}"') for i in range(50)]
+    for i, key in enumerate(keys):
+        store.write(key, float(i))
+    store.write(keys[3], 42.5)
+
+    # Readable from outside while still open, and after reopening
+    assert dict(MmapedValues.read_all(path))[keys[3]] == 42.5
+    store.close()
+    reopened = MmapedValues(path)
+    reopened.write(keys[0], 7.0)
+    reopened.write(_sample_key("m", "", 'route="/new"'), 1.0)
+    reopened.close()
+
+    values = dict(MmapedValues.read_all(path))
+    assert len(values) == 51
+    assert values[keys[0]] == 7.0
+    assert values[keys[49]] == 49.0
+
+
+@pytest.mark.parametrize("mode, expected", [
+    ("sum", 3.0 + 5.0 + 11.0),
+    ("livesum", 3.0 + 5.0),
+    ("max", 11.0),
+    ("min", 3.0),
+])
+def test_gauge_modes_aggregate_across_workers(tmp_path, mode, expected):
+    key = _sample_key("g", "", 'pool="db"')
+    live, other_live, dead = os.getpid(), os.getppid(), _dead_pid()
+    for pid, value in ((live, 3.0), (other_live, 5.0), (dead, 11.0)):
+        _write(tmp_path / f"gauge_{mode}_{pid}.db", {key: value})
+
+    merged = _collect_multiprocess(str(tmp_path))
+    assert merged["g"][("", 'pool="db"')] == expected
+
+
+def test_counters_sum_over_exited_workers(tmp_path):
+    key = _sample_key("c", "", "")
+    _write(tmp_path / f"counter_{os.getpid()}.db", {key: 2.0})
+    _write(tmp_path / f"counter_{_dead_pid()}.db", {key: 5.0})
+    # Files from before per-mode gauge files are still read as live sums
+    _write(tmp_path / f"gauge_{_dead_pid()}.db", {_sample_key("g", "", ""): 9.0})
+
+    merged = _collect_multiprocess(str(tmp_path))
+    assert merged["c"][("", "")] == 7.0
+    assert "g" not in merged
+
+
+def test_metrics_write_through_to_process_file(multiproc_dir):
+    requests = Counter(name="req_total", help="h")
+    peak = Gauge(name="peak", help="h", multiprocess_mode="max")
+    requests.inc(route="/a")
+    requests.inc(2, route="/a")
+    peak.set(4.0)
+
+    merged = _collect_multiprocess(str(multiproc_dir))
+    assert merged["req_total"][("", 'route="/a"')] == 3.0
+    assert merged["peak"][("", "")] == 4.0
+    assert (multiproc_dir / f"gauge_max_{os.getpid()}.db").exists()
+
+    with pytest.raises(ValueError):
+        Gauge(name="bad", help="h", multiprocess_mode="average")
+
+
+OBSERVATIONS = [0.001, 0.02, 0.02, 0.3, 0.7, 4.0, 12.0, 0.05, 0.1]
+
+
+def _observe(name, values):
+    histogram = Histogram(name=name, help="latency")
+    for i, value in enumerate(values):
+        histogram.observe(value, route=f"/r{i % 2}")
+    return histogram
+
+
+def test_histogram_exposition_matches_single_process(multiproc_dir):
+    half = len(OBSERVATIONS) // 2
+    # Worker 1 runs in a forked child and exits; worker 2 is this process
+    child = multiprocessing.get_context("fork").Process(
+        target=_observe, args=("lat", OBSERVATIONS[:half])
+    )
+    child.start()
+    child.join()
+    assert child.exitcode == 0
+    local = _observe("lat", OBSERVATIONS[half:])
+    assert len(list(multiproc_dir.glob("counter_*.db"))) == 2
+
+    os.environ.pop(MULTIPROC_ENV_VAR)
+    single = Histogram(name="lat", help="latency")
+    for i, value in enumerate(OBSERVATIONS):
+        # Same route assignment as the two workers combined
+        route = i % 2 if i < half else (i - half) % 2
+        single.observe(value, route=f"/r{route}")
+
+    samples = _collect_multiprocess(str(multiproc_dir))["lat"]
+    aggregated = local.format(local.states_from_samples(samples))
+
+    def lines(text):
+        return sorted(text.splitlines())
+
+    assert lines(aggregated) == lines(single.format())
+    assert 'lat_bucket{route="/r0",le="+Inf"}' in aggregated
+    assert any(line.startswith('lat_sum{route="/r1"}') for line in aggregated.splitlines())
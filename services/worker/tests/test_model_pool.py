@@ -0,0 +1,234 @@
+"""
+Tests for the process-level model pool and batch transcription.
+
+Models must load once per key, stay shared while leased, be evicted only
+when idle and unreferenced, and transcribe_many must reuse one model and
+return results in input order.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.parsers import audio_transcriber
+from src.parsers.audio_transcriber import AudioTranscriber, TranscriptionConfig
+from src.parsers.model_pool import ModelPool
+
+
+def test_lazy_shared_load_and_refcount():
+    pool = ModelPool(idle_seconds=60)
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return object()
+
+    assert "m" not in pool
+    with pool.lease("m", loader) as first:
+        with pool.lease("m", loader) as second:
+            assert first is second
+            assert pool.stats() == {"m": 2}
+        assert pool.stats() == {"m": 1}
+    assert pool.stats() == {"m": 0}
+    assert len(loads) == 1
+
+    # Still warm: not idle long enough to be evicted
+    assert pool.evict_idle() == []
+    with pool.lease("m", loader) as third:
+        assert third is first
+    assert len(loads) == 1
+
+
+def test_idle_eviction_skips_leased_models():
+    pool = ModelPool(idle_seconds=0.05)
+    with pool.lease("held", object):
+        pool.warm("idle", object)
+        time.sleep(0.1)
+        assert pool.evict_idle() == ["idle"]
+        assert "held" in pool
+    time.sleep(0.1)
+    # Released models are swept on the next pool access
+    pool.warm("other", object)
+    assert "held" not in pool
+
+
+def test_concurrent_first_use_loads_once():
+    pool = ModelPool()
+    loads = []
+    gate = threading.Event()
+
+    def loader():
+        loads.append(1)
+        gate.wait(1)
+        return object()
+
+    models = []
+
+    def use():
+        with pool.lease("m", loader) as model:
+            models.append(model)
+
+    threads = [threading.Thread(target=use) for _ in range(4)]
+    for t in threads:
+        t.start()
+    gate.set()
+    for t in threads:
+        t.join()
+
+    assert len(loads) == 1
+    assert len({id(m) for m in models}) == 1
+
+
+def test_evicted_models_are_closed():
+    pool = ModelPool(idle_seconds=0.05)
+    closed = []
+    with pool.lease("held", object, closed.append) as held:
+        pool.warm("idle", object, closed.append)
+        time.sleep(0.1)
+        assert pool.evict_idle() == ["idle"]
+        assert len(closed) == 1
+    assert closed[-1] is not held
+
+    pool.clear()
+    assert closed[-1] is held
+    assert len(closed) == 2
+
+
+def test_failed_load_is_not_cached():
+    pool = ModelPool()
+
+    def broken():
+        raise OSError("model files missing")
+
+    with pytest.raises(OSError):
+        pool.warm("m", broken)
+    assert "m" not in pool
+    pool.warm("m", object)
+    assert "m" in pool
+
+
+class _FakeWhisper:
+    """Minimal stand-in for faster_whisper.WhisperModel."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def transcribe(self, path, **kwargs):
+        self.calls += 1
+        time.sleep(0.01)
+        name = path.rsplit("/", 1)[-1]
+        segments = (
+            SimpleNamespace(id=i, start=float(i), end=i + 1.0, text=f" {name} {i} ", avg_logprob=-0.1)
+            for i in range(3)
+        )
+        return segments, SimpleNamespace(language="en", language_probability=0.99, duration=3.0)
+
+
+@pytest.fixture
+def transcriber(monkeypatch):
+    loads = []
+
+    def loader(self, cfg):
+        def load():
+            loads.append(cfg.model)
+            return _FakeWhisper()
+        return load
+
+    monkeypatch.setattr(audio_transcriber, "_whisper_available", lambda: True)
+    monkeypatch.setattr(audio_transcriber, "get_model_pool", lambda pool=ModelPool(): pool)
+    monkeypatch.setattr(AudioTranscriber, "_model_loader", loader)
+    return AudioTranscriber(TranscriptionConfig(model="tiny", compute_type="int8")), loads
+
+
+def test_transcribe_many_reuses_model_in_order(transcriber, tmp_path):
+    transcriber, loads = transcriber
+    paths = []
+    for i in range(7):
+        path = tmp_path / f"rec{i}.wav"
+        path.write_bytes(b"RIFF")
+        paths.append(path)
+    paths.insert(3, tmp_path / "notes.txt")
+    paths[3].write_text("x")
+
+    assert transcriber.warm_up()
+    results = list(transcriber.transcribe_many(paths, max_workers=3))
+
+    assert [p for p, _ in results] == paths
+    assert loads == ["tiny"]
+    assert not results[3][1].success
+    assert "Unsupported audio format" in results[3][1].errors[0]
+    ok = [r for p, r in results if p.suffix == ".wav"]
+    assert all(r.success for r in ok)
+    assert ok[0].text == "rec0.wav 0 rec0.wav 1 rec0.wav 2"
+
+    single = transcriber.transcribe(paths[0])
+    assert single.text == ok[0].text
+    assert [s.text for s in transcriber.iter_segments(paths[0])] == [s.text for s in single.segments]
+    assert loads == ["tiny"]
+
+
+class _FakeTessAPI:
+    """Records calls made on a tesserocr.PyTessBaseAPI stand-in."""
+
+    instances = []
+
+    def __init__(self, lang, psm, oem):
+        self.init = (lang, psm, oem)
+        self.calls = []
+        _FakeTessAPI.instances.append(self)
+
+    def SetVariable(self, name, value):
+        self.calls.append(("SetVariable", name, value))
+
+    def SetImage(self, img):
+        self.calls.append(("SetImage", img))
+
+    def GetUTF8Text(self):
+        self.calls.append(("GetUTF8Text",))
+        return "  scanned text \n"
+
+    def AllWordConfidences(self):
+        return [90, 80, -1]
+
+    def Clear(self):
+        self.calls.append(("Clear",))
+
+    def End(self):
+        self.calls.append(("End",))
+
+
+def test_tesserocr_engines_pooled_per_thread(monkeypatch):
+    from src.parsers import ocr_pipeline
+    from src.parsers.ocr_pipeline import OcrConfig, _ocr_image
+
+    _FakeTessAPI.instances = []
+    monkeypatch.setattr(ocr_pipeline, "tesserocr", SimpleNamespace(PyTessBaseAPI=_FakeTessAPI), raising=False)
+    monkeypatch.setattr(ocr_pipeline, "TESSEROCR_AVAILABLE", True)
+    pool = ModelPool()
+    monkeypatch.setattr(ocr_pipeline, "get_model_pool", lambda: pool)
+
+    cfg = OcrConfig(language="eng", psm=6, oem=1, preprocess=False, preserve_layout=True)
+    assert _ocr_image("page-1", cfg) == ("scanned text", pytest.approx(0.85))
+    assert _ocr_image("page-2", cfg)[0] == "scanned text"
+
+    assert len(_FakeTessAPI.instances) == 1
+    api = _FakeTessAPI.instances[0]
+    assert api.init == ("eng", 6, 1)
+    assert api.calls[0] == ("SetVariable", "preserve_interword_spaces", "1")
+    assert api.calls[1:] == [
+        ("SetImage", "page-1"), ("GetUTF8Text",), ("Clear",),
+        ("SetImage", "page-2"), ("GetUTF8Text",), ("Clear",),
+    ]
+
+    # Another thread gets its own engine
+    other = threading.Thread(target=_ocr_image, args=("page-3", cfg))
+    other.start()
+    other.join()
+    assert len(_FakeTessAPI.instances) == 2
+    assert _FakeTessAPI.instances[1].calls[-1] == ("Clear",)
+
+    # Evicted engines free their native memory
+    pool.clear()
+    assert all(api.calls[-1] == ("End",) for api in _FakeTessAPI.instances)
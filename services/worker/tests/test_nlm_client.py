@@ -325,5 +325,120 @@ class TestNLMClientError:
         assert error.retryable is False
 
 
+MESH_XML = """<?xml version="1.0"?>
+<DescriptorRecordSet>
+  <DescriptorRecord>
+    <DescriptorUI>D009203</DescriptorUI>
+    <DescriptorName><String>Myocardial Infarction</String></DescriptorName>
+    <TreeNumberList><TreeNumber>C14.280.647.500</TreeNumber></TreeNumberList>
+    <ConceptList><Concept>
+      <ScopeNote>NECROSIS of the MYOCARDIUM.</ScopeNote>
+      <TermList>
+        <Term><String>Myocardial Infarction</String></Term>
+        <Term><String>Heart Attack</String></Term>
+      </TermList>
+    </Concept></ConceptList>
+  </DescriptorRecord>
+  <DescriptorRecord>
+    <DescriptorUI>D003920</DescriptorUI>
+    <DescriptorName><String>Diabetes Mellitus</String></DescriptorName>
+    <TreeNumberList><TreeNumber>C18.452.394.750</TreeNumber></TreeNumberList>
+  </DescriptorRecord>
+</DescriptorRecordSet>
+"""
+
+
+class TestPersistentCacheAndOffline:
+    """Test the SQLite cache, offline dump and batched efetch."""
+    
+    def test_disk_cache_shared_between_clients(self, tmp_path):
+        """Results cached by one client should be visible to another."""
+        path = str(tmp_path / "mesh.sqlite")
+        writer = NLMClient(cache_path=path, mesh_dump_path="")
+        writer._add_to_cache("Diabetes", MeSHTermResult(
+            original_term="Diabetes", mesh_id="D003920", matched=True, confidence=0.95,
+        ))
+        
+        reader = NLMClient(cache_path=path, mesh_dump_path="")
+        cached = reader._get_from_cache("diabetes")
+        assert cached is not None
+        assert cached.mesh_id == "D003920"
+        assert cached.original_term == "diabetes"
+        assert cached.source == "cache"
+    
+    @pytest.mark.asyncio
+    async def test_offline_mode_uses_local_dump(self, tmp_path):
+        """Offline lookups should resolve from the dump without network calls."""
+        import gzip
+        dump = tmp_path / "desc.xml.gz"
+        with gzip.open(dump, "wt") as f:
+            f.write(MESH_XML)
+        
+        client = NLMClient(cache_path="", mesh_dump_path=str(dump), offline=True)
+        client._request_with_retry = AsyncMock(side_effect=AssertionError("network call"))
+        
+        results = await client.lookup_mesh_terms(["heart attack", "Diabetes Mellitus", "gout"])
+        assert [r.mesh_id for r in results] == ["D009203", "D003920", None]
+        assert results[0].confidence == 0.95  # synonym match
+        assert results[0].source == "offline"
+        assert results[2].matched is False
+        
+        single = await client.lookup_mesh_term("Myocardial Infarction")
+        assert single.mesh_id == "D009203"
+        
+        prefix = client.mesh_index.search_prefix("myocard")
+        assert [term for term, _ in prefix] == ["myocardial infarction"]
+    
+    @pytest.mark.asyncio
+    async def test_batched_efetch(self, tmp_path):
+        """Multi-term lookups should fetch all descriptors in one efetch call."""
+        client = NLMClient(cache_path=str(tmp_path / "mesh.sqlite"), mesh_dump_path="")
+        uids = {"heart attack": ["68009203"], "diabetes": ["68003920"], "zzz": []}
+        calls = []
+        
+        async def fake_request(method, url, params, max_retries=3):
+            calls.append((url.rsplit("/", 1)[-1], params.get("term") or params.get("id")))
+            response = MagicMock()
+            if url.endswith("esearch.fcgi"):
+                response.json.return_value = {"esearchresult": {"idlist": uids[params["term"]]}}
+            else:
+                response.text = MESH_XML
+            return response
+        
+        client._request_with_retry = fake_request
+        results = await client.lookup_mesh_terms(["heart attack", "diabetes", "zzz", "Diabetes"])
+        
+        assert [r.mesh_id for r in results] == ["D009203", "D003920", None, "D003920"]
+        assert results[3].original_term == "Diabetes"
+        efetches = [c for c in calls if c[0] == "efetch.fcgi"]
+        assert efetches == [("efetch.fcgi", "68009203,68003920")]
+        
+        # Second client on the same cache file only searches the unmatched term again
+        calls.clear()
+        other = NLMClient(cache_path=str(tmp_path / "mesh.sqlite"), mesh_dump_path="")
+        other._request_with_retry = fake_request
+        again = await other.lookup_mesh_terms(["heart attack", "zzz"])
+        assert again[0].source == "cache"
+        assert again[1].matched is False
+        assert calls == [("esearch.fcgi", "zzz")]
+    
+    @pytest.mark.asyncio
+    async def test_cache_disabled_skips_every_cache(self, tmp_path):
+        """With caching disabled, offline and batch results are not kept in memory."""
+        import gzip
+        dump = tmp_path / "desc.xml.gz"
+        with gzip.open(dump, "wt") as f:
+            f.write(MESH_XML)
+        
+        client = NLMClient(
+            enable_cache=False, cache_path=str(tmp_path / "mesh.sqlite"),
+            mesh_dump_path=str(dump), offline=True,
+        )
+        await client.lookup_mesh_terms(["heart attack", "gout"])
+        await client.lookup_mesh_term("Diabetes Mellitus")
+        assert client._cache == {}
+        assert client._disk_cache is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,119 @@
+"""
+Tests for footer-only Parquet metadata and row-group sampling.
+
+Statistics must match the data without reading it, previews must hold
+exactly the requested rows and columns, and random samples must come
+from several row groups.
+"""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from src.io.parquet_io import get_parquet_schema_metadata, write_parquet_with_schema
+from src.parsers.parquet_parser import (
+    ParquetParser,
+    read_parquet_metadata,
+    read_parquet_sample,
+    row_group_statistics,
+)
+
+
+@pytest.fixture
+def cohort_file(tmp_path):
+    """20 row groups of 1,000 rows, with nulls and an all-null group."""
+    n = 20_000
+    rng = np.random.default_rng(5)
+    df = pd.DataFrame({
+        "row_id": np.arange(n),
+        "age": rng.integers(18, 90, n).astype(float),
+        "site": rng.choice(["alpha", "beta", "gamma"], n),
+    })
+    df.loc[::7, "age"] = np.nan
+    df.loc[3000:3999, "age"] = np.nan
+    path = tmp_path / "cohort.parquet"
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), path, row_group_size=1_000)
+    return path, df
+
+
+def test_statistics_come_from_footer(cohort_file):
+    path, df = cohort_file
+    stats = row_group_statistics(pq.ParquetFile(path).metadata)
+
+    assert stats["age"]["null_count"] == int(df["age"].isna().sum())
+    assert stats["age"]["min"] == df["age"].min()
+    assert stats["age"]["max"] == df["age"].max()
+    assert stats["row_id"]["min"] == 0 and stats["row_id"]["max"] == len(df) - 1
+    assert stats["site"]["min"] == "alpha" and stats["site"]["max"] == "gamma"
+
+    metadata = read_parquet_metadata(path, columns=["age"])
+    assert metadata["record_count"] == len(df)
+    assert metadata["num_row_groups"] == 20
+    assert list(metadata["column_statistics"]) == ["age"]
+
+
+def test_head_reads_requested_rows_and_columns(cohort_file):
+    path, df = cohort_file
+    rows = read_parquet_sample(path, n_rows=800, columns=["row_id", "site"])
+
+    assert len(rows) == 800
+    assert set(rows[0]) == {"row_id", "site"}
+    assert [r["row_id"] for r in rows[:3]] == [0, 1, 2]
+
+    # Crosses a row-group boundary
+    result = ParquetParser().parse(path, max_rows=2_500)
+    assert result.record_count == 2_500
+
+
+def test_random_sample_spans_row_groups(cohort_file):
+    path, df = cohort_file
+    rows = read_parquet_sample(path, n_rows=200, random_sample=True, seed=1)
+    again = read_parquet_sample(path, n_rows=200, random_sample=True, seed=1)
+
+    ids = [r["row_id"] for r in rows]
+    assert len(rows) == 200
+    assert ids == [r["row_id"] for r in again]
+    assert ids == sorted(ids)
+    assert len({i // 1_000 for i in ids}) > 10
+    lookup = df.set_index("row_id")["site"]
+    assert all(lookup[r["row_id"]] == r["site"] for r in rows)
+
+    # Asking for more rows than exist returns the whole file
+    result = ParquetParser().parse(path, max_rows=50_000, sample=True)
+    assert result.record_count == len(df)
+
+
+def test_schema_metadata_read_without_data(tmp_path):
+    path = tmp_path / "out.parquet"
+    write_parquet_with_schema(pd.DataFrame({"a": [1, 2]}), path, "example", "v1.0.0")
+    assert get_parquet_schema_metadata(path) == {"schema_id": "example", "schema_version": "v1.0.0"}
+
+
+def test_statistics_only_on_request(cohort_file):
+    path, _ = cohort_file
+    assert "column_statistics" not in ParquetParser().parse(path, max_rows=10).metadata
+    result = ParquetParser().parse(path, include_data=False, column_statistics=True)
+    assert set(result.metadata["column_statistics"]) == {"row_id", "age", "site"}
+
+
+def test_statistics_match_dotted_and_nested_columns(tmp_path):
+    table = pa.table({
+        "a": [1, 2, 3],
+        "a.b": [10, 20, 30],
+        "s": [{"x": 1, "y": "p"}, {"x": 5, "y": "q"}, None],
+        "z": [7, 8, 9],
+    })
+    path = tmp_path / "nested.parquet"
+    pq.write_table(table, path)
+    metadata = pq.ParquetFile(path).metadata
+
+    stats = row_group_statistics(metadata, ["a.b"])
+    assert list(stats) == ["a.b"]
+    assert (stats["a.b"]["min"], stats["a.b"]["max"]) == (10, 30)
+
+    stats = row_group_statistics(metadata, ["s", "z"])
+    assert list(stats) == ["s.x", "s.y", "z"]
+    assert stats["s.x"]["max"] == 5
+    assert stats["z"]["min"] == 7
@@ -0,0 +1,183 @@
+"""Tests for page-parallel PDF/OCR helpers
+
+Checks page range chunking, that the bounded process pool streams
+results back in task order, and that serial parsing opens the PDF once
+and OCRs only pages without a text layer. PDF backends (pdfplumber,
+pdf2image, Tesseract) are replaced with fakes and are not required.
+"""
+
+import sys
+import time
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+from parsers import ocr_pipeline
+from parsers.ocr_pipeline import OcrConfig, OcrPipeline
+from parsers.pdf_parser import PDFParser, iter_ordered_results, page_ranges
+
+
+def _fake_range(first, last):
+    # Later ranges finish first, so ordering must come from the collector
+    time.sleep(0.01 * (10 - first % 10))
+    return [{"page_number": n} for n in range(first, last + 1)]
+
+
+def test_page_ranges_cover_all_pages():
+    assert page_ranges(20, 8) == [(1, 8), (9, 16), (17, 20)]
+    assert page_ranges(3, 8) == [(1, 3)]
+    assert page_ranges(0, 8) == []
+
+
+def test_iter_ordered_results_serial():
+    pages = list(iter_ordered_results(_fake_range, [(1, 2), (3, 3)], max_workers=1))
+    assert [p["page_number"] for p in pages] == [1, 2, 3]
+
+
+def test_iter_ordered_results_parallel_preserves_order():
+    tasks = page_ranges(37, 3)
+    pages = list(
+        iter_ordered_results(_fake_range, tasks, max_workers=3, max_in_flight=4)
+    )
+    assert [p["page_number"] for p in pages] == list(range(1, 38))
+
+
+# Pages 2 and 4 are scans with no text layer
+PAGE_TEXT = ["Text layer of page one.", "", "Text layer of page three.", "  ", "Text layer of page five."]
+
+
+class _FakePage:
+    def __init__(self, text):
+        self.text = text
+        self.width, self.height = 612, 792
+        self.closed = False
+
+    def extract_text(self):
+        return self.text
+
+    def extract_tables(self):
+        return []
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeImage:
+    width, height = 1700, 2200
+
+    def __init__(self, page_number):
+        self.page_number = page_number
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_pdf(tmp_path, monkeypatch):
+    """Fake pdfplumber/pdf2image/pytesseract recording opens, rasterized and OCR'd pages."""
+    calls = SimpleNamespace(opens=0, rasterized=[], ocr=[])
+
+    class _FakePDF:
+        def __init__(self):
+            self.pages = [_FakePage(text) for text in PAGE_TEXT]
+            self.metadata = {"Title": "scan"}
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    def pdf_open(path):
+        calls.opens += 1
+        return _FakePDF()
+
+    def convert_from_path(path, dpi, first_page, last_page):
+        calls.rasterized.extend(range(first_page, last_page + 1))
+        return [_FakeImage(n) for n in range(first_page, last_page + 1)]
+
+    def image_to_string(img, lang, config):
+        calls.ocr.append(img.page_number)
+        return f" scanned page{img.page_number}\n"
+
+    def image_to_data(img, lang, output_type):
+        return {"text": ["scanned", f"page{img.page_number}"], "conf": ["90", "80"]}
+
+    pdfplumber = ModuleType("pdfplumber")
+    pdfplumber.open = pdf_open
+    pdf2image = ModuleType("pdf2image")
+    pdf2image.convert_from_path = convert_from_path
+    pytesseract = ModuleType("pytesseract")
+    pytesseract.image_to_string = image_to_string
+    pytesseract.image_to_data = image_to_data
+    pytesseract.Output = SimpleNamespace(DICT="dict")
+    for module in (pdfplumber, pdf2image, pytesseract):
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+    monkeypatch.setattr(ocr_pipeline, "TESSEROCR_AVAILABLE", False)
+
+    path = tmp_path / "scan.pdf"
+    path.write_bytes(b"%PDF-1.4")
+    return path, calls
+
+
+def test_pdf_parser_serial_opens_once(fake_pdf):
+    path, calls = fake_pdf
+    result = PDFParser().parse(path)
+
+    assert result.success
+    assert calls.opens == 1
+    assert result.metadata["total_pages"] == len(PAGE_TEXT)
+    assert "Text layer of page three." in result.text_content
+
+
+def test_ocr_only_pages_without_text_layer(fake_pdf):
+    path, calls = fake_pdf
+    pipeline = OcrPipeline(OcrConfig(preprocess=False))
+    pipeline._tesseract_available = True
+
+    result = pipeline.process_pdf(path, max_workers=1)
+
+    assert result.success
+    assert calls.opens == 1
+    assert calls.rasterized == [2, 4]
+    assert calls.ocr == [2, 4]
+    assert [p["source"] for p in result.pages] == ["text_layer", "ocr", "text_layer", "ocr", "text_layer"]
+    assert result.pages[1]["text"] == "scanned page2"
+    assert result.pages[1]["confidence"] == pytest.approx(0.85)
+    assert result.pages[0]["confidence"] is None
+    assert result.metadata["ocr_pages"] == 2
+
+
+def test_iter_pdf_pages_respects_max_pages(fake_pdf):
+    path, calls = fake_pdf
+    pipeline = OcrPipeline(OcrConfig(preprocess=False))
+
+    pages = list(pipeline.iter_pdf_pages(path, max_pages=3, max_workers=1))
+
+    assert [p["page_number"] for p in pages] == [1, 2, 3]
+    assert calls.opens == 1
+    assert calls.rasterized == calls.ocr == [2]
+
+
+def test_serial_pages_stream_one_at_a_time(fake_pdf):
+    path, calls = fake_pdf
+    pipeline = OcrPipeline(OcrConfig(preprocess=False))
+
+    pages = pipeline.iter_pdf_pages(path, max_workers=1)
+
+    assert next(pages)["source"] == "text_layer"
+    assert calls.ocr == []
+    assert next(pages)["page_number"] == 2
+    assert calls.ocr == [2]
+    assert [p["page_number"] for p in pages] == [3, 4, 5]
+    assert calls.ocr == [2, 4]
+
+
+def test_text_layer_skip_can_be_disabled(fake_pdf):
+    path, calls = fake_pdf
+    pipeline = OcrPipeline(OcrConfig(preprocess=False, skip_text_layer=False))
+
+    pages = list(pipeline.iter_pdf_pages(path, max_workers=1))
+
+    assert [p["source"] for p in pages] == ["ocr"] * len(PAGE_TEXT)
+    assert calls.ocr == [1, 2, 3, 4, 5]
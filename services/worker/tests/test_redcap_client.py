@@ -0,0 +1,143 @@
+"""Tests for chunked REDCap export to Parquet
+
+Uses a fake in-memory REDCap API (content=metadata / content=record) to check:
+- Record ID listing for longitudinal projects
+- Batched, ordered, concurrent record export
+- Metadata-derived Parquet schema and value conversion
+
+Last Updated: 2026-10-18
+"""
+
+import threading
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.parquet as pq
+
+from data_ingestion.redcap.client import RedcapClient
+from data_ingestion.redcap.schema import build_export_schema, metadata_column_types
+
+
+METADATA = [
+    {"field_name": "record_id", "form_name": "demographics", "field_type": "text",
+     "text_validation_type_or_show_slider_number": "", "select_choices_or_calculations": ""},
+    {"field_name": "age", "form_name": "demographics", "field_type": "text",
+     "text_validation_type_or_show_slider_number": "integer", "select_choices_or_calculations": ""},
+    {"field_name": "bmi", "form_name": "demographics", "field_type": "text",
+     "text_validation_type_or_show_slider_number": "number", "select_choices_or_calculations": ""},
+    {"field_name": "surgery_date", "form_name": "surgery", "field_type": "text",
+     "text_validation_type_or_show_slider_number": "date_ymd", "select_choices_or_calculations": ""},
+    {"field_name": "complications", "form_name": "surgery", "field_type": "checkbox",
+     "text_validation_type_or_show_slider_number": "",
+     "select_choices_or_calculations": "1, SSI | 2, Bleeding"},
+    {"field_name": "notes_header", "form_name": "surgery", "field_type": "descriptive",
+     "text_validation_type_or_show_slider_number": "", "select_choices_or_calculations": ""},
+]
+
+N_RECORDS = 23
+EVENTS = ["baseline_arm_1", "followup_arm_1"]
+
+
+def _record(rid: str, event: str) -> dict:
+    i = int(rid[1:])
+    return {
+        "record_id": rid,
+        "redcap_event_name": event,
+        "age": str(40 + i) if event == "baseline_arm_1" else "",
+        "bmi": f"{20 + i / 10:.1f}",
+        "surgery_date": "2025-03-0%d" % (1 + i % 9) if i % 5 else "",
+        "complications___1": "1" if i % 2 else "0",
+        "complications___2": "0",
+        "demographics_complete": "2",
+        "surgery_complete": "0",
+    }
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+class _FakeRedcapSession:
+    def __init__(self):
+        self.record_requests = []
+        self.lock = threading.Lock()
+
+    def post(self, url, data, timeout):
+        if data["content"] == "metadata":
+            return _FakeResponse(METADATA)
+
+        rows = [_record(f"R{i:03d}", ev) for i in range(N_RECORDS) for ev in EVENTS]
+        if data.get("records"):
+            wanted = set(data["records"])
+            rows = [r for r in rows if r["record_id"] in wanted]
+            with self.lock:
+                self.record_requests.append(list(data["records"]))
+        if data.get("fields"):
+            rows = [{f: r[f] for f in data["fields"]} for r in rows]
+        return _FakeResponse(rows)
+
+
+@pytest.fixture
+def client():
+    fake = _FakeRedcapSession()
+    c = RedcapClient("https://redcap.example.org/api/", "token")
+    c._session = lambda: fake
+    c.fake = fake
+    return c
+
+
+def test_metadata_column_types_expands_checkboxes_and_forms():
+    types = metadata_column_types(METADATA)
+    assert types["age"] == pa.int64()
+    assert types["bmi"] == pa.float64()
+    assert types["surgery_date"] == pa.date32()
+    assert types["complications___1"] == pa.int64()
+    assert types["surgery_complete"] == pa.int64()
+    assert "notes_header" not in types
+    assert "complications" not in types
+
+
+def test_list_record_ids_dedupes_events(client):
+    ids = client.list_record_ids()
+    assert ids == [f"R{i:03d}" for i in range(N_RECORDS)]
+
+
+def test_iter_record_batches_preserves_order(client):
+    batches = list(client.iter_record_batches(chunk_size=5, max_workers=3))
+    assert len(batches) == 5
+    assert all(len(r) == 2 * 5 for r in batches[:-1])
+    flat = [r["record_id"] for batch in batches for r in batch]
+    assert flat == [f"R{i:03d}" for i in range(N_RECORDS) for _ in EVENTS]
+
+
+def test_export_records_to_parquet(client, tmp_path):
+    out = tmp_path / "export" / "records.parquet"
+    summary = client.export_records_to_parquet(out, chunk_size=4, max_workers=2)
+
+    assert summary["records"] == N_RECORDS
+    assert summary["rows"] == N_RECORDS * len(EVENTS)
+    assert summary["batches"] == 6
+    assert len(client.fake.record_requests) == 6
+
+    table = pq.read_table(out)
+    assert table.schema.field("age").type == pa.int64()
+    assert table.schema.field("surgery_date").type == pa.date32()
+    assert table.schema.field("redcap_event_name").type == pa.string()
+
+    df = table.to_pandas()
+    assert len(df) == N_RECORDS * len(EVENTS)
+    assert df["age"].isna().sum() == N_RECORDS  # blank on follow-up events
+    assert df.loc[df["record_id"] == "R000", "surgery_date"].isna().all()
+
+
+def test_build_export_schema_unknown_columns_are_strings():
+    schema = build_export_schema(["record_id", "mystery_col"], METADATA)
+    assert schema.field("mystery_col").type == pa.string()
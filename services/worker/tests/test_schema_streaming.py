@@ -0,0 +1,90 @@
+"""Tests for streaming (chunked) schema inference
+
+Checks that infer_from_chunks matches the in-memory inference on a small
+frame, and that the distinct-count and reservoir sketches merge correctly.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from schema.infer_schema import SchemaInference, infer_schema_from_file
+from schema.sketches import DistinctCounter, ReservoirSample, hash_values
+
+
+@pytest.fixture
+def frame():
+    n = 2000
+    return pd.DataFrame({
+        "id": np.arange(n),
+        "score": np.linspace(0.0, 1.0, n),
+        "group": ["a", "b", "c", None] * (n // 4),
+        "email": [f"user{i}@example.org" for i in range(n)],
+    })
+
+
+def test_streaming_matches_in_memory(frame, tmp_path):
+    path = tmp_path / "data.csv"
+    frame.to_csv(path, index=False)
+
+    expected = SchemaInference().infer_from_dataframe(pd.read_csv(path))
+    streamed = infer_schema_from_file(path, streaming=True, chunk_size=300)
+
+    assert streamed.record_count == expected.record_count
+    assert streamed.format == "csv"
+    assert streamed.metadata["chunk_count"] == 7
+    assert streamed.primary_key_candidates == expected.primary_key_candidates
+    for got, want in zip(streamed.columns, expected.columns):
+        assert got.name == want.name
+        assert got.inferred_type == want.inferred_type
+        assert got.unique_values == want.unique_values
+        assert got.null_count == want.null_count
+        assert got.sample_values == want.sample_values
+        assert got.min_value == want.min_value
+        assert got.max_value == want.max_value
+        if want.mean_value is None:
+            assert got.mean_value is None
+        else:
+            assert got.mean_value == pytest.approx(want.mean_value)
+        assert got.pattern == want.pattern
+
+
+def test_column_appearing_mid_stream_counts_earlier_rows_as_null():
+    chunks = [pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [3], "b": ["x"]})]
+    schema = SchemaInference().infer_from_chunks(chunks)
+    b = schema.columns[1]
+    assert b.name == "b"
+    assert b.null_count == 2
+    assert b.nullable is True
+
+
+def test_distinct_counter_switches_to_hll_and_merges():
+    left, right = DistinctCounter(exact_limit=1000), DistinctCounter(exact_limit=1000)
+    left.add_hashes(hash_values(pd.Series(np.arange(0, 60_000))))
+    right.add_hashes(hash_values(pd.Series(np.arange(40_000, 100_000, dtype=float))))
+    assert not left.is_exact
+    left.merge(right)
+    assert left.count() == pytest.approx(100_000, rel=0.02)
+
+
+def test_reservoir_sample_merge_keeps_size():
+    a, b = ReservoirSample(50, seed=1), ReservoirSample(50, seed=2)
+    a.add(np.arange(1000))
+    b.add(np.arange(1000, 1200))
+    a.merge(b)
+    assert len(a.items) == 50
+    assert a.seen == 1200
+    assert len(set(a.items)) == 50
+
+
+def test_large_int64_ids_keep_distinct_count_and_mean():
+    ids = np.arange(5000, dtype=np.int64) + 2 ** 60
+    chunks = [pd.DataFrame({"id": ids[i:i + 1000]}) for i in range(0, 5000, 1000)]
+    schema = SchemaInference().infer_from_chunks(chunks)
+
+    col = schema.columns[0]
+    assert col.unique_values == 5000
+    assert "id" in schema.primary_key_candidates
+    assert col.mean_value == pytest.approx(float(ids.astype("float64").mean()))
+    # Whole floats still hash like the equal integer
+    np.testing.assert_array_equal(hash_values(pd.Series([5, 7])), hash_values(pd.Series([5.0, 7.0])))